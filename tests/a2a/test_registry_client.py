@@ -14,20 +14,28 @@
 
 import inspect
 import json
+import threading
+import time
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 import requests
 
 from veadk.a2a.registry_client import (
+    DEFAULT_CARD_CACHE_TTL_MS,
     AgentKitA2ARegistryConfig,
+    AsyncRegistryClient,
     RegistryError,
+    _AGENT_CACHE,
     _OAUTH_TOKEN_CACHE,
     _agent_auth_headers,
     _volc_sign_v4,
+    clear_registry_cache,
     create_task,
     poll_task,
     registry_authorization_from_headers,
+    registry_cache_stats,
     registry_tip_token_from_headers,
     search_agent_cards,
     truncate_utf8_bytes,
@@ -39,6 +47,13 @@ from veadk.tools.builtin_tools.a2a_registry import (
 from veadk.utils.auth import VE_TIP_TOKEN_HEADER
 
 
+@pytest.fixture(autouse=True)
+def _clear_registry_cache():
+    clear_registry_cache()
+    yield
+    clear_registry_cache()
+
+
 def _mock_response(payload: dict, status_code: int = 200) -> Mock:
     response = Mock()
     response.status_code = status_code
@@ -926,3 +941,121 @@ def test_volc_sign_v4_signs_openapi_headers():
         "SignedHeaders=content-type;host;x-content-sha256;x-date"
         in headers["Authorization"]
     )
+
+
+def _get_agent_response(card: dict) -> Mock:
+    return _mock_response(
+        {
+            "ResponseMetadata": {"RequestId": "get-req"},
+            "Result": {
+                "Id": "agent-id",
+                "Status": "running",
+                "AgentCard": json.dumps(card),
+            },
+        }
+    )
+
+
+def _message_response(text: str) -> Mock:
+    return _mock_response(
+        {"result": {"kind": "message", "parts": [{"kind": "text", "text": text}]}}
+    )
+
+
+@patch.dict(
+    "os.environ",
+    {"AGENTKIT_ACCESS_KEY": "ak-test", "AGENTKIT_SECRET_KEY": "sk-test"},
+    clear=False,
+)
+@patch("veadk.a2a.registry_client.requests.post")
+def test_create_task_reuses_cached_agent_card(post: Mock):
+    post.side_effect = [
+        _get_agent_response(_agent_card()),
+        _message_response("first"),
+        _message_response("second"),
+    ]
+    config = AgentKitA2ARegistryConfig(space_id="space-test")
+
+    first = create_task("Weather-A2A-Agent", "a", config=config)
+    second = create_task("Weather-A2A-Agent", "b", config=config)
+
+    assert first["diagnostics"]["card_cache"] == "miss"
+    assert second["diagnostics"]["card_cache"] == "hit"
+    assert second["response"]["text"] == "second"
+    assert [c.kwargs.get("params", {}).get("Action") for c in post.call_args_list] == [
+        "GetA2aAgent",
+        None,
+        None,
+    ]
+    assert registry_cache_stats()["agent_cards"].hits == 1
+
+
+@patch.dict(
+    "os.environ",
+    {"AGENTKIT_ACCESS_KEY": "ak-test", "AGENTKIT_SECRET_KEY": "sk-test"},
+    clear=False,
+)
+@patch("veadk.a2a.registry_client.requests.post")
+def test_stale_agent_card_is_served_while_revalidating(post: Mock):
+    post.side_effect = [_get_agent_response(_agent_card()), _message_response("ok")]
+    config = AgentKitA2ARegistryConfig(space_id="space-test")
+    create_task("Weather-A2A-Agent", "a", config=config)
+    for entry in _AGENT_CACHE._entries.values():
+        entry.fetched_at -= DEFAULT_CARD_CACHE_TTL_MS / 1000 + 1
+
+    post.side_effect = None
+    post.return_value = _message_response("stale")
+    refreshed = threading.Event()
+
+    def _get_agent(config, action, body):
+        refreshed.set()
+        return _get_agent_response(_agent_card()).json(), 1
+
+    with patch("veadk.a2a.registry_client._agentkit_post", side_effect=_get_agent):
+        result = create_task("Weather-A2A-Agent", "b", config=config)
+        assert refreshed.wait(5)
+        for _ in range(100):
+            if registry_cache_stats()["agent_cards"].revalidated:
+                break
+            time.sleep(0.01)
+
+    assert result["diagnostics"]["card_cache"] == "stale"
+    assert result["response"]["text"] == "stale"
+    assert registry_cache_stats()["agent_cards"].revalidated == 1
+
+
+@pytest.mark.asyncio
+async def test_async_registry_client_shares_pool_and_card_cache(monkeypatch):
+    monkeypatch.setenv("AGENTKIT_ACCESS_KEY", "ak-test")
+    monkeypatch.setenv("AGENTKIT_SECRET_KEY", "sk-test")
+    requests_seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        action = request.url.params.get("Action")
+        requests_seen.append(action or request.url.host)
+        if action == "GetA2aAgent":
+            return httpx.Response(
+                200,
+                json={
+                    "Result": {
+                        "Status": "running",
+                        "AgentCard": json.dumps(_agent_card()),
+                    }
+                },
+            )
+        assert request.headers["Authorization"] == "Bearer secret-token"
+        return httpx.Response(
+            200,
+            json={"result": {"id": "task-1", "status": {"state": "completed"}}},
+        )
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with AsyncRegistryClient(
+        AgentKitA2ARegistryConfig(space_id="space-test"), http_client=http_client
+    ) as client:
+        first = await client.poll_task("Weather-A2A-Agent", "task-1")
+        second = await client.poll_task("Weather-A2A-Agent", "task-1")
+    await http_client.aclose()
+
+    assert first["is_terminal"] and second["task"]["status"] == "completed"
+    assert requests_seen == ["GetA2aAgent", "example.test", "example.test"]
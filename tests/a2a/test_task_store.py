@@ -0,0 +1,71 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+from a2a.types import Task, TaskState, TaskStatus
+
+from veadk.a2a.ve_task_store import VeTaskStore
+from veadk.configs.database_configs import A2ATaskStoreConfig
+
+
+def _task(task_id: str, state: TaskState = TaskState.working) -> Task:
+    return Task(id=task_id, context_id="ctx", status=TaskStatus(state=state))
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_least_recently_used():
+    store = VeTaskStore(A2ATaskStoreConfig(max_entries=2))
+    for task_id in ("a", "b"):
+        await store.save(_task(task_id))
+    assert await store.get("a") is not None
+    await store.save(_task("c"))
+
+    assert await store.get("b") is None
+    assert (await store.get("a")).id == "a"
+    stats = store.stats()
+    assert (stats.entries, stats.evictions, stats.misses) == (2, 1, 1)
+    assert stats.utilization == 1.0
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_expires_tasks(monkeypatch):
+    store = VeTaskStore(A2ATaskStoreConfig(ttl_seconds=10))
+    await store.save(_task("a"))
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+    assert await store.get("a") is None
+    assert store.stats().expirations == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_tier_is_shared_between_workers(tmp_path):
+    config = A2ATaskStoreConfig(
+        backend="sqlite", sqlite_path=str(tmp_path / "tasks.sqlite3")
+    )
+    first, second = VeTaskStore(config), VeTaskStore(config)
+
+    await first.save(_task("a"))
+    assert (await second.get("a")).status.state == TaskState.working
+
+    # Unfinished tasks are re-read, so progress made elsewhere is visible.
+    await second.save(_task("a", TaskState.completed))
+    assert await first.get_state("a") == TaskState.completed
+    assert (await first.get("a")).status.state == TaskState.completed
+
+    await second.delete("a")
+    assert await second.get("a") is None
+    assert await VeTaskStore(config).get_state("a") is None
@@ -0,0 +1,319 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline framework-overhead benchmark for the Runner hot path.
+
+A stub model and a stub tool stand in for the network, so every turn spends
+its time in VeADK and ADK: `Runner.run`, the `intercept_new_message` wrapper,
+`_convert_messages`, the tracing hooks and the memory and skills callbacks.
+Every feature toggle is measured at each concurrency level of
+`VEADK_BENCH_CONCURRENCY` (1, 10 and 100 sessions by default; add 1000 for the
+full matrix, which takes minutes). The benchmark only runs with
+`VEADK_RUN_BENCHMARKS=1`; its metrics are written as JSON to
+`VEADK_BENCH_OUTPUT` when set. Failed turns fail the test unless the
+`VEADK_BENCH_BASELINE` output failed as many. A p50 turn latency above
+`VEADK_BENCH_MAX_REGRESSION` times the baseline also fails the test.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tracemalloc
+from pathlib import Path
+from time import perf_counter_ns
+from typing import AsyncGenerator, Callable
+
+import pytest
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from veadk import Agent, Runner
+from veadk.memory.long_term_memory import LongTermMemory
+from veadk.memory.long_term_memory_backends.base_backend import (
+    BaseLongTermMemoryBackend,
+)
+from veadk.memory.short_term_memory import ShortTermMemory
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("VEADK_RUN_BENCHMARKS") != "1",
+    reason="set VEADK_RUN_BENCHMARKS=1 to run the Runner overhead benchmark",
+)
+
+_CONCURRENCY = [
+    int(level) for level in os.getenv("VEADK_BENCH_CONCURRENCY", "1,10,100").split(",")
+]
+_ALLOCATION_TURNS = 20
+_LAG_INTERVAL_NS = 5_000_000
+
+
+class _StubLlm(BaseLlm):
+    """Call `lookup` once per turn, then answer with the tool result."""
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        last = llm_request.contents[-1]
+        response = next(
+            (part.function_response for part in last.parts if part.function_response),
+            None,
+        )
+        if response is None:
+            query = last.parts[0].text or ""
+            part = types.Part(
+                function_call=types.FunctionCall(name="lookup", args={"query": query})
+            )
+        else:
+            part = types.Part(text=f"Answer: {response.response['result']}")
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[part]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=32, candidates_token_count=8, total_token_count=40
+            ),
+        )
+
+
+def lookup(query: str) -> dict:
+    """Look up a stub fact."""
+    return {"result": f"stub fact about {query}"}
+
+
+class _StubLongTermMemoryBackend(BaseLongTermMemoryBackend):
+    memories: list[str] = []
+
+    def precheck_index_naming(self):
+        pass
+
+    def save_memory(self, user_id: str, event_strings: list[str], **kwargs) -> bool:
+        self.memories.extend(event_strings)
+        return True
+
+    def search_memory(
+        self, user_id: str, query: str, top_k: int, **kwargs
+    ) -> list[str]:
+        return [memory for memory in self.memories if query in memory][:top_k]
+
+
+def _write_skill(root: Path) -> str:
+    skill_dir = root / "skills" / "lookup_facts"
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: lookup_facts\ndescription: Look facts up.\n---\nUse lookup.\n",
+        encoding="utf-8",
+    )
+    return str(root / "skills")
+
+
+def _agent(**kwargs) -> Agent:
+    return Agent(
+        model=_StubLlm(model="stub"), model_api_key="bench", tools=[lookup], **kwargs
+    )
+
+
+def _baseline(tmp_path: Path) -> Runner:
+    return Runner(agent=_agent())
+
+
+def _sqlite_short_term_memory(tmp_path: Path) -> Runner:
+    return Runner(
+        agent=_agent(),
+        short_term_memory=ShortTermMemory(
+            backend="sqlite", local_database_path=str(tmp_path / "sessions.db")
+        ),
+    )
+
+
+def _skills(tmp_path: Path) -> Runner:
+    return Runner(
+        agent=_agent(
+            skills=[_write_skill(tmp_path)],
+            skills_mode="local",
+            enable_dynamic_load_skills=True,
+        )
+    )
+
+
+def _long_term_memory(tmp_path: Path) -> Runner:
+    return Runner(
+        agent=_agent(
+            long_term_memory=LongTermMemory(
+                backend=_StubLongTermMemoryBackend(index="bench")
+            ),
+            auto_save_session=True,
+        )
+    )
+
+
+def _tracing(tmp_path: Path) -> Runner:
+    from veadk.tracing.telemetry.opentelemetry_tracer import OpentelemetryTracer
+
+    return Runner(
+        agent=_agent(
+            tracers=[OpentelemetryTracer()],
+        )
+    )
+
+
+# Tracing patches ADK's telemetry hooks process-wide, so it is measured last.
+_TOGGLES: dict[str, Callable[[Path], Runner]] = {
+    "baseline": _baseline,
+    "short_term_memory_sqlite": _sqlite_short_term_memory,
+    "skills": _skills,
+    "long_term_memory": _long_term_memory,
+    "tracing": _tracing,
+}
+
+
+def _percentile_ms(samples_ns: list[int], percentile: float) -> float:
+    ordered = sorted(samples_ns)
+    index = max(0, min(len(ordered) - 1, int(len(ordered) * percentile) - 1))
+    return round(ordered[index] / 1_000_000, 3)
+
+
+async def _turn(runner: Runner, session_id: str) -> tuple[int, int]:
+    """Run one turn; return its latency and the number of events it stored."""
+    started = perf_counter_ns()
+    output = await runner.run(
+        messages=f"question for {session_id}",
+        user_id="bench_user",
+        session_id=session_id,
+    )
+    latency = perf_counter_ns() - started
+    assert output == f"Answer: stub fact about question for {session_id}"
+    session = await runner.session_service.get_session(
+        app_name=runner.app_name, user_id="bench_user", session_id=session_id
+    )
+    return latency, len(session.events)
+
+
+async def _watch_loop_lag(samples_ns: list[int], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = perf_counter_ns()
+        await asyncio.sleep(_LAG_INTERVAL_NS / 1_000_000_000)
+        samples_ns.append(perf_counter_ns() - started - _LAG_INTERVAL_NS)
+
+
+async def _measure(runner: Runner, toggle: str, concurrency: int) -> dict:
+    lag_samples: list[int] = []
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(_watch_loop_lag(lag_samples, stop))
+    started = perf_counter_ns()
+    results = await asyncio.gather(
+        *(_turn(runner, f"{toggle}-{concurrency}-{i}") for i in range(concurrency)),
+        return_exceptions=True,
+    )
+    wall_ns = perf_counter_ns() - started
+    stop.set()
+    await watcher
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    turns = [result for result in results if not isinstance(result, BaseException)]
+    latencies = [latency for latency, _ in turns] or [0]
+    events = sum(count for _, count in turns)
+    # user turn, tool call, tool response and final answer
+    assert events == len(turns) * 4
+    return {
+        "turns": concurrency,
+        "failed": len(failures),
+        "errors": sorted({type(failure).__name__ for failure in failures}),
+        "events": events,
+        "events_per_second": round(events / (wall_ns / 1_000_000_000), 1),
+        "turn_ms": {
+            "p50": _percentile_ms(latencies, 0.50),
+            "p95": _percentile_ms(latencies, 0.95),
+            "p99": _percentile_ms(latencies, 0.99),
+            "max": round(max(latencies) / 1_000_000, 3),
+        },
+        "loop_lag_ms": {
+            "p99": _percentile_ms(lag_samples or [0], 0.99),
+            "max": round(max(lag_samples or [0]) / 1_000_000, 3),
+        },
+        "wall_ms": round(wall_ns / 1_000_000, 3),
+    }
+
+
+async def _measure_allocations(runner: Runner, toggle: str) -> dict:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for i in range(_ALLOCATION_TURNS):
+            await _turn(runner, f"{toggle}-alloc-{i}")
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "retained_kib_per_turn": round(
+            (current - before) / 1024 / _ALLOCATION_TURNS, 2
+        ),
+        "peak_kib": round((peak - before) / 1024, 2),
+    }
+
+
+def _check_regressions(results: dict) -> list[str]:
+    baseline_path = os.getenv("VEADK_BENCH_BASELINE")
+    baseline = (
+        json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+        if baseline_path
+        else {}
+    )
+    max_regression = float(os.getenv("VEADK_BENCH_MAX_REGRESSION", "1.5"))
+    regressions = []
+    for toggle, levels in results["toggles"].items():
+        for level, metrics in levels["concurrency"].items():
+            previous = (
+                baseline.get("toggles", {})
+                .get(toggle, {})
+                .get("concurrency", {})
+                .get(level)
+            )
+            if metrics["failed"] > (previous or {}).get("failed", 0):
+                regressions.append(
+                    f"{toggle}@{level}: {metrics['failed']} failed turns {metrics['errors']}"
+                )
+            if not previous:
+                continue
+            limit = previous["turn_ms"]["p50"] * max_regression
+            if metrics["turn_ms"]["p50"] > limit:
+                regressions.append(
+                    f"{toggle}@{level}: p50 {metrics['turn_ms']['p50']}ms > {limit:.3f}ms"
+                )
+    return regressions
+
+
+@pytest.mark.asyncio
+async def test_runner_overhead_per_feature_toggle(tmp_path: Path) -> None:
+    results: dict = {"concurrency_levels": _CONCURRENCY, "toggles": {}}
+    for toggle, build_runner in _TOGGLES.items():
+        runner = build_runner(tmp_path / toggle)
+        try:
+            # Warm caches and lazy imports, so only steady-state turns count.
+            await _turn(runner, f"{toggle}-warmup")
+            levels = {}
+            for concurrency in _CONCURRENCY:
+                levels[str(concurrency)] = await _measure(runner, toggle, concurrency)
+            results["toggles"][toggle] = {
+                "concurrency": levels,
+                "allocations": await _measure_allocations(runner, toggle),
+            }
+        finally:
+            await runner.close()
+
+    if output := os.getenv("VEADK_BENCH_OUTPUT"):
+        Path(output).write_text(json.dumps(results, indent=2, sort_keys=True))
+
+    assert _check_regressions(results) == []
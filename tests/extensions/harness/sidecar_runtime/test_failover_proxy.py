@@ -15,14 +15,32 @@
 from __future__ import annotations
 
 import json
+import socket
 import threading
+import time
+import urllib.error
 import urllib.request
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from veadk.extensions.harness.sidecar_runtime.failover_proxy import StableHttpRelay
+from veadk.extensions.harness.sidecar_runtime.runtime_gateway_proxy import (
+    RuntimeGatewayHttpRelay,
+)
 
 
-def _upstream(label: str):
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _post(url: str) -> dict[str, object]:
+    request = urllib.request.Request(url, data=b'{"messages":[]}', method="POST")
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+def _upstream(label: str, port: int = 0):
     requests: list[dict[str, object]] = []
 
     class Handler(BaseHTTPRequestHandler):
@@ -40,7 +58,7 @@ def _upstream(label: str):
             self.end_headers()
             self.wfile.write(payload)
 
-    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     host, port = server.server_address[:2]
@@ -84,3 +102,85 @@ def test_stable_relay_switches_to_direct_upstream_without_changing_url() -> None
     assert direct_requests == [
         {"path": "/direct/v3/chat/completions?trace=test", "body": '{"messages":[]}'}
     ]
+
+
+def test_stable_relay_fails_over_when_active_upstream_is_down() -> None:
+    direct, direct_thread, direct_url, direct_requests = _upstream("direct")
+    relay = StableHttpRelay(
+        f"http://127.0.0.1:{_free_port()}/api/v3",
+        f"{direct_url}/direct/v3",
+        health_check_interval=60,
+    )
+
+    try:
+        for _ in range(2):
+            assert _post(f"{relay.url}/chat/completions") == {"upstream": "direct"}
+        active, fallback = relay.stats()
+    finally:
+        relay.close()
+        direct.shutdown()
+        direct.server_close()
+        direct_thread.join(timeout=5)
+
+    assert [request["path"] for request in direct_requests] == [
+        "/direct/v3/chat/completions"
+    ] * 2
+    # The refused connection marks the active upstream unhealthy, so the second
+    # request goes straight to the fallback.
+    assert (active.name, active.requests, active.errors) == ("active", 1, 1)
+    assert not active.healthy
+    assert (fallback.requests, fallback.errors, fallback.healthy) == (2, 0, True)
+    assert fallback.latency_ms > 0
+
+
+def test_stable_relay_returns_to_active_upstream_after_health_check() -> None:
+    port = _free_port()
+    direct, direct_thread, direct_url, _ = _upstream("direct")
+    relay = StableHttpRelay(
+        f"http://127.0.0.1:{port}/api/v3",
+        f"{direct_url}/direct/v3",
+        health_check_interval=0.05,
+    )
+    sidecar = sidecar_thread = None
+
+    try:
+        assert _post(f"{relay.url}/chat/completions") == {"upstream": "direct"}
+        sidecar, sidecar_thread, _, _ = _upstream("sidecar", port)
+        deadline = time.monotonic() + 5
+        while not relay.stats()[0].healthy and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert _post(f"{relay.url}/chat/completions") == {"upstream": "sidecar"}
+
+        relay.activate_fallback()
+        assert _post(f"{relay.url}/chat/completions") == {"upstream": "direct"}
+    finally:
+        relay.close()
+        for server, thread in ((sidecar, sidecar_thread), (direct, direct_thread)):
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=5)
+
+
+def test_runtime_gateway_relay_fails_closed() -> None:
+    relay = RuntimeGatewayHttpRelay(
+        f"http://127.0.0.1:{_free_port()}/gateway",
+        source_path="/api/v3",
+        api_key="secret",
+        target_port=8000,
+        timeout_seconds=5,
+    )
+
+    try:
+        relay.activate_fallback()
+        try:
+            _post(f"{relay.url}/chat/completions")
+        except urllib.error.HTTPError as error:
+            status, body = error.code, error.read()
+        (gateway,) = relay.stats()
+    finally:
+        relay.close()
+
+    assert status == 502
+    assert body == b'{"status":"error","error":"runtime_gateway_unavailable"}'
+    assert (gateway.name, gateway.requests, gateway.errors) == ("gateway", 1, 1)
@@ -0,0 +1,169 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+
+import pytest
+from google.adk.events import Event
+from google.adk.sessions import Session
+from google.genai import types
+
+from veadk.memory.long_term_memory import LongTermMemory
+from veadk.memory.long_term_memory_backends.base_backend import (
+    BaseLongTermMemoryBackend,
+)
+from veadk.memory.memory_writer import MemoryWriter
+
+
+class _RecordingBackend(BaseLongTermMemoryBackend):
+    saves: list[dict] = []
+
+    def precheck_index_naming(self):
+        pass
+
+    def save_memory(self, user_id: str, event_strings: list[str], **kwargs) -> bool:
+        self.saves.append(
+            {
+                "session_id": kwargs.get("session_id"),
+                "texts": [json.loads(e)["parts"][0]["text"] for e in event_strings],
+            }
+        )
+        return True
+
+    def search_memory(
+        self, user_id: str, query: str, top_k: int, **kwargs
+    ) -> list[str]:
+        return []
+
+
+def _user_event(text: str, timestamp: float) -> Event:
+    return Event(
+        author="user",
+        timestamp=timestamp,
+        content=types.Content(role="user", parts=[types.Part(text=text)]),
+    )
+
+
+def _writer() -> tuple[MemoryWriter, _RecordingBackend]:
+    backend = _RecordingBackend(index="writer_test", saves=[])
+    return MemoryWriter(LongTermMemory(backend=backend)), backend
+
+
+@pytest.mark.asyncio
+async def test_writer_only_persists_new_events():
+    writer, backend = _writer()
+    session = Session(id="s1", app_name="app", user_id="u1", events=[])
+
+    session.events.append(_user_event("one", 1.0))
+    writer.enqueue(session)
+    await writer.flush()
+    session.events.append(_user_event("two", 2.0))
+    writer.enqueue(session)
+    await writer.close()
+
+    assert backend.saves == [
+        {"session_id": "s1", "texts": ["one"]},
+        {"session_id": "s1", "texts": ["two"]},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_writer_coalesces_turns_into_one_call_per_session():
+    writer, backend = _writer()
+    first = Session(id="s1", app_name="app", user_id="u1", events=[])
+    second = Session(id="s2", app_name="app", user_id="u2", events=[])
+
+    for i in range(3):
+        first.events.append(_user_event(f"a{i}", float(i)))
+        writer.enqueue(first)
+    second.events.append(_user_event("b0", 0.0))
+    writer.enqueue(second)
+    assert writer.pending_events == 4
+    await writer.close()
+
+    assert sorted(backend.saves, key=lambda save: save["session_id"]) == [
+        {"session_id": "s1", "texts": ["a0", "a1", "a2"]},
+        {"session_id": "s2", "texts": ["b0"]},
+    ]
+
+
+def test_writer_flushes_when_the_event_loop_shuts_down():
+    writer, backend = _writer()
+    session = Session(id="s1", app_name="app", user_id="u1", events=[])
+    session.events.append(_user_event("bye", 1.0))
+
+    async def _turn():
+        writer.enqueue(session)
+        # The runner keeps going after the callback; let the writer start.
+        await asyncio.sleep(0)
+
+    asyncio.run(_turn())
+
+    assert backend.saves == [{"session_id": "s1", "texts": ["bye"]}]
+
+
+@pytest.mark.asyncio
+async def test_writer_holds_back_events_below_the_save_thresholds():
+    writer, backend = _writer()
+    session = Session(id="s1", app_name="app", user_id="u1", events=[])
+
+    session.events.append(_user_event("one", 1.0))
+    assert writer.enqueue(session, min_new_events=3, min_interval=60) == 1
+    await writer.flush()
+    for i, text in enumerate(["two", "three"]):
+        session.events.append(_user_event(text, 2.0 + i))
+        assert writer.enqueue(session, min_new_events=3, min_interval=60) == 0
+    session.events.append(_user_event("four", 4.0))
+    assert writer.enqueue(session, min_new_events=3, min_interval=60) == 3
+    await writer.flush()
+    session.events.append(_user_event("five", 5.0))
+    assert writer.enqueue(session, min_new_events=3, min_interval=60) == 0
+    # Held back events are not lost when the writer is closed.
+    await writer.close()
+
+    assert [save["texts"] for save in backend.saves] == [
+        ["one"],
+        ["two", "three", "four"],
+        ["five"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_writer_retries_failed_writes_a_bounded_number_of_times():
+    class _FlakyBackend(_RecordingBackend):
+        failures: int = 0
+
+        def save_memory(self, user_id, event_strings, **kwargs) -> bool:
+            if self.failures:
+                self.failures -= 1
+                return False
+            return super().save_memory(user_id, event_strings, **kwargs)
+
+    backend = _FlakyBackend(index="writer_test", saves=[], failures=2)
+    writer = MemoryWriter(LongTermMemory(backend=backend), retry_delay=0.01)
+    session = Session(id="s1", app_name="app", user_id="u1", events=[])
+    session.events.append(_user_event("one", 1.0))
+
+    writer.enqueue(session)
+    await asyncio.sleep(0.2)
+    assert backend.saves == [{"session_id": "s1", "texts": ["one"]}]
+
+    backend.failures = 3
+    session.events.append(_user_event("two", 2.0))
+    writer.enqueue(session)
+    await asyncio.sleep(0.2)
+    await writer.close()
+    assert writer.pending_events == 0
+    assert len(backend.saves) == 1
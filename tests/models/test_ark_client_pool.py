@@ -0,0 +1,73 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from veadk.configs.model_configs import ArkClientPoolConfig
+from veadk.models.ark_client_pool import ArkClientPool
+
+API_BASE = "https://ark.example.com/api/v3"
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_clients_and_shares_connections():
+    pool = ArkClientPool(ArkClientPoolConfig(max_connections=8))
+
+    first = pool.get(API_BASE, "key-a")
+    again = pool.get(API_BASE, "key-a")
+    other = pool.get(API_BASE, "key-b")
+
+    assert first is again
+    assert other is not first
+    assert other._client is first._client
+    stats = pool.stats()
+    assert (stats.clients, stats.hits, stats.misses) == (2, 1, 2)
+
+    await pool.aclose()
+    assert first._client.is_closed
+    assert pool.get(API_BASE, "key-a") is not first
+    await pool.aclose()
+
+
+def test_pool_keeps_connections_per_event_loop():
+    pool = ArkClientPool()
+
+    async def _get():
+        client = pool.get(API_BASE, "key-a")
+        await pool.aclose()
+        return client
+
+    assert asyncio.run(_get()) is not asyncio.run(_get())
+
+
+@pytest.mark.asyncio
+async def test_pool_stays_open_until_the_last_owner_releases_it():
+    pool = ArkClientPool()
+    pool.retain()
+    pool.retain()
+    client = pool.get(API_BASE, "key-a")
+
+    await pool.release()
+    assert not client._client.is_closed
+    assert pool.get(API_BASE, "key-a") is client
+
+    await pool.release()
+    assert client._client.is_closed
+    # Unbalanced releases do not close connections of later users.
+    fresh = pool.get(API_BASE, "key-a")
+    await pool.release()
+    assert not fresh._client.is_closed
+    await pool.aclose()
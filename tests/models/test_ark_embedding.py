@@ -0,0 +1,125 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("llama_index.core")
+
+from veadk.models.ark_embedding import ArkEmbedding  # noqa: E402
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+def _embedding_for(text: str) -> list[float]:
+    return [float(len(text)), float(ord(text[0]))]
+
+
+class _FakeEmbeddings:
+    def __init__(self, rate_limited_texts=()):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._rate_limited = set(rate_limited_texts)
+        self._lock = threading.Lock()
+
+    def _enter(self, input):
+        text = input[0]["text"]
+        with self._lock:
+            self.calls.append(text)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return text
+
+    def _leave(self, text):
+        with self._lock:
+            self.in_flight -= 1
+            if text in self._rate_limited:
+                self._rate_limited.discard(text)
+                raise _RateLimited("too many requests")
+        return SimpleNamespace(data=SimpleNamespace(embedding=_embedding_for(text)))
+
+
+class _FakeSyncEmbeddings(_FakeEmbeddings):
+    def create(self, model, input, **kwargs):
+        text = self._enter(input)
+        threading.Event().wait(0.01)
+        return self._leave(text)
+
+
+class _FakeAsyncEmbeddings(_FakeEmbeddings):
+    async def create(self, model, input, **kwargs):
+        text = self._enter(input)
+        # Finish in reverse order of submission to check result ordering.
+        await asyncio.sleep(0.01 * (10 - len(self.calls) % 10))
+        return self._leave(text)
+
+
+def _make_model(**kwargs) -> ArkEmbedding:
+    kwargs.setdefault("rate_limit_backoff", 0)
+    return ArkEmbedding(api_key="test-key", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_async_embeddings_are_concurrent_bounded_and_ordered():
+    model = _make_model(num_workers=4, embed_batch_size=6)
+    embeddings = _FakeAsyncEmbeddings()
+    model._aclient = SimpleNamespace(multimodal_embeddings=embeddings)
+    texts = [f"{chr(97 + i)}{'x' * i}" for i in range(20)]
+
+    results = await model.aget_text_embeddings(texts)
+
+    assert results == [_embedding_for(text) for text in texts]
+    assert sorted(embeddings.calls) == sorted(texts)
+    assert 1 < embeddings.max_in_flight <= 4
+
+
+@pytest.mark.asyncio
+async def test_async_embeddings_retry_on_rate_limit():
+    model = _make_model(num_workers=2)
+    embeddings = _FakeAsyncEmbeddings(rate_limited_texts={"beta"})
+    model._aclient = SimpleNamespace(multimodal_embeddings=embeddings)
+
+    results = await model.aget_text_embeddings(["alpha", "beta", "gamma"])
+
+    assert results == [_embedding_for(t) for t in ["alpha", "beta", "gamma"]]
+    assert embeddings.calls.count("beta") == 2
+
+
+@pytest.mark.asyncio
+async def test_async_embeddings_give_up_after_rate_limit_retries():
+    model = _make_model(rate_limit_retries=0)
+    embeddings = _FakeAsyncEmbeddings(rate_limited_texts={"alpha"})
+    model._aclient = SimpleNamespace(multimodal_embeddings=embeddings)
+
+    with pytest.raises(_RateLimited):
+        await model.aget_text_embeddings(["alpha"])
+
+
+def test_sync_embeddings_use_worker_pool_and_keep_order():
+    model = _make_model(num_workers=3)
+    embeddings = _FakeSyncEmbeddings(rate_limited_texts={"c"})
+    model._client = SimpleNamespace(multimodal_embeddings=embeddings)
+    texts = ["a", "bb", "c", "dddd", "eeeee", "ffffff"]
+
+    results = model.get_text_embeddings(texts)
+
+    assert results == [_embedding_for(text) for text in texts]
+    assert embeddings.calls.count("c") == 2
+    assert 1 < embeddings.max_in_flight <= 3
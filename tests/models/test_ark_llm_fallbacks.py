@@ -103,6 +103,7 @@ async def test_ark_llm_retries_expired_response_before_fallback(monkeypatch):
         fallbacks=["openai/fallback-model"],
     )
     calls = []
+    tools = [{"type": "function", "name": "lookup", "parameters": {}}]
     request = httpx.Request("POST", "https://ark.example/v1/responses")
     expired_error = ArkBadRequestError(
         "previous response expired",
@@ -113,7 +114,11 @@ async def test_ark_llm_retries_expired_response_before_fallback(monkeypatch):
 
     async def fake_generate(self, responses_args, stream=False):
         calls.append(
-            (responses_args["model"], responses_args.get("previous_response_id"))
+            (
+                responses_args["model"],
+                responses_args.get("previous_response_id"),
+                responses_args.get("tools"),
+            )
         )
         if len(calls) == 1:
             raise expired_error
@@ -126,13 +131,13 @@ async def test_ark_llm_retries_expired_response_before_fallback(monkeypatch):
     responses = [
         response
         async for response in model._generate_content_with_fallbacks(
-            {"input": [], "previous_response_id": "expired-id"}
+            {"input": [], "tools": tools, "previous_response_id": "expired-id"}
         )
     ]
 
     assert calls == [
-        ("openai/primary-model", "expired-id"),
-        ("openai/primary-model", None),
-        ("openai/fallback-model", None),
+        ("openai/primary-model", "expired-id", tools),
+        ("openai/primary-model", None, tools),
+        ("openai/fallback-model", None, tools),
     ]
     assert responses[0].model_version == "openai/fallback-model"
@@ -14,7 +14,16 @@
 
 from google.genai import types
 
-from veadk.models.ark_llm import _content_to_input_item
+from google.adk.models import LlmRequest
+
+from veadk.models.ark_llm import (
+    ArkLlm,
+    _content_to_input_item,
+    _contents_to_input_items,
+    _get_responses_inputs,
+    filtered_inputs,
+    request_reorganization_by_ark,
+)
 
 
 def test_model_thought_and_final_text_are_aggregated_once():
@@ -125,3 +134,127 @@ def test_model_inline_data_is_preserved_in_single_message():
             ],
         }
     ]
+
+
+def _conversation() -> list[types.Content]:
+    return [
+        types.Content(role="user", parts=[types.Part(text="question")]),
+        types.Content(
+            role="model",
+            parts=[
+                types.Part(
+                    function_call=types.FunctionCall(
+                        id="call-1", name="lookup", args={"query": "veadk"}
+                    )
+                )
+            ],
+        ),
+        types.Content(
+            role="user",
+            parts=[
+                types.Part(
+                    function_response=types.FunctionResponse(
+                        id="call-1", name="lookup", response={"result": "ok"}
+                    )
+                )
+            ],
+        ),
+        types.Content(role="user", parts=[types.Part(text="follow-up")]),
+    ]
+
+
+def _lookup_tool() -> types.Tool:
+    return types.Tool(
+        function_declarations=[
+            types.FunctionDeclaration(name="lookup", description="Look up a term")
+        ]
+    )
+
+
+def test_inputs_after_previous_response_match_filtered_full_history():
+    contents = _conversation()
+    llm_request = LlmRequest(
+        contents=contents, config=types.GenerateContentConfig(tools=[_lookup_tool()])
+    )
+
+    _, input_params, tools, _, _ = _get_responses_inputs(
+        llm_request, previous_response_id="resp-1"
+    )
+
+    assert input_params == filtered_inputs(
+        _contents_to_input_items(contents), previous_response_id="resp-1"
+    )
+    assert [item.get("type") for item in input_params] == [
+        "function_call_output",
+        "message",
+    ]
+    # Kept for the retry without an expired previous response.
+    assert [tool["name"] for tool in tools] == ["lookup"]
+
+
+def test_ark_llm_reuses_converted_tools_for_the_same_agent_tools():
+    model = ArkLlm(model="openai/test-model")
+    tools_dict = {"lookup": object()}
+
+    def _request() -> LlmRequest:
+        llm_request = LlmRequest(
+            contents=_conversation(),
+            config=types.GenerateContentConfig(tools=[_lookup_tool()]),
+        )
+        llm_request.tools_dict = tools_dict
+        return llm_request
+
+    first = _get_responses_inputs(_request(), convert_tools=model._convert_tools)[2]
+    second = _get_responses_inputs(_request(), convert_tools=model._convert_tools)[2]
+
+    assert first is second
+    assert first[0]["name"] == "lookup"
+
+
+def test_ark_llm_reconverts_tools_whose_parameters_changed():
+    model = ArkLlm(model="openai/test-model")
+    tools_dict = {"lookup": object()}
+
+    def _request(parameter: str) -> LlmRequest:
+        declaration = types.FunctionDeclaration(
+            name="lookup",
+            description="Look up a term",
+            parameters=types.Schema(
+                type=types.Type.OBJECT,
+                properties={parameter: types.Schema(type=types.Type.STRING)},
+            ),
+        )
+        llm_request = LlmRequest(
+            contents=_conversation(),
+            config=types.GenerateContentConfig(
+                tools=[types.Tool(function_declarations=[declaration])]
+            ),
+        )
+        llm_request.tools_dict = tools_dict
+        return llm_request
+
+    first = _get_responses_inputs(_request("term"), convert_tools=model._convert_tools)
+    second = _get_responses_inputs(
+        _request("query"), convert_tools=model._convert_tools
+    )
+
+    assert list(first[2][0]["parameters"]["properties"]) == ["term"]
+    assert list(second[2][0]["parameters"]["properties"]) == ["query"]
+
+
+def test_request_reorganization_does_not_mutate_its_argument():
+    extra_body = {"caching": {"type": "enabled"}}
+    inputs = [{"type": "message", "role": "user", "content": []}]
+    request_data = {
+        "model": "openai/test-model",
+        "input": inputs,
+        "instructions": "be brief",
+        "extra_body": extra_body,
+    }
+
+    request = request_reorganization_by_ark(request_data)
+
+    assert len(request["input"]) == 2
+    assert inputs == [{"type": "message", "role": "user", "content": []}]
+    assert extra_body == {"caching": {"type": "enabled"}}
+    assert request_data["model"] == "openai/test-model"
@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List
+
+import pytest
+
+pytest.importorskip("llama_index.core")
+
+from llama_index.core.base.embeddings.base import BaseEmbedding  # noqa: E402
+
+from veadk.models.ark_embedding import create_embedding_model  # noqa: E402
+from veadk.models.embedding_cache import (  # noqa: E402
+    CachedEmbedding,
+    EmbeddingCache,
+)
+
+
+class _CountingEmbedding(BaseEmbedding):
+    calls: List[List[str]] = []
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        self.calls.append([query])
+        return [0.5, float(len(query))]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._get_text_embeddings([text])[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return [[1.0, float(len(text))] for text in texts]
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._get_text_embeddings(texts)
+
+
+def test_cached_embedding_only_embeds_misses():
+    inner = _CountingEmbedding(model_name="fake", calls=[])
+    model = CachedEmbedding(inner, EmbeddingCache(max_entries=16))
+
+    first = model.get_text_embedding_batch(["a", "bb", "a"])
+    second = model.get_text_embedding_batch(["bb", "ccc"])
+
+    assert first == [[1.0, 1.0], [1.0, 2.0], [1.0, 1.0]]
+    assert second == [[1.0, 2.0], [1.0, 3.0]]
+    assert inner.calls == [["a", "bb"], ["ccc"]]
+    stats = model.cache.stats()
+    assert (stats.hits, stats.misses) == (1, 4)
+
+
+@pytest.mark.asyncio
+async def test_cached_embedding_keeps_queries_apart_from_texts():
+    inner = _CountingEmbedding(model_name="fake", calls=[])
+    model = CachedEmbedding(inner, EmbeddingCache())
+
+    await model.aget_text_embedding("hello")
+    assert await model.aget_query_embedding("hello") == [0.5, 5.0]
+    assert await model.aget_query_embedding("hello") == [0.5, 5.0]
+
+    assert inner.calls == [["hello"], ["hello"]]
+
+
+def test_embedding_cache_evicts_least_recently_used():
+    cache = EmbeddingCache(max_entries=2)
+    cache.put_many(["k1", "k2"], [[1.0], [2.0]])
+    cache.get_many(["k1"])
+    cache.put_many(["k3"], [[3.0]])
+
+    assert cache.get_many(["k1", "k2", "k3"]) == [[1.0], None, [3.0]]
+
+
+def test_embedding_cache_disk_tier_survives_new_process(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+    EmbeddingCache(path=path).put_many(["k1"], [[0.25, -1.5]])
+
+    cache = EmbeddingCache(path=path)
+
+    assert cache.get_many(["k1", "k2"]) == [[0.25, -1.5], None]
+    stats = cache.stats()
+    assert (stats.disk_hits, stats.misses) == (1, 1)
+
+
+def test_create_embedding_model_wraps_with_cache(monkeypatch):
+    monkeypatch.setenv("MODEL_EMBEDDING_API_KEY", "test-key")
+    cache = EmbeddingCache()
+
+    cached = create_embedding_model("doubao-embedding-vision-251215", cache=cache)
+    plain = create_embedding_model("doubao-embedding-vision-251215", cache=False)
+
+    assert isinstance(cached, CachedEmbedding)
+    assert cached.cache is cache
+    assert cached.embed_model.class_name() == "ArkEmbedding"
+    assert plain.class_name() == "ArkEmbedding"
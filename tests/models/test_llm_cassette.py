@@ -0,0 +1,139 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import AsyncGenerator
+
+import pytest
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from veadk.models.llm_cassette import (
+    CassetteLlm,
+    CassetteMissError,
+    maybe_wrap_with_cassette,
+    request_fingerprint,
+)
+
+
+class _ScriptedLlm(BaseLlm):
+    calls: int = 0
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.calls += 1
+        for text in (f"call {self.calls}", " done"):
+            yield LlmResponse(
+                content=types.Content(role="model", parts=[types.Part(text=text)]),
+                partial=stream,
+            )
+
+
+def _request(text: str, call_id: str = "adk-1") -> LlmRequest:
+    return LlmRequest(
+        model="openai/test-model",
+        contents=[
+            types.Content(role="user", parts=[types.Part(text=text)]),
+            types.Content(
+                role="model",
+                parts=[
+                    types.Part(
+                        function_call=types.FunctionCall(
+                            id=call_id, name="lookup", args={"q": text}
+                        )
+                    )
+                ],
+            ),
+        ],
+    )
+
+
+async def _texts(llm: BaseLlm, request: LlmRequest, stream: bool = True) -> list[str]:
+    return [
+        response.content.parts[0].text
+        async for response in llm.generate_content_async(request, stream=stream)
+    ]
+
+
+def test_fingerprint_ignores_generated_call_ids():
+    assert request_fingerprint(_request("hi", "adk-1")) == request_fingerprint(
+        _request("hi", "adk-2")
+    )
+    assert request_fingerprint(_request("hi")) != request_fingerprint(_request("hello"))
+    assert request_fingerprint(_request("hi")) != request_fingerprint(
+        _request("hi"), stream=True
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", ["turns.jsonl", "turns.jsonl.gz"])
+async def test_recorded_turns_replay_without_calling_the_model(tmp_path, name):
+    path = str(tmp_path / name)
+    inner = _ScriptedLlm(model="openai/test-model")
+    recorder = CassetteLlm(
+        model=inner.model, inner=inner, cassette_path=path, mode="record"
+    )
+    assert await _texts(recorder, _request("hi")) == ["call 1", " done"]
+    assert await _texts(recorder, _request("hi")) == ["call 2", " done"]
+
+    replayer = CassetteLlm(model=inner.model, inner=inner, cassette_path=path)
+    assert len(replayer.cassette) == 2
+    assert await _texts(replayer, _request("hi", "adk-9")) == ["call 1", " done"]
+    assert await _texts(replayer, _request("hi")) == ["call 2", " done"]
+    # Used up turns repeat the last one.
+    assert await _texts(replayer, _request("hi")) == ["call 2", " done"]
+    assert inner.calls == 2
+
+    with pytest.raises(CassetteMissError):
+        await _texts(replayer, _request("unknown"))
+
+
+@pytest.mark.asyncio
+async def test_replay_adds_synthetic_latency(tmp_path):
+    path = str(tmp_path / "turns.jsonl")
+    inner = _ScriptedLlm(model="openai/test-model")
+    recorder = CassetteLlm(
+        model=inner.model, inner=inner, cassette_path=path, mode="record"
+    )
+    await _texts(recorder, _request("hi"))
+
+    replayer = CassetteLlm(
+        model=inner.model,
+        inner=inner,
+        cassette_path=path,
+        first_chunk_latency_ms=50,
+        chunk_latency_ms=20,
+    )
+    tik = time.perf_counter()
+    await _texts(replayer, _request("hi"))
+    assert time.perf_counter() - tik >= 0.07
+
+
+def test_models_are_wrapped_only_when_configured(monkeypatch, tmp_path):
+    inner = _ScriptedLlm(model="openai/test-model")
+    assert maybe_wrap_with_cassette(inner) is inner
+
+    monkeypatch.setenv("MODEL_CASSETTE_MODE", "replay")
+    monkeypatch.setenv("MODEL_CASSETTE_PATH", str(tmp_path / "turns.jsonl"))
+    monkeypatch.setenv("MODEL_CASSETTE_FIRST_CHUNK_LATENCY_MS", "5")
+    wrapped = maybe_wrap_with_cassette(inner)
+
+    assert isinstance(wrapped, CassetteLlm)
+    assert (wrapped.inner, wrapped.mode) == (inner, "replay")
+    assert wrapped.first_chunk_latency_ms == 5
+    assert maybe_wrap_with_cassette(wrapped) is wrapped
+    assert maybe_wrap_with_cassette("openai/test-model") == "openai/test-model"
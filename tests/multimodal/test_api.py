@@ -19,10 +19,29 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from veadk.multimodal.api import mount_media_routes
+from veadk.multimodal.models import MediaRef
 from veadk.multimodal.service import MediaService
 from veadk.multimodal.storage import LocalMediaStorage
 
 
+class _StreamOnlyStorage(LocalMediaStorage):
+    """A backend with neither a local file nor a signed URL to hand out."""
+
+    def local_path(self, ref: MediaRef) -> Path | None:
+        del ref
+        return None
+
+
+def _upload(client: TestClient, data: bytes) -> str:
+    response = client.post(
+        "/web/media",
+        data={"app_name": "demo", "user_id": "user", "session_id": "session"},
+        files={"file": ("notes.txt", data, "text/plain")},
+    )
+    assert response.status_code == 200
+    return f"/web/media/demo/user/session/{response.json()['id']}/content"
+
+
 def test_upload_download_and_session_cleanup(tmp_path: Path) -> None:
     app = FastAPI()
     mount_media_routes(app, MediaService(LocalMediaStorage(tmp_path)))
@@ -75,3 +94,40 @@ def test_upload_rejects_unsupported_file(tmp_path: Path) -> None:
 
     assert response.status_code == 400
     assert "Unsupported media type" in response.json()["detail"]
+
+
+def test_local_content_serves_byte_ranges(tmp_path: Path) -> None:
+    app = FastAPI()
+    mount_media_routes(app, MediaService(LocalMediaStorage(tmp_path)))
+    client = TestClient(app)
+    content_path = _upload(client, b"0123456789")
+
+    response = client.get(content_path, headers={"Range": "bytes=2-5"})
+
+    assert response.status_code == 206
+    assert response.content == b"2345"
+    assert response.headers["content-range"] == "bytes 2-5/10"
+
+
+def test_content_streams_when_backend_has_no_file_or_url(tmp_path: Path) -> None:
+    app = FastAPI()
+    mount_media_routes(app, MediaService(_StreamOnlyStorage(tmp_path)))
+    client = TestClient(app)
+    content_path = _upload(client, b"0123456789")
+
+    full = client.get(content_path)
+    assert full.status_code == 200
+    assert full.content == b"0123456789"
+    assert full.headers["accept-ranges"] == "bytes"
+
+    tail = client.get(content_path, headers={"Range": "bytes=-3"})
+    assert tail.status_code == 206
+    assert tail.content == b"789"
+    assert tail.headers["content-range"] == "bytes 7-9/10"
+
+    middle = client.get(content_path, headers={"Range": "bytes=4-"})
+    assert (middle.status_code, middle.content) == (206, b"456789")
+
+    unsatisfiable = client.get(content_path, headers={"Range": "bytes=10-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == "bytes */10"
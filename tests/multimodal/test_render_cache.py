@@ -0,0 +1,214 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the rendered media cache."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+from pathlib import Path
+
+import pypdfium2 as pdfium
+import pytest
+
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+
+from veadk.multimodal.models import MediaRecord
+from veadk.multimodal.models import MediaRef
+from veadk.multimodal.plugin import MultimodalMediaPlugin
+from veadk.multimodal.render_cache import MediaRenderCache
+from veadk.multimodal.storage import LocalMediaStorage
+from veadk.utils.pdf_to_images import render_pdf_to_png_parts
+
+
+def _record(media_id: str, sha256: str, mime_type: str) -> MediaRecord:
+    return MediaRecord.create(
+        ref=MediaRef("demo", "user", "session", media_id),
+        file_name=media_id,
+        mime_type=mime_type,
+        size_bytes=9,
+        sha256=sha256,
+        origin="user",
+    )
+
+
+class _CountingStorage(LocalMediaStorage):
+    def __init__(self, root_dir: Path) -> None:
+        super().__init__(root_dir)
+        self.reads = 0
+
+    async def read_bytes(self, ref: MediaRef) -> bytes:
+        self.reads += 1
+        return await super().read_bytes(ref)
+
+
+@pytest.mark.asyncio
+async def test_agent_loop_renders_each_pdf_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = _CountingStorage(tmp_path)
+    record = _record("guide.pdf", "pdf-hash", "application/pdf")
+    await storage.save_bytes(record, b"pdf-bytes")
+    renders: list[bytes] = []
+
+    def _render(data: bytes, max_pages: int, scale: float) -> list[types.Part]:
+        renders.append(data)
+        return [types.Part.from_bytes(data=b"page-1", mime_type="image/png")]
+
+    monkeypatch.setattr("veadk.multimodal.plugin.render_pdf_to_png_parts", _render)
+    plugin = MultimodalMediaPlugin(storage=storage)
+
+    for _ in range(10):
+        request = LlmRequest(
+            contents=[
+                types.Content(
+                    role="user",
+                    parts=[
+                        types.Part.from_uri(
+                            file_uri=record.ref.uri, mime_type="application/pdf"
+                        )
+                    ],
+                )
+            ]
+        )
+        await plugin.before_model_callback(callback_context=None, llm_request=request)  # type: ignore[arg-type]
+        assert request.contents[0].parts == [
+            types.Part.from_bytes(data=b"page-1", mime_type="image/png")
+        ]
+
+    assert renders == [b"pdf-bytes"]
+    assert storage.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_render() -> None:
+    cache = MediaRenderCache()
+    record = _record("guide.pdf", "pdf-hash", "application/pdf")
+    loads = 0
+
+    async def _load() -> bytes:
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return b"pdf-bytes"
+
+    def _render(data: bytes) -> list[types.Part]:
+        return [types.Part.from_bytes(data=data, mime_type="image/png")]
+
+    results = await asyncio.gather(
+        *(
+            cache.pdf_pages(record, _load, _render, max_pages=10, scale=2.0)
+            for _ in range(5)
+        )
+    )
+
+    assert loads == 1
+    assert all(parts[0].inline_data.data == b"pdf-bytes" for parts in results)
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_least_recently_used_bytes() -> None:
+    cache = MediaRenderCache(max_bytes=10)
+
+    async def _text(record: MediaRecord, data: bytes) -> str:
+        async def _load() -> bytes:
+            return data
+
+        return await cache.text(record, _load)
+
+    first = _record("a.txt", "a", "text/plain")
+    second = _record("b.txt", "b", "text/plain")
+    third = _record("c.txt", "c", "text/plain")
+    await _text(first, b"aaaa")
+    await _text(second, b"bbbb")
+    await _text(first, b"aaaa")
+    await _text(third, b"cccc")
+
+    assert cache.size_bytes == 8
+    assert await _text(first, b"changed") == "aaaa"
+    assert await _text(second, b"changed") == "changed"
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_a_new_cache(tmp_path: Path) -> None:
+    document = pdfium.PdfDocument.new()
+    for _ in range(3):
+        document.new_page(100, 100)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    record = _record("report.pdf", "report-hash", "application/pdf")
+
+    async def _load() -> bytes:
+        return buffer.getvalue()
+
+    def _render(data: bytes) -> list[types.Part]:
+        return render_pdf_to_png_parts(data, 10, 1.0)
+
+    first = await MediaRenderCache(disk_dir=tmp_path).pdf_pages(
+        record, _load, _render, max_pages=10, scale=1.0
+    )
+
+    def _fail(data: bytes) -> list[types.Part]:
+        raise AssertionError("pages should come from disk")
+
+    cache = MediaRenderCache(disk_dir=tmp_path)
+    second = await cache.pdf_pages(record, _load, _fail, max_pages=10, scale=1.0)
+
+    assert len(first) == 3
+    assert second == first
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_other_waiters() -> None:
+    cache = MediaRenderCache()
+    record = _record("notes.txt", "notes-hash", "text/plain")
+    release = asyncio.Event()
+
+    async def _load() -> bytes:
+        await release.wait()
+        return b"notes"
+
+    leader = asyncio.create_task(cache.text(record, _load))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.text(record, _load))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await waiter == "notes"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_is_bounded_and_purged_with_the_media(tmp_path: Path) -> None:
+    storage = LocalMediaStorage(tmp_path)
+    cache = MediaRenderCache(disk_dir=storage.render_cache_dir, max_disk_bytes=8)
+    records = []
+    for name in "abc":
+        data = name.encode() * 4
+        record = _record(f"{name}.txt", hashlib.sha256(data).hexdigest(), "text/plain")
+        await storage.save_bytes(record, data)
+        await cache.text(record, lambda: storage.read_bytes(record.ref))
+        records.append(record)
+
+    cached = sorted(path.name for path in storage.render_cache_dir.rglob("*.txt"))
+    assert cached == ["text.txt", "text.txt"]
+
+    for record in records:
+        await storage.delete(record.ref)
+    assert list(storage.render_cache_dir.rglob("*.txt")) == []
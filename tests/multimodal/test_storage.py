@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from types import SimpleNamespace
 import sys
@@ -81,6 +82,24 @@ async def test_local_storage_persists_and_deletes_session(tmp_path: Path) -> Non
     assert await storage.get_record(ref) is None
 
 
+@pytest.mark.asyncio
+async def test_local_storage_streams_byte_ranges(tmp_path: Path) -> None:
+    storage = LocalMediaStorage(tmp_path)
+    ref = MediaRef("demo", "user", "session", "media-id")
+    await storage.save_bytes(_record(ref, size_bytes=10), b"0123456789")
+
+    async def _read(**kwargs: Any) -> list[bytes]:
+        return [chunk async for chunk in storage.iter_bytes(ref, **kwargs)]
+
+    assert await _read(chunk_size=4) == [b"0123", b"4567", b"89"]
+    assert await _read(start=3, end=8, chunk_size=4) == [b"3456", b"7"]
+    assert await _read(start=8) == [b"89"]
+    assert await _read(start=5, end=5) == []
+    missing = MediaRef("demo", "user", "session", "missing")
+    with pytest.raises(FileNotFoundError):
+        await anext(storage.iter_bytes(missing))
+
+
 @pytest.mark.asyncio
 async def test_tos_storage_isolates_users_by_prefix(
     monkeypatch: pytest.MonkeyPatch,
@@ -175,10 +194,22 @@ class _FakeTosClient:
         data = content.read() if hasattr(content, "read") else content
         self.objects[key] = bytes(data)
 
-    def get_object(self, *, key: str, **_: object) -> SimpleNamespace:
+    def get_object(
+        self, *, key: str, range: str | None = None, **_: object
+    ) -> SimpleNamespace:
         if key not in self.objects:
             raise _FakeTosServerError(404)
-        return SimpleNamespace(read=lambda: self.objects[key])
+        data = self.objects[key]
+        if range is not None:
+            first, last = range.removeprefix("bytes=").split("-")
+            data = data[int(first) : int(last) + 1 if last else None]
+        content = io.BytesIO(data)
+        return SimpleNamespace(read=content.read, content=content)
+
+    def head_object(self, *, key: str, **_: object) -> SimpleNamespace:
+        if key not in self.objects:
+            raise _FakeTosServerError(404)
+        return SimpleNamespace()
 
     def pre_signed_url(self, _: object, *, key: str, **__: object) -> SimpleNamespace:
         return SimpleNamespace(signed_url=f"https://tos.example/{key}?signed=1")
@@ -186,10 +217,12 @@ class _FakeTosClient:
     def delete_object(self, *, key: str, **_: object) -> None:
         self.objects.pop(key, None)
 
-    def list_objects_type2(self, *, prefix: str, **_: object) -> SimpleNamespace:
+    def list_objects_type2(
+        self, *, prefix: str, max_keys: int = 1000, **_: object
+    ) -> SimpleNamespace:
         contents = [
             SimpleNamespace(key=key) for key in self.objects if key.startswith(prefix)
-        ]
+        ][:max_keys]
         return SimpleNamespace(
             contents=contents,
             is_truncated=False,
@@ -214,6 +247,7 @@ async def test_tos_storage_persists_signs_and_deletes(
         endpoint="tos.example",
         access_key="ak",
         secret_key="sk",
+        blob_grace_seconds=0,
     )
     ref = MediaRef("demo", "user", "session", "media-id")
     record = _record(ref)
@@ -221,12 +255,18 @@ async def test_tos_storage_persists_signs_and_deletes(
     await storage.save_bytes(record, b"hello")
 
     object_prefix = "veadk-media/users/user/apps/demo/sessions/session/media/media-id"
+    blob_prefix = f"veadk-media/users/user/apps/demo/blobs/{record.sha256}"
     assert set(_FakeTosClient.objects) == {
-        f"{object_prefix}/content",
         f"{object_prefix}/metadata.json",
+        f"{blob_prefix}/content",
+        f"{blob_prefix}/refs/{storage_module._scope_token(ref.uri)}",
     }
     assert await storage.get_record(ref) == record
     assert await storage.read_bytes(ref) == b"hello"
+    assert [chunk async for chunk in storage.iter_bytes(ref, 1, 4, chunk_size=2)] == [
+        b"el",
+        b"l",
+    ]
     signed_url = await storage.signed_url(ref)
     assert signed_url is not None
     assert signed_url.startswith("https://tos.example/")
@@ -237,3 +277,106 @@ async def test_tos_storage_persists_signs_and_deletes(
     await storage.save_bytes(record, b"hello")
     await storage.delete_session("demo", "user", "session")
     assert await storage.get_record(ref) is None
+    assert _FakeTosClient.objects == {}
+
+
+@pytest.mark.asyncio
+async def test_local_storage_shares_blobs_until_last_reference(
+    tmp_path: Path,
+) -> None:
+    storage = LocalMediaStorage(tmp_path)
+    first = MediaRef("demo", "user", "session-1", "first")
+    second = MediaRef("demo", "user", "session-2", "second")
+    await storage.save_bytes(_record(first), b"hello")
+    await storage.save_bytes(_record(second), b"hello")
+
+    blobs = list((tmp_path / "apps").rglob("blobs/*/*"))
+    assert len(blobs) == 1
+    assert blobs[0].stat().st_nlink == 3
+
+    await storage.delete_session("demo", "user", "session-1")
+    assert await storage.read_bytes(second) == b"hello"
+    assert blobs[0].is_file()
+
+    await storage.delete(second)
+    assert not blobs[0].exists()
+
+
+@pytest.mark.asyncio
+async def test_tos_storage_uploads_each_blob_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _FakeTosClient.objects = {}
+    uploads: list[str] = []
+
+    class _CountingClient(_FakeTosClient):
+        def put_object(self, *, key: str, content: Any, **kwargs: object) -> None:
+            if key.endswith("/content"):
+                uploads.append(key)
+            super().put_object(key=key, content=content, **kwargs)
+
+    fake_tos = SimpleNamespace(
+        TosClientV2=_CountingClient,
+        HttpMethodType=SimpleNamespace(Http_Method_Get="GET"),
+        exceptions=SimpleNamespace(TosServerError=_FakeTosServerError),
+    )
+    monkeypatch.setitem(sys.modules, "tos", fake_tos)
+    storage = TosMediaStorage(
+        bucket="bucket",
+        region="cn-beijing",
+        endpoint="tos.example",
+        access_key="ak",
+        secret_key="sk",
+        blob_grace_seconds=0,
+    )
+    first = MediaRef("demo", "user", "session-1", "first")
+    second = MediaRef("demo", "user", "session-2", "second")
+    await storage.save_bytes(_record(first), b"hello")
+    await storage.save_bytes(_record(second), b"hello")
+
+    assert len(uploads) == 1
+    await storage.delete_session("demo", "user", "session-1")
+    assert await storage.read_bytes(second) == b"hello"
+
+    await storage.delete_session("demo", "user", "session-2")
+    assert _FakeTosClient.objects == {}
+
+
+@pytest.mark.asyncio
+async def test_tos_storage_keeps_released_blob_for_a_racing_save(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _FakeTosClient.objects = {}
+    fake_tos = SimpleNamespace(
+        TosClientV2=_FakeTosClient,
+        HttpMethodType=SimpleNamespace(Http_Method_Get="GET"),
+        exceptions=SimpleNamespace(TosServerError=_FakeTosServerError),
+    )
+    monkeypatch.setitem(sys.modules, "tos", fake_tos)
+    storage = TosMediaStorage(
+        bucket="bucket",
+        region="cn-beijing",
+        endpoint="tos.example",
+        access_key="ak",
+        secret_key="sk",
+    )
+    first = MediaRef("demo", "user", "session-1", "first")
+    second = MediaRef("demo", "user", "session-2", "second")
+    record = _record(first)
+    blob_key = f"veadk-media/users/user/apps/demo/blobs/{record.sha256}/content"
+    pending_key = f"veadk-media/users/user/apps/demo/blob-gc/{record.sha256}"
+
+    await storage.save_bytes(record, b"hello")
+    await storage.delete(first)
+    # The last reference is gone, but the blob waits out the grace period.
+    assert blob_key in _FakeTosClient.objects
+    assert pending_key in _FakeTosClient.objects
+
+    await storage.save_bytes(_record(second), b"hello")
+    assert pending_key not in _FakeTosClient.objects
+
+    # An overdue collection still sees the new reference.
+    _FakeTosClient.objects[pending_key] = b"0"
+    storage._collect_blobs(second)
+    assert await storage.read_bytes(second) == b"hello"
+    assert pending_key not in _FakeTosClient.objects
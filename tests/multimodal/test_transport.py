@@ -24,6 +24,7 @@ import pytest
 
 from veadk.multimodal.service import MediaService
 from veadk.multimodal.storage import LocalMediaStorage
+from veadk.multimodal.transport import _stream_base64
 from veadk.multimodal.transport import resolve_runtime_media
 
 
@@ -141,3 +142,15 @@ async def test_media_reference_must_match_request_scope(tmp_path) -> None:
 
     with pytest.raises(ValueError, match="does not belong"):
         await resolve_runtime_media(payload, service)
+
+
+@pytest.mark.asyncio
+async def test_stream_base64_matches_whole_object_encoding() -> None:
+    data = bytes(range(256)) * 10
+
+    async def _chunks():
+        cuts = [0, 1, 3, 7, 14, 1000, len(data)]
+        for start, end in zip(cuts, cuts[1:]):
+            yield data[start:end]
+
+    assert await _stream_base64(_chunks()) == base64.b64encode(data).decode()
@@ -0,0 +1,125 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from veadk.skills import watcher as watcher_module
+from veadk.skills.check_skills_callback import check_skills
+from veadk.skills.skill import Skill
+from veadk.skills.watcher import (
+    SkillChangeWatcher,
+    get_skill_watcher,
+    stop_skill_watchers,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_background_polling(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SKILLS_LOCAL_POLL_INTERVAL", "3600")
+    monkeypatch.setenv("SKILLS_CLOUD_POLL_INTERVAL", "3600")
+    yield
+    stop_skill_watchers()
+
+
+def _write_skill(root: Path, name: str, description: str) -> None:
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\nBody.\n",
+        encoding="utf-8",
+    )
+
+
+def test_local_changes_bump_generation_only_when_skill_files_change(
+    tmp_path: Path,
+):
+    _write_skill(tmp_path, "alpha", "First.")
+    watcher = SkillChangeWatcher([str(tmp_path)])
+
+    generation, skills = watcher.snapshot()
+    assert generation == 1
+    assert skills["alpha"].description == "First."
+    assert watcher.poll() is False
+
+    _write_skill(tmp_path, "alpha", "First, edited.")
+    _write_skill(tmp_path, "beta", "Second.")
+    assert watcher.poll() is True
+
+    generation, skills = watcher.snapshot()
+    assert generation == 2
+    assert skills["alpha"].description == "First, edited."
+    assert sorted(skills) == ["alpha", "beta"]
+
+
+def test_cloud_spaces_are_polled_once_per_ttl(monkeypatch: pytest.MonkeyPatch):
+    listings = [
+        [Skill(name="remote", description="v1", path="p", skill_space_id="sp-1")],
+        [Skill(name="remote", description="v1", path="p", skill_space_id="sp-1")],
+        [Skill(name="remote", description="v2", path="p", skill_space_id="sp-1")],
+    ]
+    calls: list[str] = []
+
+    def load_skills_from_cloud(item: str) -> list[Skill]:
+        calls.append(item)
+        return listings[len(calls) - 1]
+
+    monkeypatch.setattr(
+        watcher_module, "load_skills_from_cloud", load_skills_from_cloud
+    )
+    watcher = SkillChangeWatcher(["sp-1"], cloud_poll_interval=3600)
+    assert watcher.poll() is False
+    assert calls == ["sp-1"]
+
+    # An unchanged listing revision does not publish a new generation.
+    watcher._next_cloud_poll["sp-1"] = 0.0
+    assert watcher.poll() is False
+    assert watcher.generation == 1
+
+    watcher._next_cloud_poll["sp-1"] = 0.0
+    assert watcher.poll() is True
+    assert watcher.snapshot() == (
+        2,
+        {"remote": listings[2][0]},
+    )
+
+
+def test_check_skills_applies_new_generation_to_agent(tmp_path: Path):
+    _write_skill(tmp_path, "alpha", "First.")
+    agent = SimpleNamespace(
+        skills=[str(tmp_path)],
+        skills_dict={},
+        skills_mode="local",
+        instruction="Be helpful.\nYou have the following skills:\n",
+        tools=[],
+    )
+    context = SimpleNamespace(_invocation_context=SimpleNamespace(agent=agent))
+
+    check_skills(context)
+    assert sorted(agent.skills_dict) == ["alpha"]
+    assert agent._skills_generation == 1
+
+    _write_skill(tmp_path, "beta", "Second.")
+    check_skills(context)
+    # Nothing changes until the watcher publishes the next generation.
+    assert sorted(agent.skills_dict) == ["alpha"]
+
+    get_skill_watcher(agent.skills).poll()
+    check_skills(context)
+    assert sorted(agent.skills_dict) == ["alpha", "beta"]
+    assert "- name: beta" in agent.instruction
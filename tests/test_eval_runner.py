@@ -0,0 +1,153 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+import pytest
+
+from veadk.evaluation.base_evaluator import EvalTestCase, Invocation
+from veadk.evaluation.eval_runner import (
+    ParallelEvalRunner,
+    TokenBucket,
+    percentile,
+)
+
+
+def _cases(count: int, turns: int = 2) -> list[EvalTestCase]:
+    return [
+        EvalTestCase(
+            invocations=[
+                Invocation(
+                    invocation_id=f"{case}-{turn}",
+                    input=f"case {case} turn {turn}",
+                    actual_output="",
+                    expected_output="",
+                )
+                for turn in range(turns)
+            ]
+        )
+        for case in range(count)
+    ]
+
+
+def _infos(count: int) -> list[dict]:
+    return [
+        {"app_name": "app", "user_id": "user", "session_id": f"s{i}"}
+        for i in range(count)
+    ]
+
+
+def test_cases_run_concurrently_with_invocations_in_order():
+    in_flight = 0
+    peak = 0
+
+    async def run_case(case, info, limiter):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        for invocation in case.invocations:
+            await asyncio.sleep(0.02)
+            invocation.actual_output = f"{info['session_id']}:{invocation.input}"
+        in_flight -= 1
+
+    cases = _cases(8)
+    runner = ParallelEvalRunner(max_concurrency=3)
+    stats = asyncio.run(runner.run(cases, _infos(8), run_case))
+
+    assert peak == 3
+    assert stats.completed == 8
+    assert sorted(stats.case_latencies_ms) == list(range(8))
+    assert cases[5].invocations[1].actual_output == "s5:case 5 turn 1"
+
+
+def test_token_bucket_bounds_invocation_rate():
+    async def main():
+        bucket = TokenBucket(rate=50, burst=1)
+        tik = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - tik
+
+    # One token up front, the other five at 50 per second.
+    assert asyncio.run(main()) >= 0.09
+
+
+def test_checkpoint_restores_finished_cases(tmp_path):
+    checkpoint_path = str(tmp_path / "eval.jsonl")
+    calls: list[str] = []
+
+    async def flaky(case, info, limiter):
+        calls.append(info["session_id"])
+        if info["session_id"] == "s2":
+            raise RuntimeError("quota exceeded")
+        for invocation in case.invocations:
+            invocation.actual_output = "answer"
+            invocation.latency = "1.0"
+
+    runner = ParallelEvalRunner(max_concurrency=2, checkpoint_path=checkpoint_path)
+    with pytest.raises(RuntimeError, match="quota exceeded"):
+        asyncio.run(runner.run(_cases(4), _infos(4), flaky))
+    assert sorted(calls) == ["s0", "s1", "s2", "s3"]
+
+    calls.clear()
+
+    async def healthy(case, info, limiter):
+        calls.append(info["session_id"])
+        for invocation in case.invocations:
+            invocation.actual_output = "retried"
+
+    cases = _cases(4)
+    stats = asyncio.run(runner.run(cases, _infos(4), healthy))
+
+    assert calls == ["s2"]
+    assert (stats.restored, stats.completed) == (3, 1)
+    assert cases[0].invocations[0].actual_output == "answer"
+    assert cases[2].invocations[0].actual_output == "retried"
+
+    # A different pass of the same cases is not restored.
+    calls.clear()
+    asyncio.run(runner.run(_cases(4), _infos(4), healthy, run_index=1))
+    assert len(calls) == 4
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 90) == 0.0
+
+
+def test_checkpoint_is_not_restored_for_a_changed_agent(tmp_path):
+    from types import SimpleNamespace
+
+    from veadk.evaluation.eval_runner import agent_fingerprint
+
+    checkpoint_path = str(tmp_path / "eval.jsonl")
+    calls: list[str] = []
+
+    async def run_case(case, info, limiter):
+        calls.append(info["session_id"])
+
+    old = SimpleNamespace(name="a", model="model-v1", instruction="be brief")
+    new = SimpleNamespace(name="a", model="model-v2", instruction="be brief")
+    runner = ParallelEvalRunner(checkpoint_path=checkpoint_path)
+    asyncio.run(
+        runner.run(_cases(2), _infos(2), run_case, fingerprint=agent_fingerprint(old))
+    )
+    asyncio.run(
+        runner.run(_cases(2), _infos(2), run_case, fingerprint=agent_fingerprint(new))
+    )
+
+    assert len(calls) == 4
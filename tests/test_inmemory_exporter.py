@@ -0,0 +1,73 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import SpanContext
+
+from veadk.tracing.telemetry.exporters import inmemory_exporter
+from veadk.tracing.telemetry.exporters.inmemory_exporter import _InMemoryExporter
+
+
+def _span(name: str, trace_id: int, span_id: int, session_id: str = ""):
+    attributes = {"gen_ai.session.id": session_id} if session_id else {}
+    return ReadableSpan(
+        name=name,
+        context=SpanContext(trace_id=trace_id, span_id=span_id, is_remote=False),
+        attributes=attributes,
+    )
+
+
+def test_spans_are_indexed_by_session():
+    exporter = _InMemoryExporter(max_traces=10, ttl=0)
+    exporter.export([_span("execute_tool", 1, 1)])
+    exporter.export([_span("call_llm", 1, 2, session_id="s1")])
+    exporter.export([_span("call_llm", 2, 3, session_id="s2")])
+    exporter.export([_span("invocation", 1, 4)])
+
+    assert [span.context.span_id for span in exporter.get_finished_spans("s1")] == [
+        1,
+        2,
+        4,
+    ]
+    assert exporter.session_trace_dict == {"s1": [1], "s2": [2]}
+    assert exporter.get_finished_spans("missing") == []
+
+    exporter.clear()
+    assert exporter.get_finished_spans("s1") == []
+    assert exporter.session_trace_dict == {}
+
+
+def test_least_recently_updated_traces_are_evicted():
+    exporter = _InMemoryExporter(max_traces=2, max_spans_per_trace=2, ttl=0)
+    exporter.export([_span("call_llm", 1, 1, session_id="s1")])
+    exporter.export([_span("call_llm", 2, 2, session_id="s2")])
+    exporter.export([_span("call_llm", 1, 3, session_id="s1")])
+    exporter.export([_span("call_llm", 1, 4, session_id="s1")])
+    exporter.export([_span("call_llm", 3, 5, session_id="s3")])
+
+    assert exporter.get_finished_spans("s2") == []
+    assert len(exporter.get_finished_spans("s1")) == 2
+    assert (exporter.evicted_traces, exporter.dropped_spans) == (1, 1)
+
+
+def test_idle_traces_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(inmemory_exporter.time, "monotonic", lambda: now[0])
+    exporter = _InMemoryExporter(ttl=60)
+    exporter.export([_span("call_llm", 1, 1, session_id="s1")])
+
+    now[0] += 61
+
+    assert exporter.get_finished_spans("s1") == []
+    assert exporter.evicted_traces == 1
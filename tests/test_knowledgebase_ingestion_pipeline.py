@@ -0,0 +1,109 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("llama_index.core")
+
+from llama_index.core import Document  # noqa: E402
+
+from veadk.knowledgebase.backends.ingestion_pipeline import (  # noqa: E402
+    iter_file_node_batches,
+    iter_node_batches,
+)
+from veadk.knowledgebase.backends.utils import get_llama_index_splitter  # noqa: E402
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_iter_node_batches_keeps_order_and_bounds_batches(max_workers):
+    groups = [[Document(text=f"document number {i}")] for i in range(7)]
+
+    batches = list(iter_node_batches(groups, batch_size=3, max_workers=max_workers))
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    texts = [node.text for batch in batches for node in batch]
+    assert texts == [f"document number {i}" for i in range(7)]
+
+
+def test_iter_file_node_batches_tags_nodes_with_file_path(tmp_path):
+    files = []
+    for name in ["a.md", "b.txt"]:
+        path = tmp_path / name
+        path.write_text(f"# {name}\n\ncontent of {name}")
+        files.append(str(path))
+
+    nodes = [node for batch in iter_file_node_batches(files) for node in batch]
+
+    assert {node.metadata["file_path"] for node in nodes} == set(files)
+
+
+def test_splitters_are_reused_per_file_type():
+    assert get_llama_index_splitter("a.md") is get_llama_index_splitter("b.md")
+    assert get_llama_index_splitter("a.txt") is not get_llama_index_splitter("a.md")
+
+
+def test_split_pools_are_reused_per_file_type_and_opt_in(monkeypatch):
+    from veadk.knowledgebase.backends import ingestion_pipeline
+
+    monkeypatch.delenv("VEADK_KB_SPLIT_WORKERS", raising=False)
+    assert ingestion_pipeline.split_workers() == 1
+    monkeypatch.setenv("VEADK_KB_SPLIT_WORKERS", "3")
+    assert ingestion_pipeline.split_workers() == 3
+    monkeypatch.setenv("VEADK_KB_SPLIT_WORKERS", "many")
+    assert (
+        ingestion_pipeline.split_workers() == ingestion_pipeline.DEFAULT_SPLIT_WORKERS
+    )
+
+    pool = ingestion_pipeline._split_pool("markdown", 2)
+    assert ingestion_pipeline._split_pool("markdown", 2) is pool
+    assert ingestion_pipeline._split_pool("sentence", 2) is not pool
+    assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+
+
+def test_unguarded_script_falls_back_to_in_process_splitting(tmp_path):
+    files = []
+    for name in ["a.txt", "b.txt"]:
+        (tmp_path / name).write_text(f"content of {name}")
+        files.append(str(tmp_path / name))
+    # Ingests at module top level, so every spawned worker dies on import.
+    script = tmp_path / "ingest.py"
+    script.write_text(
+        "from veadk.knowledgebase.backends.ingestion_pipeline import (\n"
+        "    iter_file_node_batches,\n"
+        ")\n"
+        f"batches = iter_file_node_batches({files!r})\n"
+        "print(sorted(node.text for batch in batches for node in batch))\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, str(script)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={
+            **os.environ,
+            "PYTHONPATH": str(Path(__file__).resolve().parents[1]),
+            "VEADK_KB_SPLIT_WORKERS": "2",
+        },
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == str(
+        ["content of a.txt", "content of b.txt"]
+    )
@@ -0,0 +1,221 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from typing import List
+
+import pytest
+
+pytest.importorskip("llama_index.core")
+
+from llama_index.core.base.embeddings.base import BaseEmbedding  # noqa: E402
+
+from veadk.knowledgebase.backends import in_memory_backend  # noqa: E402
+from veadk.knowledgebase.backends.in_memory_backend import (  # noqa: E402
+    InMemoryKnowledgeBackend,
+)
+from veadk.knowledgebase.backends.local_vector_store import (  # noqa: E402
+    LocalVectorStore,
+)
+
+
+def _letters(text: str) -> List[float]:
+    vector = [0.0] * 26
+    for char in text.lower():
+        if "a" <= char <= "z":
+            vector[ord(char) - ord("a")] += 1.0
+    return vector
+
+
+class _LetterEmbedding(BaseEmbedding):
+    calls: int = 0
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return _letters(query)
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return _letters(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        self.calls += 1
+        return _letters(text)
+
+
+@pytest.fixture
+def letter_embedding(monkeypatch):
+    monkeypatch.setenv("MODEL_EMBEDDING_API_KEY", "mocked_api_key")
+    model = _LetterEmbedding(model_name="letters")
+    monkeypatch.setattr(
+        in_memory_backend, "create_embedding_model", lambda **kwargs: model
+    )
+    return model
+
+
+def test_local_vector_store_top_k_and_delete(tmp_path):
+    store = LocalVectorStore(str(tmp_path / "kb"))
+    store.add(
+        ids=["1", "2", "3"],
+        texts=["apple", "banana", "cherry"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]],
+        ref_doc_ids=["doc-a", "doc-b", "doc-a"],
+    )
+
+    assert [text for text, _ in store.search([1.0, 0.1], top_k=2)] == [
+        "apple",
+        "cherry",
+    ]
+    assert store.delete(["doc-a"]) == 2
+    assert [text for text, _ in store.search([1.0, 0.1], top_k=2)] == ["banana"]
+    assert store.count == 1
+
+
+def test_local_vector_store_is_shared_across_instances(tmp_path):
+    path = str(tmp_path / "kb")
+    reader = LocalVectorStore(path)
+    writer = LocalVectorStore(path)
+
+    writer.add(ids=["1"], texts=["apple"], embeddings=[[1.0, 0.0]])
+
+    assert reader.search([1.0, 0.0], top_k=5)[0][0] == "apple"
+    with pytest.raises(ValueError):
+        writer.add(ids=["2"], texts=["pear"], embeddings=[[1.0, 0.0, 0.0]])
+
+
+def test_local_vector_store_compacts_deleted_rows(tmp_path):
+    path = str(tmp_path / "kb")
+    store = LocalVectorStore(path, compact_ratio=0.5, compact_min_rows=2)
+    reader = LocalVectorStore(path)
+    store.add(
+        ids=["1", "2", "3", "4"],
+        texts=["apple", "banana", "cherry", "date"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0], [0.7, 0.7], [0.9, 0.1]],
+        ref_doc_ids=["doc-a", "doc-b", "doc-c", "doc-d"],
+    )
+    assert reader.count == 4
+
+    assert store.delete(["doc-a"]) == 1
+    assert not (tmp_path / "kb" / "vectors.1.f32").exists()
+    assert store.delete(["doc-c"]) == 1
+
+    assert sorted(os.listdir(path)) == [
+        ".lock",
+        "chunks.1.jsonl",
+        "meta.json",
+        "offsets.1.u64",
+        "vectors.1.f32",
+    ]
+    assert (tmp_path / "kb" / "vectors.1.f32").stat().st_size == 2 * 2 * 4
+    for current in (store, reader, LocalVectorStore(path)):
+        assert [text for text, _ in current.search([1.0, 0.0], top_k=4)] == [
+            "date",
+            "banana",
+        ]
+    assert store.delete(["doc-d"]) == 1
+    store.add(
+        ids=["5"], texts=["elder"], embeddings=[[1.0, 0.0]], ref_doc_ids=["doc-e"]
+    )
+    assert [text for text, _ in reader.search([1.0, 0.0], top_k=4)] == [
+        "elder",
+        "banana",
+    ]
+    assert reader.delete(["doc-e"]) == 1
+    assert store.count == 1
+
+
+def test_in_memory_backend_persists_across_restarts(tmp_path, letter_embedding):
+    backend = InMemoryKnowledgeBackend(index="kb_test", persist_dir=str(tmp_path))
+    backend.add_from_text(["zzz zzz", "aaa bbb"])
+    embedded = letter_embedding.calls
+
+    restarted = InMemoryKnowledgeBackend(index="kb_test", persist_dir=str(tmp_path))
+
+    assert restarted.search("ab", top_k=1) == ["aaa bbb"]
+    assert letter_embedding.calls == embedded
+    assert (tmp_path / "kb_test" / "vectors.f32").exists()
+
+
+@pytest.mark.parametrize("persist", [False, True])
+def test_add_from_directory_only_reingests_changed_files(
+    tmp_path, letter_embedding, persist
+):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("aaaa aaaa")
+    (docs / "b.txt").write_text("bbbb bbbb")
+    (docs / "c.txt").write_text("cccc cccc")
+    kwargs = {"persist_dir": str(tmp_path / "index")} if persist else {}
+    backend = InMemoryKnowledgeBackend(index="kb_sync", **kwargs)
+
+    backend.add_from_directory(str(docs))
+    assert len(backend.last_ingestion_diff.added) == 3
+
+    (docs / "b.txt").write_text("zzzz zzzz")
+    (docs / "c.txt").unlink()
+    if persist:
+        backend = InMemoryKnowledgeBackend(index="kb_sync", **kwargs)
+    calls = letter_embedding.calls
+    backend.add_from_directory(str(docs))
+
+    diff = backend.last_ingestion_diff
+    assert (len(diff.added), len(diff.changed), len(diff.removed)) == (0, 1, 1)
+    assert len(diff.unchanged) == 1
+    assert letter_embedding.calls - calls == diff.inserted_chunks == 1
+    results = backend.search("abcz", top_k=5)
+    assert "zzzz zzzz" in results
+    assert "bbbb bbbb" not in results
+    assert "cccc cccc" not in results
+
+
+def test_persistent_manifest_requires_a_persisted_index(tmp_path, letter_embedding):
+    with pytest.raises(ValueError):
+        InMemoryKnowledgeBackend(
+            index="kb_sync", manifest_path=str(tmp_path / "manifest.json")
+        )
+
+
+def test_failed_sync_undoes_inserted_chunks(tmp_path, letter_embedding, monkeypatch):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("aaaa aaaa")
+    (docs / "b.txt").write_text("bbbb bbbb")
+    backend = InMemoryKnowledgeBackend(
+        index="kb_sync", persist_dir=str(tmp_path / "index")
+    )
+    load_batches = in_memory_backend.iter_file_node_batches
+
+    def failing_batches(files):
+        for file in files:
+            yield from load_batches([file])
+            raise RuntimeError("embedding service unavailable")
+
+    monkeypatch.setattr(in_memory_backend, "iter_file_node_batches", failing_batches)
+    with pytest.raises(RuntimeError):
+        backend.add_from_directory(str(docs))
+    assert backend._vector_store.count == 0
+
+    monkeypatch.setattr(in_memory_backend, "iter_file_node_batches", load_batches)
+    backend.add_from_directory(str(docs))
+    assert len(backend.last_ingestion_diff.added) == 2
+    assert backend._vector_store.count == 2
+
+
+def test_default_manifest_path_is_stable_per_index(tmp_path, monkeypatch):
+    from veadk.knowledgebase.backends.ingestion_manifest import default_manifest_path
+
+    monkeypatch.setenv("VEADK_KB_MANIFEST_DIR", str(tmp_path))
+    path = default_manifest_path("redis", "localhost", 6379, 0, "kb")
+
+    assert path == default_manifest_path("redis", "localhost", 6379, 0, "kb")
+    assert path != default_manifest_path("redis", "localhost", 6379, 0, "other")
+    assert path.startswith(str(tmp_path / "redis"))
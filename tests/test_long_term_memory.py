@@ -14,12 +14,33 @@
 
 
 import os
+import threading
 
 import pytest
 from google.adk.tools import load_memory
 
 from veadk.agent import Agent
 from veadk.memory.long_term_memory import LongTermMemory
+from veadk.memory.long_term_memory_backends.base_backend import (
+    BaseLongTermMemoryBackend,
+)
+
+
+class _ThreadRecordingBackend(BaseLongTermMemoryBackend):
+    threads: list[str] = []
+
+    def precheck_index_naming(self):
+        pass
+
+    def save_memory(self, user_id: str, event_strings: list[str], **kwargs) -> bool:
+        self.threads.append(threading.current_thread().name)
+        return True
+
+    def search_memory(
+        self, user_id: str, query: str, top_k: int, **kwargs
+    ) -> list[str]:
+        self.threads.append(threading.current_thread().name)
+        return []
 
 
 @pytest.mark.asyncio
@@ -46,3 +67,49 @@ async def test_long_term_memory():
     # assert agent.long_term_memory._backend.index == build_long_term_memory_index(
     #     app_name, user_id
     # )
+
+
+@pytest.mark.asyncio
+async def test_sync_backend_runs_off_the_event_loop():
+    backend = _ThreadRecordingBackend(index="ltm_test", threads=[])
+    long_term_memory = LongTermMemory(backend=backend, index="ltm_test")
+
+    response = await long_term_memory.search_memory(
+        app_name="app", user_id="user", query="hello"
+    )
+
+    assert response.memories == []
+    assert backend.threads and backend.threads[0].startswith("veadk-ltm")
+
+
+@pytest.mark.asyncio
+async def test_mem0_asave_memory_bounds_concurrent_adds(monkeypatch):
+    pytest.importorskip("mem0")
+    import asyncio
+
+    from veadk.configs.database_configs import Mem0Config
+    from veadk.memory.long_term_memory_backends import mem0_backend
+
+    in_flight = 0
+    peak = 0
+
+    class _Client:
+        async def add(self, messages, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"results": []}
+
+    monkeypatch.setattr(mem0_backend, "MemoryClient", lambda **kwargs: None)
+    backend = mem0_backend.Mem0LTMBackend(
+        index="ltm_test",
+        mem0_config=Mem0Config(
+            api_key="key", base_url="http://mem0", max_concurrency=3
+        ),
+    )
+    backend._async_mem0_client = _Client()
+
+    assert await backend.asave_memory([f"event {i}" for i in range(10)], "user")
+    assert peak == 3
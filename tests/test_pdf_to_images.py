@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import io
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 
 import pypdfium2 as pdfium
@@ -20,6 +21,7 @@ from google.adk.agents.callback_context import CallbackContext
 from google.adk.models.llm_request import LlmRequest
 from google.genai import types
 
+from veadk.utils import pdf_to_images
 from veadk.utils.pdf_to_images import make_pdf_to_images_callback
 
 # The callback ignores its context; a placeholder keeps the type checker happy.
@@ -107,3 +109,18 @@ def test_non_pdf_request_is_untouched():
     parts = _parts(request)
     assert len(parts) == 1
     assert parts[0].text == "hello"
+
+
+def test_render_pool_is_created_once_without_fork(monkeypatch):
+    monkeypatch.setenv("VEADK_PDF_RENDER_WORKERS", "2")
+    monkeypatch.setattr(pdf_to_images, "_RENDER_POOL", None)
+
+    with ThreadPoolExecutor(max_workers=8) as threads:
+        pools = list(threads.map(lambda _: pdf_to_images._get_render_pool(), range(8)))
+    try:
+        assert all(pool is pools[0] for pool in pools)
+        assert pools[0]._mp_context.get_start_method() != "fork"
+        assert len(pdf_to_images._render_pages(_make_pdf(3), 3, 1.0)) == 3
+    finally:
+        pdf_to_images._discard_render_pool()
+    assert pdf_to_images._RENDER_POOL is None
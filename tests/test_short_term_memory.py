@@ -52,3 +52,32 @@ def test_short_term_memory():
     assert session is not None
     assert os.path.exists(memory.local_database_path)
     os.remove(memory.local_database_path)
+
+
+def test_sqlite_short_term_memory_queues_concurrent_sessions(tmp_path):
+    import sqlite3
+
+    from veadk.memory.short_term_memory_backends.sqlite_backend import (
+        SQLiteSTMBackend,
+    )
+
+    path = str(tmp_path / "sessions.db")
+    # A single pooled connection makes every session wait for the previous one.
+    session_service = SQLiteSTMBackend(
+        local_path=path, db_kwargs={"pool_size": 1, "max_overflow": 0}
+    ).session_service
+
+    async def create_sessions():
+        await asyncio.gather(
+            *(
+                session_service.create_session(
+                    app_name="app", user_id="user", session_id=f"session-{i}"
+                )
+                for i in range(50)
+            )
+        )
+        return await session_service.list_sessions(app_name="app", user_id="user")
+
+    assert len(asyncio.run(create_sessions()).sessions) == 50
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
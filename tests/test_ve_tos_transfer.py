@@ -0,0 +1,166 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from veadk.configs.database_configs import TOSTransferConfig
+from veadk.integrations.ve_tos.transfer import TransferManager
+from veadk.integrations.ve_tos.ve_tos import VeTOS
+
+
+class _FakeTosClient:
+    """In-memory bucket recording which upload / download path was taken."""
+
+    def __init__(self, **kwargs):
+        self.objects: dict[str, bytes] = {}
+        self.calls: list[tuple[str, str]] = []
+        self.checkpoints: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def _enter(self, name, key):
+        with self._lock:
+            self.calls.append((name, key))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+
+    def _leave(self):
+        with self._lock:
+            self.active -= 1
+
+    def put_object_from_file(
+        self, bucket, key, file_path, meta=None, data_transfer_listener=None
+    ):
+        self._enter("put", key)
+        try:
+            if key.endswith("broken"):
+                raise RuntimeError("boom")
+            with open(file_path, "rb") as file:
+                self.objects[key] = file.read()
+            data_transfer_listener(0, 0, len(self.objects[key]), None)
+        finally:
+            self._leave()
+
+    def upload_file(self, bucket, key, file_path, checkpoint_file=None, **kwargs):
+        self._enter("multipart", key)
+        try:
+            self.checkpoints[key] = checkpoint_file
+            with open(file_path, "rb") as file:
+                self.objects[key] = file.read()
+            kwargs["data_transfer_listener"](0, 0, len(self.objects[key]), None)
+        finally:
+            self._leave()
+
+    def download_file(self, bucket, key, file_path, checkpoint_file=None, **kwargs):
+        self._enter("multipart", key)
+        try:
+            self.checkpoints[key] = checkpoint_file
+            with open(file_path, "wb") as file:
+                file.write(self.objects[key])
+        finally:
+            self._leave()
+
+    def get_object(self, bucket, key):
+        self._enter("get", key)
+        try:
+            return iter([self.objects[key]])
+        finally:
+            self._leave()
+
+    def list_objects_type2(self, bucket, prefix="", continuation_token=""):
+        contents = [
+            SimpleNamespace(key=key, size=len(data))
+            for key, data in sorted(self.objects.items())
+            if key.startswith(prefix)
+        ]
+        return SimpleNamespace(
+            is_truncated=False, next_continuation_token="", contents=contents
+        )
+
+
+def _config(tmp_path, **kwargs):
+    return TOSTransferConfig(
+        multipart_threshold=8, checkpoint_dir=str(tmp_path / "ckpt"), **kwargs
+    )
+
+
+def test_transfer_manager_picks_multipart_above_threshold(tmp_path):
+    small, large = tmp_path / "small.txt", tmp_path / "large.bin"
+    small.write_bytes(b"tiny")
+    large.write_bytes(b"x" * 64)
+    client = _FakeTosClient()
+    progress = []
+    manager = TransferManager(client, _config(tmp_path), progress.append)
+
+    result = manager.upload_files(
+        "bucket", [(str(small), "a/small.txt"), (str(large), "a/large.bin")]
+    )
+
+    assert result.ok
+    assert sorted(result.succeeded) == ["a/large.bin", "a/small.txt"]
+    assert result.transferred_bytes == 68
+    assert sorted(client.calls) == [
+        ("multipart", "a/large.bin"),
+        ("put", "a/small.txt"),
+    ]
+    assert client.checkpoints["a/large.bin"].startswith(str(tmp_path / "ckpt"))
+    assert progress[-1].done_files == 2
+    assert progress[-1].total_bytes == 68
+
+
+def test_transfer_manager_bounds_concurrency_and_collects_failures(tmp_path):
+    items = []
+    for index in range(12):
+        path = tmp_path / f"{index}.txt"
+        path.write_bytes(b"data")
+        items.append((str(path), f"k/{index}"))
+    items.append((str(items[0][0]), "k/broken"))
+    client = _FakeTosClient()
+    manager = TransferManager(client, _config(tmp_path, max_concurrency=3))
+
+    result = manager.upload_files("bucket", items)
+
+    assert 1 < client.peak <= 3
+    assert len(result.succeeded) == 12
+    assert list(result.failed) == ["k/broken"]
+
+
+@pytest.mark.asyncio
+async def test_ve_tos_directory_round_trip(monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, "tos", SimpleNamespace(TosClientV2=_FakeTosClient))
+    monkeypatch.setenv("VOLCENGINE_ACCESS_KEY", "test-ak")
+    monkeypatch.setenv("VOLCENGINE_SECRET_KEY", "test-sk")
+    monkeypatch.setenv("DATABASE_TOS_TRANSFER_MULTIPART_THRESHOLD", "8")
+    monkeypatch.setenv("DATABASE_TOS_TRANSFER_CHECKPOINT_DIR", str(tmp_path / "ckpt"))
+    source = tmp_path / "skills"
+    (source / "pdf").mkdir(parents=True)
+    (source / "SKILL.md").write_bytes(b"# skill")
+    (source / "pdf" / "big.bin").write_bytes(b"\x00" * 32)
+    client = VeTOS(bucket_name="bucket")
+    monkeypatch.setattr(client, "_ensure_client_and_bucket", lambda bucket: True)
+
+    await client.async_upload_directory(str(source))
+    target = tmp_path / "out"
+    downloaded = client.download_directory("bucket", "pdf", str(target))
+
+    assert set(client._client.objects) == {"SKILL.md", "pdf/big.bin"}
+    assert downloaded is True
+    assert (target / "big.bin").read_bytes() == b"\x00" * 32
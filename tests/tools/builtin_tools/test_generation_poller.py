@@ -0,0 +1,139 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from veadk.configs.tool_configs import MediaGenerationConfig
+from veadk.tools.builtin_tools import video_generate as video_module
+from veadk.tools.builtin_tools._generation_client import (
+    TaskPoller,
+    get_generation_http_client,
+)
+
+FAST = MediaGenerationConfig(
+    poll_initial_interval=0.01, poll_max_interval=0.02, poll_jitter=0.0
+)
+
+
+class _FakeTasks:
+    """Tasks that finish after a given number of status checks."""
+
+    def __init__(self, checks_until_done: dict[str, int]):
+        self.remaining = dict(checks_until_done)
+        self.list_calls: list[list[str]] = []
+        self.get_calls: list[str] = []
+
+    def _status(self, task_id: str) -> dict:
+        self.remaining[task_id] -= 1
+        if self.remaining[task_id] > 0:
+            return {"id": task_id, "status": "running"}
+        return {
+            "id": task_id,
+            "status": "succeeded",
+            "content": {"video_url": f"https://cdn/{task_id}.mp4"},
+        }
+
+    async def get_status(self, task_id: str) -> dict:
+        self.get_calls.append(task_id)
+        return self._status(task_id)
+
+    async def list_statuses(self, task_ids: list[str]) -> dict[str, dict]:
+        self.list_calls.append(list(task_ids))
+        return {task_id: self._status(task_id) for task_id in task_ids}
+
+
+@pytest.mark.asyncio
+async def test_poller_batches_outstanding_tasks():
+    tasks = _FakeTasks({f"t{i}": 3 for i in range(20)})
+    poller = TaskPoller(tasks.get_status, tasks.list_statuses, FAST)
+
+    results = await asyncio.gather(
+        *(poller.wait(task_id) for task_id in tasks.remaining)
+    )
+
+    assert [r["status"] for r in results] == ["succeeded"] * 20
+    assert len(tasks.list_calls) == 3
+    assert tasks.get_calls == []
+    assert poller.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_poller_falls_back_when_batch_query_is_rejected():
+    tasks = _FakeTasks({"a": 1, "b": 2})
+
+    async def reject(task_ids):
+        request = httpx.Request("GET", "https://ark/tasks")
+        raise httpx.HTTPStatusError(
+            "bad", request=request, response=httpx.Response(400, request=request)
+        )
+
+    poller = TaskPoller(tasks.get_status, reject, FAST)
+
+    results = await asyncio.gather(poller.wait("a"), poller.wait("b"))
+
+    assert [r["id"] for r in results] == ["a", "b"]
+    assert tasks.get_calls == ["a", "b", "b"]
+
+
+@pytest.mark.asyncio
+async def test_poller_drops_tasks_nobody_waits_for():
+    tasks = _FakeTasks({"slow": 10_000})
+    poller = TaskPoller(tasks.get_status, tasks.list_statuses, FAST)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(poller.wait("slow"), 0.05)
+
+    assert poller.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_per_loop():
+    assert get_generation_http_client() is get_generation_http_client()
+
+
+@pytest.mark.asyncio
+async def test_video_generate_waits_on_the_shared_poller(monkeypatch):
+    tasks = _FakeTasks({"cgt-1": 2, "cgt-2": 1})
+    ids = iter(tasks.remaining)
+
+    async def create_task(prompt, config, model_name):
+        return {"id": next(ids)}
+
+    monkeypatch.setattr(video_module, "_create_video_task", create_task)
+    monkeypatch.setattr(
+        video_module,
+        "_get_task_poller",
+        lambda: TaskPoller(tasks.get_status, tasks.list_statuses, FAST),
+    )
+    tool_context = SimpleNamespace(state={}, agent_name="agent")
+
+    result = await video_module.video_generate(
+        params=[
+            {"video_name": "a.mp4", "prompt": "a"},
+            {"video_name": "b.mp4", "prompt": "b"},
+        ],
+        tool_context=tool_context,
+    )
+
+    assert result["status"] == "success"
+    assert result["success_list"] == [
+        {"a.mp4": "https://cdn/cgt-1.mp4"},
+        {"b.mp4": "https://cdn/cgt-2.mp4"},
+    ]
+    assert tool_context.state["a.mp4_video_url"] == "https://cdn/cgt-1.mp4"
+    assert len(tasks.list_calls) == 2
@@ -19,6 +19,7 @@ schema the model sees. These tests pin the parameter names and defaults and the
 shape of the dict it returns, without making any network request.
 """
 
+import asyncio
 import inspect
 
 from veadk.tools import get_builtin_tool
@@ -45,6 +46,6 @@ def test_registered_as_web_fetch():
 def test_invalid_url_returns_error_dict():
     # A non-public / malformed URL must fail closed with an "error" key rather
     # than raising — the agent gets a tool result, not an exception.
-    result = web_fetch("not-a-valid-url")
+    result = asyncio.run(web_fetch("not-a-valid-url"))
     assert isinstance(result, dict)
     assert "error" in result
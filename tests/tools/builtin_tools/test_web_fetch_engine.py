@@ -0,0 +1,177 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from urllib.parse import urlparse
+
+import httpx
+import pytest
+
+from veadk.configs.tool_configs import WebFetchConfig
+from veadk.tools.builtin_tools import _web_fetch_engine, web_fetch as web_fetch_module
+from veadk.tools.builtin_tools._web_fetch_engine import (
+    FetchedDocument,
+    WebFetchEngine,
+    _DocumentCache,
+    _LoopState,
+)
+
+_PAGE = b"<html><head><title>Docs</title></head><body><h1>Hello</h1></body></html>"
+
+
+@pytest.fixture(autouse=True)
+def _skip_dns(monkeypatch: pytest.MonkeyPatch):
+    async def check_url(url: str) -> str:
+        return urlparse(url).hostname or ""
+
+    monkeypatch.setattr(_web_fetch_engine, "check_url", check_url)
+
+
+def _engine(handler, **config) -> WebFetchEngine:
+    engine = WebFetchEngine(WebFetchConfig(**config))
+    engine._new_loop_state = lambda: _LoopState(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return engine
+
+
+def test_concurrent_fetches_of_one_url_share_a_download():
+    requests: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, headers={"content-type": "text/html"}, content=_PAGE)
+
+    engine = _engine(handler)
+
+    async def main():
+        return await asyncio.gather(
+            *(engine.fetch("https://example.com/a") for _ in range(5))
+        )
+
+    documents = asyncio.run(main())
+    assert requests == ["https://example.com/a"]
+    assert all(document is documents[0] for document in documents)
+    assert engine.deduplicated == 4
+
+
+def test_cancelled_fetch_does_not_cancel_other_waiters():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, headers={"content-type": "text/html"}, content=_PAGE)
+
+    engine = _engine(handler)
+
+    async def main():
+        first = asyncio.create_task(engine.fetch("https://example.com/a"))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(engine.fetch("https://example.com/a"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        document = await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return document
+
+    assert asyncio.run(main()).body == _PAGE
+    assert engine.deduplicated == 1
+
+
+def test_stale_entries_are_revalidated_with_etag():
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, headers={"content-type": "text/html", "etag": '"v1"'}, content=_PAGE
+        )
+
+    engine = _engine(handler, cache_ttl_seconds=0)
+
+    async def main():
+        first = await engine.fetch("https://example.com/a")
+        second = await engine.fetch("https://example.com/a")
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert seen == [None, '"v1"']
+    assert second is first
+    assert engine.revalidated == 1
+
+
+def test_redirects_are_followed_and_cached_under_the_requested_url():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/old":
+            return httpx.Response(301, headers={"location": "/new"})
+        return httpx.Response(200, headers={"content-type": "text/plain"}, content=b"x")
+
+    engine = _engine(handler)
+    document = asyncio.run(engine.fetch("https://example.com/old"))
+
+    assert (document.url, document.redirects) == ("https://example.com/new", 1)
+    assert engine.cache.get("https://example.com/old") is document
+
+
+def test_cache_is_bounded_and_persists_to_disk(tmp_path):
+    cache = _DocumentCache(max_entries=2, max_bytes=1_000, disk_dir=tmp_path)
+    for name in ("a", "b", "c"):
+        cache.put(
+            name,
+            FetchedDocument(
+                url=name, content_type="text/plain", body=b"1", etag=f'"{name}"'
+            ),
+        )
+
+    assert list(cache._entries) == ["b", "c"]
+    cache.clear()
+    restored = cache.get("a")
+    assert restored is not None and restored.etag == '"a"'
+
+
+def test_web_fetch_extracts_markdown_through_the_engine(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/html"}, content=_PAGE)
+
+    engine = _engine(handler)
+    monkeypatch.setattr(web_fetch_module, "get_web_fetch_engine", lambda: engine)
+
+    result = asyncio.run(web_fetch_module.web_fetch("https://example.com/docs"))
+
+    assert result == {
+        "url": "https://example.com/docs",
+        "title": "Docs",
+        "content": "Docs\n# Hello",
+        "truncated": False,
+    }
+
+
+def test_disk_tier_evicts_least_recently_used_entries(tmp_path):
+    cache = _DocumentCache(
+        max_entries=10, max_bytes=1_000, disk_dir=tmp_path, disk_max_bytes=400
+    )
+    for name in ("a", "b", "c", "d"):
+        cache.put(
+            name,
+            FetchedDocument(url=name, content_type="text/plain", body=b"x" * 100),
+        )
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert cache.get("d") is not None
+    assert sum(size for _, size, _ in cache._disk_entries()) <= 400
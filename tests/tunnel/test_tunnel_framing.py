@@ -0,0 +1,206 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import socket
+import uuid
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from veadk.tunnel import LocalServer, TunnelConnector, TunnelRegistry, mount_tunnel
+from veadk.tunnel import connector as connector_module
+from veadk.tunnel.server import ConnectorConnection
+from veadk.tunnel.framing import (
+    FRAMING_BINARY,
+    FRAMING_JSON,
+    MAX_QUEUED_BYTES,
+    FrameType,
+    StreamWindow,
+    decode_frame,
+    decode_meta,
+    encode_frame,
+    encode_meta,
+    negotiate_framing,
+)
+
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB, not valid UTF-8
+
+
+def test_frames_round_trip_raw_bytes():
+    req_id = str(uuid.uuid4())
+    frame = encode_frame(
+        FrameType.REQUEST, req_id, encode_meta({"method": "POST"}, b"\xff\x00")
+    )
+
+    frame_type, decoded_id, payload = decode_frame(frame)
+
+    assert (frame_type, decoded_id) == (FrameType.REQUEST, req_id)
+    assert decode_meta(payload) == ({"method": "POST"}, b"\xff\x00")
+    with pytest.raises(ValueError):
+        decode_frame(b"\x01")
+
+
+def test_negotiation_falls_back_to_json():
+    assert negotiate_framing([FRAMING_BINARY, FRAMING_JSON]) == FRAMING_BINARY
+    assert negotiate_framing(None) == FRAMING_JSON
+    assert negotiate_framing(["msgpack"]) == FRAMING_JSON
+
+
+@pytest.mark.asyncio
+async def test_stream_window_blocks_until_released():
+    window = StreamWindow(4)
+    assert await window.acquire(10) == 4
+
+    waiter = asyncio.create_task(window.acquire(10))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    window.release(3)
+    assert await waiter == 3
+
+
+class _RecordingWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+    async def send_text(self, data):
+        self.sent.append(data)
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded_by_window_bytes_not_frames():
+    conn = ConnectorConnection(
+        connector_id="c",
+        websocket=_RecordingWebSocket(),
+        agent_name="agent",
+        servers=[],
+        framing=FRAMING_BINARY,
+        window=4096,
+    )
+    req_id, queue = await conn.request("srv", {"method": "GET"})
+
+    # Many small SSE chunks that stay inside the byte window.
+    for _ in range(4096):
+        conn.dispatch_frame(encode_frame(FrameType.RESPONSE_CHUNK, req_id, b"x"))
+    assert queue.qsize() == 4096
+    assert req_id in conn.pending
+
+    for _ in range(4096):
+        item = queue.get_nowait()
+        await conn.consumed(req_id, len(item[1]))
+    conn.dispatch_frame(encode_frame(FrameType.RESPONSE_CHUNK, req_id, b"x" * 4096))
+    assert req_id in conn.pending
+
+    # A connector that ignores its window fails the stream.
+    conn.dispatch_frame(encode_frame(FrameType.RESPONSE_CHUNK, req_id, b"x"))
+    assert req_id not in conn.pending
+    items = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert items[-1] == ("error", "tunnel client too slow")
+
+
+@pytest.mark.asyncio
+async def test_json_stream_pauses_reading_instead_of_failing():
+    conn = ConnectorConnection(
+        connector_id="c",
+        websocket=_RecordingWebSocket(),
+        agent_name="agent",
+        servers=[],
+        framing=FRAMING_JSON,
+    )
+    req_id, queue = await conn.request("srv", {"method": "GET"})
+    chunk = "x" * 65536
+
+    for _ in range(MAX_QUEUED_BYTES // len(chunk) + 1):
+        conn.dispatch({"type": "http_chunk", "id": req_id, "data": chunk})
+
+    # A legacy connector has no window; the server stops reading from it.
+    assert req_id in conn.pending
+    assert not conn.readable.is_set()
+    while not conn.readable.is_set():
+        item = queue.get_nowait()
+        assert item[0] == "chunk"
+        await conn.consumed(req_id, len(item[1]))
+    assert conn.buffered[req_id] <= MAX_QUEUED_BYTES
+
+    conn.dispatch({"type": "http_chunk", "id": req_id, "data": chunk * 8})
+    assert not conn.readable.is_set()
+    await conn.cancel(req_id)
+    assert conn.readable.is_set()
+
+
+async def _serve_tunnel(framings, monkeypatch):
+    monkeypatch.setattr(connector_module, "SUPPORTED_FRAMINGS", framings)
+    app = FastAPI()
+    registry = TunnelRegistry()
+    mount_tunnel(app, token="secret", registry=registry)
+
+    @app.post("/local/echo")
+    async def echo(request: Request) -> Response:
+        body = await request.body()
+        return Response(body + PAYLOAD, media_type="application/octet-stream")
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    port = listener.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off"))
+    server_task = asyncio.create_task(server.serve(sockets=[listener]))
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    base_url = f"http://127.0.0.1:{port}"
+    tunnel = TunnelConnector(
+        cloud_url=base_url,
+        agent="ops",
+        servers=[LocalServer(name="echo", address=f"{base_url}/local/echo")],
+        token="secret",
+    )
+    connector_task = asyncio.create_task(tunnel.start())
+    while not registry.has_agent("ops"):
+        await asyncio.sleep(0.01)
+    return base_url, registry, server, server_task, connector_task
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("framing", [FRAMING_BINARY, FRAMING_JSON])
+async def test_tunnel_proxies_requests(framing, monkeypatch):
+    base_url, registry, server, server_task, connector_task = await _serve_tunnel(
+        [framing], monkeypatch
+    )
+    body = b"\xfe\xff" if framing == FRAMING_BINARY else b"hello"
+    try:
+        async with httpx.AsyncClient(trust_env=False) as client:
+            response = await client.post(
+                f"{base_url}/tunnel/mcp/ops/echo", content=body, timeout=10
+            )
+        connection = registry.find_connection("ops", "echo")
+    finally:
+        connector_task.cancel()
+        await asyncio.gather(connector_task, return_exceptions=True)
+        server.should_exit = True
+        await server_task
+
+    assert response.status_code == 200
+    assert connection.framing == framing
+    if framing == FRAMING_BINARY:
+        assert response.content == body + PAYLOAD
+    else:
+        # JSON framing carries text, so only the UTF-8 prefix survives intact.
+        assert response.content.startswith(body)
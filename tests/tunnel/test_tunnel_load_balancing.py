@@ -0,0 +1,232 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import socket
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from veadk.tunnel import LocalServer, TunnelConnector, TunnelRegistry, mount_tunnel
+from veadk.tunnel.registry import ServerDescriptor
+from veadk.tunnel.server import ConnectorConnection
+
+
+def _connection(connector_id: str, *names: str) -> ConnectorConnection:
+    return ConnectorConnection(
+        connector_id=connector_id,
+        websocket=None,
+        agent_name="ops",
+        servers=[ServerDescriptor(name=name) for name in names],
+    )
+
+
+def test_requests_go_to_the_least_loaded_connector():
+    registry = TunnelRegistry()
+    first, second = _connection("c1", "db"), _connection("c2", "db", "kv")
+    registry.add_connection(first)
+    registry.add_connection(second)
+
+    assert [s.name for s in registry.list_servers("ops")] == ["db", "kv"]
+    picked = {registry.find_connection("ops", "db").connector_id for _ in range(4)}
+    assert picked == {"c1", "c2"}
+
+    first.begin()
+    assert all(registry.find_connection("ops", "db") is second for _ in range(4))
+    second.begin()
+    second.begin()
+    assert registry.find_connection("ops", "db") is first
+    assert registry.find_connection("ops", "kv") is second
+
+    stats = registry.connector_stats("ops")
+    assert [(c.connector_id, c.in_flight) for c in stats["db"]] == [
+        ("c1", 1),
+        ("c2", 2),
+    ]
+
+
+def test_draining_connectors_get_no_new_requests():
+    registry = TunnelRegistry()
+    first, second = _connection("c1", "db"), _connection("c2", "db", "kv")
+    registry.add_connection(first)
+    registry.add_connection(second)
+
+    registry.drain_connection("c2")
+
+    assert all(registry.find_connection("ops", "db") is first for _ in range(4))
+    assert registry.find_connection("ops", "kv") is None
+    assert [s.name for s in registry.list_servers("ops")] == ["db"]
+    assert registry.connector_stats("ops")["kv"][0].draining is True
+
+
+def test_sessions_stick_to_the_connector_that_initialized_them():
+    registry = TunnelRegistry()
+    first, second = _connection("c1", "db"), _connection("c2", "db")
+    registry.add_connection(first)
+    registry.add_connection(second)
+    registry.pin_session("ops", "db", "s1", "c1")
+
+    first.begin()
+    assert all(registry.find_connection("ops", "db", "s1") is first for _ in range(4))
+    assert registry.find_connection("ops", "db") is second
+    assert registry.find_connection("ops", "db", "unknown") is None
+
+    registry.drain_connection("c1")
+    assert registry.find_connection("ops", "db", "s1") is first
+    registry.remove_connection("c1")
+    assert registry.find_connection("ops", "db", "s1") is None
+    registry.pin_session("ops", "db", "s2", "c1")
+    assert registry.find_connection("ops", "db", "s2") is None
+
+
+def test_connection_tracks_latency_and_errors():
+    conn = _connection("c1", "db")
+    started = conn.begin()
+    conn.responded(started - 0.1)
+    conn.finish()
+    conn.begin()
+    conn.finish(error=True)
+
+    stats = conn.stats()
+    assert (stats.in_flight, stats.requests, stats.errors) == (0, 2, 1)
+    assert stats.latency_ms >= 100
+
+
+@pytest.mark.asyncio
+async def test_connectors_share_a_server_and_drain():
+    app = FastAPI()
+    registry = TunnelRegistry()
+    mount_tunnel(app, registry=registry)
+    release = asyncio.Event()
+
+    @app.post("/local/slow")
+    async def slow() -> dict:
+        await release.wait()
+        return {"ok": True}
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    base_url = f"http://127.0.0.1:{listener.getsockname()[1]}"
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off"))
+    server_task = asyncio.create_task(server.serve(sockets=[listener]))
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    connectors = [
+        TunnelConnector(
+            cloud_url=base_url,
+            agent="ops",
+            servers=[LocalServer(name="db", address=f"{base_url}/local/slow")],
+        )
+        for _ in range(2)
+    ]
+    connector_tasks = [asyncio.create_task(c.start()) for c in connectors]
+    try:
+        while len(registry.connector_stats("ops").get("db", [])) < 2:
+            await asyncio.sleep(0.01)
+
+        async with httpx.AsyncClient(base_url=base_url, trust_env=False) as client:
+            calls = [
+                asyncio.create_task(client.post("/tunnel/mcp/ops/db", timeout=10))
+                for _ in range(4)
+            ]
+            while sum(c.in_flight for c in registry.connector_stats("ops")["db"]) < 4:
+                await asyncio.sleep(0.01)
+            listing = (await client.get("/tunnel/servers?agent=ops")).json()
+            assert [c["in_flight"] for c in listing["servers"][0]["connectors"]] == [
+                2,
+                2,
+            ]
+
+            drain = asyncio.create_task(connectors[0].drain())
+            while not any(c.draining for c in registry.connector_stats("ops")["db"]):
+                await asyncio.sleep(0.01)
+            release.set()
+            responses = await asyncio.gather(*calls)
+            await drain
+            await asyncio.wait_for(connector_tasks[0], timeout=5)
+
+            assert [r.json() for r in responses] == [{"ok": True}] * 4
+            while len(registry.connector_stats("ops")["db"]) > 1:
+                await asyncio.sleep(0.01)
+            response = await client.post("/tunnel/mcp/ops/db", timeout=10)
+            assert response.json() == {"ok": True}
+    finally:
+        release.set()  # a failed assertion must not block the shutdown
+        for task in connector_tasks:
+            task.cancel()
+        await asyncio.gather(*connector_tasks, return_exceptions=True)
+        server.should_exit = True
+        await server_task
+
+
+@pytest.mark.asyncio
+async def test_proxy_pins_mcp_sessions():
+    app = FastAPI()
+    registry = TunnelRegistry()
+    mount_tunnel(app, registry=registry)
+
+    @app.api_route("/local/mcp", methods=["POST", "DELETE"])
+    async def mcp(request: Request) -> Response:
+        if "mcp-session-id" in request.headers:
+            return Response(b"{}", media_type="application/json")
+        return Response(b"{}", headers={"Mcp-Session-Id": "s1"})
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    base_url = f"http://127.0.0.1:{listener.getsockname()[1]}"
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off"))
+    server_task = asyncio.create_task(server.serve(sockets=[listener]))
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    connectors = [
+        TunnelConnector(
+            cloud_url=base_url,
+            agent="ops",
+            servers=[LocalServer(name="db", address=f"{base_url}/local/mcp")],
+        )
+        for _ in range(2)
+    ]
+    connector_tasks = [asyncio.create_task(c.start()) for c in connectors]
+    try:
+        while len(registry.connector_stats("ops").get("db", [])) < 2:
+            await asyncio.sleep(0.01)
+
+        async with httpx.AsyncClient(base_url=base_url, trust_env=False) as client:
+            initialize = await client.post("/tunnel/mcp/ops/db", timeout=10)
+            session = {"Mcp-Session-Id": initialize.headers["mcp-session-id"]}
+            for _ in range(4):
+                response = await client.post(
+                    "/tunnel/mcp/ops/db", headers=session, timeout=10
+                )
+                assert response.status_code == 200
+            requests = sorted(c.requests for c in registry.connector_stats("ops")["db"])
+            assert requests == [0, 5]
+
+            await client.delete("/tunnel/mcp/ops/db", headers=session, timeout=10)
+            response = await client.post(
+                "/tunnel/mcp/ops/db", headers=session, timeout=10
+            )
+            assert response.status_code == 404
+    finally:
+        for task in connector_tasks:
+            task.cancel()
+        await asyncio.gather(*connector_tasks, return_exceptions=True)
+        server.should_exit = True
+        await server_task
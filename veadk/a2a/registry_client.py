@@ -14,24 +14,32 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import copy
 import hashlib
 import hmac
 import json
 import os
 import re
+import threading
 import time
 import uuid
-from collections.abc import Mapping
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 from urllib.parse import quote, urlparse, urlunparse
 
+import httpx
 import requests
 
 from veadk.auth.veauth.utils import get_credential_from_vefaas_iam
 from veadk.utils.auth import VE_TIP_TOKEN_HEADER
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 DEFAULT_ENDPOINT = "http://volcengineapi.byted.org/"
 DEFAULT_VERSION = "2025-10-30"
@@ -43,6 +51,10 @@ DEFAULT_TIMEOUT_MS = 60000
 DEFAULT_POLL_INTERVAL_MS = 5000
 SEARCH_PROMPT_MAX_BYTES = 2048
 TERMINAL_STATES = {"completed", "failed", "canceled", "rejected"}
+DEFAULT_CARD_CACHE_TTL_MS = 60000
+DEFAULT_CARD_CACHE_STALE_MS = 300000
+DEFAULT_SEARCH_CACHE_TTL_MS = 30000
+DEFAULT_SEARCH_CACHE_STALE_MS = 60000
 _OAUTH_TOKEN_CACHE: dict[str, tuple[str, float]] = {}
 
 
@@ -58,6 +70,156 @@ class RegistryError(Exception):
         self.diagnostics = diagnostics or {}
 
 
+@dataclass
+class RegistryCacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    """Refreshes where the registry returned the cached version again."""
+    updated: int = 0
+    """Refreshes that replaced the cached value with a new version."""
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    version: str
+    fetched_at: float
+    refreshing: bool = False
+
+
+class _RegistryCache:
+    """TTL cache of registry lookups with stale-while-revalidate.
+
+    Fresh entries are returned directly. Past the TTL, entries stay usable
+    for a stale window: they are still returned while a single background
+    refresh revalidates them. A refresh that returns the cached version (a
+    content hash, the registry has no ETags) only renews the entry.
+    The TTL and stale window are read from the environment on every lookup;
+    a TTL of 0 disables the cache.
+    """
+
+    def __init__(
+        self,
+        ttl_env: str,
+        default_ttl_ms: int,
+        stale_env: str,
+        default_stale_ms: int,
+        max_entries: int = 1024,
+    ) -> None:
+        self._ttl_env = ttl_env
+        self._default_ttl_ms = default_ttl_ms
+        self._stale_env = stale_env
+        self._default_stale_ms = default_stale_ms
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = RegistryCacheStats()
+
+    @property
+    def ttl_seconds(self) -> float:
+        return _int_env(self._ttl_env, self._default_ttl_ms, minimum=0) / 1000
+
+    def lookup(self, key: tuple) -> tuple[Any, str]:
+        """Return ``(value, state)`` where state is ``hit``, ``stale`` or ``miss``."""
+
+        ttl = self.ttl_seconds
+        if ttl <= 0:
+            return None, "miss"
+        stale = _int_env(self._stale_env, self._default_stale_ms, minimum=0) / 1000
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry.fetched_at
+                if age < ttl:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return entry.value, "hit"
+                if age < ttl + stale:
+                    self._stats.stale_hits += 1
+                    return entry.value, "stale"
+                del self._entries[key]
+            self._stats.misses += 1
+            return None, "miss"
+
+    def store(self, key: tuple, value: Any, version: str) -> Any:
+        """Cache ``value`` and return the value callers should use."""
+
+        if self.ttl_seconds <= 0:
+            return value
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                entry.fetched_at = time.monotonic()
+                self._stats.revalidated += 1
+                return copy.deepcopy(entry.value)
+            if entry is not None:
+                self._stats.updated += 1
+            self._entries[key] = _CacheEntry(
+                copy.deepcopy(value), version, time.monotonic()
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def begin_refresh(self, key: tuple) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refreshing:
+                return False
+            entry.refreshing = True
+            return True
+
+    def end_refresh(self, key: tuple) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refreshing = False
+
+    def invalidate(self, key: tuple) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = RegistryCacheStats()
+
+    def stats(self) -> RegistryCacheStats:
+        with self._lock:
+            return RegistryCacheStats(**vars(self._stats))
+
+
+_AGENT_CACHE = _RegistryCache(
+    "REGISTRY_CARD_CACHE_TTL_MS",
+    DEFAULT_CARD_CACHE_TTL_MS,
+    "REGISTRY_CARD_CACHE_STALE_MS",
+    DEFAULT_CARD_CACHE_STALE_MS,
+)
+_SEARCH_CACHE = _RegistryCache(
+    "REGISTRY_SEARCH_CACHE_TTL_MS",
+    DEFAULT_SEARCH_CACHE_TTL_MS,
+    "REGISTRY_SEARCH_CACHE_STALE_MS",
+    DEFAULT_SEARCH_CACHE_STALE_MS,
+)
+_REFRESH_TASKS: set[asyncio.Task] = set()
+
+
+def registry_cache_stats() -> dict[str, RegistryCacheStats]:
+    """Counters of the agent-card and search-result caches."""
+
+    return {"agent_cards": _AGENT_CACHE.stats(), "search": _SEARCH_CACHE.stats()}
+
+
+def clear_registry_cache() -> None:
+    """Drop every cached agent card and search result."""
+
+    _AGENT_CACHE.clear()
+    _SEARCH_CACHE.clear()
+
+
 @dataclass(frozen=True)
 class AgentKitA2ARegistryConfig:
     space_id: str = ""
@@ -143,10 +305,30 @@ def search_agent_cards(
     *,
     strip_prompt: bool = True,
 ) -> dict[str, Any]:
-    """Search AgentKit A2A registry by prompt and return sanitized AgentCards."""
+    """Search AgentKit A2A registry by prompt and return sanitized AgentCards.
+
+    Results are cached per prompt for ``REGISTRY_SEARCH_CACHE_TTL_MS``.
+    """
 
     started = time.monotonic()
     config = _resolve_config(config)
+    body, safe_top_k = _search_body(prompt, top_k, config, strip_prompt)
+    (response, request_duration_ms), cache_state = _cached(
+        _SEARCH_CACHE,
+        _search_cache_key(config, body),
+        lambda: _versioned(_agentkit_post(config, "SearchAgentCards", body)),
+    )
+    return _search_success(
+        response, request_duration_ms, safe_top_k, started, cache_state
+    )
+
+
+def _search_body(
+    prompt: str,
+    top_k: int | None,
+    config: AgentKitA2ARegistryConfig,
+    strip_prompt: bool,
+) -> tuple[dict[str, Any], int]:
     if not prompt or not prompt.strip():
         raise RegistryError("INVALID_ARGUMENT", "prompt is required")
     _require_space_id(config)
@@ -154,11 +336,19 @@ def search_agent_cards(
     safe_top_k = max(1, min(int(top_k or config.top_k or DEFAULT_TOP_K), 20))
     request_prompt = prompt.strip() if strip_prompt else prompt
     request_prompt = truncate_utf8_bytes(request_prompt, SEARCH_PROMPT_MAX_BYTES)
-    response, request_duration_ms = _agentkit_post(
-        config,
-        "SearchAgentCards",
+    return (
         {"SpaceId": config.space_id, "Prompt": request_prompt, "TopK": safe_top_k},
+        safe_top_k,
     )
+
+
+def _search_success(
+    response: dict[str, Any],
+    request_duration_ms: int,
+    safe_top_k: int,
+    started: float,
+    cache_state: str,
+) -> dict[str, Any]:
     result = response.get("Result") or {}
     raw_cards = result.get("AgentCards") or []
 
@@ -185,6 +375,7 @@ def search_agent_cards(
                 "search_request_id": _request_id(response),
                 "request_duration_ms": request_duration_ms,
                 "duration_ms": duration_ms,
+                "cache": cache_state,
             },
         }
     )
@@ -209,15 +400,18 @@ def create_task(
 
     started = time.monotonic()
     config = _resolve_config(config)
-    if not agent_name or not agent_name.strip():
-        raise RegistryError("INVALID_ARGUMENT", "agent_name is required")
-    if not input_text or not input_text.strip():
-        raise RegistryError("INVALID_ARGUMENT", "input is required")
+    _check_task_args(agent_name, input=input_text)
 
-    result, card, raw_response, get_duration_ms = _get_a2a_agent(
-        agent_name.strip(), config
+    key = _agent_cache_key(config, agent_name.strip())
+    (result, card, raw_response, get_duration_ms), cache_state = _cached(
+        _AGENT_CACHE, key, lambda: _versioned_agent(agent_name.strip(), config)
     )
-    a2a_result = _send_message(card, input_text, config, task_id=task_id)
+    try:
+        a2a_result = _send_message(card, input_text, config, task_id=task_id)
+    except RegistryError:
+        # The agent may have moved or rotated credentials; look it up again.
+        _AGENT_CACHE.invalidate(key)
+        raise
     return _task_or_message_success(
         a2a_result,
         _sanitize_get_agent_result(result, card),
@@ -225,6 +419,7 @@ def create_task(
             "get_request_id": _request_id(raw_response),
             "get_duration_ms": get_duration_ms,
             "duration_ms": int((time.monotonic() - started) * 1000),
+            "card_cache": cache_state,
         },
     )
 
@@ -239,13 +434,247 @@ def poll_task(
 
     started = time.monotonic()
     config = _resolve_config(config)
+    _check_task_args(agent_name, task_id=task_id)
+
+    key = _agent_cache_key(config, agent_name.strip())
+    (_, card, _, _), _ = _cached(
+        _AGENT_CACHE, key, lambda: _versioned_agent(agent_name.strip(), config)
+    )
+    try:
+        return _poll_card(card, task_id, history_length, config, started)
+    except RegistryError:
+        _AGENT_CACHE.invalidate(key)
+        raise
+
+
+class AsyncRegistryClient:
+    """Async AgentKit A2A registry client on one pooled HTTP connection.
+
+    Mirrors :func:`search_agent_cards`, :func:`create_task` and
+    :func:`poll_task` and shares their agent-card and search caches, so
+    routers that look up the same agents every turn skip the registry
+    round-trip. Use it as an async context manager or call :meth:`aclose`.
+
+    Args:
+        config: Registry config, completed from env vars like the module
+            functions do.
+        http_client: Client to send requests with; one is created (and
+            closed by :meth:`aclose`) when omitted.
+    """
+
+    def __init__(
+        self,
+        config: AgentKitA2ARegistryConfig | None = None,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.config = _resolve_config(config)
+        self._owns_http_client = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            timeout=_timeout_seconds(self.config),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+    async def __aenter__(self) -> AsyncRegistryClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_http_client:
+            await self._http.aclose()
+
+    async def search_agent_cards(
+        self, prompt: str, top_k: int | None = None, *, strip_prompt: bool = True
+    ) -> dict[str, Any]:
+        """Search the registry by prompt and return sanitized AgentCards."""
+
+        started = time.monotonic()
+        body, safe_top_k = _search_body(prompt, top_k, self.config, strip_prompt)
+
+        async def _fetch() -> tuple[tuple[dict[str, Any], int], str]:
+            return _versioned(await self._agentkit_post("SearchAgentCards", body))
+
+        (response, request_duration_ms), cache_state = await _acached(
+            _SEARCH_CACHE, _search_cache_key(self.config, body), _fetch
+        )
+        return _search_success(
+            response, request_duration_ms, safe_top_k, started, cache_state
+        )
+
+    async def create_task(
+        self, agent_name: str, input_text: str, task_id: str | None = None
+    ) -> dict[str, Any]:
+        """Create a remote A2A task by AgentKit A2A agent name."""
+
+        started = time.monotonic()
+        _check_task_args(agent_name, input=input_text)
+        key = _agent_cache_key(self.config, agent_name.strip())
+        (result, card, raw_response, get_duration_ms), cache_state = await _acached(
+            _AGENT_CACHE, key, lambda: self._versioned_agent(agent_name.strip())
+        )
+        try:
+            a2a_result = await self._send_message(card, input_text, task_id)
+        except RegistryError:
+            _AGENT_CACHE.invalidate(key)
+            raise
+        return _task_or_message_success(
+            a2a_result,
+            _sanitize_get_agent_result(result, card),
+            {
+                "get_request_id": _request_id(raw_response),
+                "get_duration_ms": get_duration_ms,
+                "duration_ms": int((time.monotonic() - started) * 1000),
+                "card_cache": cache_state,
+            },
+        )
+
+    async def poll_task(
+        self, agent_name: str, task_id: str, history_length: int = 10
+    ) -> dict[str, Any]:
+        """Poll a remote A2A task by AgentKit A2A agent name."""
+
+        started = time.monotonic()
+        _check_task_args(agent_name, task_id=task_id)
+        key = _agent_cache_key(self.config, agent_name.strip())
+        (_, card, _, _), _ = await _acached(
+            _AGENT_CACHE, key, lambda: self._versioned_agent(agent_name.strip())
+        )
+        params = {"id": task_id.strip(), "historyLength": max(0, int(history_length))}
+        try:
+            a2a_result = await self._call_agent(card, "tasks/get", params)
+        except RegistryError:
+            _AGENT_CACHE.invalidate(key)
+            raise
+        payload = _poll_payload(a2a_result, started)
+        if not payload["is_terminal"]:
+            sleep_seconds = self.config.poll_interval_ms / 1000
+            await asyncio.sleep(sleep_seconds)
+            _mark_poll_again(payload, sleep_seconds)
+        return _success(payload)
+
+    async def _versioned_agent(
+        self, agent_name: str
+    ) -> tuple[tuple[dict[str, Any], dict[str, Any], dict[str, Any], int], str]:
+        response, duration_ms = await self._agentkit_post(
+            "GetA2aAgent", {"Name": agent_name, "SpaceId": self.config.space_id}
+        )
+        result, card = _agent_from_response(agent_name, response)
+        return (result, card, response, duration_ms), _agent_version(result)
+
+    async def _send_message(
+        self, card: dict[str, Any], input_text: str, task_id: str | None
+    ) -> dict[str, Any]:
+        try:
+            return await self._call_agent(
+                card, "message/send", _message_send_params(input_text, task_id)
+            )
+        except RegistryError as exc:
+            error = _task_create_error(exc)
+            if error is exc:
+                raise
+            raise error from exc
+
+    async def _call_agent(
+        self, card: dict[str, Any], method: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        headers = await self._auth_headers(card)
+        try:
+            return await self._a2a_jsonrpc(card["url"], method, params, headers)
+        except RegistryError as exc:
+            if not _should_retry_with_m2m(exc, card, self.config, headers):
+                raise
+            return await self._a2a_jsonrpc(
+                card["url"],
+                method,
+                params,
+                await self._auth_headers(card, force_m2m=True),
+            )
+
+    async def _auth_headers(
+        self, card: dict[str, Any], *, force_m2m: bool = False
+    ) -> dict[str, str]:
+        if not _has_oauth2_security(card):
+            return _agent_auth_headers(card, self.config, force_m2m=force_m2m)
+        # Fetching an OAuth2 token may call the identity service synchronously.
+        return await asyncio.to_thread(
+            _agent_auth_headers, card, self.config, force_m2m=force_m2m
+        )
+
+    async def _agentkit_post(
+        self, action: str, body: dict[str, Any]
+    ) -> tuple[dict[str, Any], int]:
+        started = time.monotonic()
+        query, headers, content = _signed_openapi_request(
+            config=self.config,
+            endpoint=self.config.endpoint,
+            service_name=self.config.service_name,
+            action=action,
+            version=self.config.version,
+            body=body,
+        )
+        try:
+            response = await self._http.post(
+                self.config.endpoint, params=query, headers=headers, content=content
+            )
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPStatusError as exc:
+            raise RegistryError(
+                "AGENTKIT_OPENAPI_FAILED",
+                f"Agent-A2A center request failed: {exc}",
+                _openapi_response_diagnostics(exc.response),
+            ) from exc
+        except httpx.HTTPError as exc:
+            raise RegistryError(
+                "AGENTKIT_OPENAPI_FAILED", f"Agent-A2A center request failed: {exc}"
+            ) from exc
+        except ValueError as exc:
+            raise RegistryError(
+                "AGENTKIT_RESPONSE_PARSE_FAILED",
+                "Agent-A2A center returned non-JSON response",
+            ) from exc
+        return _openapi_result(data), int((time.monotonic() - started) * 1000)
+
+    async def _a2a_jsonrpc(
+        self,
+        url: str,
+        method: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+    ) -> dict[str, Any]:
+        try:
+            response = await self._http.post(
+                url,
+                headers={"Content-Type": "application/json", **headers},
+                json=_jsonrpc_payload(method, params),
+            )
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPStatusError as exc:
+            raise RegistryError(
+                "A2A_HTTP_FAILED",
+                f"A2A JSON-RPC request failed: {exc}",
+                {"status_code": exc.response.status_code},
+            ) from exc
+        except httpx.HTTPError as exc:
+            raise RegistryError(
+                "A2A_HTTP_FAILED", f"A2A JSON-RPC request failed: {exc}"
+            ) from exc
+        except ValueError as exc:
+            raise RegistryError(
+                "A2A_RESPONSE_PARSE_FAILED", "A2A endpoint returned non-JSON response"
+            ) from exc
+        return _jsonrpc_result(data)
+
+
+def _check_task_args(agent_name: str, **values: str) -> None:
     if not agent_name or not agent_name.strip():
         raise RegistryError("INVALID_ARGUMENT", "agent_name is required")
-    if not task_id or not task_id.strip():
-        raise RegistryError("INVALID_ARGUMENT", "task_id is required")
-
-    _, card, _, _ = _get_a2a_agent(agent_name.strip(), config)
-    return _poll_card(card, task_id, history_length, config, started)
+    for name, value in values.items():
+        if not value or not value.strip():
+            raise RegistryError("INVALID_ARGUMENT", f"{name} is required")
 
 
 def failure(
@@ -295,6 +724,98 @@ def _resolve_config(
     )
 
 
+def _agent_cache_key(config: AgentKitA2ARegistryConfig, agent_name: str) -> tuple:
+    return ("agent", config.endpoint, config.region, config.space_id, agent_name)
+
+
+def _search_cache_key(config: AgentKitA2ARegistryConfig, body: dict[str, Any]) -> tuple:
+    return (
+        "search",
+        config.endpoint,
+        config.region,
+        body["SpaceId"],
+        body["Prompt"],
+        body["TopK"],
+    )
+
+
+def _content_version(value: Any) -> str:
+    raw = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _versioned(
+    posted: tuple[dict[str, Any], int],
+) -> tuple[tuple[dict[str, Any], int], str]:
+    return posted, _content_version(posted[0].get("Result"))
+
+
+def _versioned_agent(
+    agent_name: str, config: AgentKitA2ARegistryConfig
+) -> tuple[tuple[dict[str, Any], dict[str, Any], dict[str, Any], int], str]:
+    value = _get_a2a_agent(agent_name, config)
+    return value, _agent_version(value[0])
+
+
+def _agent_version(result: dict[str, Any]) -> str:
+    return _content_version([result.get("AgentCard"), result.get("Status")])
+
+
+def _cached(
+    cache: _RegistryCache, key: tuple, fetch: Callable[[], tuple[Any, str]]
+) -> tuple[Any, str]:
+    value, state = cache.lookup(key)
+    if state == "miss":
+        return cache.store(key, *fetch()), state
+    if state == "stale" and cache.begin_refresh(key):
+        threading.Thread(
+            target=_refresh_entry,
+            args=(cache, key, fetch),
+            name="veadk-registry-refresh",
+            daemon=True,
+        ).start()
+    return copy.deepcopy(value), state
+
+
+def _refresh_entry(
+    cache: _RegistryCache, key: tuple, fetch: Callable[[], tuple[Any, str]]
+) -> None:
+    try:
+        cache.store(key, *fetch())
+    except Exception as exc:
+        logger.warning(f"Background refresh of registry entry {key[0]} failed: {exc}")
+    finally:
+        cache.end_refresh(key)
+
+
+async def _acached(
+    cache: _RegistryCache,
+    key: tuple,
+    fetch: Callable[[], Awaitable[tuple[Any, str]]],
+) -> tuple[Any, str]:
+    value, state = cache.lookup(key)
+    if state == "miss":
+        return cache.store(key, *(await fetch())), state
+    if state == "stale" and cache.begin_refresh(key):
+        task = asyncio.create_task(_arefresh_entry(cache, key, fetch))
+        _REFRESH_TASKS.add(task)
+        task.add_done_callback(_REFRESH_TASKS.discard)
+    return copy.deepcopy(value), state
+
+
+async def _arefresh_entry(
+    cache: _RegistryCache,
+    key: tuple,
+    fetch: Callable[[], Awaitable[tuple[Any, str]]],
+) -> None:
+    try:
+        cache.store(key, *(await fetch()))
+    except Exception as exc:
+        logger.warning(f"Background refresh of registry entry {key[0]} failed: {exc}")
+    finally:
+        cache.end_refresh(key)
+
+
 def _require_space_id(config: AgentKitA2ARegistryConfig) -> None:
     if not config.space_id:
         raise RegistryError(
@@ -410,11 +931,56 @@ def _signed_openapi_post(
     version: str,
     body: dict[str, Any],
 ) -> tuple[dict[str, Any], int]:
+    started = time.monotonic()
+    query, request_headers, body_bytes = _signed_openapi_request(
+        config=config,
+        endpoint=endpoint,
+        service_name=service_name,
+        action=action,
+        version=version,
+        body=body,
+    )
+
+    response = None
+    try:
+        response = requests.post(
+            endpoint,
+            params=query,
+            headers=request_headers,
+            data=body_bytes,
+            timeout=_timeout_seconds(config),
+        )
+        response.raise_for_status()
+        data = response.json()
+    except requests.RequestException as exc:
+        raise RegistryError(
+            "AGENTKIT_OPENAPI_FAILED",
+            f"Agent-A2A center request failed: {exc}",
+            _agentkit_http_diagnostics(exc, response),
+        ) from exc
+    except ValueError as exc:
+        raise RegistryError(
+            "AGENTKIT_RESPONSE_PARSE_FAILED",
+            "Agent-A2A center returned non-JSON response",
+        ) from exc
+
+    return _openapi_result(data), int((time.monotonic() - started) * 1000)
+
+
+def _signed_openapi_request(
+    *,
+    config: AgentKitA2ARegistryConfig,
+    endpoint: str,
+    service_name: str,
+    action: str,
+    version: str,
+    body: dict[str, Any],
+) -> tuple[dict[str, str], dict[str, str], bytes]:
+    """Return the query, signed headers and body of an OpenAPI call."""
+
     _require_space_id(config)
     credentials = _resolve_credentials()
-    started = time.monotonic()
     body_str = json.dumps(body, ensure_ascii=False)
-    body_bytes = body_str.encode("utf-8")
     parsed = urlparse(endpoint)
     path = parsed.path or "/"
     query = {"Action": action, "Version": version}
@@ -440,31 +1006,10 @@ def _signed_openapi_post(
     }
     if credentials.session_token:
         request_headers["X-Security-Token"] = credentials.session_token
+    return query, request_headers, body_str.encode("utf-8")
 
-    response = None
-    try:
-        response = requests.post(
-            endpoint,
-            params=query,
-            headers=request_headers,
-            data=body_bytes,
-            timeout=_timeout_seconds(config),
-        )
-        response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as exc:
-        raise RegistryError(
-            "AGENTKIT_OPENAPI_FAILED",
-            f"Agent-A2A center request failed: {exc}",
-            _agentkit_http_diagnostics(exc, response),
-        ) from exc
-    except ValueError as exc:
-        raise RegistryError(
-            "AGENTKIT_RESPONSE_PARSE_FAILED",
-            "Agent-A2A center returned non-JSON response",
-        ) from exc
 
-    duration_ms = int((time.monotonic() - started) * 1000)
+def _openapi_result(data: dict[str, Any]) -> dict[str, Any]:
     if data.get("Error"):
         raise RegistryError(
             "AGENTKIT_OPENAPI_ERROR",
@@ -475,7 +1020,7 @@ def _signed_openapi_post(
         raise RegistryError(
             "AGENTKIT_RESPONSE_INVALID", "Agent-A2A center response missing Result"
         )
-    return data, duration_ms
+    return data
 
 
 def _identity_endpoint(config: AgentKitA2ARegistryConfig) -> str:
@@ -500,6 +1045,11 @@ def _agentkit_http_diagnostics(
     response = getattr(exc, "response", None) or response
     if response is None:
         return {}
+    return _openapi_response_diagnostics(response)
+
+
+def _openapi_response_diagnostics(response: Any) -> dict[str, Any]:
+    """Safe diagnostics of a failed OpenAPI response (requests or httpx)."""
 
     diagnostics: dict[str, Any] = {"status_code": response.status_code}
     try:
@@ -540,6 +1090,13 @@ def _get_a2a_agent(
         "GetA2aAgent",
         {"Name": agent_name, "SpaceId": config.space_id},
     )
+    result, card = _agent_from_response(agent_name, response)
+    return result, card, response, duration_ms
+
+
+def _agent_from_response(
+    agent_name: str, response: dict[str, Any]
+) -> tuple[dict[str, Any], dict[str, Any]]:
     result = response.get("Result") or {}
     status = result.get("Status", "")
     if status and status != "running":
@@ -558,7 +1115,7 @@ def _get_a2a_agent(
         raise RegistryError(
             "AGENT_URL_MISSING", f"Agent {agent_name} AgentCard missing url"
         )
-    return result, card, response, duration_ms
+    return result, card
 
 
 def _send_message(
@@ -567,44 +1124,47 @@ def _send_message(
     config: AgentKitA2ARegistryConfig,
     task_id: str | None = None,
 ) -> dict[str, Any]:
-    message: dict[str, Any] = {
-        "kind": "message",
-        "messageId": str(uuid.uuid4()),
-        "role": "user",
-        "parts": [{"kind": "text", "text": input_text}],
-    }
-    if task_id:
-        message["taskId"] = task_id
-
+    params = _message_send_params(input_text, task_id)
     headers: dict[str, str] = {}
     try:
         headers = _agent_auth_headers(card, config)
-        return _a2a_jsonrpc(
-            card["url"],
-            "message/send",
-            {"message": message, "configuration": {"blocking": False}},
-            headers,
-            config,
-        )
+        return _a2a_jsonrpc(card["url"], "message/send", params, headers, config)
     except RegistryError as exc:
         if _should_retry_with_m2m(exc, card, config, headers):
             return _a2a_jsonrpc(
                 card["url"],
                 "message/send",
-                {"message": message, "configuration": {"blocking": False}},
+                params,
                 _agent_auth_headers(card, config, force_m2m=True),
                 config,
             )
-        if exc.code in {
-            "A2A_HTTP_FAILED",
-            "A2A_RESPONSE_PARSE_FAILED",
-            "A2A_REMOTE_ERROR",
-            "A2A_RESPONSE_INVALID",
-        }:
-            raise RegistryError(
-                "A2A_TASK_CREATE_FAILED", exc.message, exc.diagnostics
-            ) from exc
-        raise
+        error = _task_create_error(exc)
+        if error is exc:
+            raise
+        raise error from exc
+
+
+def _message_send_params(input_text: str, task_id: str | None) -> dict[str, Any]:
+    message: dict[str, Any] = {
+        "kind": "message",
+        "messageId": str(uuid.uuid4()),
+        "role": "user",
+        "parts": [{"kind": "text", "text": input_text}],
+    }
+    if task_id:
+        message["taskId"] = task_id
+    return {"message": message, "configuration": {"blocking": False}}
+
+
+def _task_create_error(exc: RegistryError) -> RegistryError:
+    if exc.code in {
+        "A2A_HTTP_FAILED",
+        "A2A_RESPONSE_PARSE_FAILED",
+        "A2A_REMOTE_ERROR",
+        "A2A_RESPONSE_INVALID",
+    }:
+        return RegistryError("A2A_TASK_CREATE_FAILED", exc.message, exc.diagnostics)
+    return exc
 
 
 def _poll_card(
@@ -615,45 +1175,46 @@ def _poll_card(
     started: float | None = None,
 ) -> dict[str, Any]:
     started = started or time.monotonic()
+    params = {"id": task_id.strip(), "historyLength": max(0, int(history_length))}
     headers = _agent_auth_headers(card, config)
     try:
-        a2a_result = _a2a_jsonrpc(
-            card["url"],
-            "tasks/get",
-            {"id": task_id.strip(), "historyLength": max(0, int(history_length))},
-            headers,
-            config,
-        )
+        a2a_result = _a2a_jsonrpc(card["url"], "tasks/get", params, headers, config)
     except RegistryError as exc:
         if not _should_retry_with_m2m(exc, card, config, headers):
             raise
         a2a_result = _a2a_jsonrpc(
             card["url"],
             "tasks/get",
-            {"id": task_id.strip(), "historyLength": max(0, int(history_length))},
+            params,
             _agent_auth_headers(card, config, force_m2m=True),
             config,
         )
+    payload = _poll_payload(a2a_result, started)
+    if not payload["is_terminal"]:
+        sleep_seconds = config.poll_interval_ms / 1000
+        time.sleep(sleep_seconds)
+        _mark_poll_again(payload, sleep_seconds)
+    return _success(payload)
+
+
+def _poll_payload(a2a_result: dict[str, Any], started: float) -> dict[str, Any]:
     state = _task_state(a2a_result)
-    is_terminal = state in TERMINAL_STATES
     payload: dict[str, Any] = {
         "task": _task_summary(a2a_result),
-        "is_terminal": is_terminal,
+        "is_terminal": state in TERMINAL_STATES,
         "diagnostics": {"duration_ms": int((time.monotonic() - started) * 1000)},
     }
     response_text = _task_response_text(a2a_result)
     if response_text:
         payload["response"] = {"text": response_text}
+    return payload
 
-    if not is_terminal:
-        sleep_seconds = config.poll_interval_ms / 1000
-        time.sleep(sleep_seconds)
-        payload["diagnostics"]["sleep_seconds"] = sleep_seconds
-        payload["diagnostics"]["next_action"] = (
-            "call a2a_registry_task_poll again until task status is terminal"
-        )
 
-    return _success(payload)
+def _mark_poll_again(payload: dict[str, Any], sleep_seconds: float) -> None:
+    payload["diagnostics"]["sleep_seconds"] = sleep_seconds
+    payload["diagnostics"]["next_action"] = (
+        "call a2a_registry_task_poll again until task status is terminal"
+    )
 
 
 def _task_or_message_success(
@@ -695,12 +1256,6 @@ def _a2a_jsonrpc(
     headers: dict[str, str],
     config: AgentKitA2ARegistryConfig,
 ) -> dict[str, Any]:
-    payload = {
-        "jsonrpc": "2.0",
-        "id": str(uuid.uuid4()),
-        "method": method,
-        "params": params,
-    }
     request_headers = {"Content-Type": "application/json", **headers}
     response = None
 
@@ -708,7 +1263,7 @@ def _a2a_jsonrpc(
         response = requests.post(
             url,
             headers=request_headers,
-            json=payload,
+            json=_jsonrpc_payload(method, params),
             timeout=_timeout_seconds(config),
         )
         response.raise_for_status()
@@ -723,7 +1278,19 @@ def _a2a_jsonrpc(
         raise RegistryError(
             "A2A_RESPONSE_PARSE_FAILED", "A2A endpoint returned non-JSON response"
         ) from exc
+    return _jsonrpc_result(data)
+
+
+def _jsonrpc_payload(method: str, params: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": str(uuid.uuid4()),
+        "method": method,
+        "params": params,
+    }
+
 
+def _jsonrpc_result(data: dict[str, Any]) -> dict[str, Any]:
     if data.get("error"):
         error = data["error"]
         message = error.get("message") if isinstance(error, dict) else str(error)
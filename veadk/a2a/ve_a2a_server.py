@@ -14,11 +14,12 @@
 
 from a2a.server.apps.jsonrpc.fastapi_app import A2AFastAPIApplication
 from a2a.server.request_handlers.default_request_handler import DefaultRequestHandler
-from a2a.server.tasks.inmemory_task_store import InMemoryTaskStore
+from a2a.server.tasks import TaskStore
 from fastapi import FastAPI
 
 from veadk import Agent
 from veadk.a2a.agent_card import get_agent_card
+from veadk.a2a.ve_task_store import VeTaskStore
 from veadk.runner import Runner
 from veadk.memory.short_term_memory import ShortTermMemory
 
@@ -36,6 +37,7 @@ class VeA2AServer:
         app_name: str,
         short_term_memory: ShortTermMemory,
         credential_service: BaseCredentialService | None = None,
+        task_store: TaskStore | None = None,
     ):
         self.agent_card = get_agent_card(agent, url)
 
@@ -48,7 +50,7 @@ class VeA2AServer:
             )
         )
 
-        self.task_store = InMemoryTaskStore()
+        self.task_store = task_store or VeTaskStore()
 
         self.request_handler = DefaultRequestHandler(
             agent_executor=self.agent_executor, task_store=self.task_store
@@ -70,6 +72,7 @@ def init_app(
     agent: Agent,
     short_term_memory: ShortTermMemory,
     credential_service: BaseCredentialService | None = None,
+    task_store: TaskStore | None = None,
 ) -> FastAPI:
     """Init the fastapi application in terms of VeADK agent.
 
@@ -78,6 +81,8 @@ def init_app(
         app_name: str, the name of the app
         agent: Agent, the agent of the app
         short_term_memory: ShortTermMemory, the short term memory of the app
+        task_store: TaskStore, defaults to a `VeTaskStore` configured by the
+            `DATABASE_A2A_TASK_STORE_*` env vars
 
     Returns:
         FastAPI, the fastapi app
@@ -89,5 +94,6 @@ def init_app(
         app_name=app_name,
         short_term_memory=short_term_memory,
         credential_service=credential_service,
+        task_store=task_store,
     )
     return server.build()
@@ -12,26 +12,300 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+"""Task store of the VeADK A2A server.
+
+Tasks live in an in-process LRU tier with a TTL. With the `sqlite` or `redis`
+backend they are also written to a store shared by every worker process, so a
+task created by one worker can be queried, resumed or cancelled through
+another.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+from a2a.server.context import ServerCallContext
 from a2a.server.tasks import TaskStore
-from a2a.types import Task
+from a2a.types import Task, TaskState
 from typing_extensions import override
 
+from veadk.configs.database_configs import A2ATaskStoreConfig, RedisConfig
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Tasks in these states never change again, so every worker may cache them.
+TERMINAL_TASK_STATES = frozenset(
+    {
+        TaskState.completed,
+        TaskState.canceled,
+        TaskState.failed,
+        TaskState.rejected,
+    }
+)
+
+
+@dataclass
+class TaskStoreStats:
+    entries: int = 0
+    max_entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    shared_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def utilization(self) -> float:
+        return self.entries / self.max_entries if self.max_entries else 0.0
+
+
+class _SharedTaskStore(Protocol):
+    def put(self, task_id: str, state: str, data: str, ttl: float) -> None: ...
+
+    def get(self, task_id: str) -> Optional[str]: ...
+
+    def get_state(self, task_id: str) -> Optional[str]: ...
+
+    def delete(self, task_id: str) -> None: ...
+
+
+class _SqliteTaskStore:
+    """Shared tier in a sqlite file, for workers on one machine."""
+
+    _PURGE_EVERY = 100
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS a2a_tasks (id TEXT PRIMARY KEY, "
+                "state TEXT NOT NULL, data TEXT NOT NULL, expires_at REAL)"
+            )
+
+    def put(self, task_id: str, state: str, data: str, ttl: float) -> None:
+        expires_at = time.time() + ttl if ttl > 0 else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO a2a_tasks (id, state, data, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (task_id, state, data, expires_at),
+            )
+            self._writes += 1
+            if self._writes % self._PURGE_EVERY == 0:
+                self._conn.execute(
+                    "DELETE FROM a2a_tasks WHERE expires_at < ?", (time.time(),)
+                )
+
+    def get(self, task_id: str) -> Optional[str]:
+        return self._select("data", task_id)
+
+    def get_state(self, task_id: str) -> Optional[str]:
+        return self._select("state", task_id)
+
+    def delete(self, task_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM a2a_tasks WHERE id = ?", (task_id,))
+
+    def _select(self, column: str, task_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {column} FROM a2a_tasks WHERE id = ? "
+                "AND (expires_at IS NULL OR expires_at >= ?)",
+                (task_id, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+
+class _RedisTaskStore:
+    """Shared tier in Redis; the task state is kept under its own key."""
+
+    def __init__(self, client, prefix: str) -> None:
+        self._client = client
+        self._prefix = prefix
+
+    def put(self, task_id: str, state: str, data: str, ttl: float) -> None:
+        expire = int(ttl) if ttl > 0 else None
+        pipe = self._client.pipeline()
+        pipe.set(self._prefix + task_id, data, ex=expire)
+        pipe.set(f"{self._prefix}{task_id}:state", state, ex=expire)
+        pipe.execute()
+
+    def get(self, task_id: str) -> Optional[str]:
+        return self._decode(self._client.get(self._prefix + task_id))
+
+    def get_state(self, task_id: str) -> Optional[str]:
+        return self._decode(self._client.get(f"{self._prefix}{task_id}:state"))
+
+    def delete(self, task_id: str) -> None:
+        self._client.delete(self._prefix + task_id, f"{self._prefix}{task_id}:state")
+
+    @staticmethod
+    def _decode(value) -> Optional[str]:
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+
+def _create_shared_store(config: A2ATaskStoreConfig) -> Optional[_SharedTaskStore]:
+    if config.backend == "memory":
+        return None
+    logger.info(f"A2A tasks are shared across workers via {config.backend}")
+    if config.backend == "sqlite":
+        return _SqliteTaskStore(config.sqlite_path)
+    if config.backend == "redis":
+        try:
+            from redis import Redis
+        except ImportError:
+            raise ImportError(
+                "Please install VeADK extensions\npip install veadk-python[extensions]"
+            )
+        redis_config = RedisConfig()
+        client = Redis(
+            host=redis_config.host,
+            port=redis_config.port,
+            db=redis_config.db,
+            username=redis_config.username,
+            password=redis_config.password or None,
+        )
+        return _RedisTaskStore(client, config.redis_key_prefix)
+    raise ValueError(f"Unsupported A2A task store backend: {config.backend}")
+
 
 class VeTaskStore(TaskStore):
-    def __init__(self):
+    """A2A task store with an LRU + TTL memory tier and an optional shared tier.
+
+    Without a shared tier every read is served from memory. With one, each
+    save is written through and non-terminal tasks are always read from the
+    shared tier, because another worker may have advanced them; terminal tasks
+    never change, so they are cached locally (a delete on another worker
+    reaches those copies only when they expire). `get_state` reads only the
+    state, which is what clients polling a long-running task need.
+
+    Args:
+        config: Capacity, TTL and backend. Read from
+            `DATABASE_A2A_TASK_STORE_*` env vars when omitted.
+        shared_store: Shared tier to use instead of the configured backend.
+    """
+
+    def __init__(
+        self,
+        config: A2ATaskStoreConfig | None = None,
+        shared_store: _SharedTaskStore | None = None,
+    ) -> None:
         super().__init__()
+        self.config = config or A2ATaskStoreConfig()
+        self._shared = shared_store or _create_shared_store(self.config)
+        self._entries: OrderedDict[str, tuple[float, Task]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = TaskStoreStats(max_entries=self.config.max_entries)
 
     @override
-    async def save(self, task: Task) -> None:
+    async def save(self, task: Task, context: ServerCallContext | None = None) -> None:
         """Saves or updates a task in the store."""
-        return None
+        with self._lock:
+            self._remember(task)
+        if self._shared is not None:
+            await asyncio.to_thread(
+                self._shared.put,
+                task.id,
+                task.status.state.value,
+                task.model_dump_json(exclude_none=True),
+                self.config.ttl_seconds,
+            )
 
     @override
-    async def get(self, task_id: str) -> Task | None:
+    async def get(
+        self, task_id: str, context: ServerCallContext | None = None
+    ) -> Task | None:
         """Retrieves a task from the store by ID."""
+        with self._lock:
+            task = self._lookup(task_id)
+            if task is not None and (
+                self._shared is None or task.status.state in TERMINAL_TASK_STATES
+            ):
+                self._stats.hits += 1
+                return task
+
+        if self._shared is not None:
+            data = await asyncio.to_thread(self._shared.get, task_id)
+            if data is not None:
+                task = Task.model_validate_json(data)
+                with self._lock:
+                    self._remember(task)
+                    self._stats.shared_hits += 1
+                return task
+
+        with self._lock:
+            self._stats.misses += 1
+        return None
+
+    async def get_state(self, task_id: str) -> TaskState | None:
+        """Return only the state of a task, without loading its history."""
+        with self._lock:
+            task = self._lookup(task_id)
+            if task is not None and (
+                self._shared is None or task.status.state in TERMINAL_TASK_STATES
+            ):
+                self._stats.hits += 1
+                return task.status.state
+
+        if self._shared is not None:
+            state = await asyncio.to_thread(self._shared.get_state, task_id)
+            if state is not None:
+                with self._lock:
+                    self._stats.shared_hits += 1
+                return TaskState(state)
+
+        with self._lock:
+            self._stats.misses += 1
         return None
 
     @override
-    async def delete(self, task_id: str) -> None:
+    async def delete(
+        self, task_id: str, context: ServerCallContext | None = None
+    ) -> None:
         """Deletes a task from the store by ID."""
-        return None
+        with self._lock:
+            self._entries.pop(task_id, None)
+        if self._shared is not None:
+            await asyncio.to_thread(self._shared.delete, task_id)
+
+    def stats(self) -> TaskStoreStats:
+        with self._lock:
+            return TaskStoreStats(
+                **{**vars(self._stats), "entries": len(self._entries)}
+            )
+
+    def _lookup(self, task_id: str) -> Task | None:
+        entry = self._entries.get(task_id)
+        if entry is None:
+            return None
+        expires_at, task = entry
+        if expires_at and expires_at < time.monotonic():
+            del self._entries[task_id]
+            self._stats.expirations += 1
+            return None
+        self._entries.move_to_end(task_id)
+        return task
+
+    def _remember(self, task: Task) -> None:
+        ttl = self.config.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl > 0 else 0.0
+        self._entries[task.id] = (expires_at, task)
+        self._entries.move_to_end(task.id)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
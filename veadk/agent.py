@@ -43,6 +43,7 @@ from veadk.consts import DEFAULT_AGENT_NAME, DEFAULT_MODEL_EXTRA_CONFIG
 from veadk.knowledgebase import KnowledgeBase
 from veadk.memory.long_term_memory import LongTermMemory
 from veadk.memory.short_term_memory import ShortTermMemory
+from veadk.models.llm_cassette import CassetteLlm, maybe_wrap_with_cassette
 from veadk.processors import BaseRunProcessor, NoOpRunProcessor
 from veadk.prompts.agent_default_prompt import (
     DEFAULT_DESCRIPTION,
@@ -180,6 +181,7 @@ class Agent(LlmAgent):
     enable_dynamic_load_skills: bool = False
     enable_skills_checklist: bool = False
     _skills_with_checklist: Dict[str, Any] = {}
+    _skills_generation: Optional[int] = None
 
     runtime: Literal["adk", "codex", "piagent"] = "adk"
     """Agent runtime backend. ``"adk"`` (default) uses Google ADK's built-in LLM
@@ -299,6 +301,8 @@ class Agent(LlmAgent):
                 "You are trying to use your own LiteLLM client, some default request headers may be missing."
             )
 
+        self.model = maybe_wrap_with_cassette(self.model)
+
         self._prepare_tracers()
 
         self._validate_tool_dependencies()
@@ -446,9 +450,10 @@ class Agent(LlmAgent):
 
     def update_model(self, model_name: str):
         logger.info(f"Updating model to {model_name}")
-        self.model = self.model.model_copy(
-            update={"model": f"{self.model_provider}/{model_name}"}
-        )
+        update = {"model": f"{self.model_provider}/{model_name}"}
+        if isinstance(self.model, CassetteLlm):
+            update["inner"] = self.model.inner.model_copy(update=update)
+        self.model = self.model.model_copy(update=update)
 
     def load_skills(self):
         from pathlib import Path
@@ -110,6 +110,27 @@ class RedisConfig(BaseSettings):
     """STS token for Redis auth, not supported yet."""
 
 
+class A2ATaskStoreConfig(BaseSettings):
+    """Storage of A2A tasks served by `VeA2AServer`."""
+
+    model_config = SettingsConfigDict(env_prefix="DATABASE_A2A_TASK_STORE_")
+
+    backend: str = "memory"
+    """`memory`, or `sqlite` / `redis` to share tasks across worker processes."""
+
+    max_entries: int = 10000
+    """Capacity of the in-process LRU tier."""
+
+    ttl_seconds: float = 86400.0
+    """Seconds a task is kept after its last update; 0 keeps tasks forever."""
+
+    sqlite_path: str = ".veadk/a2a_tasks.sqlite3"
+    """Database file of the `sqlite` backend."""
+
+    redis_key_prefix: str = "veadk:a2a:task:"
+    """Key prefix of the `redis` backend, which connects with `DATABASE_REDIS_*`."""
+
+
 class MilvusConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="DATABASE_MILVUS_")
 
@@ -142,6 +163,9 @@ class Mem0Config(BaseSettings):
 
     base_url: str = ""  # "https://api.mem0.ai/v1"
 
+    max_concurrency: int = 8
+    """Events of one `asave_memory` call added at the same time."""
+
 
 class OpenVikingConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="DATABASE_OPENVIKING_")
@@ -207,6 +231,27 @@ class TOSConfig(BaseSettings):
         return _bucket
 
 
+class TOSTransferConfig(BaseSettings):
+    """Tuning of :class:`veadk.integrations.ve_tos.transfer.TransferManager`."""
+
+    model_config = SettingsConfigDict(env_prefix="DATABASE_TOS_TRANSFER_")
+
+    max_concurrency: int = 16
+    """Files transferred at the same time."""
+
+    multipart_threshold: int = 64 * 1024 * 1024
+    """Files of at least this many bytes use parallel multipart transfers."""
+
+    part_size: int = 20 * 1024 * 1024
+
+    part_concurrency: int = 4
+    """Parts of one multipart transfer in flight at the same time."""
+
+    checkpoint_dir: str = ""
+    """Where multipart checkpoints are kept so interrupted transfers resume;
+    defaults to ``<tmp>/veadk-tos-checkpoints``."""
+
+
 class NormalTOSConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="DATABASE_TOS_")
 
@@ -14,6 +14,7 @@
 
 import os
 from functools import cached_property
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -54,6 +55,22 @@ class ModelConfig(BaseSettings):
         return get_ark_token()
 
 
+class ArkClientPoolConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="MODEL_AGENT_HTTP_")
+
+    max_connections: int = 1000
+    """Upper bound of open connections shared by all pooled Ark clients."""
+
+    max_keepalive_connections: int = 100
+    """Idle connections kept open for reuse."""
+
+    keepalive_expiry: float = 30.0
+    """Seconds an idle connection stays in the pool."""
+
+    http2: bool = True
+    """Negotiate HTTP/2 when the `h2` package is installed."""
+
+
 class EmbeddingModelConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="MODEL_EMBEDDING_")
 
@@ -90,6 +107,35 @@ class NormalEmbeddingModelConfig(BaseSettings):
     api_key: str
 
 
+class EmbeddingCacheConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="MODEL_EMBEDDING_CACHE_")
+
+    enabled: bool = True
+    """Serve repeated texts and queries from the embedding cache."""
+
+    max_entries: int = 4096
+    """Capacity of the in-process LRU tier."""
+
+    path: str = ""
+    """Optional sqlite file for a persistent tier shared across processes."""
+
+
+class LlmCassetteConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="MODEL_CASSETTE_")
+
+    mode: Literal["off", "record", "replay"] = "off"
+    """`record` stores model turns to `path`, `replay` serves them offline."""
+
+    path: str = ""
+    """Cassette file (JSON lines, gzip-compressed when it ends with `.gz`)."""
+
+    first_chunk_latency_ms: float = 0.0
+    """Synthetic delay before the first replayed response of a turn."""
+
+    chunk_latency_ms: float = 0.0
+    """Synthetic delay between replayed streaming chunks."""
+
+
 class RealtimeModelConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="MODEL_REALTIME_")
 
@@ -49,6 +49,72 @@ class VeSpeechConfig(BaseSettings):
         return os.getenv("TOOL_VESPEECH_API_KEY") or get_speech_token()
 
 
+class MediaGenerationConfig(BaseSettings):
+    """HTTP pool and task polling of the image / video generation tools."""
+
+    model_config = SettingsConfigDict(env_prefix="TOOL_MEDIA_GENERATION_")
+
+    max_connections: int = 100
+    """Upper bound of open connections shared by the generation tools."""
+
+    max_keepalive_connections: int = 20
+    """Idle connections kept open for reuse."""
+
+    keepalive_expiry: float = 30.0
+    """Seconds an idle connection stays in the pool."""
+
+    poll_initial_interval: float = 2.0
+    """Seconds before the first status check of a new task."""
+
+    poll_max_interval: float = 15.0
+    """Upper bound of the per-task status check interval."""
+
+    poll_backoff: float = 1.5
+    """Factor the interval grows by after each check of an unfinished task."""
+
+    poll_jitter: float = 0.2
+    """Relative random spread of each interval, so tasks do not poll in lockstep."""
+
+    poll_batch_size: int = 100
+    """Task ids queried by one batched status request."""
+
+
+class WebFetchConfig(BaseSettings):
+    """HTTP pool, concurrency and cache of the `web_fetch` tool."""
+
+    model_config = SettingsConfigDict(env_prefix="TOOL_WEB_FETCH_")
+
+    http2: bool = True
+    """Negotiate HTTP/2 where servers offer it (needs the `h2` package)."""
+
+    max_connections: int = 100
+    """Upper bound of open connections of one event loop."""
+
+    max_keepalive_connections: int = 20
+    """Idle connections kept open for reuse."""
+
+    per_host_concurrency: int = 6
+    """Fetches in flight to one host at a time."""
+
+    cache_ttl_seconds: float = 900.0
+    """Seconds a fetched page is served without asking the server again."""
+
+    cache_max_entries: int = 256
+    """Pages kept in memory."""
+
+    cache_max_bytes: int = 64 * 1024 * 1024
+    """Total body bytes kept in memory."""
+
+    cache_dir: str = ""
+    """Directory of the disk tier; empty keeps the cache in memory only."""
+
+    cache_disk_max_bytes: int = 512 * 1024 * 1024
+    """Total bytes of the disk tier; least recently used pages go first."""
+
+    extract_workers: int = 4
+    """Threads converting fetched pages to markdown or text."""
+
+
 class BuiltinToolConfigs(BaseModel):
     vesearch: VeSearchConfig = Field(default_factory=VeSearchConfig)
     vespeech: VeSpeechConfig = Field(default_factory=VeSpeechConfig)
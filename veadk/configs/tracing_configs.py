@@ -38,6 +38,23 @@ class OpenTelemetryConfig(BaseSettings):
     )
 
 
+class InMemoryTraceStoreConfig(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="OBSERVABILITY_OPENTELEMETRY_INMEMORY_"
+    )
+
+    max_traces: int = 1000
+    """Traces kept for `Runner.save_tracing_file`, least recently updated
+    traces are evicted first."""
+
+    max_spans_per_trace: int = 10000
+    """Spans kept per trace, later spans of a larger trace are dropped."""
+
+    ttl: float = 3600
+    """Seconds a trace is kept after its last span. 0 keeps traces until
+    they are evicted by `max_traces`."""
+
+
 class APMPlusConfig(BaseSettings):
     otel_exporter_endpoint: str = Field(
         default=DEFAULT_APMPLUS_OTEL_EXPORTER_ENDPOINT,
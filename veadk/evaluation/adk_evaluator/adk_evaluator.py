@@ -78,17 +78,32 @@ class ADKEvaluator(BaseEvaluator):
         self,
         agent,
         name: str = "veadk_adk_evaluator",
+        *,
+        max_concurrency: int = 1,
+        rate_limit: Optional[float] = None,
+        checkpoint_path: Optional[str] = None,
     ):
         """Initializes the ADK evaluator with agent and name.
 
         Args:
             agent: The agent to evaluate.
             name (str): Name of the evaluator. Defaults to 'veadk_adk_evaluator'.
+            max_concurrency (int): Eval cases run at the same time. Defaults to 1.
+            rate_limit (Optional[float]): Agent invocations per second across
+                all cases. Unlimited by default.
+            checkpoint_path (Optional[str]): JSONL file recording finished
+                cases, so an interrupted run resumes where it stopped.
 
         Raises:
             ValueError: If agent is invalid.
         """
-        super().__init__(agent=agent, name=name)
+        super().__init__(
+            agent=agent,
+            name=name,
+            max_concurrency=max_concurrency,
+            rate_limit=rate_limit,
+            checkpoint_path=checkpoint_path,
+        )
 
     @override
     async def evaluate(
@@ -171,7 +186,43 @@ class ADKEvaluator(BaseEvaluator):
 
             evaluation_result_list = []
 
-            # For each eval case, generate actual outputs num_runs times using BaseEvaluator
+            # Generate actual outputs of all cases once per run; cases of a
+            # run execute concurrently through BaseEvaluator's runner
+            actual_runs: list[list[Invocation]] = [[] for _ in self.invocation_list]
+            for run_index in range(num_runs):
+                for agent_information in self.agent_information_list:
+                    agent_information["session_id"] = str(uuid.uuid4())
+
+                await self.generate_actual_outputs(run_index=run_index)
+
+                # Convert BaseEvaluator's actual data into ADK Invocation list
+                for case_idx, eval_case_data in enumerate(self.invocation_list):
+                    for inv in eval_case_data.invocations:
+                        user_content = genai_types.Content(
+                            role="user",
+                            parts=[genai_types.Part(text=inv.input or "")],
+                        )
+                        actual_final = genai_types.Content(
+                            role=None,
+                            parts=[genai_types.Part(text=inv.actual_output or "")],
+                        )
+                        # Collect the tool calls observed during actual execution
+                        actual_tool_calls = [
+                            SimpleNamespace(name=t.get("name"), args=t.get("args", {}))
+                            for t in (inv.actual_tool or [])
+                        ]
+                        # Pack a full actual Invocation for ADK metrics
+                        actual_runs[case_idx].append(
+                            Invocation(
+                                invocation_id=inv.invocation_id,
+                                user_content=user_content,
+                                final_response=actual_final,
+                                intermediate_data=IntermediateData(
+                                    tool_uses=actual_tool_calls
+                                ),
+                            )
+                        )
+
             for case_idx, eval_case_data in enumerate(self.invocation_list):
                 # Convert BaseEvaluator's expected data into ADK Invocation list
                 expected_invocations: list[Invocation] = []
@@ -200,41 +251,8 @@ class ADKEvaluator(BaseEvaluator):
                         )
                     )
 
-                # Collect actual invocations across runs
-                actual_invocations_all_runs: list[Invocation] = []
-                for _ in range(num_runs):
-                    for agent_information in self.agent_information_list:
-                        agent_information["session_id"] = str(uuid.uuid4())
-
-                    # Generate actual outputs for all cases in this run via BaseEvaluator
-                    await self.generate_actual_outputs()
-
-                    # Convert BaseEvaluator's actual data into ADK Invocation list
-                    for inv in eval_case_data.invocations:
-                        user_content = genai_types.Content(
-                            role="user",
-                            parts=[genai_types.Part(text=inv.input or "")],
-                        )
-                        actual_final = genai_types.Content(
-                            role=None,
-                            parts=[genai_types.Part(text=inv.actual_output or "")],
-                        )
-                        # Collect the tool calls observed during actual execution
-                        actual_tool_calls = [
-                            SimpleNamespace(name=t.get("name"), args=t.get("args", {}))
-                            for t in (inv.actual_tool or [])
-                        ]
-                        # Pack a full actual Invocation for ADK metrics
-                        actual_invocations_all_runs.append(
-                            Invocation(
-                                invocation_id=inv.invocation_id,
-                                user_content=user_content,
-                                final_response=actual_final,
-                                intermediate_data=IntermediateData(
-                                    tool_uses=actual_tool_calls
-                                ),
-                            )
-                        )
+                # Actual invocations of this case across runs
+                actual_invocations_all_runs = actual_runs[case_idx]
 
                 # Repeat expected invocations to align with num_runs
                 expected_invocations_repeated = expected_invocations * num_runs
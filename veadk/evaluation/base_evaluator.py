@@ -25,6 +25,12 @@ from google.adk.sessions import InMemorySessionService
 from google.genai import types
 from pydantic import BaseModel
 
+from veadk.evaluation.eval_runner import (
+    EvalRunStats,
+    ParallelEvalRunner,
+    TokenBucket,
+    agent_fingerprint,
+)
 from veadk.utils.adk_compat import get_event_function_calls
 from veadk.utils.misc import formatted_timestamp
 
@@ -192,6 +198,9 @@ class BaseEvaluator:
         invocation_list (list[EvalTestCase]): List of test cases.
         result_list (list[EvalResultData]): List of evaluation results.
         agent_information_list (list[dict]): List of agent config info.
+        runner (ParallelEvalRunner): Runs the eval cases of each pass.
+        last_run_stats (EvalRunStats | None): Latencies and counts of the
+            latest generation pass.
 
     Note:
         Subclasses must implement evaluate method.
@@ -202,12 +211,21 @@ class BaseEvaluator:
         self,
         agent,
         name: str,
+        *,
+        max_concurrency: int = 1,
+        rate_limit: Optional[float] = None,
+        checkpoint_path: Optional[str] = None,
     ):
         """Initializes the base evaluator with agent and name.
 
         Args:
             agent: Agent instance to evaluate.
             name (str): Identifier for the evaluator.
+            max_concurrency (int): Eval cases run at the same time. Defaults to 1.
+            rate_limit (Optional[float]): Agent invocations per second across
+                all cases. Unlimited by default.
+            checkpoint_path (Optional[str]): JSONL file recording finished
+                cases, so an interrupted run resumes where it stopped.
 
         Raises:
             ValueError: If agent or name invalid.
@@ -217,6 +235,12 @@ class BaseEvaluator:
         self.invocation_list: list[EvalTestCase] = []
         self.result_list: list[EvalResultData] = []
         self.agent_information_list: list[dict] = []
+        self.runner = ParallelEvalRunner(
+            max_concurrency=max_concurrency,
+            rate_limit=rate_limit,
+            checkpoint_path=checkpoint_path,
+        )
+        self.last_run_stats: Optional[EvalRunStats] = None
 
     def _build_eval_set_from_eval_json(self, eval_json_path: str) -> EvalSet:
         """Builds eval set from standard eval JSON file.
@@ -490,92 +514,110 @@ class BaseEvaluator:
             eval_case_data_list.append(eval_case_data)
         self.invocation_list = eval_case_data_list
 
-    async def generate_actual_outputs(self):
+    async def generate_actual_outputs(self, run_index: int = 0) -> EvalRunStats:
         """Generates actual outputs by running the agent on inputs.
 
         This method uses Runner to execute agent for each invocation.
-        Captures outputs, tools, and latency.
+        Captures outputs, tools, and latency. Eval cases run concurrently
+        through `self.runner`; the invocations of a case run in order.
+
+        Args:
+            run_index (int): Pass number when cases are run several times;
+                part of the checkpoint key, like the agent's configuration.
 
         Returns:
-            None: Updates invocation actual fields.
+            EvalRunStats: Case latencies and counts; also kept in
+                `last_run_stats`. Invocation actual fields are updated in place.
 
         Raises:
             Exception: If runner or execution fails.
 
         Note:
-        Uses InMemorySessionService for isolation.
+        Uses a separate InMemorySessionService per case for isolation.
         Supports long-term memory if present.
         """
-        for eval_case_data, agent_information in zip(
-            self.invocation_list, self.agent_information_list
-        ):
-            session_service = InMemorySessionService()
-            _ = await session_service.create_session(
+        self.last_run_stats = await self.runner.run(
+            self.invocation_list,
+            self.agent_information_list,
+            self._generate_case_outputs,
+            run_index=run_index,
+            fingerprint=agent_fingerprint(self.agent),
+        )
+        return self.last_run_stats
+
+    async def _generate_case_outputs(
+        self,
+        eval_case_data: EvalTestCase,
+        agent_information: dict,
+        limiter: Optional[TokenBucket] = None,
+    ) -> None:
+        """Runs the invocations of one eval case in order in its own session."""
+        session_service = InMemorySessionService()
+        _ = await session_service.create_session(
+            app_name=agent_information["app_name"],
+            user_id=agent_information["user_id"],
+            state={},
+            session_id=agent_information["session_id"],
+        )
+
+        if getattr(self.agent, "long_term_memory", None):
+            runner = Runner(
                 app_name=agent_information["app_name"],
-                user_id=agent_information["user_id"],
-                state={},
-                session_id=agent_information["session_id"],
+                agent=self.agent,
+                session_service=session_service,
+                memory_service=self.agent.long_term_memory,
+            )
+        else:
+            runner = Runner(
+                app_name=agent_information["app_name"],
+                agent=self.agent,
+                session_service=session_service,
             )
 
-            if getattr(self.agent, "long_term_memory", None):
-                runner = Runner(
-                    app_name=agent_information["app_name"],
-                    agent=self.agent,
-                    session_service=session_service,
-                    memory_service=self.agent.long_term_memory,
-                )
-            else:
-                runner = Runner(
-                    app_name=agent_information["app_name"],
-                    agent=self.agent,
-                    session_service=session_service,
-                )
+        for invocation in eval_case_data.invocations:
+            _actual_output: str = ""
+            _actual_tool: list[dict] = []
+            _latency: str = ""
+            final_response = None
+            tool_uses = []
+            invocation_id = ""
 
-            for invocation in eval_case_data.invocations:
-                _actual_output: str = ""
-                _actual_tool: list[dict] = []
-                _latency: str = ""
-                final_response = None
-                tool_uses = []
-                invocation_id = ""
+            if limiter is not None:
+                await limiter.acquire()
 
-                user_content = types.Content(
-                    role="user", parts=[types.Part(text=invocation.input)]
+            user_content = types.Content(
+                role="user", parts=[types.Part(text=invocation.input)]
+            )
+            tik = time.time()
+            async for event in runner.run_async(
+                user_id=agent_information["user_id"],
+                session_id=agent_information["session_id"],
+                new_message=user_content,
+            ):
+                invocation_id = (
+                    event.invocation_id if not invocation_id else invocation_id
+                )
+                if event.is_final_response() and event.content and event.content.parts:
+                    final_response = event.content
+                else:
+                    for call in get_event_function_calls(event):
+                        tool_uses.append(call)
+            tok = time.time()
+            _latency = str((tok - tik) * 1000)
+
+            if final_response and final_response.parts:
+                _actual_output = final_response.parts[0].text
+            for tool_use in tool_uses:
+                _actual_tool.append(
+                    {
+                        "name": tool_use.name,
+                        "args": tool_use.args,
+                    }
                 )
-                tik = time.time()
-                async for event in runner.run_async(
-                    user_id=agent_information["user_id"],
-                    session_id=agent_information["session_id"],
-                    new_message=user_content,
-                ):
-                    invocation_id = (
-                        event.invocation_id if not invocation_id else invocation_id
-                    )
-                    if (
-                        event.is_final_response()
-                        and event.content
-                        and event.content.parts
-                    ):
-                        final_response = event.content
-                    else:
-                        for call in get_event_function_calls(event):
-                            tool_uses.append(call)
-                tok = time.time()
-                _latency = str((tok - tik) * 1000)
-
-                if final_response and final_response.parts:
-                    _actual_output = final_response.parts[0].text
-                for tool_use in tool_uses:
-                    _actual_tool.append(
-                        {
-                            "name": tool_use.name,
-                            "args": tool_use.args,
-                        }
-                    )
 
-                invocation.actual_output = _actual_output
-                invocation.actual_tool = _actual_tool
-                invocation.latency = _latency
+            invocation.actual_output = _actual_output
+            invocation.actual_tool = _actual_tool
+            invocation.latency = _latency
 
     def get_eval_set_information(self) -> list[list[dict[str, Any]]]:
         """Retrieves combined evaluation information.
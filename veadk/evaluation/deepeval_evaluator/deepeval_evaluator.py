@@ -84,6 +84,10 @@ class DeepevalEvaluator(BaseEvaluator):
         judge_model_api_base: str = "",
         name: str = "veadk_deepeval_evaluator",
         prometheus_config: PrometheusPushgatewayConfig | None = None,
+        *,
+        max_concurrency: int = 1,
+        rate_limit: Optional[float] = None,
+        checkpoint_path: Optional[str] = None,
     ):
         """Sets up the DeepEval evaluator with agent and judge model.
 
@@ -98,6 +102,11 @@ class DeepevalEvaluator(BaseEvaluator):
             name: Name for this evaluator. Defaults to 'veadk_deepeval_evaluator'.
             prometheus_config: Settings for Prometheus export. If None,
                 no export happens.
+            max_concurrency: Eval cases run at the same time. Defaults to 1.
+            rate_limit: Agent invocations per second across all cases.
+                Unlimited by default.
+            checkpoint_path: JSONL file recording finished cases, so an
+                interrupted run resumes where it stopped.
 
         Raises:
             ValueError: If model settings are wrong.
@@ -111,7 +120,13 @@ class DeepevalEvaluator(BaseEvaluator):
                 prometheus_config=prometheus_config)
             ```
         """
-        super().__init__(agent=agent, name=name)
+        super().__init__(
+            agent=agent,
+            name=name,
+            max_concurrency=max_concurrency,
+            rate_limit=rate_limit,
+            checkpoint_path=checkpoint_path,
+        )
 
         if not judge_model_api_key:
             judge_model_api_key = getenv("MODEL_JUDGE_API_KEY") or getenv(
@@ -0,0 +1,308 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent generation of actual outputs for evaluation cases.
+
+Eval cases are independent conversations, so :class:`ParallelEvalRunner` runs
+them side by side under a concurrency cap, while the invocations of one case
+still run in order in that case's own session. A token bucket bounds the rate
+of agent invocations, so a large suite stays within model quotas. Finished
+cases can be appended to a JSONL checkpoint; a rerun with the same checkpoint
+and the same agent configuration restores them instead of calling the agent
+again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+from veadk.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from veadk.evaluation.base_evaluator import EvalTestCase
+
+logger = get_logger(__name__)
+
+CaseRunner = Callable[["EvalTestCase", dict, "TokenBucket | None"], Awaitable[None]]
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, at most `burst` saved up."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = float(burst or max(1, math.ceil(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of `values`; 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class EvalRunStats:
+    """Outcome of one generation pass over all eval cases.
+
+    Attributes:
+        case_latencies_ms: Wall time of each case, by case index. Restored
+            cases report the latency recorded in the checkpoint.
+        completed: Cases run against the agent in this pass.
+        restored: Cases restored from the checkpoint.
+        failed: Case index mapped to the error that stopped it.
+    """
+
+    case_latencies_ms: dict[int, float] = field(default_factory=dict)
+    completed: int = 0
+    restored: int = 0
+    failed: dict[int, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def latency_percentiles(self) -> dict[str, float]:
+        values = list(self.case_latencies_ms.values())
+        return {f"p{q}": percentile(values, q) for q in (50, 90, 99)}
+
+
+def agent_fingerprint(agent: Any) -> str:
+    """Digest of the configuration that shapes an agent's outputs.
+
+    Covers the name, model, instruction, description and tool names of the
+    agent and its sub-agents, so checkpointed outputs of an agent are not
+    restored for a changed one.
+    """
+    digest = hashlib.sha256()
+    _update_fingerprint(digest, agent, set())
+    return digest.hexdigest()[:16]
+
+
+def _update_fingerprint(digest: Any, agent: Any, seen: set[int]) -> None:
+    if agent is None or id(agent) in seen:
+        return
+    seen.add(id(agent))
+    model = getattr(agent, "model", None)
+    parts = [
+        getattr(agent, "name", ""),
+        getattr(model, "model", model),
+        getattr(agent, "instruction", ""),
+        getattr(agent, "description", ""),
+        *sorted(
+            getattr(tool, "name", None) or _describe(tool)
+            for tool in getattr(agent, "tools", None) or []
+        ),
+    ]
+    for part in parts:
+        digest.update(_describe(part).encode("utf-8"))
+        digest.update(b"\0")
+    for sub_agent in getattr(agent, "sub_agents", None) or []:
+        _update_fingerprint(digest, sub_agent, seen)
+    digest.update(b"\n")
+
+
+def _describe(value: Any) -> str:
+    # Functions are named, as their repr differs from process to process.
+    if callable(value) and hasattr(value, "__qualname__"):
+        return f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+    return str(value)
+
+
+def case_checkpoint_key(
+    run_index: int, case_index: int, case: "EvalTestCase", fingerprint: str = ""
+) -> str:
+    """Identify a case of a run by position, the content of its inputs and
+    the `fingerprint` of the agent that answers them."""
+    digest = hashlib.sha256()
+    digest.update(fingerprint.encode("utf-8"))
+    digest.update(b"\n")
+    for invocation in case.invocations:
+        digest.update(invocation.invocation_id.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(invocation.input.encode("utf-8"))
+        digest.update(b"\n")
+    return f"{run_index}:{case_index}:{digest.hexdigest()[:16]}"
+
+
+class _Checkpoint:
+    """Append-only JSONL record of finished cases."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.records: dict[str, dict] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        self.records[record["key"]] = record
+                    except (ValueError, KeyError, TypeError):
+                        # A torn last line of an interrupted run.
+                        continue
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def restore(self, key: str, case: "EvalTestCase") -> Optional[float]:
+        record = self.records.get(key)
+        if record is None or len(record["invocations"]) != len(case.invocations):
+            return None
+        for invocation, saved in zip(case.invocations, record["invocations"]):
+            invocation.actual_output = saved["actual_output"]
+            invocation.actual_tool = saved["actual_tool"]
+            invocation.latency = saved["latency"]
+        return record.get("latency_ms", 0.0)
+
+    def save(self, key: str, case: "EvalTestCase", latency_ms: float) -> None:
+        record = {
+            "key": key,
+            "latency_ms": latency_ms,
+            "invocations": [
+                {
+                    "invocation_id": invocation.invocation_id,
+                    "actual_output": invocation.actual_output,
+                    "actual_tool": invocation.actual_tool,
+                    "latency": invocation.latency,
+                }
+                for invocation in case.invocations
+            ],
+        }
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+        self.records[key] = record
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParallelEvalRunner:
+    """Run eval cases concurrently, each through `run_case`.
+
+    Args:
+        max_concurrency: Cases in flight at once.
+        rate_limit: Agent invocations per second across all cases; unlimited
+            when omitted.
+        burst: Invocations that may start at once after an idle period.
+            Defaults to one second worth of `rate_limit`.
+        checkpoint_path: JSONL file recording finished cases. Cases already
+            in it are restored instead of run.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.checkpoint_path = checkpoint_path
+
+    async def run(
+        self,
+        cases: list["EvalTestCase"],
+        agent_information_list: list[dict],
+        run_case: CaseRunner,
+        run_index: int = 0,
+        fingerprint: str = "",
+    ) -> EvalRunStats:
+        """Generate actual outputs of every case, filling them in place.
+
+        A failing case does not stop the others. Once every case finished,
+        the first error is raised; the finished cases are already in the
+        checkpoint, so a rerun only repeats the failed ones. Checkpointed
+        cases are only restored for the same `fingerprint`, see
+        `agent_fingerprint`.
+        """
+        stats = EvalRunStats()
+        errors: list[Exception] = []
+        started = time.perf_counter()
+        limiter = TokenBucket(self.rate_limit, self.burst) if self.rate_limit else None
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        checkpoint = _Checkpoint(self.checkpoint_path) if self.checkpoint_path else None
+
+        async def _run(case_index: int, case: "EvalTestCase", info: dict) -> None:
+            key = case_checkpoint_key(run_index, case_index, case, fingerprint)
+            if checkpoint is not None:
+                latency_ms = checkpoint.restore(key, case)
+                if latency_ms is not None:
+                    stats.restored += 1
+                    stats.case_latencies_ms[case_index] = latency_ms
+                    return
+            async with semaphore:
+                tik = time.perf_counter()
+                try:
+                    await run_case(case, info, limiter)
+                except Exception as e:
+                    logger.error(f"Eval case {case_index} failed: {e}")
+                    stats.failed[case_index] = str(e)
+                    errors.append(e)
+                    return
+                latency_ms = (time.perf_counter() - tik) * 1000
+            stats.completed += 1
+            stats.case_latencies_ms[case_index] = latency_ms
+            if checkpoint is not None:
+                checkpoint.save(key, case, latency_ms)
+
+        try:
+            await asyncio.gather(
+                *(
+                    _run(case_index, case, info)
+                    for case_index, (case, info) in enumerate(
+                        zip(cases, agent_information_list)
+                    )
+                )
+            )
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+        stats.elapsed = time.perf_counter() - started
+        percentiles = stats.latency_percentiles()
+        logger.info(
+            f"Generated outputs of {stats.completed} eval cases "
+            f"({stats.restored} restored, {len(stats.failed)} failed) in "
+            f"{stats.elapsed:.1f}s; case latency p50={percentiles['p50']:.0f}ms "
+            f"p90={percentiles['p90']:.0f}ms p99={percentiles['p99']:.0f}ms"
+        )
+        if errors:
+            raise errors[0]
+        return stats
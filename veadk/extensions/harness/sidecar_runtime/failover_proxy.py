@@ -12,16 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Stable localhost HTTP relay for Sidecar-to-direct-path failover."""
+"""Stable localhost HTTP relay for Sidecar-to-direct-path failover.
+
+Every model and tool call of a harness runtime passes through one of these
+relays, so they run on asyncio: one event loop thread per relay serves the
+local port with keep-alive, request and response bodies are streamed in both
+directions, and upstream connections are pooled and reused instead of being
+opened per request.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import json
+import socket
 import threading
-import urllib.error
+import time
 import urllib.parse
-import urllib.request
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+import httpx
+import uvicorn
+
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 _HOP_BY_HOP_HEADERS = {
     "connection",
@@ -34,41 +51,333 @@ _HOP_BY_HOP_HEADERS = {
     "upgrade",
 }
 
+# Weight of the newest sample in the latency moving average.
+_LATENCY_EWMA_ALPHA = 0.2
+
+
+@dataclass
+class UpstreamStats:
+    """Counters of one relay upstream.
+
+    ``latency_ms`` is a moving average of the time until response headers
+    arrive. ``errors`` counts transport failures (refused, reset or timed-out
+    connections); ``server_errors`` counts 5xx responses.
+    """
+
+    name: str
+    url: str
+    requests: int = 0
+    errors: int = 0
+    server_errors: int = 0
+    latency_ms: float = 0.0
+    healthy: bool = True
+
 
-class StableHttpRelay:
-    """Expose one stable URL and atomically switch its upstream target."""
+class _Upstream:
+    def __init__(self, name: str, base_url: str) -> None:
+        self.base_url = base_url
+        self.stats = UpstreamStats(name=name, url=base_url)
+        self.consecutive_failures = 0
 
-    def __init__(self, active_url: str, fallback_url: str) -> None:
-        self._active = _validated_base_url(active_url)
-        self._fallback = _validated_base_url(fallback_url)
-        self._source_path = urllib.parse.urlsplit(self._active).path.rstrip("/")
-        self._target = self._active
-        self._target_lock = threading.Lock()
-        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
-        self._server.daemon_threads = True
+    def record_response(self, status_code: int, latency: float) -> None:
+        self.stats.requests += 1
+        if status_code >= 500:
+            self.stats.server_errors += 1
+        latency_ms = latency * 1000
+        if self.stats.requests == 1:
+            self.stats.latency_ms = latency_ms
+        else:
+            self.stats.latency_ms += _LATENCY_EWMA_ALPHA * (
+                latency_ms - self.stats.latency_ms
+            )
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self.stats.requests += 1
+        self.stats.errors += 1
+        self.consecutive_failures += 1
+
+
+class _AsyncHttpRelay:
+    """Localhost relay core shared by the failover and Runtime Gateway relays.
+
+    Subclasses choose the upstreams of a request in ``_candidates`` and build
+    its target URL and headers in ``_upstream_request``. When an upstream
+    cannot be connected to, the request moves on to the next candidate; that
+    is safe for any method because nothing was sent yet.
+    """
+
+    _THREAD_NAME = "agentkit-harness-relay"
+    _UNAVAILABLE_ERROR = "upstream_unavailable"
+
+    def __init__(
+        self,
+        source_path: str,
+        upstreams: Sequence[_Upstream],
+        *,
+        timeout_seconds: float,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+    ) -> None:
+        self._source_path = source_path
+        self._upstreams = list(upstreams)
+        self._timeout = httpx.Timeout(timeout_seconds, connect=min(timeout_seconds, 10))
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._lock = threading.Lock()
+        self._client: httpx.AsyncClient | None = None
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen(2048)
+        self._address = self._socket.getsockname()[:2]
+        self._server = uvicorn.Server(
+            uvicorn.Config(
+                self._app,
+                interface="asgi3",
+                lifespan="off",
+                log_config=None,
+                log_level="warning",
+                access_log=False,
+                proxy_headers=False,
+                server_header=False,
+                date_header=False,
+                timeout_graceful_shutdown=5,
+            )
+        )
+        self._ready = threading.Event()
         self._thread = threading.Thread(
-            target=self._server.serve_forever,
-            name="agentkit-harness-direct-failover",
-            daemon=True,
+            target=self._run, name=self._THREAD_NAME, daemon=True
         )
         self._thread.start()
+        if not self._ready.wait(timeout=10) or not self._server.started:
+            self.close()
+            raise RuntimeError("harness relay failed to start")
 
     @property
     def url(self) -> str:
-        host, port = self._server.server_address[:2]
+        host, port = self._address
         return f"http://{host}:{port}{self._source_path}"
 
-    def activate_fallback(self) -> None:
-        with self._target_lock:
-            self._target = self._fallback
+    def stats(self) -> list[UpstreamStats]:
+        """Return a snapshot of the counters of every upstream."""
+        with self._lock:
+            return [replace(upstream.stats) for upstream in self._upstreams]
 
     def close(self) -> None:
-        self._server.shutdown()
-        self._server.server_close()
+        self._server.should_exit = True
         if threading.current_thread() is not self._thread:
-            self._thread.join(timeout=5)
+            self._thread.join(timeout=10)
+        self._socket.close()
+
+    def _candidates(self) -> list[_Upstream]:
+        return self._upstreams
+
+    def _upstream_request(
+        self, upstream: _Upstream, request_path: str, headers: list[tuple[str, str]]
+    ) -> tuple[str, list[tuple[str, str]]]:
+        raise NotImplementedError
+
+    def _mark_failure(self, upstream: _Upstream, error: httpx.TransportError) -> None:
+        with self._lock:
+            upstream.record_failure()
+
+    async def _background(self) -> None:
+        """Long-running work next to the server, e.g. health checks."""
+
+    def _run(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        self._client = httpx.AsyncClient(timeout=self._timeout, limits=self._limits)
+        background = asyncio.create_task(self._background())
+        watcher = asyncio.create_task(self._signal_ready())
+        try:
+            await self._server.serve(sockets=[self._socket])
+        finally:
+            self._ready.set()
+            for task in (background, watcher):
+                task.cancel()
+            await asyncio.gather(background, watcher, return_exceptions=True)
+            await self._client.aclose()
+
+    async def _signal_ready(self) -> None:
+        while not self._server.started and not self._server.should_exit:
+            await asyncio.sleep(0.01)
+        self._ready.set()
+
+    async def _app(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return
+        assert self._client is not None
+        method = scope["method"]
+        request_path = scope.get("raw_path") or scope["path"].encode("utf-8")
+        if scope.get("query_string"):
+            request_path += b"?" + scope["query_string"]
+        incoming_headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in scope["headers"]
+            if name.decode("latin-1").lower() not in _HOP_BY_HOP_HEADERS
+            and name.lower() != b"host"
+        ]
+        has_body = any(
+            name.lower() == "content-length" and value.strip() not in {"", "0"}
+            for name, value in incoming_headers
+        ) or any(
+            name.lower() == b"transfer-encoding" and b"chunked" in value.lower()
+            for name, value in scope["headers"]
+        )
+        body_read = False
+
+        async def request_body() -> AsyncIterator[bytes]:
+            nonlocal body_read
+            while True:
+                message = await receive()
+                body_read = True
+                if message["type"] == "http.disconnect":
+                    return
+                if message.get("body"):
+                    yield message["body"]
+                if not message.get("more_body", False):
+                    return
+
+        response: httpx.Response | None = None
+        upstream: _Upstream | None = None
+        for upstream in self._candidates():
+            url, headers = self._upstream_request(
+                upstream, request_path.decode("latin-1"), incoming_headers
+            )
+            request = httpx.Request(
+                method,
+                url,
+                headers=headers,
+                content=request_body() if has_body else None,
+            )
+            started = time.perf_counter()
+            try:
+                response = await self._client.send(request, stream=True)
+            except httpx.TransportError as error:
+                self._mark_failure(upstream, error)
+                if isinstance(error, httpx.ConnectError) and not body_read:
+                    continue
+                break
+            with self._lock:
+                upstream.record_response(
+                    response.status_code, time.perf_counter() - started
+                )
+            break
+
+        if response is None:
+            await self._send_unavailable(method, send)
+            return
+
+        try:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": response.status_code,
+                    "headers": [
+                        (name, value)
+                        for name, value in response.headers.raw
+                        if name.decode("latin-1").lower() not in _HOP_BY_HOP_HEADERS
+                    ],
+                }
+            )
+            if method != "HEAD":
+                async for chunk in response.aiter_raw():
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    )
+            await send({"type": "http.response.body", "body": b""})
+        except httpx.TransportError as error:
+            # Headers are already out; dropping the connection tells the
+            # client that the body is incomplete.
+            assert upstream is not None
+            with self._lock:
+                upstream.stats.errors += 1
+            raise RuntimeError(f"upstream stream interrupted: {error}") from error
+        finally:
+            await response.aclose()
+
+    async def _send_unavailable(self, method: str, send: Any) -> None:
+        payload = self._unavailable_payload()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 502,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(payload)).encode("ascii")),
+                ],
+            }
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": b"" if method == "HEAD" else payload,
+            }
+        )
+
+    def _unavailable_payload(self) -> bytes:
+        return json.dumps({"status": "error", "error": self._UNAVAILABLE_ERROR}).encode(
+            "utf-8"
+        )
+
+
+class StableHttpRelay(_AsyncHttpRelay):
+    """Expose one stable URL and switch its upstream target on failure.
+
+    Requests go to ``active_url`` while it is healthy. It is marked unhealthy
+    when a connection to it is refused, after ``failure_threshold``
+    consecutive transport failures, or when the periodic health check cannot
+    open a TCP connection to it; traffic then goes to ``fallback_url`` until
+    a later health check succeeds. ``activate_fallback`` pins the fallback
+    for good, e.g. once the Sidecar process is known to have exited.
+    """
+
+    _THREAD_NAME = "agentkit-harness-direct-failover"
+    _UNAVAILABLE_ERROR = "direct_upstream_unavailable"
+
+    def __init__(
+        self,
+        active_url: str,
+        fallback_url: str,
+        *,
+        timeout_seconds: float = 60.0,
+        health_check_interval: float = 2.0,
+        failure_threshold: int = 3,
+    ) -> None:
+        self._active = _Upstream("active", _validated_base_url(active_url))
+        self._fallback = _Upstream("fallback", _validated_base_url(fallback_url))
+        self._health_check_interval = health_check_interval
+        self._failure_threshold = max(1, failure_threshold)
+        self._pinned = False
+        super().__init__(
+            urllib.parse.urlsplit(self._active.base_url).path.rstrip("/"),
+            [self._active, self._fallback],
+            timeout_seconds=timeout_seconds,
+        )
+
+    def activate_fallback(self) -> None:
+        with self._lock:
+            self._pinned = True
+            self._active.stats.healthy = False
 
-    def _target_url(self, request_path: str) -> str:
+    def _candidates(self) -> list[_Upstream]:
+        with self._lock:
+            if self._pinned or not self._active.stats.healthy:
+                return [self._fallback]
+        return [self._active, self._fallback]
+
+    def _upstream_request(
+        self, upstream: _Upstream, request_path: str, headers: list[tuple[str, str]]
+    ) -> tuple[str, list[tuple[str, str]]]:
+        return self._target_url(upstream.base_url, request_path), headers
+
+    def _target_url(self, base_url: str, request_path: str) -> str:
         incoming = urllib.parse.urlsplit(request_path)
         request_base = self._source_path
         if incoming.path == request_base:
@@ -77,91 +386,65 @@ class StableHttpRelay:
             suffix = incoming.path[len(request_base) :]
         else:
             suffix = incoming.path
-        with self._target_lock:
-            target = urllib.parse.urlsplit(self._target)
+        target = urllib.parse.urlsplit(base_url)
         target_path = target.path.rstrip("/") + suffix
         query = "&".join(value for value in (target.query, incoming.query) if value)
         return urllib.parse.urlunsplit(
             (target.scheme, target.netloc, target_path or "/", query, "")
         )
 
-    def _handler(self) -> type[BaseHTTPRequestHandler]:
-        relay = self
-
-        class RelayHandler(BaseHTTPRequestHandler):
-            protocol_version = "HTTP/1.1"
-
-            def log_message(self, *_args: object) -> None:
+    def _mark_failure(self, upstream: _Upstream, error: httpx.TransportError) -> None:
+        with self._lock:
+            upstream.record_failure()
+            if upstream is not self._active or not upstream.stats.healthy:
                 return
+            if (
+                isinstance(error, httpx.ConnectError)
+                or upstream.consecutive_failures >= self._failure_threshold
+            ):
+                upstream.stats.healthy = False
+            else:
+                return
+        logger.warning(
+            f"Harness relay upstream {upstream.base_url} failed ({error!r}); "
+            f"failing over to {self._fallback.base_url}"
+        )
 
-            def do_GET(self) -> None:  # noqa: N802
-                self._forward()
-
-            def do_POST(self) -> None:  # noqa: N802
-                self._forward()
-
-            def do_PUT(self) -> None:  # noqa: N802
-                self._forward()
-
-            def do_PATCH(self) -> None:  # noqa: N802
-                self._forward()
-
-            def do_DELETE(self) -> None:  # noqa: N802
-                self._forward()
-
-            def do_OPTIONS(self) -> None:  # noqa: N802
-                self._forward()
-
-            def do_HEAD(self) -> None:  # noqa: N802
-                self._forward()
-
-            def _forward(self) -> None:
-                content_length = int(self.headers.get("Content-Length", "0") or 0)
-                body = self.rfile.read(content_length) if content_length else None
-                headers = {
-                    name: value
-                    for name, value in self.headers.items()
-                    if name.lower() not in _HOP_BY_HOP_HEADERS
-                    and name.lower() not in {"host", "content-length"}
-                }
-                request = urllib.request.Request(
-                    relay._target_url(self.path),
-                    data=body,
-                    headers=headers,
-                    method=self.command,
-                )
-                try:
-                    response = urllib.request.urlopen(request, timeout=60)
-                except urllib.error.HTTPError as error:
-                    response = error
-                except (OSError, urllib.error.URLError):
-                    payload = json.dumps(
-                        {"status": "error", "error": "direct_upstream_unavailable"}
-                    ).encode("utf-8")
-                    self.send_response(502)
-                    self.send_header("Content-Type", "application/json")
-                    self.send_header("Content-Length", str(len(payload)))
-                    self.send_header("Connection", "close")
-                    self.end_headers()
-                    if self.command != "HEAD":
-                        self.wfile.write(payload)
-                    self.close_connection = True
+    async def _background(self) -> None:
+        target = urllib.parse.urlsplit(self._active.base_url)
+        host = target.hostname or "127.0.0.1"
+        port = target.port or (443 if target.scheme == "https" else 80)
+        while True:
+            await asyncio.sleep(self._health_check_interval)
+            with self._lock:
+                if self._pinned:
                     return
+            healthy = await _tcp_reachable(host, port, self._health_check_interval)
+            with self._lock:
+                if self._pinned or healthy == self._active.stats.healthy:
+                    continue
+                self._active.stats.healthy = healthy
+                self._active.consecutive_failures = 0
+            if healthy:
+                logger.info(f"Harness relay upstream {self._active.base_url} recovered")
+            else:
+                logger.warning(
+                    f"Harness relay upstream {self._active.base_url} failed its "
+                    f"health check; failing over to {self._fallback.base_url}"
+                )
 
-                with response:
-                    self.send_response(response.getcode())
-                    for name, value in response.headers.items():
-                        if name.lower() not in _HOP_BY_HOP_HEADERS:
-                            self.send_header(name, value)
-                    self.send_header("Connection", "close")
-                    self.end_headers()
-                    if self.command != "HEAD":
-                        while chunk := response.read(64 * 1024):
-                            self.wfile.write(chunk)
-                            self.wfile.flush()
-                self.close_connection = True
 
-        return RelayHandler
+async def _tcp_reachable(host: str, port: int, timeout: float) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
 
 
 def _validated_base_url(value: str) -> str:
@@ -173,4 +456,4 @@ def _validated_base_url(value: str) -> str:
     )
 
 
-__all__ = ["StableHttpRelay"]
+__all__ = ["StableHttpRelay", "UpstreamStats"]
@@ -17,27 +17,19 @@
 from __future__ import annotations
 
 import json
-import threading
-import urllib.error
 import urllib.parse
-import urllib.request
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-
-_HOP_BY_HOP_HEADERS = {
-    "connection",
-    "keep-alive",
-    "proxy-authenticate",
-    "proxy-authorization",
-    "te",
-    "trailer",
-    "transfer-encoding",
-    "upgrade",
-}
-
-
-class RuntimeGatewayHttpRelay:
+
+from .failover_proxy import _AsyncHttpRelay, _Upstream
+
+_REPLACED_HEADERS = {"authorization", "x-faas-proxy-port"}
+
+
+class RuntimeGatewayHttpRelay(_AsyncHttpRelay):
     """Expose a localhost URL while sending every request through APIG."""
 
+    _THREAD_NAME = "agentkit-harness-runtime-gateway"
+    _UNAVAILABLE_ERROR = "runtime_gateway_unavailable"
+
     def __init__(
         self,
         gateway_url: str,
@@ -48,7 +40,6 @@ class RuntimeGatewayHttpRelay:
         timeout_seconds: float,
     ) -> None:
         self._gateway = _validated_gateway_url(gateway_url)
-        self._source_path = _normalized_path(source_path)
         self._api_key = str(api_key).strip()
         if not self._api_key:
             raise ValueError("Runtime Gateway API key is required")
@@ -57,29 +48,26 @@ class RuntimeGatewayHttpRelay:
         if timeout_seconds <= 0:
             raise ValueError("Runtime Gateway timeout must be positive")
         self._target_port = int(target_port)
-        self._timeout_seconds = float(timeout_seconds)
-        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
-        self._server.daemon_threads = True
-        self._thread = threading.Thread(
-            target=self._server.serve_forever,
-            name="agentkit-harness-runtime-gateway",
-            daemon=True,
+        super().__init__(
+            _normalized_path(source_path),
+            [_Upstream("gateway", self._gateway)],
+            timeout_seconds=float(timeout_seconds),
         )
-        self._thread.start()
-
-    @property
-    def url(self) -> str:
-        host, port = self._server.server_address[:2]
-        return f"http://{host}:{port}{self._source_path}"
 
     def activate_fallback(self) -> None:
         """Keep the APIG route fail-closed; no direct Sidecar fallback exists."""
 
-    def close(self) -> None:
-        self._server.shutdown()
-        self._server.server_close()
-        if threading.current_thread() is not self._thread:
-            self._thread.join(timeout=5)
+    def _upstream_request(
+        self, upstream: _Upstream, request_path: str, headers: list[tuple[str, str]]
+    ) -> tuple[str, list[tuple[str, str]]]:
+        forwarded = [
+            (name, value)
+            for name, value in headers
+            if name.lower() not in _REPLACED_HEADERS
+        ]
+        forwarded.append(("Authorization", f"Bearer {self._api_key}"))
+        forwarded.append(("X-Faas-Proxy-Port", str(self._target_port)))
+        return self._target_url(request_path), forwarded
 
     def _target_url(self, request_path: str) -> str:
         incoming = urllib.parse.urlsplit(request_path)
@@ -97,94 +85,11 @@ class RuntimeGatewayHttpRelay:
             )
         )
 
-    def _handler(self) -> type[BaseHTTPRequestHandler]:
-        relay = self
-
-        class RelayHandler(BaseHTTPRequestHandler):
-            protocol_version = "HTTP/1.1"
-
-            def log_message(self, *_args: object) -> None:
-                return
-
-            def do_GET(self) -> None:
-                self._forward()
-
-            def do_POST(self) -> None:
-                self._forward()
-
-            def do_PUT(self) -> None:
-                self._forward()
-
-            def do_PATCH(self) -> None:
-                self._forward()
-
-            def do_DELETE(self) -> None:
-                self._forward()
-
-            def do_OPTIONS(self) -> None:
-                self._forward()
-
-            def do_HEAD(self) -> None:
-                self._forward()
-
-            def _forward(self) -> None:
-                content_length = int(self.headers.get("Content-Length", "0") or 0)
-                body = self.rfile.read(content_length) if content_length else None
-                headers = {
-                    str(name): str(value)
-                    for name, value in self.headers.items()
-                    if str(name).lower() not in _HOP_BY_HOP_HEADERS
-                    and str(name).lower()
-                    not in {
-                        "authorization",
-                        "content-length",
-                        "host",
-                        "x-faas-proxy-port",
-                    }
-                }
-                headers["Authorization"] = f"Bearer {relay._api_key}"
-                headers["X-Faas-Proxy-Port"] = str(relay._target_port)
-                request = urllib.request.Request(
-                    relay._target_url(self.path),
-                    data=body,
-                    headers=headers,
-                    method=self.command,
-                )
-                try:
-                    response = urllib.request.urlopen(
-                        request, timeout=relay._timeout_seconds
-                    )
-                except urllib.error.HTTPError as error:
-                    response = error
-                except (OSError, urllib.error.URLError):
-                    payload = json.dumps(
-                        {"status": "error", "error": "runtime_gateway_unavailable"},
-                        separators=(",", ":"),
-                    ).encode("utf-8")
-                    self.send_response(502)
-                    self.send_header("Content-Type", "application/json")
-                    self.send_header("Content-Length", str(len(payload)))
-                    self.send_header("Connection", "close")
-                    self.end_headers()
-                    if self.command != "HEAD":
-                        self.wfile.write(payload)
-                    self.close_connection = True
-                    return
-
-                with response:
-                    self.send_response(response.getcode())
-                    for name, value in response.headers.items():
-                        if name.lower() not in _HOP_BY_HOP_HEADERS:
-                            self.send_header(name, value)
-                    self.send_header("Connection", "close")
-                    self.end_headers()
-                    if self.command != "HEAD":
-                        while chunk := response.read(64 * 1024):
-                            self.wfile.write(chunk)
-                            self.wfile.flush()
-                self.close_connection = True
-
-        return RelayHandler
+    def _unavailable_payload(self) -> bytes:
+        return json.dumps(
+            {"status": "error", "error": self._UNAVAILABLE_ERROR},
+            separators=(",", ":"),
+        ).encode("utf-8")
 
 
 def _validated_gateway_url(value: str) -> str:
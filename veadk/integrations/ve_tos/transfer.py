@@ -0,0 +1,307 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parallel bulk transfers between local files and a TOS bucket.
+
+:class:`TransferManager` moves many files at once on a bounded thread pool.
+Files at or above ``multipart_threshold`` go through the TOS SDK's multipart
+``upload_file`` / ``download_file`` with several parts in flight and a
+checkpoint file, so an interrupted transfer of a large file resumes where it
+stopped instead of starting over. Progress and throughput are reported
+through an optional callback.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from veadk.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from veadk.configs.database_configs import TOSTransferConfig
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class TransferProgress:
+    """Snapshot of a running bulk transfer."""
+
+    total_files: int
+    total_bytes: int
+    done_files: int = 0
+    failed_files: int = 0
+    transferred_bytes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second since the transfer started."""
+        return self.transferred_bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class TransferResult:
+    """Outcome of a bulk transfer.
+
+    Attributes:
+        succeeded: Object keys (uploads) or local paths (downloads) that
+            completed.
+        failed: Same identifiers mapped to the error that stopped them.
+        transferred_bytes: Bytes moved by this run.
+        elapsed: Wall time in seconds.
+    """
+
+    succeeded: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    transferred_bytes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    @property
+    def throughput(self) -> float:
+        return self.transferred_bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+ProgressCallback = Callable[[TransferProgress], None]
+
+
+class _Tracker:
+    """Thread-safe progress shared by the workers of one transfer."""
+
+    def __init__(
+        self, total_files: int, total_bytes: int, callback: Optional[ProgressCallback]
+    ) -> None:
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._callback = callback
+        self.progress = TransferProgress(total_files, total_bytes)
+        self.result = TransferResult()
+
+    def listener(self, consumed: int, total: int, rw_once: int, type_: Any) -> None:
+        """``data_transfer_listener`` of the TOS SDK."""
+        if rw_once > 0:
+            self.add_bytes(rw_once)
+
+    def add_bytes(self, size: int) -> None:
+        with self._lock:
+            self.progress.transferred_bytes += size
+            snapshot = self._snapshot()
+        self._notify(snapshot)
+
+    def done(self, name: str, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            if error is None:
+                self.progress.done_files += 1
+                self.result.succeeded.append(name)
+            else:
+                self.progress.failed_files += 1
+                self.result.failed[name] = str(error)
+            snapshot = self._snapshot()
+        self._notify(snapshot)
+
+    def finish(self) -> TransferResult:
+        with self._lock:
+            self.result.elapsed = time.monotonic() - self._started
+            self.result.transferred_bytes = self.progress.transferred_bytes
+            return self.result
+
+    def _snapshot(self) -> TransferProgress:
+        self.progress.elapsed = time.monotonic() - self._started
+        return TransferProgress(**vars(self.progress))
+
+    def _notify(self, snapshot: TransferProgress) -> None:
+        if self._callback is None:
+            return
+        try:
+            self._callback(snapshot)
+        except Exception as e:  # pragma: no cover - user callback
+            logger.warning(f"TOS transfer progress callback failed: {e}")
+
+
+class TransferManager:
+    """Upload and download many files in parallel through a TOS client.
+
+    Args:
+        client: A ``tos.TosClientV2``.
+        config: Concurrency and multipart tuning; read from
+            ``DATABASE_TOS_TRANSFER_*`` environment variables by default.
+        progress_callback: Called with a :class:`TransferProgress` snapshot
+            whenever bytes move or a file finishes, from worker threads.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        config: Optional["TOSTransferConfig"] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> None:
+        if config is None:
+            from veadk.configs.database_configs import TOSTransferConfig
+
+            config = TOSTransferConfig()
+        self._client = client
+        self.config = config
+        self.progress_callback = progress_callback
+        self.checkpoint_dir = config.checkpoint_dir or os.path.join(
+            tempfile.gettempdir(), "veadk-tos-checkpoints"
+        )
+
+    def upload_files(
+        self,
+        bucket: str,
+        items: list[tuple[str, str]],
+        metadata: Optional[dict] = None,
+    ) -> TransferResult:
+        """Upload ``(file_path, object_key)`` pairs; failures do not stop others."""
+        sizes = [os.path.getsize(path) for path, _ in items]
+        tracker = _Tracker(len(items), sum(sizes), self.progress_callback)
+
+        def _upload(path: str, key: str, size: int) -> None:
+            try:
+                if size >= self.config.multipart_threshold:
+                    self._client.upload_file(
+                        bucket=bucket,
+                        key=key,
+                        file_path=path,
+                        meta=metadata,
+                        part_size=self.config.part_size,
+                        task_num=self.config.part_concurrency,
+                        enable_checkpoint=True,
+                        checkpoint_file=self._checkpoint_path("upload", bucket, key),
+                        data_transfer_listener=tracker.listener,
+                    )
+                else:
+                    self._client.put_object_from_file(
+                        bucket=bucket,
+                        key=key,
+                        file_path=path,
+                        meta=metadata,
+                        data_transfer_listener=tracker.listener,
+                    )
+            except Exception as e:
+                logger.warning(f"Upload of {path} to {bucket}/{key} failed: {e}")
+                tracker.done(key, e)
+            else:
+                tracker.done(key)
+
+        self._run(
+            _upload, [(path, key, size) for (path, key), size in zip(items, sizes)]
+        )
+        result = tracker.finish()
+        logger.info(
+            f"Uploaded {len(result.succeeded)}/{len(items)} files to {bucket} "
+            f"({result.transferred_bytes} bytes, {result.throughput / 1e6:.1f} MB/s)"
+        )
+        return result
+
+    def download_files(
+        self, bucket: str, items: list[tuple[str, str, int]]
+    ) -> TransferResult:
+        """Download ``(object_key, file_path, size)`` triples.
+
+        The size (as listed by ``list_objects_type2``) picks the multipart path.
+        Single-shot downloads are written to a temporary file first, so a
+        failed download never leaves a truncated file behind.
+        """
+        tracker = _Tracker(
+            len(items), sum(size for _, _, size in items), self.progress_callback
+        )
+
+        def _download(key: str, path: str, size: int) -> None:
+            try:
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                if size >= self.config.multipart_threshold:
+                    self._client.download_file(
+                        bucket=bucket,
+                        key=key,
+                        file_path=path,
+                        part_size=self.config.part_size,
+                        task_num=self.config.part_concurrency,
+                        enable_checkpoint=True,
+                        checkpoint_file=self._checkpoint_path("download", bucket, key),
+                        data_transfer_listener=tracker.listener,
+                    )
+                else:
+                    self._download_small(bucket, key, path, tracker)
+            except Exception as e:
+                logger.warning(f"Download of {bucket}/{key} to {path} failed: {e}")
+                tracker.done(path, e)
+            else:
+                tracker.done(path)
+
+        self._run(_download, items)
+        result = tracker.finish()
+        logger.info(
+            f"Downloaded {len(result.succeeded)}/{len(items)} files from {bucket} "
+            f"({result.transferred_bytes} bytes, {result.throughput / 1e6:.1f} MB/s)"
+        )
+        return result
+
+    async def aupload_files(
+        self,
+        bucket: str,
+        items: list[tuple[str, str]],
+        metadata: Optional[dict] = None,
+    ) -> TransferResult:
+        return await asyncio.to_thread(self.upload_files, bucket, items, metadata)
+
+    async def adownload_files(
+        self, bucket: str, items: list[tuple[str, str, int]]
+    ) -> TransferResult:
+        return await asyncio.to_thread(self.download_files, bucket, items)
+
+    def _download_small(
+        self, bucket: str, key: str, path: str, tracker: _Tracker
+    ) -> None:
+        partial = f"{path}.{os.getpid()}.{threading.get_ident()}.partial"
+        try:
+            output = self._client.get_object(bucket=bucket, key=key)
+            with open(partial, "wb") as file:
+                for chunk in output:
+                    file.write(chunk)
+                    tracker.add_bytes(len(chunk))
+            os.replace(partial, path)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+
+    def _checkpoint_path(self, direction: str, bucket: str, key: str) -> str:
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        digest = hashlib.sha256(f"{bucket}/{key}".encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.checkpoint_dir, f"{direction}-{digest}")
+
+    def _run(self, transfer: Callable[..., None], items: list[tuple]) -> None:
+        if not items:
+            return
+        workers = max(1, min(self.config.max_concurrency, len(items)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="veadk-tos-transfer"
+        ) as pool:
+            for future in [pool.submit(transfer, *item) for item in items]:
+                future.result()
@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, List, Optional, Union
 from urllib.parse import urlparse
 
 from veadk.consts import DEFAULT_TOS_BUCKET_NAME
+from veadk.integrations.ve_tos.transfer import ProgressCallback, TransferManager
 from veadk.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -560,44 +561,48 @@ class VeTOS:
             logger.error(f"Async upload failed: {e}")
             return
 
+    def transfer_manager(
+        self, progress_callback: Optional[ProgressCallback] = None
+    ) -> TransferManager:
+        """Build a :class:`TransferManager` on this client for bulk transfers."""
+        return TransferManager(self._client, progress_callback=progress_callback)
+
+    def _file_keys(
+        self, file_paths: List[str], object_keys: Optional[List[str]]
+    ) -> List[str]:
+        # If object_keys length doesn't match file_paths, generate object key for each file
+        if object_keys is None or len(object_keys) != len(file_paths):
+            object_keys = [self._build_object_key_for_file(p) for p in file_paths]
+            logger.debug(f"Generated object keys: {object_keys}")
+        return object_keys
+
     def upload_files(
         self,
         file_paths: List[str],
         bucket_name: str = "",
         object_keys: Optional[List[str]] = None,
         metadata: dict | None = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> None:
-        """Upload multiple files to TOS bucket
+        """Upload multiple files to TOS bucket in parallel
 
         Args:
             file_paths: List of local file paths
             bucket_name: TOS bucket name
             object_keys: List of object keys, auto-generated if empty or length mismatch
             metadata: Metadata to associate with the object
+            progress_callback: Receives :class:`TransferProgress` snapshots
         """
         bucket_name = self._check_bucket_name(bucket_name)
-
-        # If object_keys is None, create empty list
-        if object_keys is None:
-            object_keys = []
-
-        # If object_keys length doesn't match file_paths, generate object key for each file
-        if len(object_keys) != len(file_paths):
-            object_keys = []
-            for file_path in file_paths:
-                object_key = self._build_object_key_for_file(file_path)
-                object_keys.append(object_key)
-            logger.debug(f"Generated object keys: {object_keys}")
-
-        # Upload each file
-        try:
-            for file_path, object_key in zip(file_paths, object_keys):
-                # Note: upload_file method doesn't return value, we use exceptions to determine success
-                self.upload_file(file_path, bucket_name, object_key, metadata=metadata)
+        object_keys = self._file_keys(file_paths, object_keys)
+        if not self._ensure_client_and_bucket(bucket_name):
             return
+        try:
+            self.transfer_manager(progress_callback).upload_files(
+                bucket_name, list(zip(file_paths, object_keys)), metadata
+            )
         except Exception as e:
             logger.error(f"Upload files failed: {str(e)}")
-            return
 
     async def async_upload_files(
         self,
@@ -605,111 +610,87 @@ class VeTOS:
         bucket_name: str = "",
         object_keys: Optional[List[str]] = None,
         metadata: dict | None = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> None:
-        """Asynchronously upload multiple files to TOS bucket
+        """Asynchronously upload multiple files to TOS bucket in parallel
 
         Args:
             file_paths: List of local file paths
             bucket_name: TOS bucket name
             object_keys: List of object keys, auto-generated if empty or length mismatch
             metadata: Metadata to associate with the object
+            progress_callback: Receives :class:`TransferProgress` snapshots
         """
-        bucket_name = self._check_bucket_name(bucket_name)
+        await asyncio.to_thread(
+            self.upload_files,
+            file_paths,
+            bucket_name,
+            object_keys,
+            metadata,
+            progress_callback,
+        )
 
-        # If object_keys is None, create empty list
-        if object_keys is None:
-            object_keys = []
-
-        # If object_keys length doesn't match file_paths, generate object key for each file
-        if len(object_keys) != len(file_paths):
-            object_keys = []
-            for file_path in file_paths:
-                object_key = self._build_object_key_for_file(file_path)
-                object_keys.append(object_key)
-            logger.debug(f"Generated object keys: {object_keys}")
-
-        # Upload each file
-        try:
-            for file_path, object_key in zip(file_paths, object_keys):
-                # Use asyncio.to_thread to execute blocking TOS operations in thread
-                await asyncio.to_thread(
-                    self._client.put_object_from_file,
-                    bucket=bucket_name,
-                    key=object_key,
-                    file_path=file_path,
-                    meta=metadata,
-                )
-                logger.debug(f"Async upload success, object_key: {object_key}")
-            return
-        except Exception as e:
-            logger.error(f"Async upload files failed: {str(e)}")
-            return
+    @staticmethod
+    def _directory_files(directory_path: str) -> List[tuple[str, str]]:
+        """``(path, object_key)`` of every file below ``directory_path``."""
+        items = []
+        for root, _, files in os.walk(directory_path):
+            for name in files:
+                path = os.path.join(root, name)
+                # Use relative path of file as object key
+                items.append((path, os.path.relpath(path, directory_path)))
+        return items
 
     def upload_directory(
-        self, directory_path: str, bucket_name: str = "", metadata: dict | None = None
+        self,
+        directory_path: str,
+        bucket_name: str = "",
+        metadata: dict | None = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> None:
-        """Upload entire directory to TOS bucket
+        """Upload entire directory to TOS bucket in parallel
 
         Args:
             directory_path: Local directory path
             bucket_name: TOS bucket name
             metadata: Metadata to associate with the objects
+            progress_callback: Receives :class:`TransferProgress` snapshots
         """
         bucket_name = self._check_bucket_name(bucket_name)
-
-        def _upload_dir(root_dir):
-            items = os.listdir(root_dir)
-            for item in items:
-                path = os.path.join(root_dir, item)
-                if os.path.isdir(path):
-                    _upload_dir(path)
-                if os.path.isfile(path):
-                    # Use relative path of file as object key
-                    object_key = os.path.relpath(path, directory_path)
-                    # upload_file method doesn't return value, use exceptions to determine success
-                    self.upload_file(path, bucket_name, object_key, metadata=metadata)
-
         try:
-            _upload_dir(directory_path)
+            items = self._directory_files(directory_path)
+            if not self._ensure_client_and_bucket(bucket_name):
+                return
+            self.transfer_manager(progress_callback).upload_files(
+                bucket_name, items, metadata
+            )
             logger.debug(f"Upload directory success: {directory_path}")
-            return
         except Exception as e:
             logger.error(f"Upload directory failed: {str(e)}")
             raise
 
     async def async_upload_directory(
-        self, directory_path: str, bucket_name: str = "", metadata: dict | None = None
+        self,
+        directory_path: str,
+        bucket_name: str = "",
+        metadata: dict | None = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> None:
-        """Asynchronously upload entire directory to TOS bucket
+        """Asynchronously upload entire directory to TOS bucket in parallel
 
         Args:
             directory_path: Local directory path
             bucket_name: TOS bucket name
             metadata: Metadata to associate with the objects
+            progress_callback: Receives :class:`TransferProgress` snapshots
         """
-        bucket_name = self._check_bucket_name(bucket_name)
-
-        async def _aupload_dir(root_dir):
-            items = os.listdir(root_dir)
-            for item in items:
-                path = os.path.join(root_dir, item)
-                if os.path.isdir(path):
-                    await _aupload_dir(path)
-                if os.path.isfile(path):
-                    # Use relative path of file as object key
-                    object_key = os.path.relpath(path, directory_path)
-                    # Asynchronously upload single file
-                    await self.async_upload_file(
-                        path, bucket_name, object_key, metadata=metadata
-                    )
-
-        try:
-            await _aupload_dir(directory_path)
-            logger.debug(f"Async upload directory success: {directory_path}")
-            return
-        except Exception as e:
-            logger.error(f"Async upload directory failed: {str(e)}")
-            raise
+        await asyncio.to_thread(
+            self.upload_directory,
+            directory_path,
+            bucket_name,
+            metadata,
+            progress_callback,
+        )
 
     def download(self, bucket_name: str, object_key: str, save_path: str) -> bool:
         """download object from TOS"""
@@ -737,14 +718,19 @@ class VeTOS:
             return False
 
     def download_directory(
-        self, bucket_name: str, prefix: str, local_dir: str = "/tmp"
+        self,
+        bucket_name: str,
+        prefix: str,
+        local_dir: str = "/tmp",
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> bool:
-        """Download entire directory from TOS bucket to local directory
+        """Download entire directory from TOS bucket to local directory in parallel
 
         Args:
             bucket_name: TOS bucket name
             prefix: Directory prefix in TOS (e.g., "skills/pdf/")
             local_dir: Local directory path to save files
+            progress_callback: Receives :class:`TransferProgress` snapshots
 
         Returns:
             bool: True if download succeeds, False otherwise
@@ -764,10 +750,9 @@ class VeTOS:
             os.makedirs(local_dir, exist_ok=True)
 
             # List all objects with the prefix
+            items: List[tuple[str, str, int]] = []
             is_truncated = True
             next_continuation_token = ""
-            downloaded_count = 0
-
             while is_truncated:
                 out = self._client.list_objects_type2(
                     bucket_name,
@@ -777,34 +762,30 @@ class VeTOS:
                 is_truncated = out.is_truncated
                 next_continuation_token = out.next_continuation_token
 
-                # Download each object
                 for content in out.contents:
                     object_key = content.key
-
                     # Skip directory markers (objects ending with /)
                     if object_key.endswith("/"):
                         continue
-
-                    # Calculate relative path and local file path
                     relative_path = object_key[len(prefix) :]
-                    local_file_path = os.path.join(local_dir, relative_path)
-
-                    # Create subdirectories if needed
-                    local_file_dir = os.path.dirname(local_file_path)
-                    if local_file_dir:
-                        os.makedirs(local_file_dir, exist_ok=True)
+                    items.append(
+                        (
+                            object_key,
+                            os.path.join(local_dir, relative_path),
+                            int(getattr(content, "size", 0) or 0),
+                        )
+                    )
 
-                    # Download the file
-                    if self.download(bucket_name, object_key, local_file_path):
-                        downloaded_count += 1
-                        logger.debug(f"Downloaded: {object_key} -> {local_file_path}")
-                    else:
-                        logger.warning(f"Failed to download: {object_key}")
+            result = self.transfer_manager(progress_callback).download_files(
+                bucket_name, items
+            )
+            for path, error in result.failed.items():
+                logger.warning(f"Failed to download: {path} ({error})")
 
             logger.info(
-                f"Downloaded {downloaded_count} files from {bucket_name}/{prefix} to {local_dir}"
+                f"Downloaded {len(result.succeeded)} files from {bucket_name}/{prefix} to {local_dir}"
             )
-            return downloaded_count > 0
+            return len(result.succeeded) > 0
 
         except Exception as e:
             logger.error(f"Failed to download directory: {str(e)}")
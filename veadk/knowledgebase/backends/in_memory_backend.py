@@ -12,14 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from llama_index.core import Document, SimpleDirectoryReader, VectorStoreIndex
-from llama_index.core.schema import BaseNode
+import os
+
+from llama_index.core import Document, VectorStoreIndex
+from llama_index.core.schema import BaseNode, MetadataMode
 from pydantic import Field
 from typing_extensions import Any, override
 
 from veadk.configs.model_configs import EmbeddingModelConfig, NormalEmbeddingModelConfig
 from veadk.knowledgebase.backends.base_backend import BaseKnowledgebaseBackend
-from veadk.knowledgebase.backends.utils import get_llama_index_splitter
+from veadk.knowledgebase.backends.ingestion_manifest import (
+    IngestionDiff,
+    IngestionManifest,
+    delete_ref_docs_from_index,
+    sync_directory,
+)
+from veadk.knowledgebase.backends.ingestion_pipeline import iter_file_node_batches
+from veadk.knowledgebase.backends.utils import split_documents
 from veadk.models.ark_embedding import create_embedding_model
 
 
@@ -27,24 +36,61 @@ class InMemoryKnowledgeBackend(BaseKnowledgebaseBackend):
     """A in-memory implementation backend for knowledgebase.
 
     In-memory backend stores embedded text in a vector storage from Llama-index.
+    When `persist_dir` is set, chunks and vectors are stored on disk instead and
+    memory-mapped on startup, so restarts and sibling worker processes reuse
+    the index without re-embedding.
 
     Attributes:
         embedding_config (EmbeddingModelConfig):
             Embedding config for text embedding and search.
             Embedding config contains embedding model name and the corresponding dim.
+        persist_dir (str):
+            Directory to persist the index to. The index is stored in the
+            `<persist_dir>/<index>` sub-directory. Empty keeps it in memory only.
+        manifest_path (str):
+            JSON file recording the files ingested by `add_from_directory`.
+            Defaults to `manifest.json` next to a persisted index, otherwise
+            the manifest is kept in memory like the index. Setting it without
+            `persist_dir` is rejected, as the manifest would outlive the index.
     """
 
     embedding_config: NormalEmbeddingModelConfig | EmbeddingModelConfig = Field(
         default_factory=EmbeddingModelConfig
     )
 
+    persist_dir: str = ""
+
+    manifest_path: str = ""
+
     def model_post_init(self, __context: Any) -> None:
         self._embed_model = create_embedding_model(
             model_name=self.embedding_config.name,
             api_key=self.embedding_config.api_key,
             api_base=self.embedding_config.api_base,
         )
-        self._vector_index = VectorStoreIndex([], embed_model=self._embed_model)
+        if self.persist_dir:
+            from veadk.knowledgebase.backends.local_vector_store import (
+                LocalVectorStore,
+            )
+
+            self._vector_store = LocalVectorStore(
+                os.path.join(self.persist_dir, self.index)
+            )
+            manifest_path = self.manifest_path or os.path.join(
+                self._vector_store.path, "manifest.json"
+            )
+        else:
+            if self.manifest_path:
+                raise ValueError(
+                    "`manifest_path` requires `persist_dir`: an in-memory index "
+                    "does not survive a restart, so the files a persisted "
+                    "manifest records would never be ingested again."
+                )
+            self._vector_store = None
+            self._vector_index = VectorStoreIndex([], embed_model=self._embed_model)
+            manifest_path = ""
+        self._manifest = IngestionManifest(manifest_path)
+        self._last_ingestion_diff: IngestionDiff | None = None
 
     @override
     def precheck_index_naming(self) -> None:
@@ -53,16 +99,19 @@ class InMemoryKnowledgeBackend(BaseKnowledgebaseBackend):
 
     @override
     def add_from_directory(self, directory: str) -> bool:
-        documents = SimpleDirectoryReader(input_dir=directory).load_data()
-        nodes = self._split_documents(documents)
-        self._vector_index.insert_nodes(nodes)
+        self._last_ingestion_diff = sync_directory(
+            directory,
+            self._manifest,
+            iter_node_batches=iter_file_node_batches,
+            insert_nodes=self._insert_nodes,
+            delete_ref_docs=self._delete_ref_docs,
+        )
         return True
 
     @override
     def add_from_files(self, files: list[str]) -> bool:
-        documents = SimpleDirectoryReader(input_files=files).load_data()
-        nodes = self._split_documents(documents)
-        self._vector_index.insert_nodes(nodes)
+        for nodes in iter_file_node_batches(files):
+            self._insert_nodes(nodes)
         return True
 
     @override
@@ -72,20 +121,46 @@ class InMemoryKnowledgeBackend(BaseKnowledgebaseBackend):
         else:
             documents = [Document(text=t) for t in text]
         nodes = self._split_documents(documents)
-        self._vector_index.insert_nodes(nodes)
+        self._insert_nodes(nodes)
         return True
 
+    @property
+    def last_ingestion_diff(self) -> IngestionDiff | None:
+        """Diff summary of the latest `add_from_directory` call."""
+        return self._last_ingestion_diff
+
     @override
     def search(self, query: str, top_k: int = 5) -> list[str]:
+        if self._vector_store is not None:
+            query_embedding = self._embed_model.get_query_embedding(query)
+            return [
+                text for text, _ in self._vector_store.search(query_embedding, top_k)
+            ]
         _retriever = self._vector_index.as_retriever(similarity_top_k=top_k)
         retrieved_nodes = _retriever.retrieve(query)
         return [node.text for node in retrieved_nodes]
 
+    def _insert_nodes(self, nodes: list[BaseNode]) -> None:
+        if self._vector_store is None:
+            self._vector_index.insert_nodes(nodes)
+            return
+        embeddings = self._embed_model.get_text_embedding_batch(
+            [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+        )
+        self._vector_store.add(
+            ids=[node.node_id for node in nodes],
+            texts=[node.get_content() for node in nodes],
+            embeddings=embeddings,
+            ref_doc_ids=[node.ref_doc_id for node in nodes],
+            metadatas=[node.metadata for node in nodes],
+        )
+
+    def _delete_ref_docs(self, ref_doc_ids: list[str]) -> None:
+        if self._vector_store is not None:
+            self._vector_store.delete(ref_doc_ids)
+        else:
+            delete_ref_docs_from_index(self._vector_index, ref_doc_ids)
+
     def _split_documents(self, documents: list[Document]) -> list[BaseNode]:
         """Split document into chunks"""
-        nodes = []
-        for document in documents:
-            splitter = get_llama_index_splitter(document.metadata.get("file_path", ""))
-            _nodes = splitter.get_nodes_from_documents([document])
-            nodes.extend(_nodes)
-        return nodes
+        return split_documents(documents)
@@ -0,0 +1,292 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Change-detecting ingestion of directories into vector knowledgebases.
+
+An `IngestionManifest` remembers, for every file added through
+`add_from_directory`, its size, mtime, content hash and the ids of the
+documents it produced. Re-running `add_from_directory` then only loads added
+or changed files and deletes the chunks of changed or removed ones.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Iterable
+
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_MANIFEST_VERSION = 1
+
+_DEFAULT_MANIFEST_DIR = "~/.cache/veadk/kb-manifests"
+
+
+@dataclass
+class FileRecord:
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    ref_doc_ids: list[str] = field(default_factory=list)
+    chunk_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class IngestionDiff:
+    """Files of one `add_from_directory` call, grouped by change type."""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    inserted_chunks: int = 0
+    deleted_ref_docs: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"added={len(self.added)} changed={len(self.changed)} "
+            f"removed={len(self.removed)} unchanged={len(self.unchanged)} "
+            f"inserted_chunks={self.inserted_chunks} "
+            f"deleted_ref_docs={self.deleted_ref_docs}"
+        )
+
+
+@dataclass
+class IngestionPlan:
+    directory: str
+    diff: IngestionDiff
+    files_to_load: list[str]
+    stale_ref_doc_ids: list[str]
+    records: dict[str, FileRecord]
+
+
+def default_manifest_path(backend: str, *scope: Any) -> str:
+    """Manifest file of a remote index, stable across processes.
+
+    `scope` identifies the index, e.g. its endpoint and name, so a fresh
+    process re-syncing the same index finds the manifest of the previous one.
+    The directory can be changed with `VEADK_KB_MANIFEST_DIR`.
+    """
+    root = os.getenv("VEADK_KB_MANIFEST_DIR") or _DEFAULT_MANIFEST_DIR
+    token = hashlib.sha256(
+        "\0".join(str(part) for part in scope).encode("utf-8")
+    ).hexdigest()[:24]
+    return os.path.join(os.path.expanduser(root), backend, f"{token}.json")
+
+
+def _sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IngestionManifest:
+    """Per-index record of ingested files.
+
+    Args:
+        path: JSON file to persist the manifest to. Empty keeps it in memory,
+            which matches indexes that do not outlive the process.
+    """
+
+    def __init__(self, path: str = "") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        # directory -> file path -> record
+        self._directories: dict[str, dict[str, FileRecord]] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._directories = {
+                directory: {
+                    file_path: FileRecord(**record)
+                    for file_path, record in files.items()
+                }
+                for directory, files in data.get("directories", {}).items()
+            }
+
+    def plan(self, directory: str, files: list[str]) -> IngestionPlan:
+        """Compare the current `files` of `directory` against the manifest."""
+        directory = os.path.abspath(directory)
+        with self._lock:
+            known = dict(self._directories.get(directory, {}))
+
+        diff = IngestionDiff()
+        records: dict[str, FileRecord] = {}
+        files_to_load: list[str] = []
+        stale_ref_doc_ids: list[str] = []
+        for file in files:
+            path = os.path.abspath(file)
+            stat = os.stat(path)
+            previous = known.pop(path, None)
+            if (
+                previous is not None
+                and previous.size == stat.st_size
+                and previous.mtime_ns == stat.st_mtime_ns
+            ):
+                diff.unchanged.append(path)
+                records[path] = previous
+                continue
+
+            sha256 = _sha256_file(path)
+            if previous is not None and previous.sha256 == sha256:
+                # Touched but identical, keep the existing chunks.
+                diff.unchanged.append(path)
+                records[path] = FileRecord(
+                    path=path,
+                    size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    sha256=sha256,
+                    ref_doc_ids=previous.ref_doc_ids,
+                    chunk_ids=previous.chunk_ids,
+                )
+                continue
+
+            if previous is None:
+                diff.added.append(path)
+            else:
+                diff.changed.append(path)
+                stale_ref_doc_ids.extend(previous.ref_doc_ids)
+            files_to_load.append(path)
+            records[path] = FileRecord(
+                path=path, size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=sha256
+            )
+
+        for path, previous in known.items():
+            diff.removed.append(path)
+            stale_ref_doc_ids.extend(previous.ref_doc_ids)
+
+        return IngestionPlan(
+            directory=directory,
+            diff=diff,
+            files_to_load=files_to_load,
+            stale_ref_doc_ids=stale_ref_doc_ids,
+            records=records,
+        )
+
+    def record(self, plan: IngestionPlan, nodes: list[Any]) -> None:
+        """Attach the ids of freshly inserted `nodes` to their file records."""
+        for node in nodes:
+            file_path = node.metadata.get("file_path")
+            if not file_path:
+                continue
+            record = plan.records.get(os.path.abspath(file_path))
+            if record is None:
+                continue
+            record.chunk_ids.append(node.node_id)
+            if node.ref_doc_id and node.ref_doc_id not in record.ref_doc_ids:
+                record.ref_doc_ids.append(node.ref_doc_id)
+
+    def commit(self, plan: IngestionPlan) -> None:
+        """Store the records of `plan` and persist the manifest."""
+        with self._lock:
+            self._directories[plan.directory] = plan.records
+            if self.path:
+                self._save()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": _MANIFEST_VERSION,
+                    "directories": {
+                        directory: {
+                            path: asdict(record) for path, record in files.items()
+                        }
+                        for directory, files in self._directories.items()
+                    },
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
+
+
+def sync_directory(
+    directory: str,
+    manifest: IngestionManifest,
+    iter_node_batches: Callable[[list[str]], Iterable[list[Any]]],
+    insert_nodes: Callable[[list[Any]], None],
+    delete_ref_docs: Callable[[list[str]], None],
+) -> IngestionDiff:
+    """Bring the chunks of `directory` in an index up to date.
+
+    Only added and changed files are loaded, split and inserted, batch by
+    batch. Chunks of changed and removed files are deleted first. If loading
+    fails partway, the chunks inserted so far are deleted again and the
+    loaded files are left out of the manifest, so the next call retries them.
+    """
+    from llama_index.core import SimpleDirectoryReader
+
+    files = [
+        str(path) for path in SimpleDirectoryReader(input_dir=directory).input_files
+    ]
+    plan = manifest.plan(directory, files)
+
+    if plan.stale_ref_doc_ids:
+        delete_ref_docs(plan.stale_ref_doc_ids)
+        plan.diff.deleted_ref_docs = len(plan.stale_ref_doc_ids)
+
+    if plan.files_to_load:
+        try:
+            for nodes in iter_node_batches(plan.files_to_load):
+                # Recorded first, so a failed insert of this batch is undone too.
+                manifest.record(plan, nodes)
+                insert_nodes(nodes)
+                plan.diff.inserted_chunks += len(nodes)
+        except BaseException:
+            _abort(plan, manifest, delete_ref_docs)
+            raise
+
+    manifest.commit(plan)
+    logger.info(f"Synced directory {plan.directory}: {plan.diff.summary()}")
+    return plan.diff
+
+
+def _abort(
+    plan: IngestionPlan,
+    manifest: IngestionManifest,
+    delete_ref_docs: Callable[[list[str]], None],
+) -> None:
+    """Undo the inserts of a failed sync and forget the files it loaded."""
+    inserted = [
+        ref_doc_id
+        for path in plan.files_to_load
+        for ref_doc_id in plan.records.pop(path).ref_doc_ids
+    ]
+    # Stale chunks are already gone, so removed files stay forgotten.
+    manifest.commit(plan)
+    if inserted:
+        try:
+            delete_ref_docs(inserted)
+        except Exception as e:
+            logger.warning(
+                f"Failed to delete {len(inserted)} documents of an aborted sync "
+                f"of {plan.directory}: {e}"
+            )
+
+
+def delete_ref_docs_from_index(vector_index: Any, ref_doc_ids: list[str]) -> None:
+    """Delete the chunks of source documents from a llama-index `VectorStoreIndex`."""
+    for ref_doc_id in ref_doc_ids:
+        vector_index.delete_ref_doc(ref_doc_id, delete_from_docstore=True)
@@ -0,0 +1,214 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming file ingestion for vector knowledgebase backends.
+
+Files are loaded one at a time, split and handed to the caller in bounded
+batches of nodes, so embedding and insertion of one batch overlaps with
+splitting of the next files and peak memory does not grow with the corpus
+size.
+
+Splitting runs in the calling process unless more split workers are
+configured, through `max_workers` or `VEADK_KB_SPLIT_WORKERS`. Worker
+processes are started with `forkserver` (or `spawn` where that is
+unavailable), never forked from a process that may be running threads; like
+any `spawn` start, they import the `__main__` module, so a script that
+ingests with workers needs an `if __name__ == "__main__":` guard. Without it,
+or whenever a pool breaks, the remaining files are split in the calling
+process.
+
+There is one long-lived pool per file type (see `_splitter_key`), so a worker
+only ever builds the splitter of its type, e.g. a single tree-sitter grammar.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, Optional
+
+from llama_index.core import Document, SimpleDirectoryReader
+from llama_index.core.schema import BaseNode
+
+from veadk.knowledgebase.backends.utils import _splitter_key, split_documents
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_NODE_BATCH_SIZE = 256
+DEFAULT_SPLIT_WORKERS = 1
+
+# (file type, worker count) -> pool
+_pools: dict[tuple[str, int], ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def split_workers() -> int:
+    """Configured split worker count, `DEFAULT_SPLIT_WORKERS` if unset."""
+    value = os.getenv("VEADK_KB_SPLIT_WORKERS", "").strip()
+    if not value:
+        return DEFAULT_SPLIT_WORKERS
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(
+            f"Invalid VEADK_KB_SPLIT_WORKERS={value!r}, "
+            f"using {DEFAULT_SPLIT_WORKERS} split workers"
+        )
+        return DEFAULT_SPLIT_WORKERS
+
+
+def _split_pool(file_type: str, max_workers: int) -> ProcessPoolExecutor:
+    with _pools_lock:
+        pool = _pools.get((file_type, max_workers))
+        if pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+            _pools[(file_type, max_workers)] = pool
+        return pool
+
+
+def _discard_pool(key: tuple[str, int], pool: ProcessPoolExecutor) -> None:
+    with _pools_lock:
+        if _pools.get(key) is pool:
+            del _pools[key]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _file_type(documents: list[Document]) -> str:
+    file_path = documents[0].metadata.get("file_path", "") if documents else ""
+    return _splitter_key(file_path)
+
+
+def iter_node_batches(
+    document_groups: Iterable[list[Document]],
+    batch_size: int = DEFAULT_NODE_BATCH_SIZE,
+    max_workers: Optional[int] = None,
+) -> Iterator[list[BaseNode]]:
+    """Split groups of documents and yield nodes in batches of `batch_size`.
+
+    With `max_workers > 1`, groups are split in the shared pool of their file
+    type with at most `2 * max_workers` groups in flight. Node order follows
+    the input order. `max_workers` defaults to `split_workers()`.
+    """
+    if max_workers is None:
+        max_workers = split_workers()
+    batch_size = max(1, batch_size)
+    buffer: list[BaseNode] = []
+
+    def _drain(nodes: list[BaseNode]) -> Iterator[list[BaseNode]]:
+        buffer.extend(nodes)
+        while len(buffer) >= batch_size:
+            yield buffer[:batch_size]
+            del buffer[:batch_size]
+
+    if max_workers <= 1:
+        for documents in document_groups:
+            yield from _drain(split_documents(documents))
+    else:
+        for nodes in _split_in_pools(document_groups, max_workers):
+            yield from _drain(nodes)
+
+    if buffer:
+        yield buffer
+
+
+def _split_in_pools(
+    document_groups: Iterable[list[Document]], max_workers: int
+) -> Iterator[list[BaseNode]]:
+    """Yield the nodes of every group in order, split in the per-type pools.
+
+    Once a pool breaks, e.g. because its workers could not import
+    `__main__`, it is discarded and the remaining groups are split here.
+    """
+    # (documents, pool key, pool, future); no pool once splitting fell back.
+    pending: deque[
+        tuple[
+            list[Document],
+            tuple[str, int],
+            Optional[ProcessPoolExecutor],
+            Optional[Future[list[BaseNode]]],
+        ]
+    ] = deque()
+    broken = False
+
+    def _submit(documents: list[Document]) -> None:
+        key = (_file_type(documents), max_workers)
+        if broken:
+            pending.append((documents, key, None, None))
+            return
+        pool = _split_pool(*key)
+        try:
+            future = pool.submit(split_documents, documents)
+        except BrokenProcessPool:
+            future = Future()
+            future.set_exception(BrokenProcessPool("split worker pool is broken"))
+        pending.append((documents, key, pool, future))
+
+    def _result() -> list[BaseNode]:
+        nonlocal broken
+        documents, key, pool, future = pending.popleft()
+        if pool is not None and future is not None:
+            try:
+                return future.result()
+            except BrokenProcessPool as e:
+                # A broken pool stays broken; start a new one next time.
+                _discard_pool(key, pool)
+                if not broken:
+                    logger.warning(
+                        f"Split worker pool broke ({e}); splitting the remaining "
+                        "files in this process. Scripts that ingest with split "
+                        'workers need an `if __name__ == "__main__":` guard.'
+                    )
+                broken = True
+        return split_documents(documents)
+
+    try:
+        for documents in document_groups:
+            _submit(documents)
+            if len(pending) >= 2 * max_workers:
+                yield _result()
+        while pending:
+            yield _result()
+    finally:
+        # The pools outlive this call, so drop the work nobody will read.
+        for _, _, _, future in pending:
+            if future is not None:
+                future.cancel()
+
+
+def iter_file_node_batches(
+    files: list[str],
+    batch_size: int = DEFAULT_NODE_BATCH_SIZE,
+    max_workers: Optional[int] = None,
+) -> Iterator[list[BaseNode]]:
+    """Lazily load `files` and yield their nodes in bounded batches."""
+    if not files:
+        return
+    if max_workers is None:
+        max_workers = split_workers()
+    reader = SimpleDirectoryReader(input_files=files)
+    # A pool only pays off when there is more than one file to split.
+    workers = max_workers if len(files) > 1 else 1
+    logger.debug(
+        f"Ingesting {len(files)} files: batch_size={batch_size} split_workers={workers}"
+    )
+    yield from iter_node_batches(reader.iter_data(), batch_size, workers)
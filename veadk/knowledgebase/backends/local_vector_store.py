@@ -0,0 +1,411 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""On-disk vector store for the local knowledgebase backend.
+
+Layout of a store directory:
+
+- ``vectors.f32``: contiguous L2-normalized float32 rows, one per chunk.
+- ``chunks.jsonl``: one JSON object (id, ref_doc_id, text, metadata) per row.
+- ``offsets.u64``: byte offset of every row in ``chunks.jsonl``.
+- ``meta.json``: dimension, committed row count, deleted rows and the
+  generation of the data files. It is replaced atomically after every write
+  and is the commit point, so readers never observe half-written rows.
+
+Deletes only mark rows. Once enough rows are deleted, the live rows are
+compacted into a new generation of data files (``vectors.1.f32`` and so on),
+which the next ``meta.json`` switches to; readers that still map the previous
+generation keep a consistent view until they refresh.
+
+Vectors and offsets are memory-mapped, so worker processes opening the same
+directory share one page-cached copy and start without reading chunk texts.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+from typing import Any, BinaryIO, Iterator, Sequence
+
+import numpy as np
+
+from veadk.utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = get_logger(__name__)
+
+_VECTORS_FILE = "vectors.f32"
+_CHUNKS_FILE = "chunks.jsonl"
+_OFFSETS_FILE = "offsets.u64"
+_META_FILE = "meta.json"
+_LOCK_FILE = ".lock"
+
+# Rows copied per block while compacting, to bound memory.
+_COMPACT_BLOCK_ROWS = 65536
+
+
+class LocalVectorStore:
+    """Append-only, memory-mapped vector store with cosine top-k search.
+
+    Args:
+        path: Directory of the store, created when missing.
+        compact_ratio: Share of deleted rows that triggers a compaction.
+        compact_min_rows: Deleted rows below which the store is never
+            compacted, so small stores are not rewritten on every delete.
+    """
+
+    def __init__(
+        self, path: str, compact_ratio: float = 0.25, compact_min_rows: int = 1024
+    ) -> None:
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self.compact_min_rows = compact_min_rows
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.RLock()
+        self._meta_stamp: tuple[int, int, int] | None = None
+        self._dim = 0
+        self._count = 0
+        self._generation = 0
+        self._deleted: set[int] = set()
+        self._vectors: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        self._offsets: np.ndarray = np.empty((0,), dtype=np.uint64)
+        self._alive: np.ndarray = np.empty((0,), dtype=bool)
+        self._chunks_file: BinaryIO | None = None
+        # ref_doc_id -> rows, built incrementally up to `_indexed_rows`.
+        self._doc_rows: dict[str, list[int]] = {}
+        self._indexed_rows = 0
+        self._refresh()
+
+    @property
+    def count(self) -> int:
+        """Number of live (not deleted) chunks."""
+        with self._lock:
+            self._refresh()
+            return self._count - len(self._deleted)
+
+    def add(
+        self,
+        ids: Sequence[str],
+        texts: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        ref_doc_ids: Sequence[str | None] | None = None,
+        metadatas: Sequence[dict[str, Any]] | None = None,
+    ) -> None:
+        """Append chunks with their embeddings."""
+        if not ids:
+            return
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(ids):
+            raise ValueError("Expected one embedding per chunk.")
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms == 0, 1, norms)
+        ref_doc_ids = ref_doc_ids or [None] * len(ids)
+        metadatas = metadatas or [{}] * len(ids)
+
+        with self._lock, self._write_lock():
+            self._refresh()
+            if self._dim and matrix.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding dimension {matrix.shape[1]} does not match store dimension {self._dim}."
+                )
+            # Drop bytes from an interrupted write before appending.
+            vectors_path = self._data_file(_VECTORS_FILE)
+            offsets_path = self._data_file(_OFFSETS_FILE)
+            chunks_path = self._data_file(_CHUNKS_FILE)
+            self._truncate(vectors_path, self._count * matrix.shape[1] * 4)
+            self._truncate(offsets_path, self._count * 8)
+            chunks_end = self._chunks_end()
+            self._truncate(chunks_path, chunks_end)
+
+            offsets = np.empty(len(ids), dtype=np.uint64)
+            with open(chunks_path, "ab") as chunks_file:
+                position = chunks_end
+                for i, (chunk_id, text, ref_doc_id, metadata) in enumerate(
+                    zip(ids, texts, ref_doc_ids, metadatas)
+                ):
+                    line = (
+                        json.dumps(
+                            {
+                                "id": chunk_id,
+                                "ref_doc_id": ref_doc_id,
+                                "text": text,
+                                "metadata": metadata,
+                            },
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    ).encode("utf-8")
+                    offsets[i] = position
+                    chunks_file.write(line)
+                    position += len(line)
+            with open(vectors_path, "ab") as vectors_file:
+                vectors_file.write(np.ascontiguousarray(matrix).tobytes())
+            with open(offsets_path, "ab") as offsets_file:
+                offsets_file.write(offsets.tobytes())
+
+            self._write_meta(
+                dim=matrix.shape[1],
+                count=self._count + len(ids),
+                deleted=self._deleted,
+            )
+            self._refresh()
+
+    def delete(self, ref_doc_ids: Sequence[str]) -> int:
+        """Mark every chunk of the given source documents as deleted.
+
+        Compacts the store once the deleted rows pass `compact_ratio` of all
+        rows and `compact_min_rows`.
+        """
+        targets = set(ref_doc_ids)
+        if not targets:
+            return 0
+        with self._lock, self._write_lock():
+            self._refresh()
+            self._index_doc_rows()
+            rows = {
+                row
+                for ref_doc_id in targets
+                for row in self._doc_rows.get(ref_doc_id, ())
+            } - self._deleted
+            if rows:
+                self._write_meta(
+                    dim=self._dim, count=self._count, deleted=self._deleted | rows
+                )
+                self._refresh()
+                if len(self._deleted) >= max(
+                    self.compact_min_rows, self.compact_ratio * self._count
+                ):
+                    self._compact()
+            return len(rows)
+
+    def compact(self) -> None:
+        """Rewrite the data files without the deleted rows."""
+        with self._lock, self._write_lock():
+            self._refresh()
+            if self._deleted:
+                self._compact()
+
+    def search(
+        self, query_embedding: Sequence[float], top_k: int
+    ) -> list[tuple[str, float]]:
+        """Return up to `top_k` (text, cosine score) pairs, best first."""
+        with self._lock:
+            self._refresh()
+            alive = self._count - len(self._deleted)
+            if top_k <= 0 or alive == 0:
+                return []
+            query = np.asarray(query_embedding, dtype=np.float32)
+            norm = np.linalg.norm(query)
+            if norm:
+                query = query / norm
+            scores = np.asarray(self._vectors @ query)
+            if self._deleted:
+                scores[~self._alive] = -np.inf
+            k = min(top_k, alive)
+            if k < len(scores):
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top], kind="stable")][:k]
+            return [
+                (self._read_record(int(row))["text"], float(scores[row])) for row in top
+            ]
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _data_file(self, name: str, generation: int | None = None) -> str:
+        """Path of a data file; generation 0 keeps the original names."""
+        generation = self._generation if generation is None else generation
+        if generation:
+            stem, ext = os.path.splitext(name)
+            name = f"{stem}.{generation}{ext}"
+        return self._file(name)
+
+    def _compact(self) -> None:
+        """Copy the live rows into the next generation and commit it.
+
+        Called with both locks held. The previous generation is removed only
+        after the new `meta.json` is in place; readers that mapped it keep
+        their open files until they refresh.
+        """
+        generation = self._generation + 1
+        live = np.flatnonzero(self._alive)
+        offsets = np.empty(len(live), dtype=np.uint64)
+        with (
+            open(self._data_file(_VECTORS_FILE, generation), "wb") as vectors_file,
+            open(self._data_file(_CHUNKS_FILE, generation), "wb") as chunks_file,
+        ):
+            position = 0
+            for start in range(0, len(live), _COMPACT_BLOCK_ROWS):
+                block = live[start : start + _COMPACT_BLOCK_ROWS]
+                vectors_file.write(np.ascontiguousarray(self._vectors[block]).tobytes())
+                for i, row in enumerate(block, start):
+                    line = self._read_line(int(row))
+                    offsets[i] = position
+                    chunks_file.write(line)
+                    position += len(line)
+        with open(self._data_file(_OFFSETS_FILE, generation), "wb") as offsets_file:
+            offsets_file.write(offsets.tobytes())
+
+        previous = self._generation
+        self._write_meta(
+            dim=self._dim, count=len(live), deleted=set(), generation=generation
+        )
+        self._refresh()
+        for name in (_VECTORS_FILE, _OFFSETS_FILE, _CHUNKS_FILE):
+            with contextlib.suppress(OSError):
+                os.remove(self._data_file(name, previous))
+        logger.info(
+            f"Compacted local vector store {self.path}: rows={len(live)} "
+            f"generation={generation}"
+        )
+
+    @contextlib.contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Serialize writers across processes sharing the directory."""
+        if fcntl is None:
+            yield
+            return
+        with open(self._file(_LOCK_FILE), "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _write_meta(
+        self,
+        dim: int,
+        count: int,
+        deleted: set[int],
+        generation: int | None = None,
+    ) -> None:
+        tmp_path = self._file(f"{_META_FILE}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "dim": dim,
+                    "count": count,
+                    "deleted": sorted(deleted),
+                    "generation": (
+                        self._generation if generation is None else generation
+                    ),
+                },
+                f,
+            )
+        os.replace(tmp_path, self._file(_META_FILE))
+
+    def _refresh(self) -> None:
+        """Re-map the store files when another writer committed new rows."""
+        while True:
+            try:
+                stat = os.stat(self._file(_META_FILE))
+            except FileNotFoundError:
+                return
+            stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if stamp == self._meta_stamp:
+                return
+            with open(self._file(_META_FILE), encoding="utf-8") as f:
+                meta = json.load(f)
+            try:
+                self._load(meta)
+                break
+            except FileNotFoundError:
+                # A compaction removed the generation this meta points to;
+                # the next meta points to the new one.
+                continue
+        self._meta_stamp = stamp
+        logger.debug(
+            f"Loaded local vector store {self.path}: rows={self._count} dim={self._dim}"
+        )
+
+    def _load(self, meta: dict[str, Any]) -> None:
+        generation = int(meta.get("generation", 0))
+        count = int(meta["count"])
+        dim = int(meta["dim"])
+        if count:
+            chunks_file = open(self._data_file(_CHUNKS_FILE, generation), "rb")
+            try:
+                vectors = np.memmap(
+                    self._data_file(_VECTORS_FILE, generation),
+                    dtype=np.float32,
+                    mode="r",
+                    shape=(count, dim),
+                )
+                offsets = np.memmap(
+                    self._data_file(_OFFSETS_FILE, generation),
+                    dtype=np.uint64,
+                    mode="r",
+                    shape=(count,),
+                )
+            except BaseException:
+                chunks_file.close()
+                raise
+            if self._chunks_file is not None:
+                self._chunks_file.close()
+            self._chunks_file = chunks_file
+            self._vectors = vectors
+            self._offsets = offsets
+        if generation != self._generation or count < self._indexed_rows:
+            # Rows were renumbered, rebuild the ref_doc_id index lazily.
+            self._doc_rows = {}
+            self._indexed_rows = 0
+        self._generation = generation
+        self._dim = dim
+        self._count = count
+        self._deleted = set(meta.get("deleted", []))
+        self._alive = np.ones(self._count, dtype=bool)
+        if self._deleted:
+            self._alive[list(self._deleted)] = False
+
+    def _chunks_end(self) -> int:
+        """Byte size of `chunks.jsonl` covered by committed rows."""
+        if not self._count:
+            return 0
+        return int(self._offsets[self._count - 1]) + len(
+            self._read_line(self._count - 1)
+        )
+
+    def _read_line(self, row: int) -> bytes:
+        assert self._chunks_file is not None
+        self._chunks_file.seek(int(self._offsets[row]))
+        return self._chunks_file.readline()
+
+    def _read_record(self, row: int) -> dict[str, Any]:
+        return json.loads(self._read_line(row))
+
+    def _index_doc_rows(self) -> None:
+        """Extend the ref_doc_id index with rows committed since the last call."""
+        if self._indexed_rows >= self._count:
+            return
+        assert self._chunks_file is not None
+        self._chunks_file.seek(int(self._offsets[self._indexed_rows]))
+        for row in range(self._indexed_rows, self._count):
+            ref_doc_id = json.loads(self._chunks_file.readline()).get("ref_doc_id")
+            if ref_doc_id is not None:
+                self._doc_rows.setdefault(ref_doc_id, []).append(row)
+        self._indexed_rows = self._count
+
+    @staticmethod
+    def _truncate(path: str, size: int) -> None:
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            with open(path, "r+b") as f:
+                f.truncate(size)
@@ -23,6 +23,13 @@ import veadk.config  # noqa E401
 from veadk.configs.database_configs import MilvusConfig
 from veadk.configs.model_configs import EmbeddingModelConfig, NormalEmbeddingModelConfig
 from veadk.knowledgebase.backends.base_backend import BaseKnowledgebaseBackend
+from veadk.knowledgebase.backends.ingestion_manifest import (
+    IngestionDiff,
+    IngestionManifest,
+    default_manifest_path,
+    delete_ref_docs_from_index,
+    sync_directory,
+)
 
 
 class MilvusKnowledgeBackend(BaseKnowledgebaseBackend):
@@ -41,7 +48,23 @@ class MilvusKnowledgeBackend(BaseKnowledgebaseBackend):
     )
     """Embedding model configs."""
 
+    manifest_path: str = ""
+    """JSON file recording the files ingested by `add_from_directory`. Empty
+    derives a file from the connection and index name, see
+    `default_manifest_path`, so a later process skips what is already indexed."""
+
     def model_post_init(self, __context: Any) -> None:
+        self._manifest = IngestionManifest(
+            self.manifest_path
+            or default_manifest_path(
+                "milvus",
+                self.milvus_config.uri,
+                self.milvus_config.db_name,
+                self.index,
+            )
+        )
+        self._last_ingestion_diff: IngestionDiff | None = None
+
         self.precheck_index_naming()
         self._precheck_milvus_uri()
 
@@ -112,20 +135,27 @@ class MilvusKnowledgeBackend(BaseKnowledgebaseBackend):
 
     @override
     def add_from_directory(self, directory: str) -> bool:
-        from llama_index.core import SimpleDirectoryReader
+        from veadk.knowledgebase.backends.ingestion_pipeline import (
+            iter_file_node_batches,
+        )
 
-        documents = SimpleDirectoryReader(input_dir=directory).load_data()
-        nodes = self._split_documents(documents)
-        self._vector_index.insert_nodes(nodes)
+        self._last_ingestion_diff = sync_directory(
+            directory,
+            self._manifest,
+            iter_node_batches=iter_file_node_batches,
+            insert_nodes=self._vector_index.insert_nodes,
+            delete_ref_docs=self._delete_ref_docs,
+        )
         return True
 
     @override
     def add_from_files(self, files: list[str]) -> bool:
-        from llama_index.core import SimpleDirectoryReader
+        from veadk.knowledgebase.backends.ingestion_pipeline import (
+            iter_file_node_batches,
+        )
 
-        documents = SimpleDirectoryReader(input_files=files).load_data()
-        nodes = self._split_documents(documents)
-        self._vector_index.insert_nodes(nodes)
+        for nodes in iter_file_node_batches(files):
+            self._vector_index.insert_nodes(nodes)
         return True
 
     @override
@@ -140,6 +170,11 @@ class MilvusKnowledgeBackend(BaseKnowledgebaseBackend):
         self._vector_index.insert_nodes(nodes)
         return True
 
+    @property
+    def last_ingestion_diff(self) -> IngestionDiff | None:
+        """Diff summary of the latest `add_from_directory` call."""
+        return self._last_ingestion_diff
+
     @override
     def search(self, query: str, top_k: int = 5) -> list[str]:
         self._ensure_collection_loaded()
@@ -189,13 +224,11 @@ class MilvusKnowledgeBackend(BaseKnowledgebaseBackend):
         if "loaded" not in str(state).lower():
             client.load_collection(collection_name=collection_name)
 
+    def _delete_ref_docs(self, ref_doc_ids: list[str]) -> None:
+        delete_ref_docs_from_index(self._vector_index, ref_doc_ids)
+
     def _split_documents(self, documents: list[Any]) -> list[Any]:
         """Split document into chunks."""
-        from veadk.knowledgebase.backends.utils import get_llama_index_splitter
-
-        nodes = []
-        for document in documents:
-            splitter = get_llama_index_splitter(document.metadata.get("file_path", ""))
-            _nodes = splitter.get_nodes_from_documents([document])
-            nodes.extend(_nodes)
-        return nodes
+        from veadk.knowledgebase.backends.utils import split_documents
+
+        return split_documents(documents)
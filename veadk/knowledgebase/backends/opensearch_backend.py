@@ -16,7 +16,6 @@ import re
 
 from llama_index.core import (
     Document,
-    SimpleDirectoryReader,
     StorageContext,
     VectorStoreIndex,
 )
@@ -31,7 +30,15 @@ from veadk.configs.model_configs import (
     NormalEmbeddingModelConfig,
 )
 from veadk.knowledgebase.backends.base_backend import BaseKnowledgebaseBackend
-from veadk.knowledgebase.backends.utils import get_llama_index_splitter
+from veadk.knowledgebase.backends.ingestion_manifest import (
+    IngestionDiff,
+    IngestionManifest,
+    default_manifest_path,
+    delete_ref_docs_from_index,
+    sync_directory,
+)
+from veadk.knowledgebase.backends.ingestion_pipeline import iter_file_node_batches
+from veadk.knowledgebase.backends.utils import split_documents
 from veadk.models.ark_embedding import create_embedding_model
 from veadk.utils.logger import get_logger
 
@@ -84,7 +91,23 @@ class OpensearchKnowledgeBackend(BaseKnowledgebaseBackend):
     )
     """Embedding model configs"""
 
+    manifest_path: str = ""
+    """JSON file recording the files ingested by `add_from_directory`. Empty
+    derives a file from the connection and index name, see
+    `default_manifest_path`, so a later process skips what is already indexed."""
+
     def model_post_init(self, __context: Any) -> None:
+        self._manifest = IngestionManifest(
+            self.manifest_path
+            or default_manifest_path(
+                "opensearch",
+                self.opensearch_config.host,
+                self.opensearch_config.port,
+                self.index,
+            )
+        )
+        self._last_ingestion_diff: IngestionDiff | None = None
+
         self.precheck_index_naming()
 
         if not self.opensearch_config.cert_path:
@@ -138,16 +161,19 @@ class OpensearchKnowledgeBackend(BaseKnowledgebaseBackend):
 
     @override
     def add_from_directory(self, directory: str) -> bool:
-        documents = SimpleDirectoryReader(input_dir=directory).load_data()
-        nodes = self._split_documents(documents)
-        self._vector_index.insert_nodes(nodes)
+        self._last_ingestion_diff = sync_directory(
+            directory,
+            self._manifest,
+            iter_node_batches=iter_file_node_batches,
+            insert_nodes=self._vector_index.insert_nodes,
+            delete_ref_docs=self._delete_ref_docs,
+        )
         return True
 
     @override
     def add_from_files(self, files: list[str]) -> bool:
-        documents = SimpleDirectoryReader(input_files=files).load_data()
-        nodes = self._split_documents(documents)
-        self._vector_index.insert_nodes(nodes)
+        for nodes in iter_file_node_batches(files):
+            self._vector_index.insert_nodes(nodes)
         return True
 
     @override
@@ -160,17 +186,20 @@ class OpensearchKnowledgeBackend(BaseKnowledgebaseBackend):
         self._vector_index.insert_nodes(nodes)
         return True
 
+    @property
+    def last_ingestion_diff(self) -> IngestionDiff | None:
+        """Diff summary of the latest `add_from_directory` call."""
+        return self._last_ingestion_diff
+
     @override
     def search(self, query: str, top_k: int = 5) -> list[str]:
         _retriever = self._vector_index.as_retriever(similarity_top_k=top_k)
         retrieved_nodes = _retriever.retrieve(query)
         return [node.text for node in retrieved_nodes]
 
+    def _delete_ref_docs(self, ref_doc_ids: list[str]) -> None:
+        delete_ref_docs_from_index(self._vector_index, ref_doc_ids)
+
     def _split_documents(self, documents: list[Document]) -> list[BaseNode]:
         """Split document into chunks"""
-        nodes = []
-        for document in documents:
-            splitter = get_llama_index_splitter(document.metadata.get("file_path", ""))
-            _nodes = splitter.get_nodes_from_documents([document])
-            nodes.extend(_nodes)
-        return nodes
+        return split_documents(documents)
@@ -12,26 +12,67 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 from pathlib import Path
 
+from llama_index.core import Document
 from llama_index.core.node_parser import (
     CodeSplitter,
     HTMLNodeParser,
     MarkdownNodeParser,
     SentenceSplitter,
 )
+from llama_index.core.schema import BaseNode
 
+# Splitters are reused per thread: building one (especially `CodeSplitter`,
+# which loads a tree-sitter grammar) costs far more than splitting a document,
+# while tree-sitter parsers must not be shared between threads.
+_splitters = threading.local()
 
-def get_llama_index_splitter(
-    file_path: str,
-) -> CodeSplitter | MarkdownNodeParser | HTMLNodeParser | SentenceSplitter:
+
+def _splitter_key(file_path: str) -> str:
     suffix = Path(file_path).suffix.lower()
 
     if suffix in [".py", ".js", ".java", ".cpp"]:
-        return CodeSplitter(language=suffix.strip("."))
+        return suffix
     elif suffix in [".md"]:
-        return MarkdownNodeParser()
+        return "markdown"
     elif suffix in [".html", ".htm"]:
-        return HTMLNodeParser()
+        return "html"
     else:
+        return "sentence"
+
+
+def _build_splitter(
+    key: str,
+) -> CodeSplitter | MarkdownNodeParser | HTMLNodeParser | SentenceSplitter:
+    if key == "markdown":
+        return MarkdownNodeParser()
+    elif key == "html":
+        return HTMLNodeParser()
+    elif key == "sentence":
         return SentenceSplitter(chunk_size=512, chunk_overlap=50)
+    else:
+        return CodeSplitter(language=key.strip("."))
+
+
+def get_llama_index_splitter(
+    file_path: str,
+) -> CodeSplitter | MarkdownNodeParser | HTMLNodeParser | SentenceSplitter:
+    key = _splitter_key(file_path)
+    cache = getattr(_splitters, "cache", None)
+    if cache is None:
+        cache = _splitters.cache = {}
+    splitter = cache.get(key)
+    if splitter is None:
+        splitter = cache[key] = _build_splitter(key)
+    return splitter
+
+
+def split_documents(documents: list[Document]) -> list[BaseNode]:
+    """Split documents into chunks with the splitter matching each file type."""
+    nodes = []
+    for document in documents:
+        splitter = get_llama_index_splitter(document.metadata.get("file_path", ""))
+        nodes.extend(splitter.get_nodes_from_documents([document]))
+    return nodes
@@ -103,7 +103,8 @@ class KnowledgeBase(BaseModel):
         description (str): A description of the knowledge base. Default is "This knowledgebase stores some user-related information."
         backend (Union[Literal["local", "opensearch", "viking", "redis", "milvus", "tos_vector", "context_search", "openviking"], BaseKnowledgebaseBackend]):
             The type of backend to use for storing and querying the knowledge base. Supported options include:
-            - 'local' for in-memory storage (data is lost when the program exits).
+            - 'local' for in-memory storage (data is lost when the program exits,
+              unless `persist_dir` is set in `backend_config`).
             - 'opensearch' for OpenSearch (requires OpenSearch cluster).
             - 'viking' for Volcengine VikingDB (requires VikingDB service).
             - 'redis' for Redis with vector search capability (requires Redis).
@@ -187,7 +188,10 @@ class KnowledgeBase(BaseModel):
     def add_from_directory(self, directory: str, **kwargs) -> bool:
         """Add knowledge from file path to knowledgebase.
 
-        Add the files in the directory to knowledgebase backend.
+        Add the files in the directory to knowledgebase backend. Vector
+        backends (local, redis, opensearch and milvus) keep an ingestion
+        manifest, so calling this again only embeds added or changed files
+        and deletes the chunks of changed or removed ones.
 
         Args:
             directory (str): The directory path that needs to store.
@@ -15,8 +15,8 @@
 # adapted from Google ADK memory service adk-python/src/google/adk/memory/vertex_ai_memory_bank_service.py at 0a9e67dbca67789247e882d16b139dbdc76a329a · google/adk-python
 
 import ast
-import asyncio
 import json
+import time
 from collections.abc import Iterable
 from typing import Any, Literal
 
@@ -28,6 +28,7 @@ from google.adk.memory.base_memory_service import (
 from google.adk.memory.memory_entry import MemoryEntry
 from google.adk.sessions import Session
 from google.genai import types
+from opentelemetry import metrics as metrics_api
 from pydantic import BaseModel, Field
 from typing_extensions import Union, override
 
@@ -38,6 +39,30 @@ from veadk.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Bucket boundaries in seconds, from local embedding lookups to slow remote
+# memory services.
+_LTM_OPERATION_DURATION_BUCKETS = [
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+]
+
+_ltm_operation_duration = metrics_api.get_meter("veadk.memory").create_histogram(
+    name="veadk.long_term_memory.operation.duration",
+    unit="s",
+    description="Latency of long-term memory backend operations",
+    explicit_bucket_boundaries_advisory=_LTM_OPERATION_DURATION_BUCKETS,
+)
+
 
 def _get_backend_cls(backend: str) -> type[BaseLongTermMemoryBackend]:
     try:
@@ -259,38 +284,64 @@ class LongTermMemory(BaseMemoryService, BaseModel):
             # Added 2 events to long term memory: index=main, user_id=user_123
             ```
         """
-        user_id = session.user_id
         save_kwargs = dict(kwargs)
         nested_kwargs = save_kwargs.pop("kwargs", None)
         if isinstance(nested_kwargs, dict):
             save_kwargs.update(nested_kwargs)
-        app_name = self.app_name or getattr(session, "app_name", "")
-        include_assistant = (
-            self.backend == "openviking"
-            or self._backend.__class__.__name__ == "OpenVikingLTMBackend"
-        )
         event_strings = self._filter_and_convert_events(
             session.events,
-            include_assistant=include_assistant,
+            include_assistant=self._includes_assistant_events(),
+        )
+        await self.save_event_strings(
+            user_id=session.user_id,
+            session_id=session.id,
+            app_name=self.app_name or getattr(session, "app_name", ""),
+            event_strings=event_strings,
+            **save_kwargs,
         )
 
+    async def save_event_strings(
+        self,
+        user_id: str,
+        session_id: str,
+        app_name: str,
+        event_strings: list[str],
+        **kwargs,
+    ) -> bool:
+        """Persist already converted events of one session to the backend.
+
+        Used by `add_session_to_memory` and by the write-behind memory writer,
+        which converts only the events appended since its last write. Returns
+        False when the backend reports that it could not store them.
+        """
         logger.info(
             f"Adding {len(event_strings)} events to long term memory: index={self.index}"
         )
         save_call = {
             "user_id": user_id,
             "event_strings": event_strings,
-            "session_id": session.id,
+            "session_id": session_id,
             "app_name": app_name,
-            **save_kwargs,
+            **kwargs,
         }
-        if self._uses_openviking_backend():
-            await asyncio.to_thread(self._backend.save_memory, **save_call)
-        else:
-            self._backend.save_memory(**save_call)
+        start_time = time.perf_counter()
+        error = True
+        try:
+            error = await self._backend.asave_memory(**save_call) is False
+        finally:
+            self._record_latency("save", start_time, error)
+        if error:
+            return False
         logger.info(
             f"Added {len(event_strings)} events to long term memory: index={self.index}, user_id={user_id}"
         )
+        return True
+
+    def _includes_assistant_events(self) -> bool:
+        return (
+            self.backend == "openviking"
+            or self._backend.__class__.__name__ == "OpenVikingLTMBackend"
+        )
 
     @override
     async def search_memory(
@@ -323,13 +374,13 @@ class LongTermMemory(BaseMemoryService, BaseModel):
                 "user_id": user_id,
                 **search_kwargs,
             }
-            if self._uses_openviking_backend():
-                memory_chunks = await asyncio.to_thread(
-                    self._backend.search_memory,
-                    **search_call,
-                )
-            else:
-                memory_chunks = self._backend.search_memory(**search_call)
+            start_time = time.perf_counter()
+            error = True
+            try:
+                memory_chunks = await self._backend.asearch_memory(**search_call)
+                error = False
+            finally:
+                self._record_latency("search", start_time, error)
         except Exception as e:
             logger.error(
                 f"Exception orrcus during memory search: {e}. Return empty memory chunks"
@@ -344,10 +395,14 @@ class LongTermMemory(BaseMemoryService, BaseModel):
         )
         return SearchMemoryResponse(memories=memory_events)
 
-    def _uses_openviking_backend(self) -> bool:
-        return (
-            self.backend == "openviking"
-            or self._backend.__class__.__name__ == "OpenVikingLTMBackend"
+    def _record_latency(self, operation: str, start_time: float, error: bool) -> None:
+        _ltm_operation_duration.record(
+            time.perf_counter() - start_time,
+            attributes={
+                "backend": self._backend.__class__.__name__,
+                "operation": operation,
+                "error": error,
+            },
         )
 
     def _convert_memory_chunk_to_entries(self, memory: str) -> list[MemoryEntry]:
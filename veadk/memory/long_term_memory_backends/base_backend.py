@@ -12,10 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import contextvars
+import functools
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
 
 from pydantic import BaseModel
 
+T = TypeVar("T")
+
+DEFAULT_LTM_EXECUTOR_WORKERS = 16
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_ltm_executor() -> ThreadPoolExecutor:
+    """Shared, bounded executor running blocking backend calls off the event loop.
+
+    The pool size is read once from `VEADK_LTM_EXECUTOR_WORKERS`.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=int(
+                    os.getenv(
+                        "VEADK_LTM_EXECUTOR_WORKERS", DEFAULT_LTM_EXECUTOR_WORKERS
+                    )
+                ),
+                thread_name_prefix="veadk-ltm",
+            )
+        return _executor
+
+
+async def run_in_ltm_executor(func: Callable[..., T], /, *args, **kwargs) -> T:
+    """Run a blocking call in the shared executor, keeping context variables."""
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        get_ltm_executor(), functools.partial(context.run, func, *args, **kwargs)
+    )
+
 
 class BaseLongTermMemoryBackend(ABC, BaseModel):
     index: str
@@ -33,3 +74,27 @@ class BaseLongTermMemoryBackend(ABC, BaseModel):
         self, user_id: str, query: str, top_k: int, **kwargs
     ) -> list[str]:
         """Retrieve memory from long term memory backend"""
+
+    async def asave_memory(
+        self, user_id: str, event_strings: list[str], **kwargs
+    ) -> bool:
+        """Save memory without blocking the event loop.
+
+        Backends whose client library supports asyncio should override this.
+        By default, `save_memory` runs in the shared long-term memory executor.
+        """
+        return await run_in_ltm_executor(
+            self.save_memory, user_id=user_id, event_strings=event_strings, **kwargs
+        )
+
+    async def asearch_memory(
+        self, user_id: str, query: str, top_k: int, **kwargs
+    ) -> list[str]:
+        """Retrieve memory without blocking the event loop.
+
+        Backends whose client library supports asyncio should override this.
+        By default, `search_memory` runs in the shared long-term memory executor.
+        """
+        return await run_in_ltm_executor(
+            self.search_memory, user_id=user_id, query=query, top_k=top_k, **kwargs
+        )
@@ -57,6 +57,24 @@ class InMemoryLTMBackend(BaseLongTermMemoryBackend):
         retrieved_nodes = _retriever.retrieve(query)
         return [node.text for node in retrieved_nodes]
 
+    @override
+    async def asave_memory(
+        self, user_id: str, event_strings: list[str], **kwargs
+    ) -> bool:
+        for event_string in event_strings:
+            document = Document(text=event_string)
+            nodes = self._split_documents([document])
+            await self._vector_index.ainsert_nodes(nodes)
+        return True
+
+    @override
+    async def asearch_memory(
+        self, user_id: str, query: str, top_k: int, **kwargs
+    ) -> list[str]:
+        _retriever = self._vector_index.as_retriever(similarity_top_k=top_k)
+        retrieved_nodes = await _retriever.aretrieve(query)
+        return [node.text for node in retrieved_nodes]
+
     def _split_documents(self, documents: list[Document]) -> list[BaseNode]:
         """Split document into chunks"""
         nodes = []
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from typing import Any
 
 from pydantic import Field
@@ -27,7 +28,7 @@ from veadk.utils.logger import get_logger
 logger = get_logger(__name__)
 
 try:
-    from mem0 import MemoryClient
+    from mem0 import AsyncMemoryClient, MemoryClient
 
 except ImportError:
     logger.error(
@@ -59,6 +60,7 @@ class Mem0LTMBackend(BaseLongTermMemoryBackend):
                 host=self.mem0_config.base_url,  # mem0 endpoint
                 api_key=self.mem0_config.api_key,  # mem0 API key
             )
+            self._async_mem0_client: AsyncMemoryClient | None = None
             logger.info(
                 f"Initialized Mem0 client for host: {self.mem0_config.base_url}"
             )
@@ -133,23 +135,90 @@ class Mem0LTMBackend(BaseLongTermMemoryBackend):
                 query, user_id=user_id, output_format="v1.1", top_k=top_k
             )
 
-            logger.debug(f"return relevant memories: {memories}")
+            return self._parse_search_result(query, memories)
+        except Exception as e:
+            logger.error(f"Failed to search memory from Mem0: {str(e)}")
+            return []
 
-            memory_list = []
-            # 如果 memories 是列表，直接返回
-            if isinstance(memories, list):
-                for mem in memories:
-                    if "memory" in mem:
-                        memory_list.append(mem["memory"])
-                return memory_list
+    @override
+    async def asave_memory(
+        self, event_strings: list[str], user_id: str = "default_user", **kwargs
+    ) -> bool:
+        """Save memory to Mem0 with the asyncio client.
 
-            if memories.get("results", []):
-                for mem in memories["results"]:
-                    if "memory" in mem:
-                        memory_list.append(mem["memory"])
+        Events are added concurrently, at most `mem0_config.max_concurrency`
+        in flight.
+        """
+        try:
+            logger.info(
+                f"Saving {len(event_strings)} events to Mem0 for user: {user_id}"
+            )
 
-            logger.info(f"Found {len(memory_list)} memories matching query: {query}")
-            return memory_list
+            client = self._get_async_client()
+            semaphore = asyncio.Semaphore(max(1, self.mem0_config.max_concurrency))
+
+            async def _add(event_string: str) -> Any:
+                async with semaphore:
+                    return await client.add(
+                        [{"role": "user", "content": event_string}],
+                        user_id=user_id,
+                        output_format="v1.1",
+                        async_mode=True,
+                    )
+
+            results = await asyncio.gather(
+                *(_add(event_string) for event_string in event_strings)
+            )
+            logger.debug(f"Saved memory results: {results}")
+
+            logger.info(f"Successfully saved {len(event_strings)} events to Mem0")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save memory to Mem0: {str(e)}")
+            return False
+
+    @override
+    async def asearch_memory(
+        self, query: str, top_k: int, user_id: str = "default_user", **kwargs
+    ) -> list[str]:
+        """Search memory from Mem0 with the asyncio client."""
+        try:
+            logger.info(
+                f"Searching Mem0 for query: {query}, user: {user_id}, top_k: {top_k}"
+            )
+
+            memories = await self._get_async_client().search(
+                query, user_id=user_id, output_format="v1.1", top_k=top_k
+            )
+            return self._parse_search_result(query, memories)
         except Exception as e:
             logger.error(f"Failed to search memory from Mem0: {str(e)}")
             return []
+
+    def _get_async_client(self) -> AsyncMemoryClient:
+        if self._async_mem0_client is None:
+            self._async_mem0_client = AsyncMemoryClient(
+                host=self.mem0_config.base_url,
+                api_key=self.mem0_config.api_key,
+            )
+        return self._async_mem0_client
+
+    @staticmethod
+    def _parse_search_result(query: str, memories: Any) -> list[str]:
+        logger.debug(f"return relevant memories: {memories}")
+
+        memory_list = []
+        # 如果 memories 是列表，直接返回
+        if isinstance(memories, list):
+            for mem in memories:
+                if "memory" in mem:
+                    memory_list.append(mem["memory"])
+            return memory_list
+
+        if memories.get("results", []):
+            for mem in memories["results"]:
+                if "memory" in mem:
+                    memory_list.append(mem["memory"])
+
+        logger.info(f"Found {len(memory_list)} memories matching query: {query}")
+        return memory_list
@@ -0,0 +1,320 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Write-behind persistence of sessions into long-term memory.
+
+`MemoryWriter` remembers the last event it persisted for every session and
+only queues events appended after it. Queued events are written by a
+background task: everything queued while a write is in flight is coalesced
+into one backend call per session, so a turn never waits for the memory
+backend and long conversations are not re-ingested on every turn. A failed
+write is requeued and retried with backoff a bounded number of times.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from google.adk.events import Event
+from google.adk.sessions import Session
+
+from veadk.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from veadk.memory.long_term_memory import LongTermMemory
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_TRACKED_SESSIONS = 10000
+DEFAULT_MAX_CONCURRENT_WRITES = 8
+DEFAULT_MAX_WRITE_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = 1.0
+
+SessionKey = tuple[str, str, str]
+
+
+@dataclass
+class _Watermark:
+    event_id: str
+    timestamp: float
+    # `time.monotonic()` of the save that queued the event.
+    saved_at: float
+
+
+@dataclass
+class _PendingWrite:
+    app_name: str
+    user_id: str
+    session_id: str
+    event_strings: list[str] = field(default_factory=list)
+    attempts: int = 0
+
+
+class MemoryWriter:
+    """Background writer that appends new session events to long-term memory.
+
+    Args:
+        long_term_memory: Memory service the events are written to.
+        max_tracked_sessions: Number of sessions whose last persisted event is
+            remembered. The least recently saved sessions are forgotten first.
+        max_concurrent_writes: Upper bound of backend calls in flight.
+        max_write_attempts: Backend calls made for a batch of events before
+            it is dropped.
+        retry_delay: Seconds before the first retry of a failed batch,
+            doubled for every further attempt.
+    """
+
+    def __init__(
+        self,
+        long_term_memory: "LongTermMemory",
+        max_tracked_sessions: int = DEFAULT_MAX_TRACKED_SESSIONS,
+        max_concurrent_writes: int = DEFAULT_MAX_CONCURRENT_WRITES,
+        max_write_attempts: int = DEFAULT_MAX_WRITE_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> None:
+        self.long_term_memory = long_term_memory
+        self.max_tracked_sessions = max_tracked_sessions
+        self.max_concurrent_writes = max(1, max_concurrent_writes)
+        self.max_write_attempts = max(1, max_write_attempts)
+        self.retry_delay = retry_delay
+        self._watermarks: OrderedDict[SessionKey, _Watermark] = OrderedDict()
+        # Sessions whose new events were held back by the save thresholds.
+        self._deferred: OrderedDict[SessionKey, tuple[Session, str]] = OrderedDict()
+        self._pending: dict[SessionKey, _PendingWrite] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._drain_lock: asyncio.Lock | None = None
+
+    @property
+    def pending_events(self) -> int:
+        """Number of converted events waiting to be written."""
+        return sum(len(write.event_strings) for write in self._pending.values())
+
+    def enqueue(
+        self,
+        session: Session,
+        app_name: str = "",
+        min_new_events: int = 0,
+        min_interval: float = 0.0,
+    ) -> int:
+        """Queue the events of `session` appended since its last save.
+
+        After the first save of a session, its new events are held back while
+        there are fewer than `min_new_events` of them and less than
+        `min_interval` seconds passed since that save. Held back events are
+        queued by a later save of the session or by `flush`.
+
+        Must be called from a running event loop. Returns the number of events
+        queued after filtering.
+        """
+        app_name = app_name or getattr(session, "app_name", "")
+        key = (app_name, session.user_id, session.id)
+        events = self._new_events(key, session.events)
+        if not events:
+            return 0
+
+        watermark = self._watermarks.get(key)
+        if (
+            watermark is not None
+            and len(events) < min_new_events
+            and time.monotonic() - watermark.saved_at < min_interval
+        ):
+            self._deferred[key] = (session, app_name)
+            self._deferred.move_to_end(key)
+            while len(self._deferred) > self.max_tracked_sessions:
+                # Queue rather than forget the oldest held back session.
+                old_key, (old_session, old_app_name) = self._deferred.popitem(
+                    last=False
+                )
+                self._queue(
+                    old_key,
+                    old_session,
+                    old_app_name,
+                    self._new_events(old_key, old_session.events),
+                )
+            logger.debug(
+                f"Holding back {len(events)} new events of session {session.id}: "
+                f"need {min_new_events} events or {min_interval}s since the last save"
+            )
+            return 0
+        return self._queue(key, session, app_name, events)
+
+    def _queue(
+        self, key: SessionKey, session: Session, app_name: str, events: list[Event]
+    ) -> int:
+        self._deferred.pop(key, None)
+        if not events:
+            return 0
+        last = events[-1]
+        self._watermarks[key] = _Watermark(
+            event_id=last.id, timestamp=last.timestamp, saved_at=time.monotonic()
+        )
+        self._watermarks.move_to_end(key)
+        while len(self._watermarks) > self.max_tracked_sessions:
+            self._watermarks.popitem(last=False)
+
+        event_strings = self.long_term_memory._filter_and_convert_events(
+            events,
+            include_assistant=self.long_term_memory._includes_assistant_events(),
+        )
+        if not event_strings:
+            return 0
+
+        pending = self._pending.setdefault(
+            key,
+            _PendingWrite(
+                app_name=self.long_term_memory.app_name or app_name,
+                user_id=session.user_id,
+                session_id=session.id,
+            ),
+        )
+        pending.event_strings.extend(event_strings)
+        self._ensure_worker().set()
+        return len(event_strings)
+
+    async def flush(self) -> None:
+        """Write every queued or held back event and wait for writes in flight."""
+        for key, (session, app_name) in list(self._deferred.items()):
+            self._queue(key, session, app_name, self._new_events(key, session.events))
+        if self._task is None and not self._pending:
+            return
+        if self._drain_lock is None or self._loop is not asyncio.get_running_loop():
+            self._ensure_worker()
+        while self._pending:
+            await self._drain()
+        # Wait for a drain started by the worker before the queue emptied.
+        async with self._drain_lock:
+            pass
+
+    async def close(self) -> None:
+        """Flush queued events and stop the background task."""
+        if self._task is None and not self._pending and not self._deferred:
+            return
+        await self.flush()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def _new_events(self, key: SessionKey, events: list[Event]) -> list[Event]:
+        watermark = self._watermarks.get(key)
+        if watermark is None:
+            return list(events)
+        for i in range(len(events) - 1, -1, -1):
+            if events[i].id == watermark.event_id:
+                return list(events[i + 1 :])
+        # The persisted event is gone, e.g. the session was compacted.
+        return [event for event in events if event.timestamp > watermark.timestamp]
+
+    def _ensure_worker(self) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            if self._loop is not loop:
+                self._wakeup = asyncio.Event()
+                self._drain_lock = asyncio.Lock()
+                self._loop = loop
+            self._task = loop.create_task(self._run(), name="veadk-memory-writer")
+        return self._wakeup
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                await self._drain()
+        except asyncio.CancelledError:
+            # The loop is shutting down, e.g. at the end of `asyncio.run`.
+            # Writes that were not sent yet have been requeued.
+            if self._pending:
+                logger.info(
+                    f"Flushing {self.pending_events} queued events to long term memory before shutdown."
+                )
+                await self._drain()
+            raise
+
+    async def _drain(self) -> None:
+        async with self._drain_lock:
+            unsent = dict(self._pending)
+            self._pending = {}
+            if not unsent:
+                return
+            semaphore = asyncio.Semaphore(self.max_concurrent_writes)
+
+            async def _write(key: SessionKey, write: _PendingWrite) -> None:
+                async with semaphore:
+                    unsent.pop(key, None)
+                    try:
+                        saved = await self.long_term_memory.save_event_strings(
+                            user_id=write.user_id,
+                            session_id=write.session_id,
+                            app_name=write.app_name,
+                            event_strings=write.event_strings,
+                        )
+                        error = "the backend did not store them"
+                    except Exception as e:
+                        saved = False
+                        error = str(e)
+                    if not saved:
+                        self._retry(key, write, error)
+
+            try:
+                await asyncio.gather(
+                    *(_write(key, write) for key, write in list(unsent.items()))
+                )
+            except asyncio.CancelledError:
+                # Writes cancelled in flight are not requeued, the backend may
+                # already have stored them.
+                for key, write in unsent.items():
+                    self._requeue(key, write)
+                raise
+
+    def _retry(self, key: SessionKey, write: _PendingWrite, error: str) -> None:
+        """Requeue a failed write, or drop it once its attempts are used up."""
+        write.attempts += 1
+        if write.attempts >= self.max_write_attempts:
+            logger.error(
+                f"Failed to write {len(write.event_strings)} events of session {write.session_id} to long term memory after {write.attempts} attempts, dropping them: {error}"
+            )
+            return
+        delay = self.retry_delay * 2 ** (write.attempts - 1)
+        logger.warning(
+            f"Failed to write {len(write.event_strings)} events of session {write.session_id} to long term memory, retrying in {delay:.1f}s: {error}"
+        )
+        self._requeue(key, write)
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_later(delay, self._wakeup.set)
+
+    def _requeue(self, key: SessionKey, write: _PendingWrite) -> None:
+        """Put an unsent write back in front of newer events of its session."""
+        newer = self._pending.get(key)
+        if newer is not None:
+            write.event_strings.extend(newer.event_strings)
+        self._pending[key] = write
+
+
+def get_memory_writer(long_term_memory: "LongTermMemory") -> MemoryWriter:
+    """Return the write-behind writer of `long_term_memory`, creating it once."""
+    writer = getattr(long_term_memory, "_memory_writer", None)
+    if writer is None:
+        writer = MemoryWriter(long_term_memory)
+        long_term_memory._memory_writer = writer
+    return writer
@@ -12,34 +12,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
 from google.adk.agents.callback_context import CallbackContext
+
 from veadk.config import getenv
+from veadk.memory.memory_writer import get_memory_writer
 from veadk.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Session-level cache for tracking save state
-# Format: {(app_name, user_id, session_id): {'last_save_time': float, 'last_event_count': int}}
-_session_save_cache: dict = {}
-
-# Track active session per user to detect session switches
-# Format: {(app_name, user_id): session_id}
-_active_sessions: dict = {}
-
 # Configurable thresholds
-MIN_MESSAGES_THRESHOLD = getenv(
-    "MIN_MESSAGES_THRESHOLD", 10
+MIN_MESSAGES_THRESHOLD = int(
+    getenv("MIN_MESSAGES_THRESHOLD", 10)
 )  # Minimum number of new messages before saving
-MIN_TIME_THRESHOLD = getenv(
-    "MIN_TIME_THRESHOLD", 60
+MIN_TIME_THRESHOLD = float(
+    getenv("MIN_TIME_THRESHOLD", 60)
 )  # Minimum seconds between saves (1 minute)
 
 
 async def save_session_to_long_term_memory(
     callback_context: CallbackContext,
 ) -> None:
-    """Save the current session to long-term memory.
+    """Queue the events of the current turn for long-term memory.
+
+    Only events appended since the last save of the session are converted and
+    queued. They are written by the long-term memory's background writer, so
+    the turn does not wait for the memory backend. After the first save of a
+    session, new events are held back until there are `MIN_MESSAGES_THRESHOLD`
+    of them or `MIN_TIME_THRESHOLD` seconds have passed; held back events are
+    written by a later save or when the writer is flushed.
 
     Args:
         callback_context: The callback context containing invocation information.
@@ -58,96 +58,17 @@ async def save_session_to_long_term_memory(
             return None
 
         app_name = callback_context._invocation_context.app_name
-        user_id = callback_context._invocation_context.user_id
-        session_id = callback_context._invocation_context.session.id
-        session_service = callback_context._invocation_context.session_service
+        session = callback_context._invocation_context.session
 
-        current_time = time.time()
-
-        # Detect session switch and force save previous session
-        user_key = (app_name, user_id)
-        previous_session_id = _active_sessions.get(user_key)
-
-        if previous_session_id and previous_session_id != session_id:
-            logger.info(
-                f"Session switch detected for user {user_id}: "
-                f"{previous_session_id} -> {session_id}. "
-                f"Force saving previous session."
-            )
-            old_session = await session_service.get_session(
-                app_name=app_name,
-                user_id=user_id,
-                session_id=previous_session_id,
-            )
-            if old_session:
-                old_events = getattr(old_session, "events", [])
-                old_event_count = len(old_events)
-                await long_term_memory.add_session_to_memory(old_session)
-                old_cache_key = (app_name, user_id, previous_session_id)
-
-                _session_save_cache[old_cache_key] = {
-                    "last_save_time": current_time,
-                    "last_event_count": old_event_count,
-                }
-                logger.info(
-                    f"Previous session `{old_session.id}` saved to long term memory due to session switch."
-                )
-
-        # Update active session
-        _active_sessions[user_key] = session_id
-
-        session = await session_service.get_session(
+        queued = get_memory_writer(long_term_memory).enqueue(
+            session,
             app_name=app_name,
-            user_id=user_id,
-            session_id=session_id,
+            min_new_events=MIN_MESSAGES_THRESHOLD,
+            min_interval=MIN_TIME_THRESHOLD,
+        )
+        logger.debug(
+            f"Queued {queued} new events of session `{session.id}` for long term memory."
         )
-
-        if not session:
-            logger.error(
-                f"Session {session_id} (app_name={app_name}, user_id={user_id}) not found in session service, cannot save to long-term memory."
-            )
-            return None
-
-        current_events = getattr(session, "events", [])
-        current_event_count = len(current_events)
-        # logger.debug(f"Current event count: {current_event_count}")
-
-        # Create cache key
-        cache_key = (app_name, user_id, session_id)
-
-        cache_info = _session_save_cache.get(cache_key)
-
-        if cache_info:
-            last_save_time = cache_info.get("last_save_time", 0)
-            last_event_count = cache_info.get("last_event_count", 0)
-
-            time_elapsed = current_time - last_save_time
-            new_events_count = current_event_count - last_event_count
-
-            # Check if we should skip save
-            if (
-                time_elapsed < MIN_TIME_THRESHOLD
-                and new_events_count < MIN_MESSAGES_THRESHOLD
-            ):
-                logger.info(
-                    f"Skipping save for session {session_id}: "
-                    f"only {new_events_count} new events (need {MIN_MESSAGES_THRESHOLD}) "
-                    f"and {time_elapsed:.1f}s elapsed (need {MIN_TIME_THRESHOLD}s)"
-                )
-                return None
-        else:
-            logger.info(f"First save for session {session_id}.")
-
-        # Save to long-term memory
-        await long_term_memory.add_session_to_memory(session)
-
-        # Update cache
-        _session_save_cache[cache_key] = {
-            "last_save_time": current_time,
-            "last_event_count": current_event_count,
-        }
-
-        logger.info(f"Add session `{session.id}` to long term memory.")
 
         return None
 
@@ -21,6 +21,8 @@ from google.adk.sessions import (
     BaseSessionService,
     DatabaseSessionService,
 )
+from pydantic import Field
+from sqlalchemy import event
 from typing_extensions import override
 
 from veadk.memory.short_term_memory_backends.base_backend import (
@@ -29,8 +31,24 @@ from veadk.memory.short_term_memory_backends.base_backend import (
 from veadk.utils.adk_compat import should_use_async_db_drivers
 
 
+# Seconds a connection waits for the write lock, or for a pooled connection,
+# before failing. SQLite has a single writer, so many concurrent sessions queue
+# on it.
+_LOCK_TIMEOUT = 60.0
+
+
+def _set_wal_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    # WAL lets readers run beside the writer and makes each commit a cheap
+    # append instead of a journal rewrite.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 class SQLiteSTMBackend(BaseShortTermMemoryBackend):
     local_path: str
+    db_kwargs: dict = Field(default_factory=dict)
 
     def model_post_init(self, context: Any) -> None:
         self.local_path = os.path.abspath(self.local_path)
@@ -48,7 +66,14 @@ class SQLiteSTMBackend(BaseShortTermMemoryBackend):
     @cached_property
     @override
     def session_service(self) -> BaseSessionService:
-        return DatabaseSessionService(db_url=self._db_url)
+        db_kwargs = {"pool_timeout": _LOCK_TIMEOUT, **self.db_kwargs}
+        db_kwargs["connect_args"] = {
+            "timeout": _LOCK_TIMEOUT,
+            **db_kwargs.get("connect_args", {}),
+        }
+        session_service = DatabaseSessionService(db_url=self._db_url, **db_kwargs)
+        event.listen(session_service.db_engine.sync_engine, "connect", _set_wal_pragmas)
+        return session_service
 
     def _db_exists(self) -> bool:
         return os.path.exists(self.local_path)
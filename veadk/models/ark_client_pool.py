@@ -0,0 +1,205 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reusable `AsyncArk` clients backed by one shared connection pool.
+
+Creating an `AsyncArk` per model call opens a new httpx pool, so every turn
+pays DNS, TCP and TLS setup and idle sockets pile up until they are garbage
+collected. `ArkClientPool` keeps one client per (api_base, api_key) and lets
+all of them share a single `httpx.AsyncClient` per event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import threading
+import weakref
+from dataclasses import dataclass, field
+
+import httpx
+from opentelemetry import metrics as metrics_api
+from volcenginesdkarkruntime import AsyncArk
+
+from veadk.configs.model_configs import ArkClientPoolConfig
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_meter = metrics_api.get_meter("veadk.models")
+_acquire_counter = _meter.create_counter(
+    name="veadk.ark_client_pool.acquire",
+    unit="count",
+    description="Ark client lookups, by whether a pooled client was reused",
+)
+_client_counter = _meter.create_up_down_counter(
+    name="veadk.ark_client_pool.clients",
+    unit="count",
+    description="Ark clients currently held by the pool",
+)
+
+ClientKey = tuple[str, str]
+
+# Same budget as the Ark SDK's own clients: model calls can run for minutes.
+_TIMEOUT = httpx.Timeout(600.0, connect=60.0)
+
+
+@dataclass
+class ArkClientPoolStats:
+    clients: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass
+class _LoopClients:
+    http_client: httpx.AsyncClient
+    clients: dict[ClientKey, AsyncArk] = field(default_factory=dict)
+
+
+class ArkClientPool:
+    """Pool of `AsyncArk` clients keyed by (api_base, api_key).
+
+    httpx connections are bound to the event loop that opened them, so each
+    running loop gets its own shared `httpx.AsyncClient`.
+
+    Owners such as `Runner` `retain` the pool and `release` it when they
+    close. The connections are only closed when the last owner releases it,
+    so closing one runner does not break the calls of the others.
+
+    Args:
+        config: Connection limits. Read from `MODEL_AGENT_HTTP_*` env vars
+            when omitted.
+    """
+
+    def __init__(self, config: ArkClientPoolConfig | None = None) -> None:
+        self.config = config or ArkClientPoolConfig()
+        self._lock = threading.Lock()
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopClients
+        ] = weakref.WeakKeyDictionary()
+        self._hits = 0
+        self._misses = 0
+        self._owners = 0
+
+    def get(self, api_base: str, api_key: str) -> AsyncArk:
+        """Return the pooled client for `api_base` and `api_key`.
+
+        Must be called from a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        key = (api_base, hashlib.sha256(api_key.encode("utf-8")).hexdigest())
+        with self._lock:
+            loop_clients = self._loops.get(loop)
+            if loop_clients is None:
+                loop_clients = _LoopClients(http_client=self._new_http_client())
+                self._loops[loop] = loop_clients
+            client = loop_clients.clients.get(key)
+            reused = client is not None
+            if client is None:
+                client = AsyncArk(
+                    base_url=api_base,
+                    api_key=api_key,
+                    http_client=loop_clients.http_client,
+                )
+                loop_clients.clients[key] = client
+                self._misses += 1
+                _client_counter.add(1)
+            else:
+                self._hits += 1
+        _acquire_counter.add(1, attributes={"reused": reused})
+        return client
+
+    def stats(self) -> ArkClientPoolStats:
+        with self._lock:
+            return ArkClientPoolStats(
+                clients=sum(len(entry.clients) for entry in self._loops.values()),
+                hits=self._hits,
+                misses=self._misses,
+            )
+
+    def retain(self) -> None:
+        """Register an owner; see `release`."""
+        with self._lock:
+            self._owners += 1
+
+    async def release(self) -> None:
+        """Drop an owner and close the current loop's connections if it was
+        the last one."""
+        with self._lock:
+            if self._owners == 0:
+                return
+            self._owners -= 1
+            last = self._owners == 0
+        if last:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connections of the current event loop.
+
+        Clients are created again on the next `get`, so closing is safe even
+        if the pool is used afterwards.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_clients = self._loops.pop(loop, None)
+        if loop_clients is None:
+            return
+        _client_counter.add(-len(loop_clients.clients))
+        await loop_clients.http_client.aclose()
+        logger.debug(
+            f"Closed Ark client pool with {len(loop_clients.clients)} clients."
+        )
+
+    def _new_http_client(self) -> httpx.AsyncClient:
+        http2 = self.config.http2 and importlib.util.find_spec("h2") is not None
+        logger.debug(
+            f"Creating Ark connection pool: max_connections={self.config.max_connections} "
+            f"max_keepalive_connections={self.config.max_keepalive_connections} http2={http2}"
+        )
+        return httpx.AsyncClient(
+            timeout=_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry,
+            ),
+            follow_redirects=True,
+            http2=http2,
+        )
+
+
+_default_pool: ArkClientPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_ark_client_pool() -> ArkClientPool:
+    """Return the process-wide Ark client pool."""
+    global _default_pool
+
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ArkClientPool()
+        return _default_pool
+
+
+async def close_ark_client_pool() -> None:
+    """Close the pooled connections of the current event loop, if any.
+
+    This ends the in-flight calls of every user of the pool; owners that may
+    share it should `release` it instead.
+    """
+    if _default_pool is not None:
+        await _default_pool.aclose()
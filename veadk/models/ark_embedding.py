@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import os
-from typing import Any, Dict, Optional, List, Union, Tuple
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, Optional, List, Union, Tuple
 from enum import Enum
 
 import httpx
@@ -24,6 +28,21 @@ from volcenginesdkarkruntime import Ark, AsyncArk
 
 from veadk.consts import DEFAULT_MODEL_EMBEDDING_NAME, DEFAULT_MODEL_EMBEDDING_API_BASE
 from llama_index.embeddings.openai_like import OpenAILikeEmbedding
+from veadk.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from veadk.models.embedding_cache import CachedEmbedding, EmbeddingCache
+
+logger = get_logger(__name__)
+
+# Upper bound of in-flight embedding requests when `num_workers` is not set.
+DEFAULT_EMBEDDING_CONCURRENCY = 8
+# Upper bound of a single rate-limit backoff sleep, in seconds.
+MAX_RATE_LIMIT_BACKOFF = 30.0
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    return getattr(exc, "status_code", None) == 429
 
 
 class ArkEmbeddingModel(str, Enum):
@@ -60,6 +79,17 @@ class ArkEmbedding(BaseEmbedding):
         ),
     )
 
+    rate_limit_retries: int = Field(
+        default=5,
+        description="Maximum number of retries of a single text on HTTP 429.",
+        ge=0,
+    )
+    rate_limit_backoff: float = Field(
+        default=1.0,
+        description="Initial backoff in seconds between rate-limited retries.",
+        ge=0,
+    )
+
     _client: Optional[Ark] = PrivateAttr()
     _aclient: Optional[AsyncArk] = PrivateAttr()
     _http_client: Optional[httpx.Client] = PrivateAttr()
@@ -153,94 +183,115 @@ class ArkEmbedding(BaseEmbedding):
             self._aclient = AsyncArk(**self._get_credential_kwargs(is_async=True))
         return self._aclient
 
-    def _get_query_embedding(self, query: str) -> List[float]:
-        """Get query embedding."""
-        client = self._get_client()
+    def _get_concurrency(self) -> int:
+        return max(1, self.num_workers or DEFAULT_EMBEDDING_CONCURRENCY)
 
-        input_data = [{"type": "text", "text": query}]
+    def _backoff_delay(self, attempt: int) -> float:
+        delay = min(self.rate_limit_backoff * (2**attempt), MAX_RATE_LIMIT_BACKOFF)
+        # Full jitter keeps concurrent workers from retrying in lockstep.
+        return random.uniform(0, delay)
 
-        response = client.multimodal_embeddings.create(
-            model=self.model_name, input=input_data, **self.additional_kwargs
-        )
+    def _embed_one(self, client: Ark, text: str) -> List[float]:
+        input_data = [{"type": "text", "text": text}]
+        attempt = 0
+        while True:
+            try:
+                response = client.multimodal_embeddings.create(
+                    model=self.model_name, input=input_data, **self.additional_kwargs
+                )
+                return response.data.embedding
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt >= self.rate_limit_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Embedding request rate limited, retry {attempt}/{self.rate_limit_retries} in {delay:.2f}s"
+                )
+                time.sleep(delay)
+
+    async def _aembed_one(self, aclient: AsyncArk, text: str) -> List[float]:
+        input_data = [{"type": "text", "text": text}]
+        attempt = 0
+        while True:
+            try:
+                response = await aclient.multimodal_embeddings.create(
+                    model=self.model_name, input=input_data, **self.additional_kwargs
+                )
+                return response.data.embedding
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt >= self.rate_limit_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Embedding request rate limited, retry {attempt}/{self.rate_limit_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
 
-        return response.data.embedding
+    def _get_query_embedding(self, query: str) -> List[float]:
+        """Get query embedding."""
+        return self._embed_one(self._get_client(), query)
 
     async def _aget_query_embedding(self, query: str) -> List[float]:
         """The asynchronous version of _get_query_embedding."""
-        aclient = self._get_aclient()
-
-        input_data = [{"type": "text", "text": query}]
-
-        response = await aclient.multimodal_embeddings.create(
-            model=self.model_name, input=input_data, **self.additional_kwargs
-        )
-
-        return response.data.embedding
+        return await self._aembed_one(self._get_aclient(), query)
 
     def _get_text_embedding(self, text: str) -> List[float]:
         """Get text embedding."""
-        client = self._get_client()
-
-        input_data = [{"type": "text", "text": text}]
-
-        response = client.multimodal_embeddings.create(
-            model=self.model_name, input=input_data, **self.additional_kwargs
-        )
-
-        return response.data.embedding
+        return self._embed_one(self._get_client(), text)
 
     async def _aget_text_embedding(self, text: str) -> List[float]:
         """Asynchronously get text embedding."""
-        aclient = self._get_aclient()
-
-        input_data = [{"type": "text", "text": text}]
-
-        response = await aclient.multimodal_embeddings.create(
-            model=self.model_name, input=input_data, **self.additional_kwargs
-        )
-
-        return response.data.embedding
+        return await self._aembed_one(self._get_aclient(), text)
 
     def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         Get text embeddings for multiple texts.
 
-        Simple loop implementation - Ark API requires one request per text.
+        Ark API requires one request per text, so requests are fanned out over
+        a thread pool of `num_workers` threads. Results keep the input order.
         """
         if not texts:
             return []
 
         client = self._get_client()
-        results = []
+        concurrency = min(self._get_concurrency(), len(texts))
+        if concurrency == 1:
+            return [self._embed_one(client, text) for text in texts]
 
-        for text in texts:
-            single_input = [{"type": "text", "text": text}]
-            response = client.multimodal_embeddings.create(
-                model=self.model_name, input=single_input, **self.additional_kwargs
-            )
-            results.append(response.data.embedding)
-
-        return results
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="ark-embedding"
+        ) as executor:
+            return list(executor.map(lambda text: self._embed_one(client, text), texts))
 
     async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         Asynchronously get text embeddings for multiple texts.
 
-        Simple async loop implementation - Ark API requires one request per text.
+        Ark API requires one request per text, so requests are issued
+        concurrently, at most `num_workers` in flight. Tasks are created in
+        windows of `embed_batch_size` to bound scheduling overhead for large
+        inputs. Results keep the input order.
         """
         if not texts:
             return []
 
         aclient = self._get_aclient()
-        results = []
-
-        for text in texts:
-            single_input = [{"type": "text", "text": text}]
-            response = await aclient.multimodal_embeddings.create(
-                model=self.model_name, input=single_input, **self.additional_kwargs
+        semaphore = asyncio.Semaphore(self._get_concurrency())
+
+        async def _embed(text: str) -> List[float]:
+            async with semaphore:
+                return await self._aembed_one(aclient, text)
+
+        results: List[List[float]] = []
+        window = max(1, self.embed_batch_size)
+        for start in range(0, len(texts), window):
+            results.extend(
+                await _gather_in_order(
+                    [_embed(text) for text in texts[start : start + window]]
+                )
             )
-            results.append(response.data.embedding)
-
         return results
 
     def get_text_embedding(self, text: str) -> List[float]:
@@ -266,13 +317,28 @@ class ArkEmbedding(BaseEmbedding):
         return "ArkEmbedding"
 
 
+async def _gather_in_order(
+    coros: List[Awaitable[List[float]]],
+) -> List[List[float]]:
+    """Gather coroutines, cancelling the rest as soon as one of them fails."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 # Independent factory function
 def create_embedding_model(
     model_name: str,
     api_key: Optional[str] = None,
     api_base: Optional[str] = None,
+    cache: Union["EmbeddingCache", bool, None] = None,
     **kwargs: Any,
-) -> Union["ArkEmbedding", "OpenAILikeEmbedding"]:
+) -> Union["ArkEmbedding", "OpenAILikeEmbedding", "CachedEmbedding"]:
     """
     Factory function: smart embedding model creation by model name
 
@@ -280,23 +346,38 @@ def create_embedding_model(
         model_name: Model name
         api_key: API key
         api_base: API base URL
+        cache: Embedding cache to wrap the model with. `None` uses the
+            process-wide cache from `EmbeddingCacheConfig`, `False` disables
+            caching.
         **kwargs: Other parameters
 
     Returns:
-        Suitable embedding model instance (ArkEmbedding or OpenAILikeEmbedding)
+        Suitable embedding model instance (ArkEmbedding or OpenAILikeEmbedding),
+        wrapped by CachedEmbedding when caching is enabled
     """
+    from veadk.models.embedding_cache import (
+        CachedEmbedding,
+        get_default_embedding_cache,
+    )
+
     # Ark supported model list
     ark_models = {"doubao-embedding-vision-250615", "doubao-embedding-vision-251215"}
 
     # Check if it's Ark supported model
     if model_name in ark_models:
-        return ArkEmbedding(
+        embed_model = ArkEmbedding(
             model_name=model_name, api_key=api_key, api_base=api_base, **kwargs
         )
     else:
         # Use OpenAILikeEmbedding
         from llama_index.embeddings.openai_like import OpenAILikeEmbedding
 
-        return OpenAILikeEmbedding(
+        embed_model = OpenAILikeEmbedding(
             model_name=model_name, api_key=api_key, api_base=api_base, **kwargs
         )
+
+    if cache is None or cache is True:
+        cache = get_default_embedding_cache()
+    if not cache:
+        return embed_model
+    return CachedEmbedding(embed_model, cache)
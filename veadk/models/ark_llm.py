@@ -15,16 +15,25 @@
 # adapted from Google ADK models adk-python/blob/main/src/google/adk/models/lite_llm.py at f1f44675e4a86b75e72cfd838efd8a0399f23e24 · google/adk-python
 
 import base64
-import copy
 import json
 import time
-from typing import Any, Dict, Union, AsyncGenerator, Tuple, List, Optional, Literal
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Union,
+    AsyncGenerator,
+    Tuple,
+    List,
+    Optional,
+    Literal,
+)
 from typing_extensions import override
 
 from google.adk.models import LlmRequest, LlmResponse, Gemini
 from google.genai import types
-from pydantic import Field, BaseModel
-from volcenginesdkarkruntime import AsyncArk
+from pydantic import Field, BaseModel, PrivateAttr
 from volcenginesdkarkruntime._streaming import AsyncStream
 from volcenginesdkarkruntime.types.responses import (
     Response as ArkTypeResponse,
@@ -61,6 +70,7 @@ from volcenginesdkarkruntime._exceptions import ArkBadRequestError
 
 from veadk.config import settings
 from veadk.consts import DEFAULT_VIDEO_MODEL_API_BASE
+from veadk.models.ark_client_pool import get_ark_client_pool
 from veadk.utils.adk_compat import (
     get_previous_interaction_id,
     llm_request_has_field,
@@ -72,6 +82,9 @@ logger = get_logger(__name__)
 
 _ARK_TEXT_FIELD_TYPES = {"json_object", "json_schema"}
 
+# Distinct tool sets per model whose converted declarations are kept.
+_TOOL_PARAMS_CACHE_SIZE = 32
+
 _FINISH_REASON_MAPPING = {
     "incomplete": {
         "length": types.FinishReason.MAX_TOKENS,
@@ -372,8 +385,77 @@ def _responses_schema_to_text(
     )
 
 
+def _contents_to_input_items(
+    contents: List[types.Content],
+) -> List[ResponseInputItemParam]:
+    input_params: List[ResponseInputItemParam] = []
+    for content in contents:
+        # Each content represents `one conversation`.
+        # This `one conversation` may contain `multiple pieces of content`,
+        # but it cannot contain `multiple conversations`.
+        input_item_or_list = _content_to_input_item(content)
+        if isinstance(input_item_or_list, list):
+            input_params.extend(input_item_or_list)
+        elif input_item_or_list:
+            input_params.append(input_item_or_list)
+    return input_params
+
+
+def _is_new_input_item(item: ResponseInputItemParam) -> bool:
+    return item.get("type") == "function_call_output" or item.get("role") == "user"
+
+
+def _contents_to_new_input_items(
+    contents: List[types.Content],
+) -> List[ResponseInputItemParam]:
+    """Convert only the trailing contents that `filtered_inputs` would keep.
+
+    Walks the history backwards and stops at the first item that is neither a
+    user message nor a function call output, so the result equals
+    `filtered_inputs(_contents_to_input_items(contents), previous_response_id)`.
+    """
+    new_items: List[ResponseInputItemParam] = []
+    for content in reversed(contents):
+        input_item_or_list = _content_to_input_item(content)
+        if not isinstance(input_item_or_list, list):
+            input_item_or_list = [input_item_or_list] if input_item_or_list else []
+        for item in reversed(input_item_or_list):
+            if not _is_new_input_item(item):
+                return new_items[::-1]
+            new_items.append(item)
+    return new_items[::-1]
+
+
+def _function_declarations_to_tool_params(
+    function_declarations: List[types.FunctionDeclaration],
+) -> List[FunctionToolParam]:
+    return [
+        _function_declarations_to_tool_param(declaration)
+        for declaration in function_declarations
+    ]
+
+
+def _parameters_digest(declaration: types.FunctionDeclaration) -> int:
+    """Hash of the parameter schema of a tool declaration."""
+    parameters = (
+        declaration.parameters.model_dump_json(exclude_none=True)
+        if declaration.parameters
+        else ""
+    )
+    json_schema = (
+        json.dumps(declaration.parameters_json_schema, sort_keys=True, default=str)
+        if declaration.parameters_json_schema is not None
+        else ""
+    )
+    return hash((parameters, json_schema))
+
+
 def _get_responses_inputs(
     llm_request: LlmRequest,
+    previous_response_id: Optional[str] = None,
+    convert_tools: Optional[
+        Callable[[LlmRequest, List[types.FunctionDeclaration]], List[FunctionToolParam]]
+    ] = None,
 ) -> Tuple[
     Optional[str],
     Optional[List[ResponseInputItemParam]],
@@ -386,28 +468,28 @@ def _get_responses_inputs(
     if llm_request.config and llm_request.config.system_instruction:
         instructions = llm_request.config.system_instruction
     # 1. input
-    input_params: Optional[List[ResponseInputItemParam]] = []
-    for content in llm_request.contents or []:
-        # Each content represents `one conversation`.
-        # This `one conversation` may contain `multiple pieces of content`,
-        # but it cannot contain `multiple conversations`.
-        input_item_or_list = _content_to_input_item(content)
-        if isinstance(input_item_or_list, list):
-            input_params.extend(input_item_or_list)
-        elif input_item_or_list:
-            input_params.append(input_item_or_list)
+    # With a previous response only the trailing user turn and tool outputs
+    # are sent, so the rest of the history does not need to be converted.
+    if previous_response_id:
+        input_params = _contents_to_new_input_items(llm_request.contents or [])
+    else:
+        input_params = _contents_to_input_items(llm_request.contents or [])
 
     # 2. Convert tool declarations
+    # Tools are kept even with a previous response: `request_reorganization_by_ark`
+    # drops them, and the retry without the expired response needs them.
     tools: Optional[List[FunctionToolParam]] = None
     if (
         llm_request.config
         and llm_request.config.tools
         and llm_request.config.tools[0].function_declarations
     ):
-        tools = [
-            _function_declarations_to_tool_param(tool)
-            for tool in llm_request.config.tools[0].function_declarations
-        ]
+        declarations = llm_request.config.tools[0].function_declarations
+        tools = (
+            convert_tools(llm_request, declarations)
+            if convert_tools
+            else _function_declarations_to_tool_params(declarations)
+        )
 
     # 3. Handle `output-schema` -> `text`
     text: Optional[ResponseTextConfigParam] = None
@@ -417,11 +499,11 @@ def _get_responses_inputs(
     # 4. Extract generation parameters
     generation_params: Optional[Dict] = None
     if llm_request.config:
-        config_dict = llm_request.config.model_dump(exclude_none=True)
         generation_params = {}
         for key in ("temperature", "max_output_tokens", "top_p"):
-            if key in config_dict:
-                generation_params[key] = config_dict[key]
+            value = getattr(llm_request.config, key, None)
+            if value is not None:
+                generation_params[key] = value
 
         if not generation_params:
             generation_params = None
@@ -461,7 +543,7 @@ def filtered_inputs(
         return inputs
     new_inputs = []
     for m in reversed(inputs):  # Skip the first message
-        if m.get("type") == "function_call_output" or m.get("role") == "user":
+        if _is_new_input_item(m):
             new_inputs.append(m)
         else:
             break  # Stop when we encounter a non-user message
@@ -489,6 +571,11 @@ def _remove_caching(request_data: dict) -> None:
 def request_reorganization_by_ark(
     request_data: Dict, enable_responses_cache: bool = True
 ) -> Dict:
+    # Work on a copy so the caller can reuse `request_data` for fallbacks.
+    request_data = dict(request_data)
+    if isinstance(request_data.get("extra_body"), dict):
+        request_data["extra_body"] = dict(request_data["extra_body"])
+
     # 1. model provider
     request_data = get_model_without_provider(request_data)
 
@@ -498,9 +585,11 @@ def request_reorganization_by_ark(
         request_data.pop("store", None)
 
     # 2. filtered input
-    request_data["input"] = filtered_inputs(
-        request_data.get("input"),
-        previous_response_id=request_data.get("previous_response_id", None),
+    request_data["input"] = list(
+        filtered_inputs(
+            request_data.get("input") or [],
+            previous_response_id=request_data.get("previous_response_id", None),
+        )
     )
 
     # 3. filter not support data
@@ -689,11 +778,8 @@ class ArkLlmClient:
         if api_key is None:
             api_key = settings.model.api_key
 
-        # 2. Call openai responses
-        client = AsyncArk(
-            base_url=api_base,
-            api_key=api_key,
-        )
+        # 2. Call openai responses with a pooled client
+        client = get_ark_client_pool().get(api_base, api_key)
 
         raw_response = await client.responses.create(**kwargs)
         return raw_response
@@ -704,6 +790,7 @@ class ArkLlm(Gemini):
     fallbacks: Optional[List[str]] = None
     llm_client: ArkLlmClient = Field(default_factory=ArkLlmClient)
     _additional_args: Dict[str, Any] = None
+    _tool_params_cache: OrderedDict = PrivateAttr(default_factory=OrderedDict)
     use_interactions_api: bool = True
     enable_responses_cache: bool = True
 
@@ -743,18 +830,23 @@ class ArkLlm(Gemini):
         self._maybe_append_user_content(llm_request)
         # logger.debug(_build_request_log(llm_request))
 
+        # get previous_response_id
+        previous_response_id = None
+        if self.enable_responses_cache:
+            previous_response_id = get_previous_interaction_id(llm_request)
+
         instructions, input_param, tools, text_format, generation_params = (
-            _get_responses_inputs(llm_request)
+            _get_responses_inputs(
+                llm_request,
+                previous_response_id=previous_response_id,
+                convert_tools=self._convert_tools,
+            )
         )
 
         if "functions" in self._additional_args:
             # LiteLLM does not support both tools and functions together.
             tools = None
         # ------------------------------------------------------ #
-        # get previous_response_id
-        previous_response_id = None
-        if self.enable_responses_cache:
-            previous_response_id = get_previous_interaction_id(llm_request)
         responses_args = {
             "model": self.model,
             "instructions": instructions,
@@ -768,25 +860,75 @@ class ArkLlm(Gemini):
 
         if generation_params:
             responses_args.update(generation_params)
+        full_input = None
+        if previous_response_id:
+            # Only needed if the previous response expired on the server.
+            def full_input() -> List[ResponseInputItemParam]:
+                return _contents_to_input_items(llm_request.contents or [])
+
         async for llm_response in self._generate_content_with_fallbacks(
-            responses_args, stream=stream
+            responses_args, stream=stream, full_input=full_input
         ):
             yield llm_response
 
+    def _convert_tools(
+        self,
+        llm_request: LlmRequest,
+        function_declarations: List[types.FunctionDeclaration],
+    ) -> List[FunctionToolParam]:
+        """Convert tool declarations, reusing the result for the same tools.
+
+        Declarations are rebuilt for every request, so the cache is keyed by
+        the tool objects of the agent and the declared name, description and
+        parameters, which a tool may change between requests. The cached entry
+        keeps the tools alive, which keeps their ids unique.
+        """
+        tools_dict = getattr(llm_request, "tools_dict", None) or {}
+        tool_objects = [tools_dict.get(d.name) for d in function_declarations]
+        if any(tool is None for tool in tool_objects):
+            return _function_declarations_to_tool_params(function_declarations)
+
+        key = tuple(
+            (
+                declaration.name,
+                declaration.description,
+                _parameters_digest(declaration),
+                id(tool),
+            )
+            for declaration, tool in zip(function_declarations, tool_objects)
+        )
+        cached = self._tool_params_cache.get(key)
+        if cached is not None:
+            self._tool_params_cache.move_to_end(key)
+            return cached[0]
+
+        tool_params = _function_declarations_to_tool_params(function_declarations)
+        self._tool_params_cache[key] = (tool_params, tool_objects)
+        while len(self._tool_params_cache) > _TOOL_PARAMS_CACHE_SIZE:
+            self._tool_params_cache.popitem(last=False)
+        return tool_params
+
     async def _generate_content_with_fallbacks(
-        self, responses_args: dict, stream: bool = False
+        self,
+        responses_args: dict,
+        stream: bool = False,
+        full_input: Optional[Callable[[], List[ResponseInputItemParam]]] = None,
     ) -> AsyncGenerator[LlmResponse, None]:
         """Try the primary Ark model and configured fallbacks in order.
 
         A fallback is safe only before an attempt has yielded output. Once a
         streaming response has reached the caller, switching models would mix
         chunks from two responses, so the original error is propagated.
+
+        `full_input` rebuilds the whole conversation when `responses_args`
+        only carries the input that follows `previous_response_id`.
         """
         models = [self.model, *(self.fallbacks or [])]
 
         for index, model in enumerate(models):
-            attempt_args = copy.deepcopy(responses_args)
-            attempt_args["model"] = model
+            # `request_reorganization_by_ark` does not mutate its argument,
+            # so a shallow copy per attempt is enough.
+            attempt_args = {**responses_args, "model": model}
             yielded_response = False
 
             try:
@@ -808,10 +950,12 @@ class ArkLlm(Gemini):
                     logger.warning(
                         f"Interaction expired for model `{model}` (PreviousResponseNotFound). Retrying without previous_response_id. Error: {error}"
                     )
-                    responses_args = copy.deepcopy(responses_args)
+                    responses_args = dict(responses_args)
                     responses_args.pop("previous_response_id", None)
-                    retry_args = copy.deepcopy(responses_args)
-                    retry_args["model"] = model
+                    if full_input is not None:
+                        responses_args["input"] = full_input()
+                        full_input = None
+                    retry_args = {**responses_args, "model": model}
                     retry_yielded_response = False
                     try:
                         async for llm_response in self.generate_content_via_responses(
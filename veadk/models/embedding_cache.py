@@ -0,0 +1,315 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed cache for text embeddings.
+
+Embeddings are keyed by model name, output dimensions and the sha256 of the
+text, so identical chunks and queries are embedded once per process (memory
+tier) or once per machine (optional sqlite tier) no matter which knowledgebase
+or long-term memory backend asks for them.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from pydantic import PrivateAttr
+
+from veadk.configs.model_configs import EmbeddingCacheConfig
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES = 4096
+
+
+def embedding_cache_key(
+    model_name: str, dimensions: Optional[int], text: str, kind: str = "text"
+) -> str:
+    """Build the cache key of one text for one embedding model."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model_name}:{dimensions or ''}:{kind}:{digest}"
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _SqliteEmbeddingStore:
+    """On-disk tier storing vectors as packed float32 blobs."""
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, array]:
+        if not keys:
+            return {}
+        found: dict[str, array] = {}
+        with self._lock:
+            # Stay well below SQLITE_MAX_VARIABLE_NUMBER.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector
+        return found
+
+    def put_many(self, items: dict[str, array]) -> None:
+        if not items:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, vector.tobytes()) for key, vector in items.items()],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache: an in-process LRU and an optional sqlite file.
+
+    Vectors are held as float32 arrays, so a 2048-dim embedding costs 8 KiB in
+    the memory tier.
+
+    Args:
+        max_entries: Capacity of the in-process LRU tier.
+        path: Optional sqlite file path for the persistent tier.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES,
+        path: str | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, array] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = EmbeddingCacheStats()
+        self._disk = _SqliteEmbeddingStore(path) if path else None
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        """Look up `keys`, returning `None` for every miss."""
+        results: List[Optional[List[float]]] = [None] * len(keys)
+        missing: dict[str, list[int]] = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._entries.get(key)
+                if vector is None:
+                    missing.setdefault(key, []).append(i)
+                    continue
+                self._entries.move_to_end(key)
+                results[i] = vector.tolist()
+            self._stats.memory_hits += len(keys) - sum(map(len, missing.values()))
+
+        if missing and self._disk is not None:
+            found = self._disk.get_many(list(missing))
+            with self._lock:
+                for key, vector in found.items():
+                    self._remember(key, vector)
+                    for i in missing.pop(key):
+                        results[i] = vector.tolist()
+                        self._stats.disk_hits += 1
+
+        with self._lock:
+            misses = sum(map(len, missing.values()))
+            self._stats.misses += misses
+            self._stats.hits += len(keys) - misses
+        return results
+
+    def put_many(self, keys: Sequence[str], embeddings: Sequence[List[float]]) -> None:
+        items = {key: array("f", embedding) for key, embedding in zip(keys, embeddings)}
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, vector)
+        if self._disk is not None:
+            self._disk.put_many(items)
+
+    def stats(self) -> EmbeddingCacheStats:
+        with self._lock:
+            return EmbeddingCacheStats(**self._stats.__dict__)
+
+    def clear(self) -> None:
+        """Drop the memory tier and reset counters. The disk tier is kept."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = EmbeddingCacheStats()
+
+    def _remember(self, key: str, vector: array) -> None:
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embedding model wrapper that serves repeated texts from an `EmbeddingCache`.
+
+    Only cache misses are forwarded to the wrapped model, batched through its
+    own `_get_text_embeddings` / `_aget_text_embeddings`.
+    """
+
+    _embed_model: BaseEmbedding = PrivateAttr()
+    _cache: EmbeddingCache = PrivateAttr()
+    _dimensions: Optional[int] = PrivateAttr()
+
+    def __init__(
+        self, embed_model: BaseEmbedding, cache: EmbeddingCache, **kwargs: Any
+    ) -> None:
+        super().__init__(
+            model_name=embed_model.model_name,
+            embed_batch_size=embed_model.embed_batch_size,
+            callback_manager=embed_model.callback_manager,
+            num_workers=embed_model.num_workers,
+            **kwargs,
+        )
+        self._embed_model = embed_model
+        self._cache = cache
+        self._dimensions = getattr(embed_model, "dimensions", None)
+
+    @property
+    def embed_model(self) -> BaseEmbedding:
+        return self._embed_model
+
+    @property
+    def cache(self) -> EmbeddingCache:
+        return self._cache
+
+    def _keys(self, texts: Sequence[str], kind: str) -> List[str]:
+        return [
+            embedding_cache_key(self.model_name, self._dimensions, text, kind)
+            for text in texts
+        ]
+
+    def _split_misses(
+        self, texts: Sequence[str], kind: str
+    ) -> tuple[List[str], List[Optional[List[float]]], dict[str, List[int]]]:
+        keys = self._keys(texts, kind)
+        results = self._cache.get_many(keys)
+        # Deduplicate identical texts within one batch as well.
+        misses: dict[str, List[int]] = {}
+        for i, (text, result) in enumerate(zip(texts, results)):
+            if result is None:
+                misses.setdefault(text, []).append(i)
+        return keys, results, misses
+
+    def _fill(
+        self,
+        keys: List[str],
+        results: List[Optional[List[float]]],
+        misses: dict[str, List[int]],
+        embeddings: List[List[float]],
+    ) -> List[List[float]]:
+        for positions, embedding in zip(misses.values(), embeddings):
+            for i in positions:
+                results[i] = embedding
+        self._cache.put_many(
+            [keys[positions[0]] for positions in misses.values()], embeddings
+        )
+        return results  # type: ignore[return-value]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        keys, results, misses = self._split_misses(texts, "text")
+        if not misses:
+            return results  # type: ignore[return-value]
+        embeddings = self._embed_model._get_text_embeddings(list(misses))
+        return self._fill(keys, results, misses, embeddings)
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        keys, results, misses = self._split_misses(texts, "text")
+        if not misses:
+            return results  # type: ignore[return-value]
+        embeddings = await self._embed_model._aget_text_embeddings(list(misses))
+        return self._fill(keys, results, misses, embeddings)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._get_text_embeddings([text])[0]
+
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        return (await self._aget_text_embeddings([text]))[0]
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        keys, results, misses = self._split_misses([query], "query")
+        if not misses:
+            return results[0]  # type: ignore[return-value]
+        embedding = self._embed_model._get_query_embedding(query)
+        return self._fill(keys, results, misses, [embedding])[0]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        keys, results, misses = self._split_misses([query], "query")
+        if not misses:
+            return results[0]  # type: ignore[return-value]
+        embedding = await self._embed_model._aget_query_embedding(query)
+        return self._fill(keys, results, misses, [embedding])[0]
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+
+_default_cache: EmbeddingCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_embedding_cache() -> EmbeddingCache | None:
+    """Return the process-wide embedding cache, or `None` when disabled.
+
+    Configured by `EmbeddingCacheConfig` (`MODEL_EMBEDDING_CACHE_*` env vars).
+    """
+    global _default_cache
+
+    config = EmbeddingCacheConfig()
+    if not config.enabled:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = EmbeddingCache(
+                max_entries=config.max_entries, path=config.path or None
+            )
+            logger.debug(
+                f"Embedding cache enabled: max_entries={config.max_entries}, path={config.path or None}"
+            )
+        return _default_cache
@@ -0,0 +1,220 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Record and replay model turns at the `BaseLlm` boundary.
+
+`CassetteLlm` wraps the `ArkLlm` / `LiteLlm` instance of an agent. In record
+mode every turn goes to the wrapped model and the yielded `LlmResponse`s are
+appended to a cassette under a fingerprint of the request. In replay mode the
+turns are served from the cassette, optionally with synthetic latency, and the
+model is never called, so runs are deterministic and measure VeADK's own
+overhead instead of model latency.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict
+from typing import Any, AsyncGenerator, Literal, Optional
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from pydantic import PrivateAttr
+
+from veadk.configs.model_configs import LlmCassetteConfig
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Generated per run by ADK, so they must not change the fingerprint.
+_VOLATILE_PART_KEYS = ("function_call", "function_response")
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when the cassette has no turn for a request."""
+
+
+def _scrub_ids(value: Any) -> Any:
+    if isinstance(value, dict):
+        scrubbed = {}
+        for key, item in value.items():
+            if key in _VOLATILE_PART_KEYS and isinstance(item, dict):
+                item = {k: v for k, v in item.items() if k != "id"}
+            scrubbed[key] = _scrub_ids(item)
+        return scrubbed
+    if isinstance(value, list):
+        return [_scrub_ids(item) for item in value]
+    return value
+
+
+def request_fingerprint(llm_request: LlmRequest, stream: bool = False) -> str:
+    """Fingerprint the model, contents and generation config of a request.
+
+    Function call ids, `previous_interaction_id` and HTTP options differ
+    between otherwise identical runs and are left out.
+    """
+    payload = llm_request.model_dump(
+        exclude_none=True, include={"model", "contents", "config"}
+    )
+    payload.get("config", {}).pop("http_options", None)
+    payload["stream"] = stream
+    canonical = json.dumps(
+        _scrub_ids(payload), sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LlmCassette:
+    """Append-only store of recorded turns, one JSON line per turn.
+
+    A fingerprint may be recorded several times, e.g. when an eval case is
+    run repeatedly; replay serves its turns in recorded order and repeats the
+    last one once they are used up.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._compressed = path.endswith(".gz")
+        self._turns: dict[str, list[list[str]]] = defaultdict(list)
+        self._cursors: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with self._open("rt") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        responses = [
+                            json.dumps(response, ensure_ascii=False)
+                            for response in record["responses"]
+                        ]
+                        self._turns[record["key"]].append(responses)
+                    except (ValueError, KeyError, TypeError):
+                        # A torn last line of an interrupted recording.
+                        continue
+
+    def _open(self, mode: str):
+        if self._compressed:
+            return gzip.open(self.path, mode, encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def __len__(self) -> int:
+        return sum(len(turns) for turns in self._turns.values())
+
+    def next_turn(self, key: str) -> Optional[list[LlmResponse]]:
+        with self._lock:
+            turns = self._turns.get(key)
+            if not turns:
+                return None
+            cursor = self._cursors[key]
+            self._cursors[key] = cursor + 1
+            responses = turns[min(cursor, len(turns) - 1)]
+        return [LlmResponse.model_validate_json(response) for response in responses]
+
+    def record(self, key: str, responses: list[LlmResponse]) -> None:
+        dumped = [response.model_dump_json(exclude_none=True) for response in responses]
+        line = f'{{"key":{json.dumps(key)},"responses":[{",".join(dumped)}]}}'
+        with self._lock:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            # gzip members concatenate, so appending keeps the file readable.
+            with self._open("at") as f:
+                f.write(line + "\n")
+            self._turns[key].append(dumped)
+
+
+class CassetteLlm(BaseLlm):
+    """Record the turns of `inner` to a cassette or replay them from it.
+
+    Args:
+        inner: The wrapped model. Not called in replay mode.
+        cassette_path: Cassette file; see `LlmCassette`.
+        mode: `record` or `replay`.
+        first_chunk_latency_ms: Replay delay before the first response.
+        chunk_latency_ms: Replay delay before each following response.
+    """
+
+    inner: BaseLlm
+    cassette_path: str
+    mode: Literal["record", "replay"] = "replay"
+    first_chunk_latency_ms: float = 0.0
+    chunk_latency_ms: float = 0.0
+
+    _cassette: LlmCassette = PrivateAttr()
+
+    def model_post_init(self, context: Any) -> None:
+        self._cassette = LlmCassette(self.cassette_path)
+
+    @property
+    def cassette(self) -> LlmCassette:
+        return self._cassette
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        key = request_fingerprint(llm_request, stream=stream)
+
+        if self.mode == "replay":
+            responses = self._cassette.next_turn(key)
+            if responses is None:
+                raise CassetteMissError(
+                    f"No recorded turn for request {key[:12]} in cassette `{self.cassette_path}`"
+                )
+            for index, response in enumerate(responses):
+                delay = (
+                    self.first_chunk_latency_ms if index == 0 else self.chunk_latency_ms
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay / 1000)
+                yield response
+            return
+
+        recorded: list[LlmResponse] = []
+        async for response in self.inner.generate_content_async(
+            llm_request, stream=stream
+        ):
+            recorded.append(response.model_copy(deep=True))
+            yield response
+        self._cassette.record(key, recorded)
+
+
+def maybe_wrap_with_cassette(model: Any) -> Any:
+    """Wrap `model` in a `CassetteLlm` when `MODEL_CASSETTE_MODE` asks for it.
+
+    Configured by `LlmCassetteConfig` (`MODEL_CASSETTE_*` env vars). Models
+    given by name, and models already wrapped, are returned unchanged.
+    """
+    config = LlmCassetteConfig()
+    if config.mode == "off" or not isinstance(model, BaseLlm):
+        return model
+    if isinstance(model, CassetteLlm):
+        return model
+    if not config.path:
+        logger.warning(
+            "MODEL_CASSETTE_MODE is set without MODEL_CASSETTE_PATH, cassette disabled."
+        )
+        return model
+
+    logger.info(f"Model turns are {config.mode}ed with cassette `{config.path}`")
+    return CassetteLlm(
+        model=model.model,
+        inner=model,
+        cassette_path=config.path,
+        mode=config.mode,
+        first_chunk_latency_ms=config.first_chunk_latency_ms,
+        chunk_latency_ms=config.chunk_latency_ms,
+    )
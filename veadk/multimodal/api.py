@@ -17,16 +17,19 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+import re
 import tempfile
 
 from fastapi import FastAPI
 from fastapi import File
 from fastapi import Form
 from fastapi import HTTPException
+from fastapi import Request
 from fastapi import UploadFile
 from fastapi.responses import FileResponse
 from fastapi.responses import RedirectResponse
 from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 
 from .models import MediaRef
 from .service import MediaService
@@ -96,7 +99,7 @@ def mount_media_routes(app: FastAPI, service: MediaService) -> None:
 
     @app.get("/web/media/{app_name}/{user_id}/{session_id}/{media_id}/content")
     async def get_media_content(
-        app_name: str, user_id: str, session_id: str, media_id: str
+        app_name: str, user_id: str, session_id: str, media_id: str, request: Request
     ) -> Response:
         ref = _media_ref(app_name, user_id, session_id, media_id)
         try:
@@ -105,6 +108,7 @@ def mount_media_routes(app: FastAPI, service: MediaService) -> None:
             raise HTTPException(status_code=404, detail="Media not found.") from error
         local_path = service.storage.local_path(ref)
         if local_path is not None:
+            # FileResponse serves single `Range` requests with 206 itself.
             return FileResponse(
                 local_path,
                 media_type=record.mime_type,
@@ -113,9 +117,24 @@ def mount_media_routes(app: FastAPI, service: MediaService) -> None:
                 headers={"Cache-Control": "private, max-age=300"},
             )
         signed_url = await service.storage.signed_url(ref)
-        if not signed_url:
-            raise HTTPException(status_code=404, detail="Media content unavailable.")
-        return RedirectResponse(signed_url, status_code=307)
+        if signed_url:
+            return RedirectResponse(signed_url, status_code=307)
+        # Neither a file nor a URL to hand out: stream it through this process.
+        byte_range = _parse_range(request.headers.get("range"), record.size_bytes)
+        start, end = byte_range or (0, record.size_bytes)
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Cache-Control": "private, max-age=300",
+            "Content-Length": str(end - start),
+        }
+        if byte_range is not None:
+            headers["Content-Range"] = f"bytes {start}-{end - 1}/{record.size_bytes}"
+        return StreamingResponse(
+            service.storage.iter_bytes(ref, start, end),
+            status_code=206 if byte_range is not None else 200,
+            media_type=record.mime_type,
+            headers=headers,
+        )
 
     @app.delete("/web/media/{app_name}/{user_id}/{session_id}/{media_id}")
     @app.post("/web/media/{app_name}/{user_id}/{session_id}/{media_id}/delete")
@@ -134,6 +153,37 @@ def mount_media_routes(app: FastAPI, service: MediaService) -> None:
         await service.storage.delete_session(app_name, user_id, session_id)
 
 
+_RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def _parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single-range ``Range`` header into ``[start, end)``.
+
+    Returns ``None`` when the whole object should be sent, as for a missing or
+    multi-range header, which a client must accept a 200 response for.
+    """
+    if not header:
+        return None
+    match = _RANGE_PATTERN.fullmatch(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last) + 1, size) if last else size
+    elif last:
+        start, end = max(size - int(last), 0), size
+    else:
+        return None
+    if start >= size or start >= end:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable.",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
 def _media_ref(app_name: str, user_id: str, session_id: str, media_id: str) -> MediaRef:
     return MediaRef(
         app_name=app_name,
@@ -15,7 +15,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 
 from google.adk.agents.callback_context import CallbackContext
@@ -68,8 +67,7 @@ class MultimodalMediaPlugin(BasePlugin):
                     continue
                 record = await self._service.get_record(ref)
                 if record.mime_type in ("text/plain", "text/markdown"):
-                    data = await self._service.storage.read_bytes(ref)
-                    text = data.decode("utf-8-sig")
+                    text = await self._service.read_text(record)
                     part.file_data = None
                     part.text = (
                         f'<document name="{record.file_name}" '
@@ -77,17 +75,14 @@ class MultimodalMediaPlugin(BasePlugin):
                     )
                     resolved_parts.append(part)
                     continue
-                data = await self._service.storage.read_bytes(ref)
                 if record.mime_type == "application/pdf":
                     resolved_parts.extend(
-                        await asyncio.to_thread(
-                            render_pdf_to_png_parts,
-                            data,
-                            10,
-                            2.0,
+                        await self._service.render_pdf(
+                            record, render_pdf_to_png_parts, max_pages=10, scale=2.0
                         )
                     )
                     continue
+                data = await self._service.storage.read_bytes(ref)
                 part.file_data = None
                 part.inline_data = types.Blob(
                     data=data,
@@ -0,0 +1,349 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Content-addressed cache of model-ready renderings of stored media."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import threading
+from typing import Awaitable
+from typing import Callable
+
+from google.genai import types
+
+from .models import MediaRecord
+
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+PdfRenderer = Callable[[bytes], list[types.Part]]
+
+
+class MediaRenderCache:
+    """Cache rendered PDF pages and decoded text documents by content hash.
+
+    Every model call of an agent loop resolves the whole history again, so the
+    same attachment would otherwise be read from storage and rendered on every
+    step. Entries are keyed by the owning user and the record's SHA-256 (plus
+    render settings), so identical uploads in one user's sessions share them
+    while different users never do.
+
+    The memory tier is an LRU bounded by total bytes. The optional disk tier
+    keeps renderings across processes and restarts. It is bounded by
+    ``max_disk_bytes``, evicting the least recently used entries, and the
+    storage purges a user's entries with :func:`purge_render_cache` once it
+    deletes the last copy of the media they were rendered from.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int | None = None,
+        disk_dir: str | Path | None = None,
+        max_disk_bytes: int | None = None,
+    ) -> None:
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(
+                os.getenv("VEADK_MEDIA_RENDER_CACHE_BYTES", str(_DEFAULT_MAX_BYTES))
+            )
+        )
+        self.max_disk_bytes = (
+            max_disk_bytes
+            if max_disk_bytes is not None
+            else int(
+                os.getenv(
+                    "VEADK_MEDIA_RENDER_CACHE_DISK_BYTES", str(_DEFAULT_MAX_DISK_BYTES)
+                )
+            )
+        )
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self._entries: OrderedDict[str, tuple[object, int]] = OrderedDict()
+        self._size = 0
+        # Bytes on disk, counted by a scan on the first write.
+        self._disk_size: int | None = None
+        self._disk_lock = threading.Lock()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    async def pdf_pages(
+        self,
+        record: MediaRecord,
+        load: Callable[[], Awaitable[bytes]],
+        render: PdfRenderer,
+        *,
+        max_pages: int,
+        scale: float,
+    ) -> list[types.Part]:
+        """Return page image parts of a PDF, rendering it on a miss.
+
+        ``load`` reads the PDF bytes and ``render`` turns them into parts; both
+        only run when neither tier has the pages.
+        """
+
+        async def _compute() -> list[tuple[str, bytes]]:
+            parts = await asyncio.to_thread(render, await load())
+            return [
+                (
+                    part.inline_data.mime_type or "image/png",
+                    bytes(part.inline_data.data),
+                )
+                for part in parts
+                if part.inline_data and part.inline_data.data
+            ]
+
+        key = f"{_entry_prefix(record)}pdf-{max_pages}-{scale:g}"
+        pages = await self._get(
+            record, key, _compute, self._read_pages, self._write_pages
+        )
+        return [
+            types.Part(inline_data=types.Blob(mime_type=mime_type, data=data))
+            for mime_type, data in pages
+        ]
+
+    async def text(
+        self, record: MediaRecord, load: Callable[[], Awaitable[bytes]]
+    ) -> str:
+        """Return the decoded text of a text document, reading it on a miss."""
+
+        async def _compute() -> str:
+            return (await load()).decode("utf-8-sig")
+
+        return await self._get(
+            record,
+            f"{_entry_prefix(record)}text",
+            _compute,
+            self._read_text,
+            self._write_text,
+        )
+
+    def clear(self) -> None:
+        """Drop the memory tier; the disk tier is left untouched."""
+        self._entries.clear()
+        self._size = 0
+
+    async def _get(
+        self,
+        record: MediaRecord,
+        key: str,
+        compute: Callable[[], Awaitable],
+        read_disk: Callable[[Path], object],
+        write_disk: Callable[[Path, object], None],
+    ):
+        if not record.sha256:
+            return await compute()
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        task = self._inflight.get(key)
+        if task is not None:
+            self.hits += 1
+        else:
+            # The load runs in its own task, so a cancelled caller neither
+            # cancels the other waiters nor discards the rendering.
+            task = asyncio.ensure_future(
+                self._load(key, compute, read_disk, write_disk)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._loaded(key, done))
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable],
+        read_disk: Callable[[Path], object],
+        write_disk: Callable[[Path, object], None],
+    ):
+        value = None
+        if self.disk_dir is not None:
+            value = await asyncio.to_thread(read_disk, self._disk_path(key))
+        if value is None:
+            self.misses += 1
+            value = await compute()
+            if self.disk_dir is not None:
+                await asyncio.to_thread(self._store_disk, key, value, write_disk)
+        else:
+            self.hits += 1
+        self._remember(key, value)
+        return value
+
+    def _loaded(self, key: str, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Every waiter may have been cancelled; mark the error as seen.
+            task.exception()
+
+    def _remember(self, key: str, value: object) -> None:
+        if isinstance(value, str):
+            size = len(value.encode("utf-8"))
+        else:
+            size = sum(len(data) for _, data in value)  # type: ignore[union-attr]
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self._size += size
+        while self._size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= evicted
+
+    def _disk_path(self, key: str) -> Path:
+        assert self.disk_dir is not None
+        return self.disk_dir.joinpath(*key.split("/"))
+
+    def _store_disk(
+        self, key: str, value: object, write_disk: Callable[[Path, object], None]
+    ) -> None:
+        """Write one entry and evict the oldest ones beyond ``max_disk_bytes``."""
+        assert self.disk_dir is not None
+        with self._disk_lock:
+            self._store_disk_locked(key, value, write_disk)
+
+    def _store_disk_locked(
+        self, key: str, value: object, write_disk: Callable[[Path, object], None]
+    ) -> None:
+        assert self.disk_dir is not None
+        if self._disk_size is None:
+            self._disk_size = sum(size for _, size, _ in _disk_entries(self.disk_dir))
+        path = self._disk_path(key)
+        write_disk(path, value)
+        self._disk_size += _entry_size(path)
+        if self._disk_size <= self.max_disk_bytes:
+            return
+        entries = sorted(_disk_entries(self.disk_dir), key=lambda entry: entry[2])
+        self._disk_size = sum(size for _, size, _ in entries)
+        for entry_path, size, _ in entries:
+            if self._disk_size <= self.max_disk_bytes:
+                break
+            _remove_entry(entry_path)
+            self._disk_size -= size
+
+    @staticmethod
+    def _read_pages(path: Path) -> list[tuple[str, bytes]] | None:
+        manifest = path / "pages.json"
+        if not manifest.is_file():
+            return None
+        try:
+            mime_types = json.loads(manifest.read_text(encoding="utf-8"))
+            pages = [
+                (mime_type, (path / f"{index}.page").read_bytes())
+                for index, mime_type in enumerate(mime_types)
+            ]
+            # Eviction goes by the manifest's mtime.
+            os.utime(manifest)
+            return pages
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_pages(path: Path, pages: list[tuple[str, bytes]]) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        for index, (_, data) in enumerate(pages):
+            _write_atomic(path / f"{index}.page", data)
+        # The manifest goes last, so readers never see a partial entry.
+        _write_atomic(
+            path / "pages.json",
+            json.dumps([mime_type for mime_type, _ in pages]).encode("utf-8"),
+        )
+
+    @staticmethod
+    def _read_text(path: Path) -> str | None:
+        try:
+            text = path.with_suffix(".txt").read_text(encoding="utf-8")
+            os.utime(path.with_suffix(".txt"))
+            return text
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write_text(path: Path, text: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path.with_suffix(".txt"), text.encode("utf-8"))
+
+
+def _scope_dir(app_name: str, user_id: str, sha256: str) -> str:
+    """Relative directory of the renderings of one user's content."""
+    scope = hashlib.sha256(f"{app_name}\0{user_id}".encode("utf-8")).hexdigest()
+    return f"{scope[:24]}/{sha256[:2]}/{sha256}"
+
+
+def _entry_prefix(record: MediaRecord) -> str:
+    ref = record.ref
+    return f"{_scope_dir(ref.app_name, ref.user_id, record.sha256)}/"
+
+
+def purge_render_cache(
+    disk_dir: str | Path, app_name: str, user_id: str, sha256: str
+) -> None:
+    """Delete the on-disk renderings of one user's content."""
+    shutil.rmtree(
+        Path(disk_dir).joinpath(*_scope_dir(app_name, user_id, sha256).split("/")),
+        ignore_errors=True,
+    )
+
+
+def _disk_entries(disk_dir: Path) -> list[tuple[Path, int, float]]:
+    """Path, size and last use of every entry of a disk tier."""
+    entries = []
+    for path in disk_dir.glob("*/*/*/*"):
+        if path.name.startswith(".tmp-"):
+            continue
+        try:
+            marker = path / "pages.json" if path.is_dir() else path
+            entries.append((path, _entry_size(path), marker.stat().st_mtime))
+        except OSError:
+            continue
+    return entries
+
+
+def _entry_size(path: Path) -> int:
+    try:
+        if path.is_dir():
+            return sum(child.stat().st_size for child in path.iterdir())
+        return path.with_suffix(".txt").stat().st_size
+    except OSError:
+        return 0
+
+
+def _remove_entry(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
@@ -20,12 +20,15 @@ import hashlib
 import mimetypes
 import os
 from pathlib import Path
+from typing import Callable
 import uuid
 
 import filetype
+from google.genai import types
 
 from .models import MediaRecord
 from .models import MediaRef
+from .render_cache import MediaRenderCache
 from .storage import MediaStorage
 
 SUPPORTED_MIME_TYPES = frozenset(
@@ -55,12 +58,18 @@ class MediaService:
     """Validate files and coordinate a configured storage backend."""
 
     def __init__(
-        self, storage: MediaStorage, max_file_bytes: int | None = None
+        self,
+        storage: MediaStorage,
+        max_file_bytes: int | None = None,
+        render_cache: MediaRenderCache | None = None,
     ) -> None:
         self.storage = storage
         self.max_file_bytes = max_file_bytes or int(
             os.getenv("VEADK_MEDIA_MAX_FILE_BYTES", str(20 * 1024 * 1024))
         )
+        self.render_cache = render_cache or MediaRenderCache(
+            disk_dir=self._default_render_cache_dir(storage)
+        )
 
     async def save_file(
         self,
@@ -125,6 +134,37 @@ class MediaService:
             raise FileNotFoundError(ref.uri)
         return record
 
+    async def read_text(self, record: MediaRecord) -> str:
+        """Decoded text of a text document, served from the render cache."""
+        return await self.render_cache.text(
+            record, lambda: self.storage.read_bytes(record.ref)
+        )
+
+    async def render_pdf(
+        self,
+        record: MediaRecord,
+        render: Callable[[bytes, int, float], list[types.Part]],
+        *,
+        max_pages: int = 10,
+        scale: float = 2.0,
+    ) -> list[types.Part]:
+        """Page image parts of a stored PDF, served from the render cache."""
+        return await self.render_cache.pdf_pages(
+            record,
+            lambda: self.storage.read_bytes(record.ref),
+            lambda data: render(data, max_pages, scale),
+            max_pages=max_pages,
+            scale=scale,
+        )
+
+    @staticmethod
+    def _default_render_cache_dir(storage: MediaStorage) -> Path | None:
+        """Keep a disk tier next to local media unless it is disabled."""
+        enabled = os.getenv("VEADK_MEDIA_RENDER_CACHE_DISK", "true").strip().lower()
+        if enabled in ("0", "false", "no", "off"):
+            return None
+        return getattr(storage, "render_cache_dir", None)
+
     def _validate_size(self, size_bytes: int) -> None:
         if size_bytes <= 0:
             raise ValueError("Uploaded file is empty.")
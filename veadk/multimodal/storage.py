@@ -16,19 +16,29 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 import hashlib
 import json
 import os
 from pathlib import Path
+import re
 import shutil
+import threading
+import time
+from typing import AsyncIterator
+from typing import Callable
 from typing import Protocol
 from urllib.parse import quote
 
 from .models import MediaRecord
 from .models import MediaRef
+from .render_cache import purge_render_cache
 
 _DEFAULT_LOCAL_MEDIA_DIR = Path("/tmp/veadk-media")
 
+#: Bytes per chunk yielded by :meth:`MediaStorage.iter_bytes`.
+STREAM_CHUNK_BYTES = 1024 * 1024
+
 
 class MediaStorage(Protocol):
     """Persistence contract shared by local filesystem and TOS backends."""
@@ -49,6 +59,16 @@ class MediaStorage(Protocol):
         """Load all bytes for model input."""
         ...
 
+    def iter_bytes(
+        self,
+        ref: MediaRef,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_BYTES,
+    ) -> AsyncIterator[bytes]:
+        """Stream bytes ``[start, end)`` of one object without loading it whole."""
+        ...
+
     def local_path(self, ref: MediaRef) -> Path | None:
         """Return a local delivery path when the backend has one."""
         ...
@@ -101,6 +121,32 @@ def _session_prefix(app_name: str, user_id: str, session_id: str) -> str:
     )
 
 
+def _blob_prefix(app_name: str, user_id: str) -> str:
+    """Content-addressed blobs are shared by one user's sessions of one app."""
+    return "/".join(
+        ("apps", _scope_token(app_name), "users", _scope_token(user_id), "blobs")
+    )
+
+
+_SHA256_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+def _file_digest(record: MediaRecord, source: Path) -> str:
+    """Blob key of an uploaded file; the service already hashed it."""
+    if _SHA256_PATTERN.fullmatch(record.sha256):
+        return record.sha256
+    digest = hashlib.sha256()
+    with source.open("rb") as content:
+        for chunk in iter(lambda: content.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _metadata_json(record: MediaRecord, blob: str) -> str:
+    # `blob` is the digest the content is stored under; MediaRecord ignores it.
+    return json.dumps({**record.to_dict(), "blob": blob}, ensure_ascii=False)
+
+
 def _tos_scope_prefix(ref: MediaRef) -> str:
     """Return a readable, user-first TOS key prefix."""
     return "/".join(
@@ -134,11 +180,25 @@ def _tos_session_prefix(app_name: str, user_id: str, session_id: str) -> str:
 
 
 class LocalMediaStorage:
-    """Store media beneath a private local directory."""
+    """Store media beneath a private local directory.
+
+    Bytes are stored once per unique SHA-256 in a per-user blob directory, and
+    each media object's ``content`` is a hard link to its blob. The link count
+    is the blob's reference count: deleting objects drops links, and a blob
+    left with only its own link is removed together with its renderings in
+    :attr:`render_cache_dir`. Filesystems without hard links get a plain copy
+    per object instead.
+    """
 
     def __init__(self, root_dir: str | Path) -> None:
         self.root_dir = Path(root_dir).expanduser().resolve()
         self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._blob_lock = threading.Lock()
+
+    @property
+    def render_cache_dir(self) -> Path:
+        """Directory for content-addressed renderings of the stored media."""
+        return self.root_dir / "render-cache"
 
     def _object_dir(self, ref: MediaRef) -> Path:
         return self.root_dir.joinpath(*_scope_prefix(ref).split("/"))
@@ -149,28 +209,90 @@ class LocalMediaStorage:
     def _metadata_path(self, ref: MediaRef) -> Path:
         return self._object_dir(ref) / "metadata.json"
 
+    def _blob_path(self, app_name: str, user_id: str, digest: str) -> Path:
+        prefix = _blob_prefix(app_name, user_id)
+        return self.root_dir.joinpath(*prefix.split("/"), digest[:2], digest)
+
     async def save_file(self, record: MediaRecord, source: Path) -> None:
         await asyncio.to_thread(self._save_file, record, source)
 
     def _save_file(self, record: MediaRecord, source: Path) -> None:
-        object_dir = self._object_dir(record.ref)
-        object_dir.mkdir(parents=True, exist_ok=False)
-        shutil.copyfile(source, self._content_path(record.ref))
-        self._metadata_path(record.ref).write_text(
-            json.dumps(record.to_dict(), ensure_ascii=False), encoding="utf-8"
+        self._save(
+            record,
+            _file_digest(record, source),
+            lambda path: shutil.copyfile(source, path),
         )
 
     async def save_bytes(self, record: MediaRecord, data: bytes) -> None:
         await asyncio.to_thread(self._save_bytes, record, data)
 
     def _save_bytes(self, record: MediaRecord, data: bytes) -> None:
+        self._save(
+            record,
+            hashlib.sha256(data).hexdigest(),
+            lambda path: path.write_bytes(data),
+        )
+
+    def _save(
+        self, record: MediaRecord, digest: str, write: Callable[[Path], object]
+    ) -> None:
+        """Link the object's content to its blob, writing the blob if new."""
         object_dir = self._object_dir(record.ref)
         object_dir.mkdir(parents=True, exist_ok=False)
-        self._content_path(record.ref).write_bytes(data)
+        content_path = self._content_path(record.ref)
+        blob = self._blob_path(record.ref.app_name, record.ref.user_id, digest)
+        with self._blob_lock:
+            if not blob.is_file():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                partial = blob.with_name(f".{digest}.{os.getpid()}.partial")
+                write(partial)
+                os.replace(partial, blob)
+            try:
+                os.link(blob, content_path)
+            except FileNotFoundError:
+                # Collected by another process since the check above.
+                write(content_path)
+            except OSError:
+                shutil.copyfile(blob, content_path)
         self._metadata_path(record.ref).write_text(
-            json.dumps(record.to_dict(), ensure_ascii=False), encoding="utf-8"
+            _metadata_json(record, digest), encoding="utf-8"
         )
 
+    def _blobs_of(self, path: Path) -> dict[Path, MediaRecord]:
+        """Blobs referenced by the objects at or below ``path``."""
+        blobs: dict[Path, MediaRecord] = {}
+        for metadata_path in path.rglob("metadata.json"):
+            try:
+                data = json.loads(metadata_path.read_text(encoding="utf-8"))
+                record = MediaRecord.from_dict(data)
+            except (OSError, ValueError, KeyError):
+                continue
+            if isinstance(data.get("blob"), str):
+                blob = self._blob_path(
+                    record.ref.app_name, record.ref.user_id, data["blob"]
+                )
+                blobs[blob] = record
+        return blobs
+
+    def _remove(self, path: Path) -> None:
+        """Delete objects below ``path`` and collect their unreferenced blobs."""
+        blobs = self._blobs_of(path) if path.is_dir() else {}
+        shutil.rmtree(path, True)
+        with self._blob_lock:
+            for blob, record in blobs.items():
+                try:
+                    if blob.stat().st_nlink > 1:
+                        continue
+                    blob.unlink()
+                except FileNotFoundError:
+                    pass
+                purge_render_cache(
+                    self.render_cache_dir,
+                    record.ref.app_name,
+                    record.ref.user_id,
+                    record.sha256,
+                )
+
     async def get_record(self, ref: MediaRef) -> MediaRecord | None:
         metadata_path = self._metadata_path(ref)
         if not metadata_path.is_file():
@@ -184,6 +306,31 @@ class LocalMediaStorage:
             raise FileNotFoundError(ref.uri)
         return await asyncio.to_thread(content_path.read_bytes)
 
+    async def iter_bytes(
+        self,
+        ref: MediaRef,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_BYTES,
+    ) -> AsyncIterator[bytes]:
+        content_path = self._content_path(ref)
+        if not content_path.is_file():
+            raise FileNotFoundError(ref.uri)
+        content = await asyncio.to_thread(content_path.open, "rb")
+        try:
+            await asyncio.to_thread(content.seek, start)
+            remaining = None if end is None else max(end - start, 0)
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await asyncio.to_thread(content.read, size)
+                if not chunk:
+                    return
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(content.close)
+
     def local_path(self, ref: MediaRef) -> Path | None:
         path = self._content_path(ref)
         return path if path.is_file() else None
@@ -193,7 +340,7 @@ class LocalMediaStorage:
         return None
 
     async def delete(self, ref: MediaRef) -> None:
-        await asyncio.to_thread(shutil.rmtree, self._object_dir(ref), True)
+        await asyncio.to_thread(self._remove, self._object_dir(ref))
 
     async def delete_session(
         self, app_name: str, user_id: str, session_id: str
@@ -201,11 +348,22 @@ class LocalMediaStorage:
         path = self.root_dir.joinpath(
             *_session_prefix(app_name, user_id, session_id).split("/")[:-1]
         )
-        await asyncio.to_thread(shutil.rmtree, path, True)
+        await asyncio.to_thread(self._remove, path)
 
 
 class TosMediaStorage:
-    """Store private media objects in Volcengine TOS."""
+    """Store private media objects in Volcengine TOS.
+
+    Bytes are stored once per unique SHA-256 under a per-user ``blobs/``
+    prefix. Every media object that uses a blob writes an empty reference
+    marker next to it. Dropping the last marker does not delete the blob right
+    away: it schedules the blob for collection, and a later release or session
+    delete of the same user collects it once ``blob_grace_seconds`` have
+    passed without a new reference. A save cancels the pending collection of
+    its blob, so a save racing a release cannot end up pointing at a deleted
+    blob. Objects written before blobs existed keep their own ``content`` key
+    and are still read from it.
+    """
 
     def __init__(
         self,
@@ -217,6 +375,7 @@ class TosMediaStorage:
         secret_key: str,
         session_token: str = "",
         key_prefix: str = "veadk-media",
+        blob_grace_seconds: float = 3600.0,
     ) -> None:
         if not bucket or not access_key or not secret_key:
             raise ValueError(
@@ -227,6 +386,7 @@ class TosMediaStorage:
         self._tos = tos
         self._bucket = bucket
         self._key_prefix = key_prefix.strip("/")
+        self._blob_grace_seconds = blob_grace_seconds
         self._client = tos.TosClientV2(
             ak=access_key,
             sk=secret_key,
@@ -234,11 +394,30 @@ class TosMediaStorage:
             endpoint=endpoint,
             region=region,
         )
+        # media ref -> key its bytes live under (objects are immutable)
+        self._content_keys: OrderedDict[MediaRef, str] = OrderedDict()
+        self._content_keys_lock = threading.Lock()
 
     def _key(self, ref: MediaRef, name: str) -> str:
         prefix = _tos_scope_prefix(ref)
         return f"{self._key_prefix}/{prefix}/{name}"
 
+    def _blob_key(self, ref: MediaRef, digest: str, name: str) -> str:
+        user = quote(ref.user_id, safe="")
+        app = quote(ref.app_name, safe="")
+        return f"{self._key_prefix}/users/{user}/apps/{app}/blobs/{digest}/{name}"
+
+    def _ref_marker_key(self, ref: MediaRef, digest: str) -> str:
+        return self._blob_key(ref, digest, f"refs/{_scope_token(ref.uri)}")
+
+    def _pending_prefix(self, ref: MediaRef) -> str:
+        user = quote(ref.user_id, safe="")
+        app = quote(ref.app_name, safe="")
+        return f"{self._key_prefix}/users/{user}/apps/{app}/blob-gc/"
+
+    def _pending_key(self, ref: MediaRef, digest: str) -> str:
+        return f"{self._pending_prefix(ref)}{digest}"
+
     def _session_key_prefix(self, app_name: str, user_id: str, session_id: str) -> str:
         prefix = _tos_session_prefix(app_name, user_id, session_id)
         return f"{self._key_prefix}/{prefix}"
@@ -247,49 +426,85 @@ class TosMediaStorage:
         await asyncio.to_thread(self._save_file, record, source)
 
     def _save_file(self, record: MediaRecord, source: Path) -> None:
-        with source.open("rb") as content:
+        def _upload(key: str) -> None:
+            with source.open("rb") as content:
+                self._client.put_object(
+                    bucket=self._bucket,
+                    key=key,
+                    content=content,
+                    content_length=record.size_bytes,
+                    content_type=record.mime_type,
+                )
+
+        self._save(record, _file_digest(record, source), _upload)
+
+    async def save_bytes(self, record: MediaRecord, data: bytes) -> None:
+        await asyncio.to_thread(self._save_bytes, record, data)
+
+    def _save_bytes(self, record: MediaRecord, data: bytes) -> None:
+        def _upload(key: str) -> None:
             self._client.put_object(
                 bucket=self._bucket,
-                key=self._key(record.ref, "content"),
-                content=content,
-                content_length=record.size_bytes,
+                key=key,
+                content=data,
+                content_length=len(data),
                 content_type=record.mime_type,
             )
-        self._put_metadata(record)
 
-    async def save_bytes(self, record: MediaRecord, data: bytes) -> None:
-        await asyncio.to_thread(self._save_bytes, record, data)
+        self._save(record, hashlib.sha256(data).hexdigest(), _upload)
 
-    def _save_bytes(self, record: MediaRecord, data: bytes) -> None:
-        self._client.put_object(
-            bucket=self._bucket,
-            key=self._key(record.ref, "content"),
-            content=data,
-            content_length=len(data),
-            content_type=record.mime_type,
+    def _save(
+        self, record: MediaRecord, digest: str, upload: Callable[[str], None]
+    ) -> None:
+        """Reference the blob for ``digest``, uploading it only if it is new."""
+        # The marker and the cancelled collection come first, so a collection
+        # that starts later sees the blob used.
+        self._put(self._ref_marker_key(record.ref, digest), b"", "text/plain")
+        self._client.delete_object(
+            bucket=self._bucket, key=self._pending_key(record.ref, digest)
+        )
+        content_key = self._blob_key(record.ref, digest, "content")
+        if not self._exists(content_key):
+            upload(content_key)
+        self._put(
+            self._key(record.ref, "metadata.json"),
+            _metadata_json(record, digest).encode("utf-8"),
+            "application/json",
         )
-        self._put_metadata(record)
+        # A collection already past its checks may have deleted the blob.
+        if not self._exists(content_key):
+            upload(content_key)
 
-    def _put_metadata(self, record: MediaRecord) -> None:
-        data = json.dumps(record.to_dict(), ensure_ascii=False).encode("utf-8")
+    def _put(self, key: str, data: bytes, content_type: str) -> None:
         self._client.put_object(
             bucket=self._bucket,
-            key=self._key(record.ref, "metadata.json"),
+            key=key,
             content=data,
             content_length=len(data),
-            content_type="application/json",
+            content_type=content_type,
         )
 
+    def _exists(self, key: str) -> bool:
+        try:
+            self._client.head_object(bucket=self._bucket, key=key)
+        except self._tos.exceptions.TosServerError as error:
+            if error.status_code == 404:
+                return False
+            raise
+        return True
+
     async def get_record(self, ref: MediaRef) -> MediaRecord | None:
+        data = await asyncio.to_thread(self._get_metadata, ref)
+        return MediaRecord.from_dict(data) if data is not None else None
+
+    def _get_metadata(self, ref: MediaRef) -> dict | None:
         try:
-            data = await asyncio.to_thread(
-                self._get_object, self._key(ref, "metadata.json")
-            )
+            data = self._get_object(self._key(ref, "metadata.json"))
         except self._tos.exceptions.TosServerError as error:
             if error.status_code == 404:
                 return None
             raise
-        return MediaRecord.from_dict(json.loads(data.decode("utf-8")))
+        return json.loads(data.decode("utf-8"))
 
     def _get_object(self, key: str) -> bytes:
         output = self._client.get_object(bucket=self._bucket, key=key)
@@ -298,8 +513,60 @@ class TosMediaStorage:
             raise TypeError(f"TOS returned non-bytes content for {key}.")
         return data
 
+    def _content_key(self, ref: MediaRef) -> str:
+        with self._content_keys_lock:
+            key = self._content_keys.get(ref)
+            if key is not None:
+                self._content_keys.move_to_end(ref)
+                return key
+        data = self._get_metadata(ref)
+        if data is None:
+            raise FileNotFoundError(ref.uri)
+        blob = data.get("blob")
+        key = (
+            self._blob_key(ref, blob, "content")
+            if isinstance(blob, str)
+            else self._key(ref, "content")
+        )
+        with self._content_keys_lock:
+            self._content_keys[ref] = key
+            if len(self._content_keys) > 4096:
+                self._content_keys.popitem(last=False)
+        return key
+
+    def _forget_content_key(self, ref: MediaRef) -> None:
+        with self._content_keys_lock:
+            self._content_keys.pop(ref, None)
+
     async def read_bytes(self, ref: MediaRef) -> bytes:
-        return await asyncio.to_thread(self._get_object, self._key(ref, "content"))
+        key = await asyncio.to_thread(self._content_key, ref)
+        return await asyncio.to_thread(self._get_object, key)
+
+    async def iter_bytes(
+        self,
+        ref: MediaRef,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_BYTES,
+    ) -> AsyncIterator[bytes]:
+        if end is not None and end <= start:
+            return
+        key = await asyncio.to_thread(self._content_key, ref)
+        # HTTP ranges are inclusive.
+        last = "" if end is None else str(end - 1)
+        output = await asyncio.to_thread(
+            self._client.get_object,
+            bucket=self._bucket,
+            key=key,
+            range=f"bytes={start}-{last}",
+        )
+        try:
+            while chunk := await asyncio.to_thread(output.read, chunk_size):
+                yield chunk
+        finally:
+            close = getattr(output.content, "close", None)
+            if close is not None:
+                await asyncio.to_thread(close)
 
     def local_path(self, ref: MediaRef) -> Path | None:
         del ref
@@ -312,32 +579,94 @@ class TosMediaStorage:
         output = self._client.pre_signed_url(
             self._tos.HttpMethodType.Http_Method_Get,
             bucket=self._bucket,
-            key=self._key(ref, "content"),
+            key=self._content_key(ref),
             expires=900,
         )
         return output.signed_url
 
     async def delete(self, ref: MediaRef) -> None:
-        await asyncio.gather(
-            asyncio.to_thread(
-                self._client.delete_object,
-                bucket=self._bucket,
-                key=self._key(ref, "content"),
-            ),
-            asyncio.to_thread(
-                self._client.delete_object,
-                bucket=self._bucket,
-                key=self._key(ref, "metadata.json"),
-            ),
+        await asyncio.to_thread(self._delete, ref)
+
+    def _delete(self, ref: MediaRef) -> None:
+        data = self._get_metadata(ref)
+        for name in ("content", "metadata.json"):
+            self._client.delete_object(bucket=self._bucket, key=self._key(ref, name))
+        self._forget_content_key(ref)
+        if data is not None and isinstance(data.get("blob"), str):
+            self._release(ref, data["blob"])
+        self._collect_blobs(ref)
+
+    def _has_refs(self, ref: MediaRef, digest: str) -> bool:
+        output = self._client.list_objects_type2(
+            bucket=self._bucket,
+            prefix=self._blob_key(ref, digest, "refs/"),
+            max_keys=1,
         )
+        return bool(output.contents)
+
+    def _release(self, ref: MediaRef, digest: str) -> None:
+        """Drop one reference to a blob and schedule it if it was the last."""
+        self._client.delete_object(
+            bucket=self._bucket, key=self._ref_marker_key(ref, digest)
+        )
+        if not self._has_refs(ref, digest):
+            self._put(
+                self._pending_key(ref, digest),
+                repr(time.time()).encode("utf-8"),
+                "text/plain",
+            )
+
+    def _collect_blobs(self, ref: MediaRef) -> None:
+        """Delete this user's scheduled blobs that stayed unreferenced."""
+        now = time.time()
+        for pending_key in self._list_keys(self._pending_prefix(ref)):
+            digest = pending_key.rsplit("/", 1)[-1]
+            try:
+                scheduled_at = float(self._get_object(pending_key).decode("utf-8"))
+            except self._tos.exceptions.TosServerError as error:
+                if error.status_code == 404:
+                    continue
+                raise
+            except ValueError:
+                scheduled_at = 0.0
+            if now - scheduled_at < self._blob_grace_seconds:
+                continue
+            if self._has_refs(ref, digest):
+                self._client.delete_object(bucket=self._bucket, key=pending_key)
+                continue
+            # A save deletes the pending key before it checks the blob.
+            if not self._exists(pending_key):
+                continue
+            self._client.delete_object(
+                bucket=self._bucket, key=self._blob_key(ref, digest, "content")
+            )
+            self._client.delete_object(bucket=self._bucket, key=pending_key)
 
     async def delete_session(
         self, app_name: str, user_id: str, session_id: str
     ) -> None:
         prefix = self._session_key_prefix(app_name, user_id, session_id)
-        await asyncio.to_thread(self._delete_prefix, prefix)
-
-    def _delete_prefix(self, prefix: str) -> None:
+        await asyncio.to_thread(self._delete_session, prefix)
+
+    def _delete_session(self, prefix: str) -> None:
+        keys = self._list_keys(prefix)
+        released: list[tuple[MediaRef, str]] = []
+        for key in keys:
+            if not key.endswith("/metadata.json"):
+                continue
+            data = json.loads(self._get_object(key).decode("utf-8"))
+            if isinstance(data.get("blob"), str):
+                released.append((MediaRecord.from_dict(data).ref, data["blob"]))
+        for key in keys:
+            self._client.delete_object(bucket=self._bucket, key=key)
+        for ref, digest in released:
+            self._forget_content_key(ref)
+            self._release(ref, digest)
+        if released:
+            self._collect_blobs(released[0][0])
+
+    def _list_keys(self, prefix: str) -> list[str]:
+        keys: list[str] = []
         continuation_token = ""
         while True:
             output = self._client.list_objects_type2(
@@ -346,10 +675,9 @@ class TosMediaStorage:
                 continuation_token=continuation_token,
                 max_keys=1000,
             )
-            for item in output.contents or []:
-                self._client.delete_object(bucket=self._bucket, key=item.key)
+            keys.extend(item.key for item in output.contents or [])
             if not output.is_truncated:
-                return
+                return keys
             continuation_token = output.next_continuation_token
             if not continuation_token:
                 raise RuntimeError(
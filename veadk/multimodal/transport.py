@@ -15,15 +15,18 @@
 
 from __future__ import annotations
 
-import asyncio
 import base64
 from typing import Any
+from typing import AsyncIterator
 
 from veadk.utils.pdf_to_images import render_pdf_to_png_parts
 
 from .models import MediaRef
 from .service import MediaService
 
+# A multiple of 3, so every chunk encodes without padding.
+_BASE64_CHUNK_BYTES = 3 * 256 * 1024
+
 
 async def resolve_runtime_media(
     payload: dict[str, Any], service: MediaService
@@ -52,17 +55,17 @@ async def resolve_runtime_media(
             continue
         _validate_scope(payload, ref)
         record = await service.get_record(ref)
-        data = await service.storage.read_bytes(ref)
         metadata = _transport_metadata(part, record.to_api_dict())
 
         if record.mime_type in ("text/plain", "text/markdown"):
+            text = await service.read_text(record)
             resolved_parts.append(
                 {
                     **_without_file_data(part),
                     "text": (
                         f'<document name="{record.file_name}" '
                         f'type="{record.mime_type}">\n'
-                        f"{data.decode('utf-8-sig')}\n</document>"
+                        f"{text}\n</document>"
                     ),
                     "partMetadata": {
                         **metadata,
@@ -73,8 +76,8 @@ async def resolve_runtime_media(
             continue
 
         if record.mime_type == "application/pdf":
-            image_parts = await asyncio.to_thread(
-                render_pdf_to_png_parts, data, 10, 2.0
+            image_parts = await service.render_pdf(
+                record, render_pdf_to_png_parts, max_pages=10, scale=2.0
             )
             for index, image_part in enumerate(image_parts):
                 if not image_part.inline_data or not image_part.inline_data.data:
@@ -99,12 +102,15 @@ async def resolve_runtime_media(
                 )
             continue
 
+        data = await _stream_base64(
+            service.storage.iter_bytes(ref, chunk_size=_BASE64_CHUNK_BYTES)
+        )
         resolved_parts.append(
             {
                 **_without_file_data(part),
                 "inlineData": {
                     "mimeType": record.mime_type,
-                    "data": _base64(data),
+                    "data": data,
                     "displayName": record.file_name,
                 },
                 "partMetadata": metadata,
@@ -145,3 +151,17 @@ def _transport_metadata(
 
 def _base64(data: bytes) -> str:
     return base64.b64encode(data).decode("ascii")
+
+
+async def _stream_base64(chunks: AsyncIterator[bytes]) -> str:
+    """Base64-encode a byte stream without holding the raw object in memory."""
+    pieces: list[str] = []
+    carry = b""
+    async for chunk in chunks:
+        data = carry + chunk if carry else chunk
+        cut = len(data) - len(data) % 3
+        pieces.append(_base64(data[:cut]))
+        carry = data[cut:]
+    if carry:
+        pieces.append(_base64(carry))
+    return "".join(pieces)
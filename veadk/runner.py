@@ -465,6 +465,11 @@ class Runner(ADKRunner):
             intercept_new_message(_upload_image_to_tos)(super().run_async), self
         )
 
+        from veadk.models.ark_client_pool import get_ark_client_pool
+
+        self._ark_client_pool = get_ark_client_pool()
+        self._ark_client_pool.retain()
+
     async def run(
         self,
         messages: RunnerMessage,
@@ -787,3 +792,19 @@ class Runner(ADKRunner):
 
         await self.long_term_memory.add_session_to_memory(session, **kwargs)
         logger.info(f"Add session `{session.id}` to long term memory.")
+
+    async def close(self) -> None:
+        """Flush events queued by ``auto_save_session``, release the shared Ark
+        connection pool and close the runner.
+
+        Pooled connections are only closed once every runner released them.
+        """
+        if self.long_term_memory is not None:
+            from veadk.memory.memory_writer import get_memory_writer
+
+            await get_memory_writer(self.long_term_memory).close()
+        pool = getattr(self, "_ark_client_pool", None)
+        self._ark_client_pool = None
+        if pool is not None:
+            await pool.release()
+        await super().close()
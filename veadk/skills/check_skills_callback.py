@@ -18,7 +18,7 @@ from typing import Optional, Dict, List
 from google.adk.agents.callback_context import CallbackContext
 from google.genai import types
 from veadk.skills.skill import Skill
-from veadk.skills.utils import load_skill_from_directory, load_skills_from_cloud
+from veadk.skills.watcher import get_skill_watcher, load_skills_from_source
 from veadk.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -156,34 +156,7 @@ def reload_skills_from_config(skills_config: List[str]) -> Dict[str, Skill]:
     for item in skills_config:
         if not item or str(item).strip() == "":
             continue
-
-        path = Path(item)
-
-        # Check if it's a local directory
-        if path.exists() and path.is_dir():
-            logger.debug(f"Reloading skills from local directory: {path}")
-            try:
-                for skill_dir in path.iterdir():
-                    if skill_dir.is_dir():
-                        skill = load_skill_from_directory(skill_dir)
-                        # Only add skill if it loaded successfully
-                        if skill is not None:
-                            all_skills[skill.name] = skill
-                        else:
-                            logger.warning(f"Skipped failed skill from {skill_dir}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to reload skills from local directory {path}: {e}"
-                )
-        else:
-            # Treat as cloud skill space ID
-            logger.debug(f"Reloading skills from cloud space: {item}")
-            try:
-                cloud_skills = load_skills_from_cloud(item)
-                for skill in cloud_skills:
-                    all_skills[skill.name] = skill
-            except Exception as e:
-                logger.error(f"Failed to reload skills from cloud space {item}: {e}")
+        all_skills.update(load_skills_from_source(item))
 
     return all_skills
 
@@ -282,8 +255,10 @@ def check_skills(callback_context: CallbackContext) -> Optional[types.Content]:
     including new skills, modified skills, and deleted skills. When changes are detected,
     it updates the agent's instruction and reloads the SkillsToolset.
 
-    The detection process:
-    1. Reload all skills from the original configuration
+    Skill sources are watched in the background by a shared
+    `SkillChangeWatcher`, so an unchanged configuration costs one generation
+    comparison per call. Once the watcher publishes a new generation:
+    1. Take its snapshot of all skills from the original configuration
     2. Compare with current skills_dict to detect:
        - New skills: present in reloaded but not in current
        - Modified skills: present in both but content changed (via hash comparison)
@@ -320,8 +295,12 @@ def check_skills(callback_context: CallbackContext) -> Optional[types.Content]:
             logger.debug("Agent has no skills configuration, skip checking")
             return None
 
-        # Reload skills from original configuration
-        reloaded_skills_dict = reload_skills_from_config(agent.skills)
+        # Skills are re-read by the watcher; only act on a new generation
+        watcher = get_skill_watcher(agent.skills)
+        if getattr(agent, "_skills_generation", None) == watcher.generation:
+            return None
+        generation, reloaded_skills_dict = watcher.snapshot()
+        agent._skills_generation = generation
 
         # If both are empty, skip
         if not current_skills_dict and not reloaded_skills_dict:
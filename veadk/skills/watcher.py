@@ -0,0 +1,262 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Background detection of skill changes for dynamically loaded skills.
+
+A :class:`SkillChangeWatcher` keeps the skills of one agent configuration up
+to date off the request path. Local skill directories are polled by the
+modification time and size of every ``SKILL.md``, which costs one ``stat``
+per skill; cloud skill spaces are listed at most once per TTL and only
+republished when their listing revision changes. Every published change bumps
+``generation``, so callers detect changes with one integer comparison.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from veadk.skills.skill import Skill
+from veadk.skills.utils import load_skill_from_directory, load_skills_from_cloud
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_DEFAULT_LOCAL_POLL_INTERVAL = 2.0
+_DEFAULT_CLOUD_POLL_INTERVAL = 60.0
+
+
+def _get_interval(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning(f"Invalid {name}={raw!r}, fallback to {default}.")
+        return default
+    if value <= 0:
+        logger.warning(f"Non-positive {name}={value}, fallback to {default}.")
+        return default
+    return value
+
+
+def is_local_skill_source(item: str) -> bool:
+    """Whether a configured skill source is a local directory (else a space id)."""
+    return Path(item).is_dir()
+
+
+def load_skills_from_source(item: str) -> Dict[str, Skill]:
+    """Load the skills of one configured source: a directory or cloud space ids."""
+    skills: Dict[str, Skill] = {}
+    path = Path(item)
+    if is_local_skill_source(item):
+        logger.debug(f"Reloading skills from local directory: {path}")
+        try:
+            for skill_dir in path.iterdir():
+                if skill_dir.is_dir():
+                    skill = load_skill_from_directory(skill_dir)
+                    # Only add skill if it loaded successfully
+                    if skill is not None:
+                        skills[skill.name] = skill
+                    else:
+                        logger.warning(f"Skipped failed skill from {skill_dir}")
+        except Exception as e:
+            logger.error(f"Failed to reload skills from local directory {path}: {e}")
+    else:
+        logger.debug(f"Reloading skills from cloud space: {item}")
+        try:
+            for skill in load_skills_from_cloud(item):
+                skills[skill.name] = skill
+        except Exception as e:
+            logger.error(f"Failed to reload skills from cloud space {item}: {e}")
+    return skills
+
+
+def local_skills_fingerprint(directory: Path) -> tuple:
+    """Cheap change marker of a skills directory: the stat of each SKILL.md."""
+    entries = []
+    try:
+        children = sorted(os.scandir(directory), key=lambda entry: entry.name)
+    except OSError:
+        return ()
+    for child in children:
+        if not child.is_dir():
+            continue
+        try:
+            stat = os.stat(os.path.join(child.path, "SKILL.md"))
+        except OSError:
+            entries.append((child.name, None, None))
+        else:
+            entries.append((child.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+def cloud_skills_revision(skills: Dict[str, Skill]) -> str:
+    """Revision of a cloud skill listing; changes with any listed skill."""
+    digest = hashlib.sha256()
+    for name in sorted(skills):
+        skill = skills[name]
+        digest.update(
+            "\0".join(
+                str(value or "")
+                for value in (
+                    skill.name,
+                    skill.description,
+                    skill.path,
+                    skill.id,
+                    skill.version_id,
+                )
+            ).encode("utf-8")
+        )
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class SkillChangeWatcher:
+    """Watch configured skill sources and publish a generation number.
+
+    The first scan runs in the constructor. After :meth:`start`, a daemon
+    thread polls local directories every ``local_poll_interval`` seconds and
+    cloud spaces every ``cloud_poll_interval`` seconds; a source is reloaded
+    only when its fingerprint or revision changed.
+
+    Args:
+        sources: Skill sources as configured on the agent (local directories
+            or comma-separated cloud skill space ids).
+        local_poll_interval: Defaults to `SKILLS_LOCAL_POLL_INTERVAL` or 2s.
+        cloud_poll_interval: Defaults to `SKILLS_CLOUD_POLL_INTERVAL` or 60s.
+    """
+
+    def __init__(
+        self,
+        sources: List[str],
+        *,
+        local_poll_interval: Optional[float] = None,
+        cloud_poll_interval: Optional[float] = None,
+    ) -> None:
+        self.sources = [str(item) for item in sources if item and str(item).strip()]
+        self.local_poll_interval = local_poll_interval or _get_interval(
+            "SKILLS_LOCAL_POLL_INTERVAL", _DEFAULT_LOCAL_POLL_INTERVAL
+        )
+        self.cloud_poll_interval = cloud_poll_interval or _get_interval(
+            "SKILLS_CLOUD_POLL_INTERVAL", _DEFAULT_CLOUD_POLL_INTERVAL
+        )
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._generation = 0
+        self._skills: Dict[str, Skill] = {}
+        self._source_skills: Dict[str, Dict[str, Skill]] = {}
+        self._markers: Dict[str, object] = {}
+        self._next_cloud_poll: Dict[str, float] = {}
+        self.poll()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def snapshot(self) -> tuple[int, Dict[str, Skill]]:
+        """Return the current generation and a copy of its skills."""
+        with self._lock:
+            return self._generation, dict(self._skills)
+
+    def poll(self) -> bool:
+        """Check every due source once; return whether a change was published."""
+        now = time.monotonic()
+        changed = False
+        for item in self.sources:
+            if is_local_skill_source(item):
+                marker: object = local_skills_fingerprint(Path(item))
+                if marker == self._markers.get(item):
+                    continue
+                skills = load_skills_from_source(item)
+            else:
+                if now < self._next_cloud_poll.get(item, 0.0):
+                    continue
+                self._next_cloud_poll[item] = now + self.cloud_poll_interval
+                skills = load_skills_from_source(item)
+                marker = cloud_skills_revision(skills)
+                if marker == self._markers.get(item):
+                    continue
+            self._markers[item] = marker
+            self._source_skills[item] = skills
+            changed = True
+
+        if changed:
+            merged: Dict[str, Skill] = {}
+            for item in self.sources:
+                merged.update(self._source_skills.get(item, {}))
+            with self._lock:
+                self._skills = merged
+                self._generation += 1
+            logger.debug(
+                f"Published skills generation {self._generation} "
+                f"with {len(merged)} skills"
+            )
+        return changed
+
+    def start(self) -> None:
+        """Start the background polling thread if it is not running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="veadk-skill-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def _run(self) -> None:
+        interval = min(self.local_poll_interval, self.cloud_poll_interval)
+        while not self._stop.wait(interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"Skill change watcher poll failed: {e}", exc_info=True)
+
+
+_watchers: Dict[tuple[str, ...], SkillChangeWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def get_skill_watcher(sources: List[str]) -> SkillChangeWatcher:
+    """Return the running watcher shared by every agent with these sources."""
+    key = tuple(str(item) for item in sources)
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            watcher = SkillChangeWatcher(list(sources))
+            _watchers[key] = watcher
+    watcher.start()
+    return watcher
+
+
+def stop_skill_watchers() -> None:
+    """Stop and forget every shared watcher."""
+    with _watchers_lock:
+        watchers = list(_watchers.values())
+        _watchers.clear()
+    for watcher in watchers:
+        watcher.stop()
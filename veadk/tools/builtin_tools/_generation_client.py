@@ -0,0 +1,267 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared HTTP client and task poller of the image / video generation tools.
+
+Opening an `httpx.AsyncClient` per request pays DNS, TCP and TLS setup every
+time, and polling every task with its own fixed-interval loop sends one GET per
+task per round. `get_generation_http_client` hands out one pooled client per
+event loop, and `TaskPoller` checks all outstanding tasks of a loop together:
+due tasks are queried in batches, each task backs off exponentially with
+jitter, and waiters are resolved as soon as their task finishes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+from veadk.configs.tool_configs import MediaGenerationConfig
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TERMINAL_STATUSES = frozenset({"succeeded", "failed", "cancelled", "expired"})
+
+StatusFetcher = Callable[[str], Awaitable[dict]]
+BatchStatusFetcher = Callable[[list[str]], Awaitable[dict[str, dict]]]
+
+_T = TypeVar("_T")
+
+_lock = threading.Lock()
+_http_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def per_event_loop(
+    cache: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _T],
+    factory: Callable[[], _T],
+) -> _T:
+    """Return the running loop's entry of `cache`, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        value = cache.get(loop)
+        if value is None:
+            value = factory()
+            cache[loop] = value
+        return value
+
+
+def get_generation_http_client() -> httpx.AsyncClient:
+    """Return the pooled client of the running event loop.
+
+    httpx connections are bound to the loop that opened them, so every loop
+    gets its own client. Pass per-request timeouts to the request methods.
+    """
+
+    def _create() -> httpx.AsyncClient:
+        config = MediaGenerationConfig()
+        return httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+        )
+
+    client = per_event_loop(_http_clients, _create)
+    if client.is_closed:
+        loop = asyncio.get_running_loop()
+        with _lock:
+            _http_clients.pop(loop, None)
+        client = per_event_loop(_http_clients, _create)
+    return client
+
+
+async def close_generation_http_client() -> None:
+    """Close the pooled connections of the current event loop, if any."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _http_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+@dataclass
+class _PendingTask:
+    interval: float
+    max_interval: float
+    next_check: float
+    waiters: list[asyncio.Future] = field(default_factory=list)
+
+
+class TaskPoller:
+    """Wait for asynchronous generation tasks with batched status checks.
+
+    One poller serves every caller on an event loop, so tasks submitted by
+    different sessions share status requests. A background runner wakes at
+    the earliest due check, queries all due tasks (in batches when
+    `list_statuses` is given, falling back to one request per task) and
+    resolves the waiters of every task that reached a terminal status.
+
+    Args:
+        get_status: Fetches the status payload of one task.
+        list_statuses: Optionally fetches several tasks in one request and
+            returns their payloads by task id.
+        config: Polling intervals and batch size. Read from
+            `TOOL_MEDIA_GENERATION_*` env vars when omitted.
+    """
+
+    def __init__(
+        self,
+        get_status: StatusFetcher,
+        list_statuses: Optional[BatchStatusFetcher] = None,
+        config: Optional[MediaGenerationConfig] = None,
+    ) -> None:
+        self.config = config or MediaGenerationConfig()
+        self._get_status = get_status
+        self._list_statuses = list_statuses
+        self._tasks: dict[str, _PendingTask] = {}
+        self._wake = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+        self.requests = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    async def wait(self, task_id: str, max_interval: Optional[float] = None) -> dict:
+        """Return the status payload of `task_id` once it is terminal.
+
+        Cancel the call (e.g. with `asyncio.wait_for`) to stop waiting; the
+        task is dropped from polling when nobody waits for it anymore.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._tasks.get(task_id)
+        if entry is None:
+            max_interval = max_interval or self.config.poll_max_interval
+            interval = min(self.config.poll_initial_interval, max_interval)
+            entry = _PendingTask(
+                interval=interval,
+                max_interval=max_interval,
+                next_check=loop.time() + self._jittered(interval),
+            )
+            self._tasks[task_id] = entry
+            self._wake.set()
+        elif max_interval is not None:
+            entry.max_interval = min(entry.max_interval, max_interval)
+
+        future = loop.create_future()
+        entry.waiters.append(future)
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+        try:
+            return await future
+        finally:
+            if future in entry.waiters:
+                entry.waiters.remove(future)
+            if not entry.waiters and self._tasks.get(task_id) is entry:
+                del self._tasks[task_id]
+
+    def _jittered(self, interval: float) -> float:
+        jitter = self.config.poll_jitter
+        return interval * random.uniform(1 - jitter, 1 + jitter)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._tasks:
+                now = loop.time()
+                due = [
+                    task_id
+                    for task_id, entry in self._tasks.items()
+                    if entry.next_check <= now
+                ]
+                if not due:
+                    self._wake.clear()
+                    delay = min(entry.next_check for entry in self._tasks.values())
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), delay - now)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                results = await self._fetch(due)
+                for task_id in due:
+                    entry = self._tasks.get(task_id)
+                    if entry is None:
+                        continue
+                    result = results.get(task_id)
+                    if result is not None and result.get("status") in (
+                        TERMINAL_STATUSES
+                    ):
+                        del self._tasks[task_id]
+                        for waiter in entry.waiters:
+                            if not waiter.done():
+                                waiter.set_result(result)
+                        continue
+                    entry.interval = min(
+                        entry.max_interval, entry.interval * self.config.poll_backoff
+                    )
+                    entry.next_check = loop.time() + self._jittered(entry.interval)
+        except Exception as e:
+            logger.error(f"Generation task poller stopped: {e}")
+            for entry in self._tasks.values():
+                for waiter in entry.waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+            self._tasks.clear()
+
+    async def _fetch(self, task_ids: list[str]) -> dict[str, dict]:
+        results: dict[str, dict] = {}
+        if self._list_statuses is not None:
+            size = max(1, self.config.poll_batch_size)
+            for start in range(0, len(task_ids), size):
+                chunk = task_ids[start : start + size]
+                self.requests += 1
+                try:
+                    listed = await self._list_statuses(chunk)
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code < 500:
+                        logger.warning(
+                            f"Batched task status query rejected "
+                            f"({e.response.status_code}), polling tasks one by one."
+                        )
+                        self._list_statuses = None
+                        break
+                    logger.warning(f"Batched task status query failed: {e}")
+                    continue
+                except Exception as e:
+                    logger.warning(f"Batched task status query failed: {e}")
+                    continue
+                results.update(
+                    (task_id, listed[task_id]) for task_id in chunk if task_id in listed
+                )
+
+        missing = [task_id for task_id in task_ids if task_id not in results]
+        if missing:
+            self.requests += len(missing)
+            fetched = await asyncio.gather(
+                *(self._get_status(task_id) for task_id in missing),
+                return_exceptions=True,
+            )
+            for task_id, result in zip(missing, fetched):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error polling task {task_id}: {result}")
+                else:
+                    results[task_id] = result
+        return results
@@ -0,0 +1,519 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Async fetch engine behind the `web_fetch` tool.
+
+Agents fan out many fetches per turn, so pages are downloaded on one pooled
+`httpx.AsyncClient` per event loop (HTTP/2 when `h2` is installed) with a
+concurrency limit per host. Concurrent fetches of the same URL share one
+download, and fetched documents are kept in a bounded LRU cache, optionally
+backed by a directory. Once an entry is older than the TTL it is revalidated
+with `If-None-Match` / `If-Modified-Since`, so unchanged pages cost a 304.
+Extraction runs on a small thread pool, off the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import ipaddress
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import urljoin, urlparse
+
+import httpx
+
+from veadk.configs.tool_configs import WebFetchConfig
+from veadk.tools.builtin_tools._generation_client import per_event_loop
+from veadk.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ---- limits / defaults (mirror OpenClaw's tools.web.fetch.* config) ----------
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+_ACCEPT_LANGUAGE = "en-US,en;q=0.9"
+_TIMEOUT_SECONDS = 30
+MAX_REDIRECTS = 3
+_MAX_RESPONSE_BYTES = 2_000_000  # cap the download before truncation (HTML)
+_MAX_PDF_BYTES = 10_000_000  # higher cap for PDFs (truncation corrupts parsing)
+
+_HEADERS = {
+    "User-Agent": _USER_AGENT,
+    "Accept-Language": _ACCEPT_LANGUAGE,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+
+class WebFetchError(Exception):
+    """Surfaced to the model as {"error": ...}."""
+
+
+# ---------------------------------------------------------------- SSRF guard --
+def _assert_public_addresses(host: str, infos: list) -> None:
+    """Reject private/internal/loopback/link-local resolutions of `host`.
+
+    Note: this validates the resolved addresses but does not pin the connection
+    to them, so a determined attacker controlling DNS could still race the
+    re-resolution (TOCTOU). It blocks the common SSRF cases; pinning the socket
+    to the validated IP would be the hardening follow-up.
+    """
+    for info in infos:
+        addr = info[4][0]
+        try:
+            ip = ipaddress.ip_address(addr)
+        except ValueError:
+            continue
+        if (
+            ip.is_private
+            or ip.is_loopback
+            or ip.is_link_local
+            or ip.is_reserved
+            or ip.is_multicast
+            or ip.is_unspecified
+        ):
+            raise WebFetchError(f"Blocked non-public address for host {host!r}: {ip}")
+
+
+async def check_url(url: str) -> str:
+    """Validate scheme and host of `url` and return the host."""
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https"):
+        raise WebFetchError("only http(s) URLs are supported")
+    host = parsed.hostname
+    if not host:
+        raise WebFetchError("URL has no host")
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(host, None)
+    except OSError as e:
+        raise WebFetchError(f"DNS resolution failed for {host!r}: {e}")
+    _assert_public_addresses(host, infos)
+    return host
+
+
+# ------------------------------------------------------------------ documents --
+@dataclass
+class FetchedDocument:
+    """A fetched page: the final URL after HTTP redirects and its raw body."""
+
+    url: str
+    content_type: str
+    body: bytes
+    redirects: int = 0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    # Extraction results of this body, by extraction settings.
+    extracted: dict = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def validators(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class _DocumentCache:
+    """LRU of fetched documents bounded by count and bytes, plus a disk tier.
+
+    The disk tier is keyed by the SHA-256 of the requested URL. Stale disk
+    entries are kept because they carry the validators for a conditional
+    request; once the tier exceeds `disk_max_bytes` the least recently used
+    entries are evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        disk_dir: Optional[Path],
+        disk_max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._entries: OrderedDict[str, FetchedDocument] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        # Bytes on disk, counted by a scan on the first write.
+        self._disk_size: Optional[int] = None
+        self._disk_lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[FetchedDocument]:
+        with self._lock:
+            document = self._entries.get(url)
+            if document is not None:
+                self._entries.move_to_end(url)
+                return document
+        if self.disk_dir is None:
+            return None
+        document = self._read_disk(url)
+        if document is not None:
+            self._remember(url, document)
+        return document
+
+    def put(self, url: str, document: FetchedDocument) -> None:
+        self._remember(url, document)
+        if self.disk_dir is not None:
+            self._write_disk(url, document)
+
+    def clear(self) -> None:
+        """Drop the memory tier; the disk tier is left untouched."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remember(self, url: str, document: FetchedDocument) -> None:
+        size = len(document.body)
+        with self._lock:
+            previous = self._entries.pop(url, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+            if size > self.max_bytes:
+                return
+            self._entries[url] = document
+            self._size += size
+            while self._size > self.max_bytes or len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+
+    def _disk_path(self, url: str) -> Path:
+        assert self.disk_dir is not None
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.disk_dir / key[:2] / key
+
+    def _read_disk(self, url: str) -> Optional[FetchedDocument]:
+        path = self._disk_path(url)
+        try:
+            meta = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+            body = path.with_suffix(".body").read_bytes()
+            document = FetchedDocument(body=body, **meta)
+            # Eviction goes by the metadata's mtime.
+            os.utime(path.with_suffix(".json"))
+            return document
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write_disk(self, url: str, document: FetchedDocument) -> None:
+        path = self._disk_path(url)
+        meta = {
+            "url": document.url,
+            "content_type": document.content_type,
+            "redirects": document.redirects,
+            "etag": document.etag,
+            "last_modified": document.last_modified,
+            "fetched_at": document.fetched_at,
+        }
+        encoded = json.dumps(meta).encode("utf-8")
+        with self._disk_lock:
+            if self._disk_size is None:
+                self._disk_size = sum(size for _, size, _ in self._disk_entries())
+            replaced = self._entry_size(path)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                _write_atomic(path.with_suffix(".body"), document.body)
+                # The metadata goes last, so readers never see a partial entry.
+                _write_atomic(path.with_suffix(".json"), encoded)
+            except OSError as e:
+                logger.warning(f"Failed to write web_fetch cache entry {path}: {e}")
+            self._disk_size += self._entry_size(path) - replaced
+            if self._disk_size > self.disk_max_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        self._disk_size = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self._disk_size <= self.disk_max_bytes:
+                return
+            path.with_suffix(".json").unlink(missing_ok=True)
+            path.with_suffix(".body").unlink(missing_ok=True)
+            self._disk_size -= size
+
+    def _disk_entries(self) -> list[tuple[Path, int, float]]:
+        """Path, size and last use of every entry of the disk tier."""
+        assert self.disk_dir is not None
+        entries = []
+        for meta_path in self.disk_dir.glob("*/*.json"):
+            try:
+                last_used = meta_path.stat().st_mtime
+            except OSError:
+                continue
+            path = meta_path.with_suffix("")
+            entries.append((path, self._entry_size(path), last_used))
+        return entries
+
+    @staticmethod
+    def _entry_size(path: Path) -> int:
+        size = 0
+        for suffix in (".json", ".body"):
+            try:
+                size += path.with_suffix(suffix).stat().st_size
+            except OSError:
+                pass
+        return size
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+# --------------------------------------------------------------------- engine --
+@dataclass
+class _LoopState:
+    client: httpx.AsyncClient
+    host_limits: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+    inflight: dict[tuple[str, int], asyncio.Task] = field(default_factory=dict)
+
+
+class WebFetchEngine:
+    """Fetch pages with pooled connections, single-flight and a revalidating cache.
+
+    Args:
+        config: Pool, concurrency and cache settings. Read from
+            `TOOL_WEB_FETCH_*` env vars when omitted.
+    """
+
+    def __init__(self, config: Optional[WebFetchConfig] = None) -> None:
+        self.config = config or WebFetchConfig()
+        self.cache = _DocumentCache(
+            max_entries=self.config.cache_max_entries,
+            max_bytes=self.config.cache_max_bytes,
+            disk_dir=Path(self.config.cache_dir) if self.config.cache_dir else None,
+            disk_max_bytes=self.config.cache_disk_max_bytes,
+        )
+        self.http2 = self.config.http2 and importlib.util.find_spec("h2") is not None
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopState
+        ] = weakref.WeakKeyDictionary()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.extract_workers),
+            thread_name_prefix="veadk-web-fetch",
+        )
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.deduplicated = 0
+
+    async def fetch(
+        self, url: str, *, max_redirects: int = MAX_REDIRECTS
+    ) -> FetchedDocument:
+        """Return the document at `url`, from the cache when still valid."""
+        cached = await self._cached(url)
+        if (
+            cached is not None
+            and cached.redirects <= max_redirects
+            and self._is_fresh(cached)
+        ):
+            self.hits += 1
+            return cached
+
+        state = per_event_loop(self._loops, self._new_loop_state)
+        key = (url, max_redirects)
+        task = state.inflight.get(key)
+        if task is not None:
+            self.deduplicated += 1
+        else:
+            # The download runs in its own task, so a cancelled caller does
+            # not cancel the other agents waiting for the same URL.
+            task = asyncio.ensure_future(self._load(state, url, max_redirects, cached))
+            state.inflight[key] = task
+            task.add_done_callback(lambda done: _loaded(state, key, done))
+        return await asyncio.shield(task)
+
+    async def extract(
+        self,
+        document: FetchedDocument,
+        key: Any,
+        extractor: Callable[..., dict],
+        *args: Any,
+    ) -> dict:
+        """Run `extractor(*args)` on the worker pool, once per document and key."""
+        result = document.extracted.get(key)
+        if result is None:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, extractor, *args)
+            document.extracted[key] = result
+        return dict(result)
+
+    async def aclose(self) -> None:
+        """Close the pooled connections of the current event loop, if any."""
+        state = self._loops.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state.client.aclose()
+
+    def _new_loop_state(self) -> _LoopState:
+        return _LoopState(
+            client=httpx.AsyncClient(
+                http2=self.http2,
+                headers=_HEADERS,
+                timeout=_TIMEOUT_SECONDS,
+                follow_redirects=False,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                ),
+            )
+        )
+
+    def _is_fresh(self, document: FetchedDocument) -> bool:
+        return time.time() - document.fetched_at < self.config.cache_ttl_seconds
+
+    async def _cached(self, url: str) -> Optional[FetchedDocument]:
+        if self.cache.disk_dir is None:
+            return self.cache.get(url)
+        return await asyncio.to_thread(self.cache.get, url)
+
+    async def _store(self, url: str, document: FetchedDocument) -> None:
+        if self.cache.disk_dir is None:
+            self.cache.put(url, document)
+        else:
+            await asyncio.to_thread(self.cache.put, url, document)
+
+    async def _load(
+        self,
+        state: _LoopState,
+        url: str,
+        max_redirects: int,
+        stale: Optional[FetchedDocument],
+    ) -> FetchedDocument:
+        if stale is not None and stale.validators:
+            response, body = await self._request(state, stale.url, stale.validators)
+            if response.status_code == 304:
+                self.revalidated += 1
+                stale.fetched_at = time.time()
+                await self._store(url, stale)
+                return stale
+            if response.is_success:
+                self.misses += 1
+                document = self._document(stale.url, response, body, stale.redirects)
+                await self._cache_if_allowed(url, response, document)
+                return document
+
+        self.misses += 1
+        current = url
+        hops = 0
+        while True:
+            response, body = await self._request(state, current)
+            if response.is_redirect and response.headers.get("location"):
+                hops += 1
+                if hops > max_redirects:
+                    raise WebFetchError(f"too many redirects (>{MAX_REDIRECTS})")
+                current = urljoin(current, response.headers["location"])
+                continue
+            if not response.is_success:
+                raise WebFetchError(f"HTTP {response.status_code}")
+            document = self._document(current, response, body, hops)
+            await self._cache_if_allowed(url, response, document)
+            return document
+
+    async def _request(
+        self,
+        state: _LoopState,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+    ) -> tuple[httpx.Response, bytes]:
+        host = await check_url(url)
+        limit = state.host_limits.get(host)
+        if limit is None:
+            limit = asyncio.Semaphore(max(1, self.config.per_host_concurrency))
+            state.host_limits[host] = limit
+        async with limit:
+            async with state.client.stream("GET", url, headers=headers) as response:
+                if not response.is_success:
+                    return response, b""
+                content_type = response.headers.get("content-type", "")
+                cap = (
+                    _MAX_PDF_BYTES
+                    if "pdf" in content_type.lower()
+                    else _MAX_RESPONSE_BYTES
+                )
+                return response, await _read_capped(response, cap)
+
+    @staticmethod
+    def _document(
+        url: str, response: httpx.Response, body: bytes, redirects: int
+    ) -> FetchedDocument:
+        return FetchedDocument(
+            url=url,
+            content_type=response.headers.get("content-type", ""),
+            body=body,
+            redirects=redirects,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            fetched_at=time.time(),
+        )
+
+    async def _cache_if_allowed(
+        self, url: str, response: httpx.Response, document: FetchedDocument
+    ) -> None:
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return
+        await self._store(url, document)
+
+
+def _loaded(state: _LoopState, key: tuple[str, int], task: asyncio.Task) -> None:
+    state.inflight.pop(key, None)
+    if not task.cancelled():
+        # Every waiter may have been cancelled; mark the error as seen.
+        task.exception()
+
+
+async def _read_capped(response: httpx.Response, cap: int) -> bytes:
+    chunks: list[bytes] = []
+    total = 0
+    async for chunk in response.aiter_bytes(chunk_size=16_384):
+        if not chunk:
+            continue
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= cap:
+            break
+    return b"".join(chunks)
+
+
+_engine: Optional[WebFetchEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_web_fetch_engine() -> WebFetchEngine:
+    """Return the process-wide engine, creating it on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = WebFetchEngine()
+        return _engine
@@ -29,6 +29,7 @@ from veadk.consts import (
     DEFAULT_IMAGE_GENERATE_MODEL_API_BASE,
     DEFAULT_IMAGE_GENERATE_MODEL_NAME,
 )
+from veadk.tools.builtin_tools._generation_client import get_generation_http_client
 from veadk.utils.logger import get_logger
 from veadk.utils.misc import formatted_timestamp, read_file_to_bytes
 from veadk.version import VERSION
@@ -114,16 +115,16 @@ async def _call_image_api(
     url = f"{API_BASE}/images/generations"
     body = _build_request_body(item, model_name)
 
-    async with httpx.AsyncClient(timeout=float(timeout)) as client:
-        response = await client.post(url, headers=_get_headers(), json=body)
-        if response.status_code >= 400:
-            error_body = response.text
-            logger.error(f"API Error {response.status_code}: {error_body}")
-            logger.error(
-                f"Request body: {json.dumps(body, ensure_ascii=False, indent=2)}"
-            )
-        response.raise_for_status()
-        return response.json()
+    client = get_generation_http_client()
+    response = await client.post(
+        url, headers=_get_headers(), json=body, timeout=float(timeout)
+    )
+    if response.status_code >= 400:
+        error_body = response.text
+        logger.error(f"API Error {response.status_code}: {error_body}")
+        logger.error(f"Request body: {json.dumps(body, ensure_ascii=False, indent=2)}")
+    response.raise_for_status()
+    return response.json()
 
 
 def add_span_attributes(
@@ -15,6 +15,7 @@
 import asyncio
 import json
 import traceback
+import weakref
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
@@ -25,6 +26,11 @@ from opentelemetry.trace import Span
 
 from veadk.config import getenv, settings
 from veadk.consts import DEFAULT_VIDEO_MODEL_API_BASE, DEFAULT_VIDEO_MODEL_NAME
+from veadk.tools.builtin_tools._generation_client import (
+    TaskPoller,
+    per_event_loop,
+    get_generation_http_client,
+)
 from veadk.utils.logger import get_logger
 from veadk.version import VERSION
 
@@ -206,27 +212,54 @@ async def _create_video_task(
     url = f"{API_BASE}/contents/generations/tasks"
     body = _build_request_body(prompt, config, model_name)
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(url, headers=_get_headers(), json=body)
-        if response.status_code >= 400:
-            error_body = response.text
-            logger.error(f"API Error {response.status_code}: {error_body}")
-            logger.error(
-                f"Request body: {json.dumps(body, ensure_ascii=False, indent=2)}"
-            )
-        response.raise_for_status()
-        data = response.json()
-        logger.debug(f"Video task created: {data}")
-        return data
+    client = get_generation_http_client()
+    response = await client.post(url, headers=_get_headers(), json=body)
+    if response.status_code >= 400:
+        error_body = response.text
+        logger.error(f"API Error {response.status_code}: {error_body}")
+        logger.error(f"Request body: {json.dumps(body, ensure_ascii=False, indent=2)}")
+    response.raise_for_status()
+    data = response.json()
+    logger.debug(f"Video task created: {data}")
+    return data
 
 
 async def _get_task_status(task_id: str) -> dict:
     url = f"{API_BASE}/contents/generations/tasks/{task_id}"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.get(url, headers=_get_headers())
-        response.raise_for_status()
-        return response.json()
+    client = get_generation_http_client()
+    response = await client.get(url, headers=_get_headers())
+    response.raise_for_status()
+    return response.json()
+
+
+async def _list_task_statuses(task_ids: list[str]) -> dict[str, dict]:
+    """Query several tasks with one request to the task list API."""
+    url = f"{API_BASE}/contents/generations/tasks"
+    params = {
+        "page_num": 1,
+        "page_size": len(task_ids),
+        "filter.task_ids": task_ids,
+    }
+
+    client = get_generation_http_client()
+    response = await client.get(url, headers=_get_headers(), params=params)
+    response.raise_for_status()
+    return {item["id"]: item for item in response.json().get("items") or []}
+
+
+_pollers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_task_poller() -> TaskPoller:
+    """Return the video task poller shared by all sessions on this event loop."""
+    return per_event_loop(
+        _pollers,
+        lambda: TaskPoller(
+            lambda task_id: _get_task_status(task_id),
+            lambda task_ids: _list_task_statuses(task_ids),
+        ),
+    )
 
 
 async def video_task_query(
@@ -325,48 +358,42 @@ async def _poll_task_status(
     max_wait_seconds: int = 1200,
     poll_interval: int = 10,
 ) -> VideoTaskResult:
-    max_polls = max_wait_seconds // poll_interval
-    polls = 0
-
-    while polls < max_polls:
+    try:
+        result = await asyncio.wait_for(
+            _get_task_poller().wait(task_id, max_interval=poll_interval),
+            max_wait_seconds,
+        )
+    except asyncio.TimeoutError:
         result = await _get_task_status(task_id)
-        status = result.get("status")
-
-        if status == "succeeded":
-            video_url = result.get("content", {}).get("video_url")
-            logger.debug(f"Video {video_name} succeeded: {video_url}")
-            return VideoTaskResult(
-                video_name=video_name,
-                task_id=task_id,
-                video_url=video_url,
-                status="succeeded",
-                execution_expires_after=result.get("execution_expires_after"),
-            )
-
-        if status == "failed":
-            error = result.get("error", {})
-            logger.error(f"Video {video_name} failed: {error}")
-            return VideoTaskResult(
-                video_name=video_name,
-                task_id=task_id,
-                error=str(error),
-                status="failed",
-                execution_expires_after=result.get("execution_expires_after"),
-            )
+        logger.warning(
+            f"Video {video_name} polling timed out after {max_wait_seconds}s, task still pending"
+        )
+        return VideoTaskResult(
+            video_name=video_name,
+            task_id=task_id,
+            error="polling_timeout",
+            status="pending",
+            execution_expires_after=result.get("execution_expires_after"),
+        )
 
-        logger.debug(f"Video {video_name} status: {status}, retrying...")
-        await asyncio.sleep(poll_interval)
-        polls += 1
+    if result.get("status") == "succeeded":
+        video_url = result.get("content", {}).get("video_url")
+        logger.debug(f"Video {video_name} succeeded: {video_url}")
+        return VideoTaskResult(
+            video_name=video_name,
+            task_id=task_id,
+            video_url=video_url,
+            status="succeeded",
+            execution_expires_after=result.get("execution_expires_after"),
+        )
 
-    result = await _get_task_status(task_id)
-    logger.warning(
-        f"Video {video_name} polling timed out after {max_wait_seconds}s, task still pending"
-    )
+    error = result.get("error") or {"status": result.get("status")}
+    logger.error(f"Video {video_name} failed: {error}")
     return VideoTaskResult(
         video_name=video_name,
         task_id=task_id,
-        error="polling_timeout",
-        status="pending",
+        error=str(error),
+        status="failed",
         execution_expires_after=result.get("execution_expires_after"),
     )
 
@@ -735,58 +762,53 @@ async def video_generate(
             input_part[f"parts.{idx}.text"] = json.dumps(item, ensure_ascii=False)
 
         with tracer.start_as_current_span("video_generate_batch") as span:
-            poll_count = 0
-            max_polls = max_wait_seconds // 10
-
-            while pending_tasks and poll_count < max_polls:
-                completed_in_round = []
-
-                for task_id in list(pending_tasks.keys()):
-                    task_info = pending_tasks[task_id]
-                    video_name = task_info["video_name"]
-
-                    try:
-                        result = await _get_task_status(task_id)
-                        status = result.get("status")
-
-                        if status == "succeeded":
-                            video_url = result.get("content", {}).get("video_url")
-                            tool_context.state[f"{video_name}_video_url"] = video_url
-                            usage = result.get("usage", {})
-                            total_tokens += usage.get("completion_tokens", 0)
-
-                            idx = list(pending_tasks.keys()).index(task_id)
-                            output_part[f"message.parts.{idx}.type"] = "text"
-                            output_part[f"message.parts.{idx}.text"] = (
-                                f"{video_name}: {video_url}"
-                            )
-
-                            success_list.append({video_name: video_url})
-                            completed_in_round.append(task_id)
-                            logger.debug(f"Video {video_name} completed: {video_url}")
-
-                        elif status == "failed":
-                            error_info = result.get("error")
-                            error_list.append(video_name)
-                            error_details.append(
-                                {
-                                    "video_name": video_name,
-                                    "error": error_info,
-                                }
-                            )
-                            completed_in_round.append(task_id)
-                            logger.error(f"Video {video_name} failed: {error_info}")
-                    except Exception as e:
-                        logger.error(f"Error polling task {task_id}: {e}")
-
-                for task_id in completed_in_round:
-                    pending_tasks.pop(task_id, None)
-
-                if not pending_tasks:
-                    break
-
-                await asyncio.sleep(10)
-                poll_count += 1
+            # All sessions share one poller, which batches the status checks
+            # of every outstanding task and backs off while they run.
+            poller = _get_task_poller()
+            waits = {
+                task_id: asyncio.ensure_future(poller.wait(task_id))
+                for task_id in pending_tasks
+            }
+            if waits:
+                await asyncio.wait(waits.values(), timeout=max_wait_seconds)
+
+            for idx, (task_id, waiter) in enumerate(waits.items()):
+                if not waiter.done():
+                    waiter.cancel()
+                    continue
+                video_name = pending_tasks[task_id]["video_name"]
+                try:
+                    result = waiter.result()
+                except Exception as e:
+                    logger.error(f"Error polling task {task_id}: {e}")
+                    continue
+
+                if result.get("status") == "succeeded":
+                    video_url = result.get("content", {}).get("video_url")
+                    tool_context.state[f"{video_name}_video_url"] = video_url
+                    usage = result.get("usage", {})
+                    total_tokens += usage.get("completion_tokens", 0)
+
+                    output_part[f"message.parts.{idx}.type"] = "text"
+                    output_part[f"message.parts.{idx}.text"] = (
+                        f"{video_name}: {video_url}"
+                    )
+
+                    success_list.append({video_name: video_url})
+                    logger.debug(f"Video {video_name} completed: {video_url}")
+                else:
+                    error_info = result.get("error") or {"status": result.get("status")}
+                    error_list.append(video_name)
+                    error_details.append(
+                        {
+                            "video_name": video_name,
+                            "error": error_info,
+                        }
+                    )
+                    logger.error(f"Video {video_name} failed: {error_info}")
+                pending_tasks.pop(task_id)
+            if waits:
+                await asyncio.gather(*waits.values(), return_exceptions=True)
 
             for task_id, task_info in pending_tasks.items():
                 pending_list.append(
@@ -19,87 +19,29 @@ NOT execute JavaScript — for JS-heavy / login-protected pages a headless brows
 is needed instead. The design mirrors OpenClaw's `web_fetch`: Chrome-like
 headers, SSRF protection (block private/internal addresses, re-validate every
 redirect), a download-size cap, a coarse HTML→markdown extractor, and a short
-in-memory cache.
+cache. Downloading, caching and revalidation live in `_web_fetch_engine`.
 """
 
 import html as _html
-import ipaddress
 import re
-import socket
-import time
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
-import requests
+import httpx
 
 from google.adk.tools import ToolContext
 
+from veadk.tools.builtin_tools._web_fetch_engine import (
+    MAX_REDIRECTS as _MAX_REDIRECTS,
+    FetchedDocument,
+    WebFetchError as _WebFetchError,
+    get_web_fetch_engine,
+)
 from veadk.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# ---- limits / defaults (mirror OpenClaw's tools.web.fetch.* config) ----------
-_USER_AGENT = (
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-)
-_ACCEPT_LANGUAGE = "en-US,en;q=0.9"
-_TIMEOUT_SECONDS = 30
-_MAX_REDIRECTS = 3
-_MAX_RESPONSE_BYTES = 2_000_000  # cap the download before truncation (HTML)
-_MAX_PDF_BYTES = 10_000_000  # higher cap for PDFs (truncation corrupts parsing)
 _MAX_CHARS_CAP = 200_000  # hard ceiling for the max_chars parameter
 _DEFAULT_MAX_CHARS = 50_000
-_CACHE_TTL_SECONDS = 15 * 60
-_CACHE_MAX_ENTRIES = 128
-
-# Tiny in-process TTL cache: {(url, mode, max_chars): (expires_at, result)}.
-_CACHE: dict[tuple[str, str, int], tuple[float, dict]] = {}
-
-
-class _WebFetchError(Exception):
-    """Internal: surfaced to the model as {"error": ...}."""
-
-
-# ---------------------------------------------------------------- SSRF guard --
-def _assert_public_host(host: str) -> None:
-    """Resolve `host` and reject private/internal/loopback/link-local targets.
-
-    Note: this validates the resolved addresses but does not pin the connection
-    to them, so a determined attacker controlling DNS could still race the
-    re-resolution (TOCTOU). It blocks the common SSRF cases; pinning the socket
-    to the validated IP would be the hardening follow-up.
-    """
-    if not host:
-        raise _WebFetchError("missing host")
-    try:
-        infos = socket.getaddrinfo(host, None)
-    except socket.gaierror as e:
-        raise _WebFetchError(f"DNS resolution failed for {host!r}: {e}")
-    for info in infos:
-        addr = info[4][0]
-        try:
-            ip = ipaddress.ip_address(addr)
-        except ValueError:
-            continue
-        if (
-            ip.is_private
-            or ip.is_loopback
-            or ip.is_link_local
-            or ip.is_reserved
-            or ip.is_multicast
-            or ip.is_unspecified
-        ):
-            raise _WebFetchError(f"Blocked non-public address for host {host!r}: {ip}")
-
-
-def _check_url(url: str) -> str:
-    parsed = urlparse(url)
-    if parsed.scheme not in ("http", "https"):
-        raise _WebFetchError("only http(s) URLs are supported")
-    if not parsed.hostname:
-        raise _WebFetchError("URL has no host")
-    _assert_public_host(parsed.hostname)
-    return parsed.hostname
 
 
 # ---------------------------------------------- coarse HTML -> markdown/text --
@@ -219,7 +161,7 @@ def _markdown_to_text(markdown: str) -> str:
 
 
 # ----------------------------------------------------------------- the tool --
-def web_fetch(
+async def web_fetch(
     url: str,
     extract_mode: str = "markdown",
     max_chars: int = _DEFAULT_MAX_CHARS,
@@ -251,39 +193,15 @@ def web_fetch(
         max_chars = _DEFAULT_MAX_CHARS
     max_chars = max(1, min(max_chars, _MAX_CHARS_CAP))
 
-    cache_key = (url, mode, max_chars)
-    cached = _CACHE.get(cache_key)
-    if cached and cached[0] > time.monotonic():
-        return cached[1]
-
     try:
-        result = _fetch_and_extract(url, mode, max_chars)
+        return await _fetch_and_extract(url, mode, max_chars)
     except _WebFetchError as e:
         logger.warning(f"web_fetch failed for {url!r}: {e}")
         return {"error": str(e)}
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.warning(f"web_fetch request error for {url!r}: {e}")
         return {"error": f"request failed: {e}"}
 
-    # Cache + bound the cache size.
-    if len(_CACHE) >= _CACHE_MAX_ENTRIES:
-        _CACHE.clear()
-    _CACHE[cache_key] = (time.monotonic() + _CACHE_TTL_SECONDS, result)
-    return result
-
-
-def _read_capped(response: requests.Response, cap: int) -> bytes:
-    chunks: list[bytes] = []
-    total = 0
-    for chunk in response.iter_content(chunk_size=16_384):
-        if not chunk:
-            continue
-        chunks.append(chunk)
-        total += len(chunk)
-        if total >= cap:
-            break
-    return b"".join(chunks)
-
 
 def _result(url: str, title: str | None, content: str, max_chars: int) -> dict:
     return {
@@ -294,76 +212,43 @@ def _result(url: str, title: str | None, content: str, max_chars: int) -> dict:
     }
 
 
-def _fetch_and_extract(url: str, mode: str, max_chars: int) -> dict:
-    session = requests.Session()
-    headers = {
-        "User-Agent": _USER_AGENT,
-        "Accept-Language": _ACCEPT_LANGUAGE,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
+def _decode(raw: bytes, content_type: str) -> str:
+    # Honor charset from the header, else fall back to utf-8.
+    charset = "utf-8"
+    m = re.search(r"charset=([\w-]+)", content_type, flags=re.IGNORECASE)
+    if m:
+        charset = m.group(1)
+    try:
+        return raw.decode(charset, errors="replace")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
 
-    current = url
-    hops = 0
-    # Follow HTTP 3xx AND <meta refresh> redirects, both bounded by the same hop
-    # budget, SSRF-checking every hop.
-    while True:
-        _check_url(current)
-        response = session.get(
-            current,
-            headers=headers,
-            timeout=_TIMEOUT_SECONDS,
-            allow_redirects=False,
-            stream=True,
-        )
 
-        if response.is_redirect and response.headers.get("location"):
-            response.close()
-            hops += 1
-            if hops > _MAX_REDIRECTS:
-                raise _WebFetchError(f"too many redirects (>{_MAX_REDIRECTS})")
-            current = urljoin(current, response.headers["location"])
-            continue
+def _is_pdf(document: FetchedDocument) -> bool:
+    return "pdf" in document.content_type.lower() or document.body[:5] == b"%PDF-"
 
-        if not response.ok:
-            status = response.status_code
-            response.close()
-            raise _WebFetchError(f"HTTP {status}")
-
-        content_type = response.headers.get("content-type", "")
-        is_pdf = "pdf" in content_type.lower()
-        raw = _read_capped(response, _MAX_PDF_BYTES if is_pdf else _MAX_RESPONSE_BYTES)
-        response.close()
-
-        # PDF (by content-type or magic bytes) -> extract text via pypdf.
-        if is_pdf or raw[:5] == b"%PDF-":
-            extracted = _extract_pdf_text(raw)
-            if extracted is None:
-                return {
-                    "url": current,
-                    "title": None,
-                    "content": "[PDF detected — text extraction requires `pypdf`]",
-                    "truncated": False,
-                }
-            text, title = extracted
-            return _result(
-                current, title, text or "[PDF had no extractable text]", max_chars
-            )
 
-        # Decode: honor charset from the header, else fall back to utf-8.
-        charset = "utf-8"
-        m = re.search(r"charset=([\w-]+)", content_type, flags=re.IGNORECASE)
-        if m:
-            charset = m.group(1)
-        try:
-            body = raw.decode(charset, errors="replace")
-        except LookupError:
-            body = raw.decode("utf-8", errors="replace")
+def _is_html(document: FetchedDocument) -> bool:
+    content_type = document.content_type.lower()
+    return "html" in content_type or "xml" in content_type
 
-        is_html = "html" in content_type.lower() or "xml" in content_type.lower()
+
+async def _fetch_and_extract(url: str, mode: str, max_chars: int) -> dict:
+    engine = get_web_fetch_engine()
+    current = url
+    hops = 0
+    # Follow HTTP 3xx AND <meta refresh> redirects, both bounded by the same hop
+    # budget; the engine SSRF-checks every hop.
+    while True:
+        document = await engine.fetch(current, max_redirects=_MAX_REDIRECTS - hops)
+        hops += document.redirects
+        current = document.url
 
         # Honor <meta refresh> redirects on shell pages (e.g. sina.com).
-        if is_html and hops < _MAX_REDIRECTS:
-            meta = _meta_refresh_url(body)
+        if not _is_pdf(document) and _is_html(document) and hops < _MAX_REDIRECTS:
+            meta = _meta_refresh_url(
+                _decode(document.body[:4096], document.content_type)
+            )
             if meta:
                 nxt = urljoin(current, meta)
                 if nxt != current:
@@ -371,12 +256,36 @@ def _fetch_and_extract(url: str, mode: str, max_chars: int) -> dict:
                     current = nxt
                     continue
 
-        if not is_html:
-            # Other text-ish content: return as-is (truncated).
-            return _result(current, None, _normalize_whitespace(body), max_chars)
+        return await engine.extract(
+            document, (mode, max_chars), _extract, document, mode, max_chars
+        )
+
+
+def _extract(document: FetchedDocument, mode: str, max_chars: int) -> dict:
+    """Turn a fetched document into the tool result; runs on a worker thread."""
+    current = document.url
+    # PDF (by content-type or magic bytes) -> extract text via pypdf.
+    if _is_pdf(document):
+        extracted = _extract_pdf_text(document.body)
+        if extracted is None:
+            return {
+                "url": current,
+                "title": None,
+                "content": "[PDF detected — text extraction requires `pypdf`]",
+                "truncated": False,
+            }
+        text, title = extracted
+        return _result(
+            current, title, text or "[PDF had no extractable text]", max_chars
+        )
+
+    body = _decode(document.body, document.content_type)
+    if not _is_html(document):
+        # Other text-ish content: return as-is (truncated).
+        return _result(current, None, _normalize_whitespace(body), max_chars)
 
-        markdown, title = _html_to_markdown(body)
-        content = markdown if mode == "markdown" else _markdown_to_text(markdown)
-        if not content:
-            content = _normalize_whitespace(_strip_tags(body))
-        return _result(current, title, content, max_chars)
+    markdown, title = _html_to_markdown(body)
+    content = markdown if mode == "markdown" else _markdown_to_text(markdown)
+    if not content:
+        content = _normalize_whitespace(_strip_tags(body))
+    return _result(current, title, content, max_chars)
@@ -12,8 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Sequence
 
+from opentelemetry import metrics as metrics_api
 from opentelemetry.context import (
     _SUPPRESS_INSTRUMENTATION_KEY,
     attach,
@@ -23,12 +28,33 @@ from opentelemetry.context import (
 from opentelemetry.sdk.trace import ReadableSpan, export
 from typing_extensions import override
 
+from veadk.configs.tracing_configs import InMemoryTraceStoreConfig
 from veadk.tracing.telemetry.exporters.base_exporter import BaseExporter
 from veadk.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+_meter = metrics_api.get_meter("veadk.tracing")
+_evicted_traces_counter = _meter.create_counter(
+    name="veadk.inmemory_exporter.evicted_traces",
+    unit="count",
+    description="Traces evicted from the in-memory span store",
+)
+_dropped_spans_counter = _meter.create_counter(
+    name="veadk.inmemory_exporter.dropped_spans",
+    unit="count",
+    description="Spans dropped because their trace reached the span cap",
+)
+
+
+@dataclass
+class _TraceEntry:
+    spans: list[ReadableSpan] = field(default_factory=list)
+    session_ids: set[str] = field(default_factory=set)
+    updated_at: float = 0.0
+
+
 # ======== Adapted from Google ADK ========
 class _InMemoryExporter(export.SpanExporter):
     """Internal span exporter that stores spans in memory for local analysis and debugging.
@@ -39,23 +65,58 @@ class _InMemoryExporter(export.SpanExporter):
     data is needed.
 
     Key Features:
-    - In-memory span storage with session-based organization
-    - Trace ID tracking for span correlation
-    - Session-to-trace mapping for efficient filtering
-    - Support for span retrieval by session ID
+    - Span storage indexed by trace ID and session ID
+    - Bounded memory: least recently updated traces are evicted beyond
+      `max_traces`, idle traces after `ttl` seconds
+    - Support for span retrieval by session ID without scanning all spans
 
     Attributes:
-        _spans: List of all collected ReadableSpan objects
         trace_id: Current trace identifier from the most recent span
-        session_trace_dict: Mapping of session IDs to their associated trace IDs
+        evicted_traces: Number of traces evicted so far
+        dropped_spans: Number of spans dropped by the per-trace cap
     """
 
-    def __init__(self) -> None:
-        """Initialize the in-memory exporter with empty storage containers."""
+    def __init__(
+        self,
+        max_traces: int | None = None,
+        max_spans_per_trace: int | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Initialize the in-memory exporter with empty storage containers.
+
+        Args:
+            max_traces: Number of traces to keep.
+            max_spans_per_trace: Number of spans to keep per trace.
+            ttl: Seconds to keep a trace after its last span, 0 disables.
+
+        Defaults come from `InMemoryTraceStoreConfig`.
+        """
         super().__init__()
-        self._spans = []
+        config = InMemoryTraceStoreConfig()
+        self.max_traces = max_traces if max_traces is not None else config.max_traces
+        self.max_spans_per_trace = (
+            max_spans_per_trace
+            if max_spans_per_trace is not None
+            else config.max_spans_per_trace
+        )
+        self.ttl = ttl if ttl is not None else config.ttl
         self.trace_id = ""
-        self.session_trace_dict = {}
+        self.evicted_traces = 0
+        self.dropped_spans = 0
+        self._lock = threading.Lock()
+        # trace id -> spans, least recently updated first
+        self._traces: OrderedDict[int, _TraceEntry] = OrderedDict()
+        # session id -> trace ids in the order they were first seen
+        self._session_traces: dict[str, dict[int, None]] = {}
+
+    @property
+    def session_trace_dict(self) -> dict[str, list[int]]:
+        """Mapping of session IDs to their associated trace IDs."""
+        with self._lock:
+            return {
+                session_id: list(trace_ids)
+                for session_id, trace_ids in self._session_traces.items()
+            }
 
     @override
     def export(self, spans: Sequence[ReadableSpan]) -> export.SpanExportResult:
@@ -71,23 +132,36 @@ class _InMemoryExporter(export.SpanExporter):
         Returns:
             SpanExportResult.SUCCESS: Always returns success for in-memory storage
         """
-        for span in spans:
-            if span.context:
-                self.trace_id = span.context.trace_id
-            else:
-                logger.warning(
-                    f"Span context is missing, failed to get `trace_id`. span: {span}"
-                )
-
-            if span.name == "call_llm":
-                attributes = dict(span.attributes or {})
-                session_id = attributes.get("gen_ai.session.id", None)
-                if session_id:
-                    if session_id not in self.session_trace_dict:
-                        self.session_trace_dict[session_id] = [self.trace_id]
-                    else:
-                        self.session_trace_dict[session_id] += [self.trace_id]
-        self._spans.extend(spans)
+        now = time.monotonic()
+        with self._lock:
+            for span in spans:
+                if not span.context:
+                    logger.warning(
+                        f"Span context is missing, failed to get `trace_id`. span: {span}"
+                    )
+                    continue
+                trace_id = span.context.trace_id
+                self.trace_id = trace_id
+
+                entry = self._traces.get(trace_id)
+                if entry is None:
+                    entry = _TraceEntry()
+                    self._traces[trace_id] = entry
+                else:
+                    self._traces.move_to_end(trace_id)
+                entry.updated_at = now
+                if len(entry.spans) < self.max_spans_per_trace:
+                    entry.spans.append(span)
+                else:
+                    self.dropped_spans += 1
+                    _dropped_spans_counter.add(1)
+
+                if span.name == "call_llm":
+                    session_id = (span.attributes or {}).get("gen_ai.session.id")
+                    if session_id and session_id not in entry.session_ids:
+                        entry.session_ids.add(session_id)
+                        self._session_traces.setdefault(session_id, {})[trace_id] = None
+            self._evict(now)
         return export.SpanExportResult.SUCCESS
 
     @override
@@ -105,8 +179,8 @@ class _InMemoryExporter(export.SpanExporter):
     def get_finished_spans(self, session_id: str):
         """Retrieve all spans associated with a specific session ID.
 
-        Filters stored spans to return only those belonging to the specified
-        session, enabling session-scoped trace analysis and debugging.
+        Looks up the traces of the session in the session index, enabling
+        session-scoped trace analysis and debugging.
 
         Args:
             session_id: Session identifier to filter spans by
@@ -115,10 +189,12 @@ class _InMemoryExporter(export.SpanExporter):
             list[ReadableSpan]: List of spans associated with the session,
                 empty list if session not found or no spans available
         """
-        trace_ids = self.session_trace_dict.get(session_id, None)
-        if trace_ids is None or not trace_ids:
-            return []
-        return [x for x in self._spans if x.context.trace_id in trace_ids]
+        with self._lock:
+            self._evict(time.monotonic())
+            spans: list[ReadableSpan] = []
+            for trace_id in self._session_traces.get(session_id, ()):
+                spans.extend(self._traces[trace_id].spans)
+            return spans
 
     def clear(self):
         """Clear all stored spans and session mappings.
@@ -126,7 +202,32 @@ class _InMemoryExporter(export.SpanExporter):
         Removes all collected span data from memory, useful for cleanup
         between test runs or to free memory in long-running processes.
         """
-        self._spans.clear()
+        with self._lock:
+            self._traces.clear()
+            self._session_traces.clear()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired traces, then the least recently updated beyond the cap."""
+        while self._traces:
+            trace_id, entry = next(iter(self._traces.items()))
+            if self.ttl > 0 and now - entry.updated_at > self.ttl:
+                self._remove_trace(trace_id, reason="ttl")
+            elif len(self._traces) > self.max_traces:
+                self._remove_trace(trace_id, reason="capacity")
+            else:
+                break
+
+    def _remove_trace(self, trace_id: int, reason: str) -> None:
+        entry = self._traces.pop(trace_id)
+        for session_id in entry.session_ids:
+            trace_ids = self._session_traces.get(session_id)
+            if trace_ids is None:
+                continue
+            trace_ids.pop(trace_id, None)
+            if not trace_ids:
+                del self._session_traces[session_id]
+        self.evicted_traces += 1
+        _evicted_traces_counter.add(1, attributes={"reason": reason})
 
 
 class _InMemorySpanProcessor(export.SimpleSpanProcessor):
@@ -236,7 +337,8 @@ class InMemoryExporter(BaseExporter):
     Note:
         - Cannot be added to exporter lists (validation prevents this)
         - Automatically managed by OpentelemetryTracer
-        - Memory usage grows with span count - consider periodic clearing
+        - Memory usage is bounded by `InMemoryTraceStoreConfig`
+          (`OBSERVABILITY_OPENTELEMETRY_INMEMORY_*` env vars)
         - Session tracking requires properly configured session IDs
     """
 
@@ -30,6 +30,19 @@ from typing import Optional
 import httpx
 import websockets
 
+from veadk.tunnel.framing import (
+    DEFAULT_STREAM_WINDOW,
+    FRAMING_BINARY,
+    FRAMING_JSON,
+    SUPPORTED_FRAMINGS,
+    FrameType,
+    StreamWindow,
+    decode_frame,
+    decode_meta,
+    decode_window,
+    encode_frame,
+    encode_meta,
+)
 from veadk.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -74,6 +87,14 @@ _HOP_BY_HOP = {
 }
 
 
+_JSON_FRAME_TYPES = {
+    FrameType.RESPONSE_HEAD: "http_response",
+    FrameType.RESPONSE_CHUNK: "http_chunk",
+    FrameType.RESPONSE_END: "http_end",
+    FrameType.RESPONSE_ERROR: "http_error",
+}
+
+
 class TunnelConnector:
     """Connects local MCP servers to a cloud agent over an outbound tunnel."""
 
@@ -103,6 +124,12 @@ class TunnelConnector:
         self.token = token
         self.extra_headers = extra_headers or {}
         self._tasks: set = set()
+        self._framing = FRAMING_JSON
+        self._window = DEFAULT_STREAM_WINDOW
+        # request id -> handler task / send window (binary framing)
+        self._streams: dict[str, asyncio.Task] = {}
+        self._windows: dict[str, StreamWindow] = {}
+        self._ws = None
 
     def _ws_url(self) -> str:
         ws = self.cloud_url.replace("https://", "wss://").replace("http://", "ws://")
@@ -118,6 +145,7 @@ class TunnelConnector:
         headers = dict(self.extra_headers)
         async with httpx.AsyncClient() as http:
             async with websockets.connect(ws_url, additional_headers=headers) as ws:
+                self._ws = ws
                 await ws.send(
                     json.dumps(
                         {
@@ -125,35 +153,122 @@ class TunnelConnector:
                             "token": self.token,
                             "agent": self.agent,
                             "servers": [s.descriptor() for s in self.servers.values()],
+                            "framing": SUPPORTED_FRAMINGS,
                         }
                     )
                 )
                 ack = json.loads(await ws.recv())
                 if not ack.get("ok"):
                     raise RuntimeError(f"tunnel register rejected: {ack.get('error')}")
+                # Clouds without binary framing do not answer with `framing`.
+                self._framing = ack.get("framing", FRAMING_JSON)
+                self._window = int(ack.get("window", DEFAULT_STREAM_WINDOW))
                 logger.info(
                     f"Tunnel connected: agent=`{self.agent}` "
-                    f"servers={list(self.servers)} (connector {ack.get('connector_id')})"
+                    f"servers={list(self.servers)} (connector {ack.get('connector_id')}, "
+                    f"framing {self._framing})"
                 )
 
                 async for raw in ws:
+                    if isinstance(raw, bytes):
+                        self._on_frame(ws, http, raw)
+                        continue
                     msg = json.loads(raw)
                     if msg.get("type") == "http_request":
-                        # Handle concurrently: a long-lived stream (e.g. the MCP
-                        # server->client SSE channel) must not block other
-                        # requests like tools/list.
-                        task = asyncio.create_task(self._handle_request(ws, http, msg))
-                        self._tasks.add(task)
-                        task.add_done_callback(self._tasks.discard)
-
-    async def _handle_request(self, ws, http: httpx.AsyncClient, msg: dict) -> None:
+                        self._spawn(self._handle_request(ws, http, msg), msg["id"])
+        self._ws = None
+
+    async def drain(self, timeout: float = 30.0) -> None:
+        """Leave the cloud's rotation gracefully and disconnect.
+
+        The cloud stops routing new requests to this connector, in-flight
+        requests get up to ``timeout`` seconds to finish, then the tunnel is
+        closed and :meth:`start` returns.
+        """
+        ws = self._ws
+        if ws is None:
+            return
+        await ws.send(json.dumps({"type": "drain"}))
+        deadline = asyncio.get_running_loop().time() + timeout
+        while self._tasks:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                logger.warning(
+                    f"Tunnel drain timed out with {len(self._tasks)} request(s) in flight"
+                )
+                break
+            await asyncio.wait(set(self._tasks), timeout=remaining)
+        await ws.close()
+
+    def _spawn(self, coro, req_id: str) -> None:
+        # Handle concurrently: a long-lived stream (e.g. the MCP server->client
+        # SSE channel) must not block other requests like tools/list.
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        self._streams[req_id] = task
+
+        def _done(task: asyncio.Task) -> None:
+            self._tasks.discard(task)
+            self._streams.pop(req_id, None)
+            self._windows.pop(req_id, None)
+
+        task.add_done_callback(_done)
+
+    def _on_frame(self, ws, http: httpx.AsyncClient, data: bytes) -> None:
+        try:
+            frame_type, req_id, payload = decode_frame(data)
+        except ValueError as e:
+            logger.warning(f"Ignoring bad tunnel frame: {e}")
+            return
+        if frame_type == FrameType.REQUEST:
+            meta, body = decode_meta(payload)
+            self._windows[req_id] = StreamWindow(self._window)
+            self._spawn(
+                self._handle_request(ws, http, {**meta, "id": req_id}, body), req_id
+            )
+        elif frame_type == FrameType.WINDOW_UPDATE:
+            window = self._windows.get(req_id)
+            if window is not None:
+                window.release(decode_window(payload))
+        elif frame_type == FrameType.CANCEL:
+            task = self._streams.get(req_id)
+            if task is not None:
+                task.cancel()
+
+    async def _send(
+        self, ws, frame_type: FrameType, req_id: str, meta: dict, data: bytes = b""
+    ) -> None:
+        """Send one response frame in the negotiated framing."""
+        if self._framing == FRAMING_BINARY:
+            if frame_type == FrameType.RESPONSE_CHUNK:
+                window = self._windows[req_id]
+                while data:
+                    size = await window.acquire(len(data))
+                    await ws.send(encode_frame(frame_type, req_id, data[:size]))
+                    data = data[size:]
+            elif frame_type == FrameType.RESPONSE_HEAD:
+                await ws.send(encode_frame(frame_type, req_id, encode_meta(meta)))
+            else:
+                await ws.send(encode_frame(frame_type, req_id, data))
+            return
+
+        msg = {"type": _JSON_FRAME_TYPES[frame_type], "id": req_id, **meta}
+        if frame_type == FrameType.RESPONSE_CHUNK:
+            msg["data"] = data.decode("utf-8", errors="ignore")
+        await ws.send(json.dumps(msg))
+
+    async def _handle_request(
+        self, ws, http: httpx.AsyncClient, msg: dict, body: Optional[bytes] = None
+    ) -> None:
         req_id = msg["id"]
         server = self.servers.get(msg.get("server", ""))
         if server is None:
-            await ws.send(
-                json.dumps(
-                    {"type": "http_error", "id": req_id, "error": "unknown server"}
-                )
+            await self._send(
+                ws,
+                FrameType.RESPONSE_ERROR,
+                req_id,
+                {"error": "unknown server"},
+                b"unknown server",
             )
             return
 
@@ -164,6 +279,8 @@ class TunnelConnector:
             if k.lower() not in _HOP_BY_HOP
         }
         fwd.update(server.headers)
+        if body is None:
+            body = msg.get("body", "").encode("utf-8")
 
         try:
             async with http.stream(
@@ -171,32 +288,29 @@ class TunnelConnector:
                 url=server.address,
                 headers=fwd,
                 params=server.query or None,
-                content=msg.get("body", "").encode("utf-8"),
+                content=body,
             ) as resp:
-                await ws.send(
-                    json.dumps(
-                        {
-                            "type": "http_response",
-                            "id": req_id,
-                            "status": resp.status_code,
-                            "headers": dict(resp.headers),
-                        }
-                    )
+                await self._send(
+                    ws,
+                    FrameType.RESPONSE_HEAD,
+                    req_id,
+                    {"status": resp.status_code, "headers": dict(resp.headers)},
                 )
                 async for chunk in resp.aiter_bytes():
                     if chunk:
-                        await ws.send(
-                            json.dumps(
-                                {
-                                    "type": "http_chunk",
-                                    "id": req_id,
-                                    "data": chunk.decode("utf-8", errors="ignore"),
-                                }
-                            )
+                        await self._send(
+                            ws, FrameType.RESPONSE_CHUNK, req_id, {}, chunk
                         )
-                await ws.send(json.dumps({"type": "http_end", "id": req_id}))
+                await self._send(ws, FrameType.RESPONSE_END, req_id, {})
+        except asyncio.CancelledError:
+            logger.debug(f"Tunnel stream {req_id} cancelled by the cloud")
+            raise
         except Exception as e:
             logger.warning(f"Local request to `{server.name}` failed: {e}")
-            await ws.send(
-                json.dumps({"type": "http_error", "id": req_id, "error": str(e)})
+            await self._send(
+                ws,
+                FrameType.RESPONSE_ERROR,
+                req_id,
+                {"error": str(e)},
+                str(e).encode("utf-8"),
             )
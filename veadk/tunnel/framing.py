@@ -0,0 +1,140 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wire framing of the tunnel WebSocket.
+
+Two framings are supported and negotiated at ``register`` time:
+
+- ``json``: every frame is a JSON text message and bodies travel as UTF-8
+  text. This is the original protocol and the fallback for peers that do not
+  offer anything else.
+- ``binary``: every frame is a binary message ``type (1 byte) | request id
+  (16 bytes, UUID) | payload``. Bodies and response chunks are raw bytes, so
+  binary payloads survive the tunnel and nothing is JSON-encoded per chunk.
+
+In binary framing, response chunks are flow controlled per stream. The
+connector may only send as many chunk bytes as the cloud has granted. The
+cloud grants more with ``WINDOW_UPDATE`` as the HTTP client consumes the
+stream, so a slow client cannot make the cloud buffer without limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+import uuid
+from enum import IntEnum
+from typing import Any, Optional
+
+FRAMING_JSON = "json"
+FRAMING_BINARY = "binary"
+#: Framings offered by this side, most preferred first.
+SUPPORTED_FRAMINGS = [FRAMING_BINARY, FRAMING_JSON]
+
+#: Response bytes a connector may send per stream before it is granted more.
+DEFAULT_STREAM_WINDOW = 256 * 1024
+
+#: Chunk bytes buffered per JSON stream on the cloud side before the server
+#: stops reading from the connector until the client catches up. Binary
+#: streams are bounded by their window instead, which a connector that
+#: honours flow control never exceeds.
+MAX_QUEUED_BYTES = DEFAULT_STREAM_WINDOW
+
+_HEADER = struct.Struct("!B16s")
+_META_LENGTH = struct.Struct("!I")
+_WINDOW = struct.Struct("!I")
+
+
+class FrameType(IntEnum):
+    REQUEST = 1
+    RESPONSE_HEAD = 2
+    RESPONSE_CHUNK = 3
+    RESPONSE_END = 4
+    RESPONSE_ERROR = 5
+    WINDOW_UPDATE = 6
+    CANCEL = 7
+
+
+def negotiate_framing(offered: Optional[list[str]]) -> str:
+    """Pick the first framing in :data:`SUPPORTED_FRAMINGS` the peer offered."""
+    for framing in SUPPORTED_FRAMINGS:
+        if offered and framing in offered:
+            return framing
+    return FRAMING_JSON
+
+
+def encode_frame(frame_type: FrameType, request_id: str, payload: bytes = b"") -> bytes:
+    return _HEADER.pack(frame_type, uuid.UUID(request_id).bytes) + payload
+
+
+def decode_frame(data: bytes) -> tuple[FrameType, str, bytes]:
+    """Split a binary frame into its type, request id and payload.
+
+    Raises:
+        ValueError: If the frame is truncated or its type is unknown.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError(f"tunnel frame too short: {len(data)} bytes")
+    frame_type, request_id = _HEADER.unpack_from(data)
+    return (
+        FrameType(frame_type),
+        str(uuid.UUID(bytes=request_id)),
+        bytes(data[_HEADER.size :]),
+    )
+
+
+def encode_meta(meta: dict[str, Any], body: bytes = b"") -> bytes:
+    """Payload of a frame carrying JSON metadata followed by a raw body."""
+    encoded = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    return _META_LENGTH.pack(len(encoded)) + encoded + body
+
+
+def decode_meta(payload: bytes) -> tuple[dict[str, Any], bytes]:
+    (length,) = _META_LENGTH.unpack_from(payload)
+    start = _META_LENGTH.size
+    meta = json.loads(payload[start : start + length].decode("utf-8"))
+    return meta, payload[start + length :]
+
+
+def encode_window(size: int) -> bytes:
+    return _WINDOW.pack(size)
+
+
+def decode_window(payload: bytes) -> int:
+    return _WINDOW.unpack_from(payload)[0]
+
+
+class StreamWindow:
+    """Send credit of one stream, refilled by the receiver's window updates."""
+
+    def __init__(self, size: int = DEFAULT_STREAM_WINDOW) -> None:
+        self._credit = size
+        self._available = asyncio.Event()
+        if size > 0:
+            self._available.set()
+
+    async def acquire(self, wanted: int) -> int:
+        """Wait for credit and take up to ``wanted`` bytes of it."""
+        while self._credit <= 0:
+            self._available.clear()
+            await self._available.wait()
+        granted = min(wanted, self._credit)
+        self._credit -= granted
+        return granted
+
+    def release(self, size: int) -> None:
+        self._credit += size
+        if self._credit > 0:
+            self._available.set()
@@ -19,6 +19,14 @@ A local connector registers one or more resource servers (e.g. MCP servers) to a
 reads this registry on every turn to know which servers are currently online and
 mount their tools dynamically.
 
+Several connectors may register the same server name for an agent (e.g. one
+connector per replica of an enterprise MCP server). The agent still sees the
+server once. An MCP session lives on the local server behind one connector, so
+requests carrying an ``Mcp-Session-Id`` go to the connector that answered the
+session's ``initialize``; only requests without a session id are routed to the
+connector with the fewest outstanding requests, and draining connectors receive
+no new sessions.
+
 The registry is intentionally a single in-process object: the connector's
 WebSocket and the agent run must live in the same process to share it (see the
 module docstring of :mod:`veadk.tunnel.server` for the multi-replica caveat).
@@ -64,6 +72,27 @@ class ServerDescriptor(BaseModel):
     query: dict[str, str] = Field(default_factory=dict)
 
 
+class ConnectorStats(BaseModel):
+    """Load of one connector serving a tunneled server.
+
+    Attributes:
+        connector_id: Id assigned to the connector at register time.
+        in_flight: Proxied requests (including open streams) not finished yet.
+        requests: Proxied requests routed to the connector so far.
+        errors: Requests that ended in a tunnel error.
+        latency_ms: Moving average of the time until the response head, or
+            ``None`` before the first response.
+        draining: Whether the connector stopped accepting new requests.
+    """
+
+    connector_id: str
+    in_flight: int = 0
+    requests: int = 0
+    errors: int = 0
+    latency_ms: Optional[float] = None
+    draining: bool = False
+
+
 class TunnelRegistry:
     """In-process registry mapping ``agent_name`` -> online connector(s)."""
 
@@ -71,6 +100,10 @@ class TunnelRegistry:
         self._lock = threading.RLock()
         # connector_id -> connection
         self._connections: dict[str, "ConnectorConnection"] = {}
+        # (agent_name, server_name, session_id) -> connector_id
+        self._sessions: dict[tuple[str, str, str], str] = {}
+        # rotates ties between equally loaded connectors
+        self._next = 0
 
     def add_connection(self, conn: "ConnectorConnection") -> None:
         with self._lock:
@@ -83,35 +116,96 @@ class TunnelRegistry:
     def remove_connection(self, connector_id: str) -> None:
         with self._lock:
             conn = self._connections.pop(connector_id, None)
+            self._sessions = {
+                key: pinned
+                for key, pinned in self._sessions.items()
+                if pinned != connector_id
+            }
             if conn:
                 logger.info(
                     f"Connector {connector_id} (agent `{conn.agent_name}`) removed"
                 )
 
+    def drain_connection(self, connector_id: str) -> None:
+        """Stop routing new requests to a connector; in-flight ones continue."""
+        with self._lock:
+            conn = self._connections.get(connector_id)
+            if conn and not conn.draining:
+                conn.draining = True
+                logger.info(
+                    f"Connector {connector_id} (agent `{conn.agent_name}`) draining "
+                    f"with {conn.in_flight} request(s) in flight"
+                )
+
     def list_servers(self, agent_name: str) -> list[ServerDescriptor]:
-        """All online server descriptors registered to ``agent_name``."""
+        """All online server descriptors registered to ``agent_name``.
+
+        A server served by several connectors is listed once.
+        """
         with self._lock:
-            servers: list[ServerDescriptor] = []
+            servers: dict[str, ServerDescriptor] = {}
             for conn in self._connections.values():
-                if conn.agent_name == agent_name:
-                    servers.extend(conn.servers)
-            return servers
+                if conn.agent_name == agent_name and not conn.draining:
+                    for server in conn.servers:
+                        servers.setdefault(server.name, server)
+            return list(servers.values())
+
+    def connector_stats(self, agent_name: str) -> dict[str, list[ConnectorStats]]:
+        """Per-connector load of every server registered to ``agent_name``."""
+        with self._lock:
+            stats: dict[str, list[ConnectorStats]] = {}
+            for conn in self._connections.values():
+                if conn.agent_name != agent_name:
+                    continue
+                for server in conn.servers:
+                    stats.setdefault(server.name, []).append(conn.stats())
+            return stats
+
+    def pin_session(
+        self, agent_name: str, server_name: str, session_id: str, connector_id: str
+    ) -> None:
+        """Route later requests of ``session_id`` to ``connector_id``."""
+        with self._lock:
+            if connector_id in self._connections:
+                self._sessions[(agent_name, server_name, session_id)] = connector_id
+
+    def unpin_session(self, agent_name: str, server_name: str, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop((agent_name, server_name, session_id), None)
 
     def find_connection(
-        self, agent_name: str, server_name: str
+        self, agent_name: str, server_name: str, session_id: Optional[str] = None
     ) -> Optional["ConnectorConnection"]:
-        """Connector serving ``server_name`` for ``agent_name`` (for proxying)."""
+        """Connector serving ``server_name`` for ``agent_name`` (for proxying).
+
+        A request of an MCP session goes to the connector the session is pinned
+        to, even while it drains, and gets ``None`` once that connector is gone.
+        Other requests pick the non-draining connector with the fewest in-flight
+        requests; ties rotate between connectors.
+        """
         with self._lock:
-            for conn in self._connections.values():
-                if conn.agent_name == agent_name and any(
-                    s.name == server_name for s in conn.servers
-                ):
-                    return conn
-            return None
+            if session_id is not None:
+                connector_id = self._sessions.get((agent_name, server_name, session_id))
+                return self._connections.get(connector_id) if connector_id else None
+            candidates = [
+                conn
+                for conn in self._connections.values()
+                if conn.agent_name == agent_name
+                and not conn.draining
+                and any(s.name == server_name for s in conn.servers)
+            ]
+            if not candidates:
+                return None
+            self._next = (self._next + 1) % len(candidates)
+            rotated = candidates[self._next :] + candidates[: self._next]
+            return min(rotated, key=lambda c: c.in_flight)
 
     def has_agent(self, agent_name: str) -> bool:
         with self._lock:
-            return any(c.agent_name == agent_name for c in self._connections.values())
+            return any(
+                c.agent_name == agent_name and not c.draining
+                for c in self._connections.values()
+            )
 
 
 _REGISTRY: Optional[TunnelRegistry] = None
@@ -24,6 +24,12 @@
   response is piped back.
 - ``GET /tunnel/servers`` — list online servers (for a web UI / health).
 
+Several connectors may register the same server; requests are balanced across
+them (see :class:`~veadk.tunnel.registry.TunnelRegistry`). A connector that
+sends ``{"type": "drain"}`` gets no new requests while its in-flight ones
+finish, and a connector that disconnects is taken out of rotation before its
+pending requests are failed.
+
 Multi-replica caveat: a connector's WebSocket lives on one process, and the
 registry is in-process, so the agent run must hit the same process. Use a single
 replica or sticky routing until a shared registry/bus is added.
@@ -33,6 +39,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
 import uuid
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
@@ -40,7 +47,25 @@ from typing import Any, Callable, Optional
 from fastapi import FastAPI, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 
-from veadk.tunnel.registry import ServerDescriptor, TunnelRegistry, get_registry
+from veadk.tunnel.framing import (
+    DEFAULT_STREAM_WINDOW,
+    FRAMING_BINARY,
+    FRAMING_JSON,
+    MAX_QUEUED_BYTES,
+    FrameType,
+    decode_frame,
+    decode_meta,
+    encode_frame,
+    encode_meta,
+    encode_window,
+    negotiate_framing,
+)
+from veadk.tunnel.registry import (
+    ConnectorStats,
+    ServerDescriptor,
+    TunnelRegistry,
+    get_registry,
+)
 from veadk.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -58,59 +83,219 @@ _HOP_BY_HOP = {
     "host",
 }
 
+# Header carrying the MCP streamable-HTTP session id (lower-cased).
+MCP_SESSION_HEADER = "mcp-session-id"
+
+
+# Weight of the newest sample in the connector latency moving average.
+_LATENCY_ALPHA = 0.2
+
 
 def _filter_headers(headers: dict[str, str]) -> dict[str, str]:
     return {k: v for k, v in headers.items() if k.lower() not in _HOP_BY_HOP}
 
 
+def _header(headers: dict[str, str], name: str) -> Optional[str]:
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
 @dataclass
 class ConnectorConnection:
-    """One connected connector (enterprise side) and the servers it advertises."""
+    """One connected connector (enterprise side) and the servers it advertises.
+
+    ``framing`` is negotiated at ``register`` time, see
+    :mod:`veadk.tunnel.framing`.
+    """
 
     connector_id: str
     websocket: WebSocket
     agent_name: str
     servers: list[ServerDescriptor]
     pending: dict[str, "asyncio.Queue"] = field(default_factory=dict)
+    framing: str = FRAMING_JSON
+    window: int = DEFAULT_STREAM_WINDOW
+    # request id -> chunk bytes consumed but not yet granted back
+    unacked: dict[str, int] = field(default_factory=dict)
+    # request id -> chunk bytes queued but not yet consumed
+    buffered: dict[str, int] = field(default_factory=dict)
+    # JSON streams over MAX_QUEUED_BYTES; reading pauses while any is left
+    paused: set[str] = field(default_factory=set)
+    readable: asyncio.Event = field(default_factory=asyncio.Event)
+    draining: bool = False
+    in_flight: int = 0
+    requests: int = 0
+    errors: int = 0
+    latency_ms: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        self.readable.set()
+
+    def begin(self) -> float:
+        """Count a proxied request as in flight; returns its start time."""
+        self.in_flight += 1
+        self.requests += 1
+        return time.monotonic()
+
+    def responded(self, started: float) -> None:
+        """Fold the time until the response head into the latency average."""
+        sample = (time.monotonic() - started) * 1000
+        if self.latency_ms is None:
+            self.latency_ms = sample
+        else:
+            self.latency_ms += _LATENCY_ALPHA * (sample - self.latency_ms)
+
+    def finish(self, error: bool = False) -> None:
+        self.in_flight -= 1
+        if error:
+            self.errors += 1
+
+    def stats(self) -> ConnectorStats:
+        return ConnectorStats(
+            connector_id=self.connector_id,
+            in_flight=self.in_flight,
+            requests=self.requests,
+            errors=self.errors,
+            latency_ms=self.latency_ms,
+            draining=self.draining,
+        )
 
-    async def request(self, server: str, payload: dict) -> "asyncio.Queue":
-        """Send an http_request frame and return the queue it will stream into."""
+    async def request(
+        self, server: str, payload: dict, body: bytes = b""
+    ) -> tuple[str, "asyncio.Queue"]:
+        """Send an http_request frame and return its id and the queue it will
+        stream into."""
         req_id = str(uuid.uuid4())
+        # Unbounded in frames: `_put` bounds the chunk bytes instead.
         queue: asyncio.Queue = asyncio.Queue()
         self.pending[req_id] = queue
-        await self.websocket.send_text(
-            json.dumps(
-                {"type": "http_request", "id": req_id, "server": server, **payload}
+        self.buffered[req_id] = 0
+        if self.framing == FRAMING_BINARY:
+            self.unacked[req_id] = 0
+            await self.websocket.send_bytes(
+                encode_frame(
+                    FrameType.REQUEST,
+                    req_id,
+                    encode_meta({"server": server, **payload}, body),
+                )
             )
-        )
-        return queue
+        else:
+            await self.websocket.send_text(
+                json.dumps(
+                    {
+                        "type": "http_request",
+                        "id": req_id,
+                        "server": server,
+                        **payload,
+                        "body": body.decode("utf-8", errors="ignore"),
+                    }
+                )
+            )
+        return req_id, queue
 
     def dispatch(self, msg: dict) -> None:
-        """Route an inbound frame from the connector to its waiting queue."""
+        """Route an inbound JSON frame from the connector to its waiting queue."""
         req_id = msg.get("id")
-        queue = self.pending.get(req_id) if req_id else None
-        if queue is None:
-            return
         t = msg.get("type")
         if t == "http_response":
-            queue.put_nowait(("head", msg.get("status", 200), msg.get("headers", {})))
+            self._put(req_id, ("head", msg.get("status", 200), msg.get("headers", {})))
         elif t == "http_chunk":
-            queue.put_nowait(("chunk", msg.get("data", "")))
+            self._put(req_id, ("chunk", msg.get("data", "").encode("utf-8")))
         elif t == "http_end":
-            queue.put_nowait(("end", None))
-            self.pending.pop(req_id, None)
+            self._put(req_id, ("end", None), last=True)
         elif t == "http_error":
-            queue.put_nowait(("error", msg.get("error", "tunnel error")))
-            self.pending.pop(req_id, None)
+            self._put(req_id, ("error", msg.get("error", "tunnel error")), last=True)
+
+    def dispatch_frame(self, data: bytes) -> None:
+        """Route an inbound binary frame from the connector to its waiting queue."""
+        frame_type, req_id, payload = decode_frame(data)
+        if frame_type == FrameType.RESPONSE_HEAD:
+            meta, _ = decode_meta(payload)
+            self._put(
+                req_id, ("head", meta.get("status", 200), meta.get("headers", {}))
+            )
+        elif frame_type == FrameType.RESPONSE_CHUNK:
+            self._put(req_id, ("chunk", payload))
+        elif frame_type == FrameType.RESPONSE_END:
+            self._put(req_id, ("end", None), last=True)
+        elif frame_type == FrameType.RESPONSE_ERROR:
+            self._put(req_id, ("error", payload.decode("utf-8", "replace")), last=True)
+
+    async def consumed(self, req_id: str, size: int) -> None:
+        """Grant the connector more window once the client consumed a chunk."""
+        if req_id in self.buffered:
+            self.buffered[req_id] -= _queued_size(size)
+            if self.buffered[req_id] <= MAX_QUEUED_BYTES:
+                self._resume(req_id)
+        if self.framing != FRAMING_BINARY or req_id not in self.unacked:
+            return
+        self.unacked[req_id] += size
+        # Batch updates instead of sending one frame per chunk.
+        if self.unacked[req_id] >= self.window // 4:
+            granted, self.unacked[req_id] = self.unacked[req_id], 0
+            await self.websocket.send_bytes(
+                encode_frame(FrameType.WINDOW_UPDATE, req_id, encode_window(granted))
+            )
+
+    async def cancel(self, req_id: str) -> None:
+        """Stop a stream whose client went away before it ended."""
+        if self.pending.pop(req_id, None) is None:
+            return
+        self.unacked.pop(req_id, None)
+        self.buffered.pop(req_id, None)
+        self._resume(req_id)
+        if self.framing == FRAMING_BINARY:
+            await self.websocket.send_bytes(encode_frame(FrameType.CANCEL, req_id))
 
     def fail_all(self) -> None:
         for queue in self.pending.values():
             queue.put_nowait(("error", "connector disconnected"))
         self.pending.clear()
+        self.unacked.clear()
+        self.buffered.clear()
+        self.paused.clear()
+        self.readable.set()
+
+    def _put(self, req_id: Optional[str], item: tuple, last: bool = False) -> None:
+        queue = self.pending.get(req_id) if req_id else None
+        if queue is None:
+            return
+        if item[0] == "chunk":
+            self.buffered[req_id] += _queued_size(len(item[1]))
+            if self.framing != FRAMING_BINARY:
+                # JSON connectors have no window: stop reading from their
+                # socket until the client consumed this stream's backlog.
+                if self.buffered[req_id] > MAX_QUEUED_BYTES:
+                    self.paused.add(req_id)
+                    self.readable.clear()
+            elif self.buffered[req_id] > self.window:
+                # Binary streams stay within the window, so only a connector
+                # that ignores flow control gets here.
+                logger.warning(
+                    f"Tunnel stream {req_id} exceeded {self.window} buffered bytes, failing it"
+                )
+                item = ("error", "tunnel client too slow")
+                last = True
+        queue.put_nowait(item)
+        if last:
+            self.pending.pop(req_id, None)
+            self.unacked.pop(req_id, None)
+            self.buffered.pop(req_id, None)
+            self._resume(req_id)
+
+    def _resume(self, req_id: str) -> None:
+        self.paused.discard(req_id)
+        if not self.paused:
+            self.readable.set()
+
+
+def _queued_size(size: int) -> int:
+    """Bytes a chunk counts against the buffer; empty chunks still take a slot."""
+    return max(size, 1)
 
 
-# Default auth: ``token`` must match (if configured) and the target agent must be
-# in ``allowed_agents`` (if configured).
 AuthFn = Callable[[Optional[str], str], bool]
 
 
@@ -193,53 +378,104 @@ def mount_tunnel(
             websocket=ws,
             agent_name=agent_name,
             servers=servers,
+            framing=negotiate_framing(register.get("framing")),
         )
         reg.add_connection(conn)
         await ws.send_text(
             json.dumps(
-                {"type": "register_ack", "ok": True, "connector_id": connector_id}
+                {
+                    "type": "register_ack",
+                    "ok": True,
+                    "connector_id": connector_id,
+                    "framing": conn.framing,
+                    "window": conn.window,
+                }
             )
         )
 
         try:
             while True:
-                raw = await ws.receive_text()
-                conn.dispatch(json.loads(raw))
+                message = await ws.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if message.get("bytes") is not None:
+                    try:
+                        conn.dispatch_frame(message["bytes"])
+                    except ValueError as e:
+                        logger.warning(
+                            f"Connector {connector_id} sent a bad frame: {e}"
+                        )
+                elif message.get("text") is not None:
+                    msg = json.loads(message["text"])
+                    if msg.get("type") == "drain":
+                        reg.drain_connection(connector_id)
+                    else:
+                        conn.dispatch(msg)
+                        # Backpressure for JSON framing, see `_put`.
+                        await conn.readable.wait()
         except WebSocketDisconnect:
             pass
         except Exception as e:  # pragma: no cover
             logger.warning(f"Connector {connector_id} ws error: {e}")
         finally:
+            # Out of rotation first, so no new request races the failing ones.
+            reg.drain_connection(connector_id)
             conn.fail_all()
             reg.remove_connection(connector_id)
 
     async def _proxy(agent: str, server: str, request: Request) -> Response:
-        conn = reg.find_connection(agent, server)
+        body = await request.body()
+        session_id = request.headers.get(MCP_SESSION_HEADER)
+        # No await between picking a connector and counting the request on it,
+        # or concurrent requests all see the same load and pile on one.
+        conn = reg.find_connection(agent, server, session_id)
         if conn is None:
+            if session_id is not None:
+                # The session died with its connector; MCP clients answer a 404
+                # by initializing a new session.
+                return Response("tunnel session not found", status_code=404)
             return Response("tunnel server not connected", status_code=503)
+        started = conn.begin()
 
-        body = await request.body()
         payload = {
             "method": request.method,
             "headers": _filter_headers(dict(request.headers)),
-            "body": body.decode("utf-8", errors="ignore"),
         }
-        queue = await conn.request(server, payload)
-
-        head = await queue.get()
+        try:
+            req_id, queue = await conn.request(server, payload, body)
+            head = await queue.get()
+        except BaseException:
+            conn.finish(error=True)
+            raise
         if head[0] == "error":
+            conn.finish(error=True)
             return Response(f"tunnel error: {head[1]}", status_code=502)
+        conn.responded(started)
         _, status, headers = head
+        if session_id is None:
+            new_session = _header(headers, MCP_SESSION_HEADER)
+            if new_session:
+                reg.pin_session(agent, server, new_session, conn.connector_id)
+        elif request.method == "DELETE" and status < 400:
+            reg.unpin_session(agent, server, session_id)
 
         async def gen():
-            while True:
-                item = await queue.get()
-                if item[0] == "chunk":
-                    yield item[1].encode("utf-8")
-                elif item[0] == "end":
-                    break
-                elif item[0] == "error":
-                    break
+            finished = False
+            failed = False
+            try:
+                while True:
+                    item = await queue.get()
+                    if item[0] == "chunk":
+                        yield item[1]
+                        await conn.consumed(req_id, len(item[1]))
+                    else:  # "end" or "error"
+                        finished = True
+                        failed = item[0] == "error"
+                        break
+            finally:
+                conn.finish(error=failed)
+                if not finished:
+                    await conn.cancel(req_id)
 
         return StreamingResponse(
             gen(),
@@ -262,11 +498,19 @@ def mount_tunnel(
     async def list_servers(agent: Optional[str] = None) -> dict[str, Any]:  # noqa: ANN202
         if agent:
             servers = reg.list_servers(agent)
+            stats = reg.connector_stats(agent)
         else:
             servers = []  # listing across agents is intentionally not exposed
+            stats = {}
         return {
             "agent": agent,
-            "servers": [s.model_dump(exclude={"headers", "query"}) for s in servers],
+            "servers": [
+                {
+                    **s.model_dump(exclude={"headers", "query"}),
+                    "connectors": [c.model_dump() for c in stats.get(s.name, [])],
+                }
+                for s in servers
+            ],
         }
 
     logger.info(
@@ -32,7 +32,13 @@ Usage::
 PDF rendering dependencies are included in the default VeADK installation.
 """
 
+import atexit
 import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional
 
 from google.adk.agents.callback_context import CallbackContext
@@ -46,34 +52,114 @@ logger = get_logger(__name__)
 
 _PDF_MIME = "application/pdf"
 
+_RENDER_POOL: Optional[ProcessPoolExecutor] = None
+_RENDER_POOL_LOCK = threading.Lock()
+
+
+def _render_workers() -> int:
+    return int(os.getenv("VEADK_PDF_RENDER_WORKERS", str(min(os.cpu_count() or 1, 4))))
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Process pool shared by every PDF render in this process.
+
+    Renders run from `asyncio.to_thread` workers, so the pool is created under a
+    lock and starts its processes with forkserver (or spawn): forking a
+    multi-threaded process can deadlock the child.
+    """
+    global _RENDER_POOL
+    with _RENDER_POOL_LOCK:
+        if _RENDER_POOL is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            _RENDER_POOL = ProcessPoolExecutor(
+                max_workers=_render_workers(), mp_context=context
+            )
+        return _RENDER_POOL
+
+
+def _discard_render_pool(pool: Optional[ProcessPoolExecutor] = None) -> None:
+    """Shut down the shared pool (only if it is still ``pool``, when given)."""
+    global _RENDER_POOL
+    with _RENDER_POOL_LOCK:
+        if _RENDER_POOL is None or (pool is not None and _RENDER_POOL is not pool):
+            return
+        pool, _RENDER_POOL = _RENDER_POOL, None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_discard_render_pool)
+
+
+def _render_page_range(
+    pdf_bytes: bytes, start: int, stop: int, scale: float
+) -> list[bytes]:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(pdf_bytes)
+    pages: list[bytes] = []
+    for i in range(start, stop):
+        # pypdfium2 leaves `scale` untyped (default 1), so it is inferred as
+        # int; floats are valid at runtime (e.g. 1.5x). Cast away the warning.
+        image = pdf[i].render(scale=scale).to_pil()  # type: ignore[arg-type]
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        pages.append(buffer.getvalue())
+    return pages
+
+
+def _render_pages(pdf_bytes: bytes, page_count: int, scale: float) -> list[bytes]:
+    """Render pages, spread over the render process pool when it has workers."""
+    workers = min(_render_workers(), page_count)
+    if workers <= 1:
+        return _render_page_range(pdf_bytes, 0, page_count, scale)
+
+    step = -(-page_count // workers)
+    pool = _get_render_pool()
+    try:
+        futures = [
+            pool.submit(
+                _render_page_range,
+                pdf_bytes,
+                start,
+                min(start + step, page_count),
+                scale,
+            )
+            for start in range(0, page_count, step)
+        ]
+        return [page for future in futures for page in future.result()]
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(
+            f"PDF render pool unavailable, rendering in-process: {e}. Scripts "
+            'rendering PDFs in a pool need an `if __name__ == "__main__":` guard.'
+        )
+        _discard_render_pool(pool)
+        return _render_page_range(pdf_bytes, 0, page_count, scale)
+
 
 def render_pdf_to_png_parts(
     pdf_bytes: bytes, max_pages: int, scale: float
 ) -> list[types.Part]:
-    """Render up to ``max_pages`` pages of a PDF into ``image/png`` parts."""
+    """Render up to ``max_pages`` pages of a PDF into ``image/png`` parts.
+
+    Pages are rendered in parallel across a process pool of
+    ``VEADK_PDF_RENDER_WORKERS`` workers (default: up to 4 CPUs).
+    """
     import pypdfium2 as pdfium
 
-    pdf = pdfium.PdfDocument(pdf_bytes)
-    page_count = len(pdf)
+    page_count = len(pdfium.PdfDocument(pdf_bytes))
     rendered = min(page_count, max_pages)
     if page_count > max_pages:
         logger.warning(
             f"PDF has {page_count} pages; rendering only the first {max_pages}."
         )
 
-    parts: list[types.Part] = []
-    for i in range(rendered):
-        # pypdfium2 leaves `scale` untyped (default 1), so it is inferred as
-        # int; floats are valid at runtime (e.g. 1.5x). Cast away the warning.
-        image = pdf[i].render(scale=scale).to_pil()  # type: ignore[arg-type]
-        buffer = io.BytesIO()
-        image.save(buffer, format="PNG")
-        parts.append(
-            types.Part(
-                inline_data=types.Blob(mime_type="image/png", data=buffer.getvalue())
-            )
-        )
-    return parts
+    return [
+        types.Part(inline_data=types.Blob(mime_type="image/png", data=page))
+        for page in _render_pages(pdf_bytes, rendered, scale)
+    ]
 
 
 def make_pdf_to_images_callback(max_pages: int = 10, scale: float = 2.0):